@@ -9,6 +9,11 @@ logging configuration. App-wide logging should be configured centrally in app.py
 
 PRD-034: Added retry logic with exponential backoff to call_claude() method
 for improved reliability during transient API failures.
+
+Prompt caching: static system prompts (and an optional static instruction
+block passed as cached_context) are sent as cache_control breakpoints, so
+repeated calls only pay full input price for the per-item content. Token
+counts, including cache reads and writes, are tracked per agent.
 """
 
 import os
@@ -16,14 +21,22 @@ import json
 import logging
 import time
 import base64
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Union
 from anthropic import Anthropic, APITimeoutError, RateLimitError, InternalServerError, APIConnectionError
 from dotenv import load_dotenv
-from agents.config import MODEL_ANALYSIS, TIMEOUT_DEFAULT
+from agents.config import MODEL_ANALYSIS, PROMPT_CACHE_ENABLED, TIMEOUT_DEFAULT
+from backend.utils.usage_limiter import TOKEN_FIELDS, get_usage_limiter
 
 RETRYABLE_ERRORS = (APITimeoutError, RateLimitError, InternalServerError, APIConnectionError, ConnectionError, TimeoutError)
 
+CACHE_CONTROL = {"type": "ephemeral"}
+
+# Process-wide token totals per agent class
+_token_usage: Dict[str, Dict[str, int]] = {}
+_token_usage_lock = threading.Lock()
+
 # Get logger (don't configure here - let app.py handle logging config)
 logger = logging.getLogger(__name__)
 
@@ -59,8 +72,100 @@ class BaseAgent:
         self.model = model or MODEL_ANALYSIS
         self.api_timeout = api_timeout or TIMEOUT_DEFAULT
         self.client = Anthropic(api_key=self.api_key)
+        self.token_usage: Dict[str, int] = dict.fromkeys(TOKEN_FIELDS, 0)
         logger.info(f"Initialized {self.__class__.__name__} with model {self.model}")
 
+    # =========================================================================
+    # Prompt caching and token usage
+    # =========================================================================
+
+    @staticmethod
+    def _system_param(system_prompt: Optional[str], cache: bool) -> Union[str, List[Dict[str, Any]]]:
+        """System prompt as a cacheable text block, or a plain string when not caching."""
+        if not system_prompt:
+            return ""
+        if not (cache and PROMPT_CACHE_ENABLED):
+            return system_prompt
+        return [{"type": "text", "text": system_prompt, "cache_control": CACHE_CONTROL}]
+
+    @staticmethod
+    def _user_content(prompt: str, cached_context: Optional[str]) -> Union[str, List[Dict[str, Any]]]:
+        """User message content: the static cached_context block (cache breakpoint), then the prompt."""
+        if not cached_context:
+            return prompt
+        context_block = {"type": "text", "text": cached_context}
+        if PROMPT_CACHE_ENABLED:
+            context_block["cache_control"] = CACHE_CONTROL
+        return [context_block, {"type": "text", "text": prompt}]
+
+    def _record_token_usage(self, response: Any):
+        """
+        Add a response's token counts to this agent's totals.
+
+        Non-zero counts are also reported to the usage limiter (per agent
+        class, per day) so cache reads vs writes are visible in usage tracking.
+        """
+        usage = getattr(response, "usage", None)
+        counts = {"calls": 1}
+        for field in TOKEN_FIELDS[1:]:
+            value = getattr(usage, field, 0)
+            counts[field] = value if isinstance(value, int) else 0
+        if not any(counts[field] for field in TOKEN_FIELDS[1:]):
+            return
+
+        agent = self.__class__.__name__
+        with _token_usage_lock:
+            totals = _token_usage.setdefault(agent, dict.fromkeys(TOKEN_FIELDS, 0))
+            for field, value in counts.items():
+                self.token_usage[field] += value
+                totals[field] += value
+
+        logger.debug(
+            f"{agent} tokens: input={counts['input_tokens']} output={counts['output_tokens']} "
+            f"cache_write={counts['cache_creation_input_tokens']} cache_read={counts['cache_read_input_tokens']}"
+        )
+
+        try:
+            get_usage_limiter().record_token_usage(agent, counts)
+        except Exception as e:
+            logger.warning(f"Could not record token usage for {agent}: {e}")
+
+    def message_params(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        cached_context: Optional[str] = None,
+        cache_system: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Messages API parameters for a text prompt, as call_claude sends them.
+
+        Also used as the params of message batch requests (see agents/bulk_runner.py).
+        """
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "system": self._system_param(system_prompt, cache_system),
+            "messages": [{"role": "user", "content": self._user_content(prompt, cached_context)}],
+        }
+
+    def response_payload(self, response: Any, expect_json: bool = True) -> Dict[str, Any]:
+        """
+        Text of a Messages API response, parsed as JSON if expected.
+
+        Raises:
+            ValueError: If JSON is expected but cannot be parsed
+        """
+        response_text = response.content[0].text
+        logger.debug(f"Received response length: {len(response_text)}")
+
+        if expect_json:
+            return self._parse_json_response(response_text)
+        return {"response": response_text}
+
     def call_claude(
         self,
         prompt: str,
@@ -68,7 +173,9 @@ class BaseAgent:
         max_tokens: int = 4096,
         temperature: float = 0.0,
         expect_json: bool = True,
-        max_retries: int = 3
+        max_retries: int = 3,
+        cached_context: Optional[str] = None,
+        cache_system: bool = True
     ) -> Dict[str, Any]:
         """
         Make a call to Claude API with retry logic.
@@ -82,6 +189,9 @@ class BaseAgent:
             temperature: Sampling temperature (0.0 = deterministic)
             expect_json: Whether to expect JSON response
             max_retries: Maximum number of retry attempts (default: 3)
+            cached_context: Static instructions sent before the prompt as a
+                cacheable block (must be identical across calls to hit the cache)
+            cache_system: Mark the system prompt as a cacheable prefix
 
         Returns:
             Parsed response (dict if JSON, string otherwise)
@@ -95,28 +205,13 @@ class BaseAgent:
             try:
                 logger.debug(f"Calling Claude with prompt length: {len(prompt)} (attempt {attempt + 1}/{max_retries})")
 
-                # Build messages
-                messages = [{"role": "user", "content": prompt}]
-
                 # Make API call
                 response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                    system=system_prompt if system_prompt else "",
-                    messages=messages,
+                    **self.message_params(prompt, system_prompt, max_tokens, temperature, cached_context, cache_system),
                     timeout=self.api_timeout
                 )
-
-                # Extract text content
-                response_text = response.content[0].text
-                logger.debug(f"Received response length: {len(response_text)}")
-
-                # Parse JSON if expected
-                if expect_json:
-                    return self._parse_json_response(response_text)
-                else:
-                    return {"response": response_text}
+                self._record_token_usage(response)
+                return self.response_payload(response, expect_json)
 
             except RETRYABLE_ERRORS as e:
                 last_exception = e
@@ -145,7 +240,8 @@ class BaseAgent:
         max_tokens: int = 4096,
         temperature: float = 0.0,
         expect_json: bool = True,
-        max_retries: int = 3
+        max_retries: int = 3,
+        cache_system: bool = True
     ) -> Dict[str, Any]:
         """
         Make a call to Claude Vision API with an image.
@@ -160,6 +256,7 @@ class BaseAgent:
             temperature: Sampling temperature (0.0 = deterministic)
             expect_json: Whether to expect JSON response
             max_retries: Maximum number of retry attempts (default: 3)
+            cache_system: Mark the system prompt as a cacheable prefix
 
         Returns:
             Parsed response (dict if JSON, string otherwise)
@@ -213,15 +310,16 @@ class BaseAgent:
                     ]
                 }]
 
-                # Make API call
+                # Make API call (the image follows the system prompt, so only that is cached)
                 response = self.client.messages.create(
                     model=self.model,
                     max_tokens=max_tokens,
                     temperature=temperature,
-                    system=system_prompt if system_prompt else "",
+                    system=self._system_param(system_prompt, cache_system),
                     messages=messages,
                     timeout=self.api_timeout
                 )
+                self._record_token_usage(response)
 
                 # Extract text content
                 response_text = response.content[0].text
@@ -323,3 +421,14 @@ class BaseAgent:
             NotImplementedError: Must be implemented by subclass
         """
         raise NotImplementedError("Subclasses must implement analyze() method")
+
+
+def get_agent_token_usage() -> Dict[str, Dict[str, int]]:
+    """
+    Token totals per agent class since process start.
+
+    Returns:
+        Dict of agent class name -> TOKEN_FIELDS counts
+    """
+    with _token_usage_lock:
+        return {agent: dict(counts) for agent, counts in _token_usage.items()}
@@ -0,0 +1,237 @@
+"""
+Bulk Analysis Runner
+
+Offline mode for backfills (reclassifying a source, rescoring a month,
+re-extracting symbols after a prompt change). Instead of one synchronous
+call_claude per item, prompts are submitted as asynchronous message
+batches: every batch is submitted up front, processed by the API in
+parallel outside the per-minute rate limits, then polled until it ends
+and its results fetched in one pass.
+
+The transport is swappable: AnthropicBatchTransport uses the Message
+Batches API, LocalBatchTransport answers each request in-process with a
+callable (a local fake in tests, or the synchronous Messages API for small
+runs). Request params come from BaseAgent.message_params, so a batch
+request is exactly the call the agent would have made, cache breakpoints
+included, and results are parsed with BaseAgent.response_payload.
+"""
+
+import logging
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from agents.base_agent import BaseAgent
+from agents.config import BULK_BATCH_MAX_REQUESTS, BULK_MAX_WAIT, BULK_POLL_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+
+class BulkRequest:
+    """
+    One prompt in a bulk run.
+
+    custom_id identifies the item when results come back (Message Batches
+    require 1-64 characters from [a-zA-Z0-9_-], e.g. "ac-123").
+    """
+
+    def __init__(
+        self,
+        custom_id: str,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        cached_context: Optional[str] = None,
+        expect_json: bool = True
+    ):
+        self.custom_id = custom_id
+        self.prompt = prompt
+        self.system_prompt = system_prompt
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self.cached_context = cached_context
+        self.expect_json = expect_json
+
+
+# ============================================================================
+# Transports
+# ============================================================================
+
+class BatchTransport:
+    """Submits message batches and fetches their results."""
+
+    def submit(self, requests: List[Dict[str, Any]]) -> str:
+        """Submit [{"custom_id", "params"}] requests; returns the batch id."""
+        raise NotImplementedError
+
+    def is_done(self, batch_id: str) -> bool:
+        """True once the batch has ended and its results can be fetched."""
+        raise NotImplementedError
+
+    def results(self, batch_id: str) -> Iterable[Tuple[str, Any, Optional[str]]]:
+        """Yield (custom_id, message, error) per request; message is None on error."""
+        raise NotImplementedError
+
+
+class AnthropicBatchTransport(BatchTransport):
+    """Message Batches API (client.messages.batches)."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def submit(self, requests: List[Dict[str, Any]]) -> str:
+        return self.client.messages.batches.create(requests=requests).id
+
+    def is_done(self, batch_id: str) -> bool:
+        return self.client.messages.batches.retrieve(batch_id).processing_status == "ended"
+
+    def results(self, batch_id: str) -> Iterable[Tuple[str, Any, Optional[str]]]:
+        for entry in self.client.messages.batches.results(batch_id):
+            result = entry.result
+            if result.type == "succeeded":
+                yield entry.custom_id, result.message, None
+            else:
+                error = getattr(result, "error", None)
+                yield entry.custom_id, None, f"{result.type}: {error}" if error else result.type
+
+
+class LocalBatchTransport(BatchTransport):
+    """
+    Answers each request in-process when the batch is submitted.
+
+    respond(params) returns a Messages API response, or plain response text;
+    an exception becomes that request's error.
+    """
+
+    def __init__(self, respond: Callable[[Dict[str, Any]], Any]):
+        self.respond = respond
+        self._batches: Dict[str, List[Tuple[str, Any, Optional[str]]]] = {}
+
+    def submit(self, requests: List[Dict[str, Any]]) -> str:
+        batch_id = f"local_{len(self._batches) + 1}"
+        entries = []
+        for request in requests:
+            try:
+                message = self.respond(request["params"])
+                if isinstance(message, str):
+                    message = SimpleNamespace(content=[SimpleNamespace(text=message)], usage=None)
+                entries.append((request["custom_id"], message, None))
+            except Exception as e:
+                entries.append((request["custom_id"], None, f"{type(e).__name__}: {e}"))
+        self._batches[batch_id] = entries
+        return batch_id
+
+    def is_done(self, batch_id: str) -> bool:
+        return True
+
+    def results(self, batch_id: str) -> Iterable[Tuple[str, Any, Optional[str]]]:
+        return iter(self._batches.pop(batch_id, []))
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+class BulkAnalysisRunner:
+    """
+    Run many prompts for one agent through a BatchTransport.
+
+    Usage:
+        runner = BulkAnalysisRunner(ConfluenceScorerAgent())
+        results = runner.run([BulkRequest("ac-1", prompt, system_prompt), ...])
+        # {"ac-1": parsed JSON dict, or the Exception for that request}
+    """
+
+    def __init__(
+        self,
+        agent: BaseAgent,
+        transport: Optional[BatchTransport] = None,
+        max_requests: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        max_wait: Optional[float] = None,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.agent = agent
+        self.transport = transport or AnthropicBatchTransport(agent.client)
+        self.max_requests = max(1, max_requests or BULK_BATCH_MAX_REQUESTS)
+        self.poll_interval = BULK_POLL_INTERVAL if poll_interval is None else poll_interval
+        self.max_wait = BULK_MAX_WAIT if max_wait is None else max_wait
+        self.sleep = sleep
+        self.stats: Dict[str, Any] = {}
+
+    def run(self, requests: List[BulkRequest]) -> Dict[str, Any]:
+        """
+        Submit all requests, wait for every batch, and collect parsed results.
+
+        Returns:
+            {custom_id: parsed response dict, or the Exception for that request}
+
+        Raises:
+            ValueError: If custom_ids are not unique
+        """
+        by_id = {request.custom_id: request for request in requests}
+        if len(by_id) != len(requests):
+            raise ValueError("Bulk request custom_ids must be unique")
+
+        started = time.monotonic()
+        batch_ids, batch_of = [], {}
+        for start in range(0, len(requests), self.max_requests):
+            chunk = requests[start:start + self.max_requests]
+            batch_of.update((r.custom_id, len(batch_ids)) for r in chunk)
+            batch_ids.append(self.transport.submit([
+                {"custom_id": r.custom_id, "params": self.agent.message_params(
+                    r.prompt, r.system_prompt, r.max_tokens, r.temperature, r.cached_context)}
+                for r in chunk
+            ]))
+        logger.info(
+            f"Submitted {len(requests)} {self.agent.__class__.__name__} requests in {len(batch_ids)} batches"
+        )
+
+        pending = list(batch_ids)
+        while pending:
+            pending = [batch_id for batch_id in pending if not self.transport.is_done(batch_id)]
+            if not pending:
+                break
+            if time.monotonic() - started >= self.max_wait:
+                logger.error(f"Bulk run gave up waiting on batches {pending} after {self.max_wait}s")
+                break
+            self.sleep(self.poll_interval)
+
+        results: Dict[str, Any] = {}
+        for batch_id in batch_ids:
+            if batch_id in pending:
+                continue
+            for custom_id, message, error in self.transport.results(batch_id):
+                request = by_id.get(custom_id)
+                if request is None:
+                    continue
+                if message is None:
+                    results[custom_id] = RuntimeError(error or "Request failed")
+                    continue
+                self.agent._record_token_usage(message)
+                try:
+                    results[custom_id] = self.agent.response_payload(message, request.expect_json)
+                except Exception as e:
+                    results[custom_id] = e
+
+        for custom_id in by_id:
+            if custom_id not in results:
+                if batch_ids[batch_of[custom_id]] in pending:
+                    results[custom_id] = TimeoutError(f"Batch did not end within {self.max_wait}s")
+                else:
+                    results[custom_id] = RuntimeError("No result returned for request")
+
+        failed = sum(isinstance(result, Exception) for result in results.values())
+        self.stats = {
+            "requests": len(requests),
+            "batches": len(batch_ids),
+            "succeeded": len(requests) - failed,
+            "failed": failed,
+            "seconds": round(time.monotonic() - started, 2),
+        }
+        logger.info(
+            f"Bulk run finished: {self.stats['succeeded']}/{len(requests)} succeeded "
+            f"in {self.stats['seconds']}s"
+        )
+        return results
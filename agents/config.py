@@ -14,3 +14,29 @@ TIMEOUT_SYNTHESIS = int(os.getenv("SYNTHESIS_TIMEOUT_PER_CALL", "300"))
 MAX_SOURCE_TOKENS = int(os.getenv("MAX_SOURCE_TOKENS", "8000"))
 MAX_TRANSCRIPT_CHARS = int(os.getenv("MAX_TRANSCRIPT_CHARS", "60000"))  # ~15K tokens
 MAX_SOURCE_PROMPT_CHARS = int(os.getenv("MAX_SOURCE_PROMPT_CHARS", "150000"))  # ~37K tokens
+
+# Theme similarity prefilter (local TF-IDF before Claude matching / clustering)
+THEME_MATCH_TOP_K = int(os.getenv("THEME_MATCH_TOP_K", "5"))  # existing themes sent per new theme
+THEME_MATCH_THRESHOLD = float(os.getenv("THEME_MATCH_THRESHOLD", "0.8"))  # auto-update at or above
+THEME_CANDIDATE_THRESHOLD = float(os.getenv("THEME_CANDIDATE_THRESHOLD", "0.2"))  # auto-create below
+THEME_CLUSTER_MAX_PAIRS = int(os.getenv("THEME_CLUSTER_MAX_PAIRS", "40"))  # ambiguous pairs per call
+
+# Prompt caching: mark static system prompts / instruction blocks as cacheable prefixes
+PROMPT_CACHE_ENABLED = os.getenv("PROMPT_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# Confluence scoring: short items are packed into one multi-item prompt; batches run concurrently
+CONFLUENCE_BATCH_SIZE = int(os.getenv("CONFLUENCE_BATCH_SIZE", "5"))  # items per scoring prompt
+CONFLUENCE_BATCH_ITEM_CHARS = int(os.getenv("CONFLUENCE_BATCH_ITEM_CHARS", "4000"))  # longer items scored alone
+CONFLUENCE_SCORING_WORKERS = int(os.getenv("CONFLUENCE_SCORING_WORKERS", "4"))  # concurrent scoring calls
+
+# Content classification: small items packed per prompt with indexed JSON output
+CLASSIFIER_BATCH_SIZE = int(os.getenv("CLASSIFIER_BATCH_SIZE", "15"))  # items per classification prompt
+
+# Deterministic pre-routing: obvious content types skip the Claude classification call
+PRE_ROUTER_ENABLED = os.getenv("PRE_ROUTER_ENABLED", "true").lower() in ("1", "true", "yes")
+PRE_ROUTE_MIN_CONFIDENCE = float(os.getenv("PRE_ROUTE_MIN_CONFIDENCE", "0.85"))  # rules below this go to Claude
+
+# Bulk analysis: backfills submitted as asynchronous message batches
+BULK_BATCH_MAX_REQUESTS = int(os.getenv("BULK_BATCH_MAX_REQUESTS", "10000"))  # requests per submitted batch
+BULK_POLL_INTERVAL = float(os.getenv("BULK_POLL_INTERVAL", "30"))  # seconds between status checks
+BULK_MAX_WAIT = float(os.getenv("BULK_MAX_WAIT", "86400"))  # batches expire after 24h
@@ -27,7 +27,9 @@ from datetime import datetime, timedelta
 from collections import defaultdict
 
 from agents.base_agent import BaseAgent
+from agents.config import THEME_CANDIDATE_THRESHOLD, THEME_CLUSTER_MAX_PAIRS, THEME_MATCH_THRESHOLD
 from backend.utils.sanitization import wrap_content_for_prompt, sanitize_content_text
+from backend.utils.text_similarity import DisjointSet, TermIndex, theme_terms
 
 logger = logging.getLogger(__name__)
 
@@ -245,7 +247,12 @@ class CrossReferenceAgent(BaseAgent):
         themes: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """
-        Cluster similar themes using Claude for semantic similarity.
+        Cluster similar themes, using Claude only for ambiguous pairs.
+
+        A local TF-IDF prefilter (backend.utils.text_similarity) merges
+        near-duplicate theses outright and skips pairs with little overlap;
+        Claude then adjudicates at most THEME_CLUSTER_MAX_PAIRS pairs in the
+        middle band, so prompt size no longer grows with the theme count.
 
         Args:
             themes: List of themes to cluster
@@ -256,13 +263,66 @@ class CrossReferenceAgent(BaseAgent):
         if not themes:
             return []
 
-        try:
-            logger.info(f"Clustering {len(themes)} themes")
+        logger.info(f"Clustering {len(themes)} themes")
+
+        index = TermIndex({i: theme_terms(theme["theme"]) for i, theme in enumerate(themes)})
+        clusters = DisjointSet(range(len(themes)))
+        link_confidence: Dict[Tuple[int, int], float] = {}
+
+        ambiguous = []
+        for a, b, score in index.pairs(THEME_CANDIDATE_THRESHOLD):
+            if score >= THEME_MATCH_THRESHOLD:
+                clusters.union(a, b)
+                link_confidence[(a, b)] = score
+            else:
+                ambiguous.append((a, b))
+        ambiguous = [(a, b) for a, b in ambiguous if clusters.find(a) != clusters.find(b)]
+        ambiguous = ambiguous[:THEME_CLUSTER_MAX_PAIRS]
+
+        if ambiguous:
+            try:
+                for a, b, confidence in self._adjudicate_theme_pairs(themes, ambiguous):
+                    clusters.union(a, b)
+                    link_confidence[(a, b)] = confidence
+            except Exception as e:
+                logger.warning(f"Theme pair adjudication failed, keeping local clusters: {e}")
+
+        clustered = []
+        for members in clusters.groups():
+            cluster_themes = [themes[i] for i in members]
+            representative = max(cluster_themes, key=lambda t: t.get("core_score") or 0)
+            confidences = [c for (a, b), c in link_confidence.items() if a in members]
+            clustered.append({
+                "representative_theme": representative["theme"],
+                "themes": cluster_themes,
+                "confidence": round(min(confidences), 2) if confidences else 1.0,
+                "source_count": len(set(t["source"] for t in cluster_themes))
+            })
+
+        logger.info(
+            f"Clustered into {len(clustered)} groups "
+            f"({len(ambiguous)} ambiguous pairs sent for adjudication)"
+        )
+        return clustered
+
+    def _adjudicate_theme_pairs(
+        self,
+        themes: List[Dict[str, Any]],
+        pairs: List[Tuple[int, int]]
+    ) -> List[Tuple[int, int, float]]:
+        """
+        Ask Claude which candidate theme pairs are the same investment thesis.
+
+        Args:
+            themes: Themes being clustered
+            pairs: Candidate (index, index) pairs, 0-based
 
-            # Build prompt for Claude
-            system_prompt = """You are analyzing investment themes to find similar ideas across different sources.
+        Returns:
+            Confirmed (index, index, confidence) pairs
+        """
+        system_prompt = """You are analyzing investment themes to find similar ideas across different sources.
 
-Your job is to cluster themes that are essentially the same investment thesis, even if worded differently.
+Your job is to decide whether two themes are essentially the same investment thesis, even if worded differently.
 
 For example:
 - "Tech sector outperformance likely" and "NASDAQ to outperform S&P" = SAME theme
@@ -271,26 +331,28 @@ For example:
 
 Be smart about semantic similarity."""
 
-            themes_text = "\n".join([
-                f"{i+1}. [{theme['source']}] {theme['theme']} (score: {theme['core_score']}/10)"
-                for i, theme in enumerate(themes)
-            ])
-            wrapped_themes = wrap_content_for_prompt(
-                sanitize_content_text(themes_text), max_chars=30000
-            )
+        def describe(theme: Dict[str, Any]) -> str:
+            return f"[{theme['source']}] {theme['theme']} (score: {theme['core_score']}/10)"
+
+        pairs_text = "\n".join(
+            f"{n}. A: {describe(themes[a])}\n   B: {describe(themes[b])}"
+            for n, (a, b) in enumerate(pairs, start=1)
+        )
+        wrapped_pairs = wrap_content_for_prompt(
+            sanitize_content_text(pairs_text), max_chars=30000
+        )
 
-            user_prompt = f"""Cluster these investment themes by similarity:
+        user_prompt = f"""For each numbered pair, decide whether A and B are the same investment theme:
 
-{wrapped_themes}
+{wrapped_pairs}
 
-Return a JSON array of clusters, where each cluster contains theme indices that are similar:
+Return JSON:
 
 {{
-    "clusters": [
+    "pairs": [
         {{
-            "cluster_id": 1,
-            "representative_theme": "Main theme description",
-            "theme_indices": [1, 3, 5],
+            "pair": 1,
+            "same": true,
             "confidence": 0.85
         }},
         ...
@@ -299,49 +361,28 @@ Return a JSON array of clusters, where each cluster contains theme indices that
 
 Rules:
 - Themes must be semantically similar (same investment idea)
-- Different instruments on same theme = SAME cluster
-- Opposite views = DIFFERENT clusters
-- Be conservative - only cluster if truly similar
+- Different instruments on same theme = SAME
+- Opposite views = DIFFERENT
+- Be conservative - only mark same if truly similar
 
 Return ONLY valid JSON."""
 
-            # Call Claude
-            response = self.call_claude(
-                prompt=user_prompt,
-                system_prompt=system_prompt,
-                max_tokens=2048,
-                temperature=0.0,
-                expect_json=True
-            )
-
-            clusters_data = response.get("clusters", [])
-
-            # Build clustered themes
-            clustered = []
-            for cluster in clusters_data:
-                indices = cluster.get("theme_indices", [])
-                if not indices:
-                    continue
-
-                # Get themes in this cluster (adjust for 0-based indexing)
-                cluster_themes = [themes[i-1] for i in indices if 0 < i <= len(themes)]
-
-                if cluster_themes:
-                    clustered.append({
-                        "representative_theme": cluster.get("representative_theme", ""),
-                        "themes": cluster_themes,
-                        "confidence": cluster.get("confidence", 0.0),
-                        "source_count": len(set(t["source"] for t in cluster_themes))
-                    })
-
-            logger.info(f"Clustered into {len(clustered)} groups")
-            return clustered
-
-        except Exception as e:
-            logger.warning(f"Theme clustering failed, returning unclustered: {e}")
-            # Fallback: each theme is its own cluster
-            return [{"representative_theme": t["theme"], "themes": [t], "confidence": 1.0, "source_count": 1}
-                    for t in themes]
+        response = self.call_claude(
+            prompt=user_prompt,
+            system_prompt=system_prompt,
+            max_tokens=1024,
+            temperature=0.0,
+            expect_json=True
+        )
+
+        confirmed = []
+        for verdict in response.get("pairs", []):
+            number = verdict.get("pair")
+            if not verdict.get("same") or not isinstance(number, int) or not 0 < number <= len(pairs):
+                continue
+            a, b = pairs[number - 1]
+            confirmed.append((a, b, float(verdict.get("confidence", 0.0))))
+        return confirmed
 
     def _find_confluent_themes(
         self,
@@ -549,9 +590,10 @@ Return ONLY valid JSON."""
         by_ticker = defaultdict(list)
 
         for score in confluence_scores:
-            # Get tickers from original analysis
-            tickers = []
-            if "full_analysis" in score:
+            # Prefer canonical tickers from the mention index; fall back to
+            # the raw list in the original analysis
+            tickers = score.get("tickers") or []
+            if not tickers and "full_analysis" in score:
                 tickers = score["full_analysis"].get("tickers_mentioned", []) or []
 
             variant_view = score.get("variant_view", "")
@@ -263,7 +263,8 @@ class PDFAnalyzerAgent(BaseAgent):
     def extract_images(
         self,
         pdf_path: str,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        page_index: Optional[Any] = None
     ) -> List[Dict[str, Any]]:
         """
         Extract all images from PDF using PyMuPDF.
@@ -271,6 +272,8 @@ class PDFAnalyzerAgent(BaseAgent):
         Args:
             pdf_path: Path to PDF file
             output_dir: Directory to save extracted images (defaults to temp dir)
+            page_index: Optional PageTextIndex (agents.transcript_chart_matcher),
+                filled with each page's text and images in the same pass
 
         Returns:
             List of extracted image metadata
@@ -293,6 +296,9 @@ class PDFAnalyzerAgent(BaseAgent):
             for page_num in range(len(doc)):
                 page = doc[page_num]
 
+                if page_index is not None:
+                    page_index.add_page(page_num + 1, page.get_text())
+
                 # Get list of images on this page
                 image_list = page.get_images(full=True)
 
@@ -324,6 +330,8 @@ class PDFAnalyzerAgent(BaseAgent):
                     }
 
                     extracted_images.append(image_metadata)
+                    if page_index is not None:
+                        page_index.add_image(page_num + 1, image_path)
 
                     logger.debug(
                         f"Extracted image {img_index + 1} from page {page_num + 1}: "
@@ -378,8 +386,12 @@ class PDFAnalyzerAgent(BaseAgent):
         try:
             logger.info(f"Starting image analysis pipeline for: {pdf_path}")
 
-            # Step 1: Extract images
-            extracted_images = self.extract_images(pdf_path)
+            # Step 1: Extract images (indexing page text when transcript matching will use it)
+            page_index = None
+            if transcript and source == "42macro":
+                from agents.transcript_chart_matcher import PageTextIndex
+                page_index = PageTextIndex()
+            extracted_images = self.extract_images(pdf_path, page_index=page_index)
             logger.info(f"Extracted {len(extracted_images)} images")
 
             if not extracted_images:
@@ -396,7 +408,8 @@ class PDFAnalyzerAgent(BaseAgent):
                 match_result = matcher.prioritize_for_analysis(
                     transcript=transcript,
                     all_images=extracted_images,
-                    max_analyze=image_limit or 15  # Default to 15 if no limit specified
+                    max_analyze=image_limit or 15,  # Default to 15 if no limit specified
+                    page_index=page_index
                 )
 
                 if match_result["status"] == "success":
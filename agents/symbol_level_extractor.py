@@ -33,6 +33,50 @@ class CompassType(Enum):
     UNKNOWN = "unknown"
 
 
+def _sweep_staleness(db: Session):
+    """Run the set-based staleness sweep after an extraction; never fails the save."""
+    from backend.utils.staleness_manager import check_and_mark_stale_data
+
+    try:
+        check_and_mark_stale_data(db)
+    except Exception as e:
+        logger.warning(f"Post-extraction staleness sweep failed: {e}")
+
+
+def _upsert_states(db: Session, rows: List[Dict[str, Any]]):
+    """
+    INSERT ... ON CONFLICT (symbol) DO UPDATE for SymbolState rows.
+
+    Rows sharing a column set go out as one executemany. KT primary
+    target/invalidation keep the stored value when the row has none, and
+    primary support only moves up, matching the per-row merge it replaces.
+    """
+    from sqlalchemy import case, func, or_
+
+    from backend.models import SymbolState
+    from backend.utils.upsert import dialect_insert
+
+    table = SymbolState.__table__
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+
+    for columns, group in groups.items():
+        stmt = dialect_insert(db.get_bind().dialect.name, table)
+        set_ = {}
+        for col in columns:
+            if col == "symbol":
+                continue
+            new, old = stmt.excluded[col], table.c[col]
+            if col in ("kt_primary_target", "kt_invalidation"):
+                set_[col] = func.coalesce(new, old)
+            elif col == "kt_primary_support":
+                set_[col] = case((or_(old.is_(None), new > old), func.coalesce(new, old)), else_=old)
+            else:
+                set_[col] = new
+        db.execute(stmt.on_conflict_do_update(index_elements=["symbol"], set_=set_), group)
+
+
 class SymbolLevelExtractor(BaseAgent):
     """
     Extracts price levels and wave counts for tracked symbols.
@@ -93,6 +137,12 @@ class SymbolLevelExtractor(BaseAgent):
     # Transcript chunking: Long videos (30+ min) must be split to avoid "lost in middle" errors
     CHUNK_SIZE_MINUTES = 5  # Split transcripts every 5 minutes or by speaker change
 
+    # Text content eligible for level extraction (run_symbol_extraction, bulk backfills)
+    TEXT_SOURCES = ("kt_technical", "discord")
+    TEXT_CONTENT_TYPES = ("blog_post", "discord_message", "transcript", "video")
+    MIN_TEXT_CHARS = 100
+    MAX_TRANSCRIPT_CHARS = 15000
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -163,18 +213,16 @@ class SymbolLevelExtractor(BaseAgent):
 
             # Sanitize and truncate for prompt
             safe_transcript = sanitize_content_text(transcript)
-            truncated = truncate_for_prompt(safe_transcript, max_chars=15000)
+            truncated = truncate_for_prompt(safe_transcript, max_chars=self.MAX_TRANSCRIPT_CHARS)
 
-            # Build extraction prompt
-            prompt = self._build_transcript_extraction_prompt(truncated, source)
-
-            # Call Claude
+            # Call Claude (static instructions cached, transcript sent after them)
             result = self.call_claude(
-                prompt=prompt,
+                prompt=self._build_transcript_content_prompt(truncated),
                 system_prompt=self._get_transcript_extraction_system_prompt(),
                 max_tokens=16384,
                 temperature=0.0,
-                expect_json=True
+                expect_json=True,
+                cached_context=self._get_transcript_extraction_instructions()
             )
 
             # Validate and normalize
@@ -658,18 +706,14 @@ Be rigorous:
 
 You must respond with valid JSON only."""
 
-    def _build_transcript_extraction_prompt(self, transcript: str, source: str) -> str:
+    def _get_transcript_extraction_instructions(self) -> str:
         """
-        Build the extraction prompt for transcripts.
+        Static transcript extraction instructions and output format.
 
-        Args:
-            transcript: Sanitized transcript text
-            source: Source type
-
-        Returns:
-            Formatted prompt
+        Identical for every transcript, so it is sent as a cached block
+        ahead of the content (see BaseAgent.call_claude cached_context).
         """
-        return f"""Extract price levels for specific symbols from this investment research content.
+        return """Extract price levels for specific symbols from this investment research content.
 
 TRACKED SYMBOLS: SPX, QQQ, IWM, BTC, SMH, TSLA, NVDA, GOOGL, AAPL, MSFT, AMZN
 (Also match aliases: "Google"=GOOGL, "Nasdaq"=QQQ, "S&P"=SPX, "Russell"=IWM, etc.)
@@ -693,22 +737,17 @@ For each level, you MUST also extract:
 - context_snippet: The exact 5-10 words surrounding this level in the transcript
 - invalidation_price: At what price does THIS LEVEL become invalid? (e.g., "support at 313 invalid if we lose 308")
 
-**Content to analyze:**
-<user_content>
-{transcript}
-</user_content>
-
 Return JSON in this format:
-{{
+{
   "symbols": [
-    {{
+    {
       "symbol": "GOOGL",
       "bias": "bullish",
       "wave_position": "wave_4",
       "wave_direction": "up",
       "wave_phase": "impulse",
       "levels": [
-        {{
+        {
           "type": "support",
           "price": 313.04,
           "fib": "0.382",
@@ -716,23 +755,47 @@ Return JSON in this format:
           "context": "wave iv retracement",
           "context_snippet": "support likely holding at 313 if bulls defend",
           "invalidation_price": 308.27
-        }},
-        {{
+        },
+        {
           "type": "target",
           "price": 330,
           "direction": "neutral",
           "context": "wave 5 completion",
           "context_snippet": "looking for wave 5 to complete around 328 to 330",
           "invalidation_price": null
-        }}
+        }
       ],
       "notes": "Monster breakout from 270 low, looking for wave 5 to 328-330 if 310 support holds"
-    }}
+    }
   ],
   "extraction_confidence": 0.9
-}}
+}"""
 
-Return ONLY valid JSON, no markdown formatting."""
+    def _build_transcript_content_prompt(self, transcript: str) -> str:
+        """Per-transcript part of the extraction prompt."""
+        return f"""**Content to analyze:**
+<user_content>
+{transcript}
+</user_content>
+
+Return ONLY valid JSON in the format above, no markdown formatting."""
+
+    def _build_transcript_extraction_prompt(self, transcript: str, source: str) -> str:
+        """
+        Build the full extraction prompt for transcripts.
+
+        Args:
+            transcript: Sanitized transcript text
+            source: Source type
+
+        Returns:
+            Formatted prompt (instructions followed by the content)
+        """
+        return (
+            self._get_transcript_extraction_instructions()
+            + "\n\n"
+            + self._build_transcript_content_prompt(transcript)
+        )
 
     def _get_chart_vision_prompt(self) -> str:
         """Prompt for chart image vision analysis."""
@@ -900,8 +963,9 @@ You must respond with valid JSON only."""
         """
         Save extraction results to database.
 
-        Creates SymbolLevel records for each level and updates SymbolState
-        for each symbol. Calculates confluence scores after saving.
+        Upserts one SymbolState per symbol (INSERT ... ON CONFLICT) and
+        bulk-inserts the SymbolLevel rows, then recalculates confluence for
+        the affected symbols in one pass before a single commit.
 
         Args:
             db: Database session
@@ -912,8 +976,12 @@ You must respond with valid JSON only."""
         Returns:
             Summary of saved records
         """
-        from backend.models import SymbolLevel, SymbolState
-        from backend.utils.staleness_manager import update_symbol_confluence
+        from sqlalchemy import insert
+
+        from backend.models import SymbolLevel
+        from backend.services.level_index import get_level_index, level_entry
+        from backend.services.symbol_snapshot import get_symbol_snapshot
+        from backend.utils.staleness_manager import apply_confluence_for_symbols
 
         summary = {
             "symbols_processed": 0,
@@ -924,6 +992,9 @@ You must respond with valid JSON only."""
 
         try:
             symbols_data = extraction_result.get("symbols", [])
+            now = datetime.utcnow()
+            state_rows: Dict[str, Dict[str, Any]] = {}
+            level_rows = []
 
             for sym_data in symbols_data:
                 symbol = sym_data.get("symbol")
@@ -931,74 +1002,87 @@ You must respond with valid JSON only."""
                     continue
 
                 try:
-                    # Get or create SymbolState
-                    state = db.query(SymbolState).filter_by(symbol=symbol).first()
-                    if not state:
-                        state = SymbolState(symbol=symbol)
-                        db.add(state)
-                        db.flush()
-
-                    # Update state based on source
-                    now = datetime.utcnow()
+                    # Repeated symbols merge into one row, later entries winning
+                    row = state_rows.get(symbol, {"symbol": symbol})
 
                     if source == 'kt_technical':
-                        state.kt_wave_position = sym_data.get("wave_position")
-                        state.kt_wave_direction = sym_data.get("wave_direction")
-                        state.kt_wave_phase = sym_data.get("wave_phase")
-                        state.kt_bias = sym_data.get("bias")
-                        state.kt_notes = sym_data.get("notes")
-                        state.kt_last_updated = now
-                        state.kt_is_stale = False
-                        state.kt_stale_warning = None
-                        state.kt_source_content_id = content_id
-
-                        # Extract primary target/support/invalidation from levels
+                        row.update(
+                            kt_wave_position=sym_data.get("wave_position"),
+                            kt_wave_direction=sym_data.get("wave_direction"),
+                            kt_wave_phase=sym_data.get("wave_phase"),
+                            kt_bias=sym_data.get("bias"),
+                            kt_notes=sym_data.get("notes"),
+                            kt_last_updated=now,
+                            kt_is_stale=False,
+                            kt_stale_warning=None,
+                            kt_stale_since=None,
+                            kt_source_content_id=content_id
+                        )
+
+                        # Primary target/support/invalidation from levels; None keeps
+                        # the stored value and support only moves up (see _upsert_states)
+                        target = row.get("kt_primary_target")
+                        support = row.get("kt_primary_support")
+                        invalidation = row.get("kt_invalidation")
                         for level in sym_data.get("levels", []):
                             level_type = level.get("type")
                             price = level.get("price")
                             if level_type == "target" and price:
-                                state.kt_primary_target = price
+                                target = price
                             elif level_type == "support" and price:
-                                if not state.kt_primary_support or price > state.kt_primary_support:
-                                    state.kt_primary_support = price
+                                if not support or price > support:
+                                    support = price
                             elif level_type == "invalidation" and price:
-                                state.kt_invalidation = price
+                                invalidation = price
+                        row.update(
+                            kt_primary_target=target,
+                            kt_primary_support=support,
+                            kt_invalidation=invalidation
+                        )
 
                     elif source == 'discord':
                         # For Discord text posts with quadrant info
                         if "quadrant" in sym_data:
-                            state.discord_quadrant = sym_data.get("quadrant")
-                            state.discord_iv_regime = sym_data.get("iv_regime")
-                            state.discord_strategy_rec = sym_data.get("strategy_rec")
-                        state.discord_notes = sym_data.get("notes")
-                        state.discord_last_updated = now
-                        state.discord_is_stale = False
-                        state.discord_source_content_id = content_id
-
-                    state.updated_at = now
+                            row.update(
+                                discord_quadrant=sym_data.get("quadrant"),
+                                discord_iv_regime=sym_data.get("iv_regime"),
+                                discord_strategy_rec=sym_data.get("strategy_rec")
+                            )
+                        row.update(
+                            discord_notes=sym_data.get("notes"),
+                            discord_last_updated=now,
+                            discord_is_stale=False,
+                            discord_stale_since=None,
+                            discord_source_content_id=content_id
+                        )
+
+                    row.update(updated_at=now, stale_since=None)
+                    state_rows[symbol] = row
                     summary["states_updated"] += 1
 
-                    # Create SymbolLevel records for each level
+                    # SymbolLevel rows for each level, inserted in one executemany
                     for level in sym_data.get("levels", []):
-                        level_record = SymbolLevel(
-                            symbol=symbol,
-                            source=source,
-                            level_type=level.get("type", "unknown"),
-                            price=level.get("price"),
-                            price_upper=level.get("price_upper"),
-                            significance=level.get("significance"),
-                            direction=level.get("direction"),
-                            wave_context=level.get("context"),
-                            fib_level=level.get("fib"),
-                            context_snippet=level.get("context_snippet"),
-                            confidence=extraction_result.get("extraction_confidence", 0.8),
-                            extracted_from_content_id=content_id,
-                            extraction_method=sym_data.get("extraction_method", "transcript"),
-                            invalidation_price=level.get("invalidation_price"),
-                            is_active=True,
-                            is_stale=False
-                        )
-                        db.add(level_record)
+                        if level.get("price") is None:
+                            summary["errors"].append(f"{symbol}: {level.get('type', 'unknown')} level has no price")
+                            continue
+                        level_rows.append({
+                            "symbol": symbol,
+                            "source": source,
+                            "level_type": level.get("type", "unknown"),
+                            "price": level.get("price"),
+                            "price_upper": level.get("price_upper"),
+                            "significance": level.get("significance"),
+                            "direction": level.get("direction"),
+                            "wave_context": level.get("context"),
+                            "fib_level": level.get("fib"),
+                            "context_snippet": level.get("context_snippet"),
+                            "confidence": extraction_result.get("extraction_confidence", 0.8),
+                            "extracted_from_content_id": content_id,
+                            "extraction_method": sym_data.get("extraction_method", "transcript"),
+                            "invalidation_price": level.get("invalidation_price"),
+                            "is_active": True,
+                            "is_stale": False
+                        })
                         summary["levels_created"] += 1
 
                     summary["symbols_processed"] += 1
@@ -1007,17 +1091,27 @@ You must respond with valid JSON only."""
                     logger.error(f"Error saving data for {symbol}: {e}")
                     summary["errors"].append(f"{symbol}: {str(e)}")
 
-            # Commit all changes
+            symbols = list(state_rows)
+            _upsert_states(db, list(state_rows.values()))
+
+            new_levels = []
+            if level_rows:
+                # RETURNING the inserted rows gives the ids for the level index
+                inserted = db.execute(
+                    insert(SymbolLevel.__table__).returning(*SymbolLevel.__table__.c),
+                    level_rows
+                ).all()
+                new_levels = [level_entry(row) for row in inserted]
+
+            # Confluence for all processed symbols, committed with the upsert
+            apply_confluence_for_symbols(db, symbols)
             db.commit()
 
-            # Update confluence scores for all processed symbols
-            for sym_data in symbols_data:
-                symbol = sym_data.get("symbol")
-                if symbol:
-                    try:
-                        update_symbol_confluence(db, symbol)
-                    except Exception as e:
-                        logger.warning(f"Failed to update confluence for {symbol}: {e}")
+            get_level_index().add_levels(new_levels)
+            # New levels change active counts - refresh just these symbols
+            get_symbol_snapshot().refresh(db, symbols)
+
+            _sweep_staleness(db)
 
             logger.info(f"Saved extraction: {summary['symbols_processed']} symbols, "
                        f"{summary['levels_created']} levels, {summary['states_updated']} states updated")
@@ -1039,7 +1133,8 @@ You must respond with valid JSON only."""
         """
         Save Stock Compass extraction results to database.
 
-        Updates SymbolState with Discord quadrant/IV data.
+        Upserts SymbolState Discord quadrant/IV data for every compass item
+        and recalculates confluence in the same transaction.
 
         Args:
             db: Database session
@@ -1049,8 +1144,8 @@ You must respond with valid JSON only."""
         Returns:
             Summary of saved records
         """
-        from backend.models import SymbolState
-        from backend.utils.staleness_manager import update_symbol_confluence
+        from backend.services.symbol_snapshot import get_symbol_snapshot
+        from backend.utils.staleness_manager import apply_confluence_for_symbols
 
         summary = {
             "symbols_processed": 0,
@@ -1061,46 +1156,35 @@ You must respond with valid JSON only."""
         try:
             compass_data = compass_result.get("compass_data", [])
             now = datetime.utcnow()
+            state_rows: Dict[str, Dict[str, Any]] = {}
 
             for item in compass_data:
                 symbol = item.get("symbol")
                 if not symbol:
                     continue
 
-                try:
-                    # Get or create SymbolState
-                    state = db.query(SymbolState).filter_by(symbol=symbol).first()
-                    if not state:
-                        state = SymbolState(symbol=symbol)
-                        db.add(state)
-                        db.flush()
-
-                    # Update Discord state from compass
-                    state.discord_quadrant = item.get("quadrant")
-                    state.discord_iv_regime = item.get("iv_regime")
-                    state.discord_last_updated = now
-                    state.discord_is_stale = False
-                    state.discord_source_content_id = content_id
-                    state.updated_at = now
-
-                    summary["states_updated"] += 1
-                    summary["symbols_processed"] += 1
-
-                except Exception as e:
-                    logger.error(f"Error saving compass data for {symbol}: {e}")
-                    summary["errors"].append(f"{symbol}: {str(e)}")
-
-            # Commit all changes
+                # Update Discord state from compass
+                state_rows[symbol] = {
+                    "symbol": symbol,
+                    "discord_quadrant": item.get("quadrant"),
+                    "discord_iv_regime": item.get("iv_regime"),
+                    "discord_last_updated": now,
+                    "discord_is_stale": False,
+                    "discord_stale_since": None,
+                    "discord_source_content_id": content_id,
+                    "updated_at": now,
+                    "stale_since": None
+                }
+                summary["states_updated"] += 1
+                summary["symbols_processed"] += 1
+
+            symbols = list(state_rows)
+            _upsert_states(db, list(state_rows.values()))
+            apply_confluence_for_symbols(db, symbols)
             db.commit()
+            get_symbol_snapshot().refresh(db, symbols)
 
-            # Update confluence scores
-            for item in compass_data:
-                symbol = item.get("symbol")
-                if symbol:
-                    try:
-                        update_symbol_confluence(db, symbol)
-                    except Exception as e:
-                        logger.warning(f"Failed to update confluence for {symbol}: {e}")
+            _sweep_staleness(db)
 
             logger.info(f"Saved compass data: {summary['symbols_processed']} symbols updated")
 
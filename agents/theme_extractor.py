@@ -12,6 +12,18 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from agents.base_agent import BaseAgent
+from agents.config import (
+    THEME_CANDIDATE_THRESHOLD,
+    THEME_MATCH_THRESHOLD,
+    THEME_MATCH_TOP_K,
+)
+from backend.utils.text_similarity import (
+    TermIndex,
+    normalize_name,
+    parse_aliases,
+    stored_terms,
+    theme_terms,
+)
 from backend.utils.sanitization import wrap_content_for_prompt, sanitize_content_text
 
 logger = logging.getLogger(__name__)
@@ -135,30 +147,81 @@ Respond with JSON:
         """
         Match newly extracted themes against existing themes.
 
+        A local TF-IDF prefilter (backend.utils.text_similarity) settles
+        exact name/alias hits and near-identical themes as updates, and themes
+        with no similar candidate as creates. Only the remaining ambiguous
+        themes go to Claude, each with its top-k nearest existing themes, so
+        the prompt does not grow with the theme history.
+
         Args:
             new_themes: Themes extracted from current synthesis
             existing_themes: Existing themes from database
 
         Returns:
-            List of match results with actions (create, update, evolve, merge_suggestion)
+            List of match results with actions (create, update, evolve, merge_suggestion),
+            in new_themes order
         """
         if not new_themes:
             return []
 
         if not existing_themes:
             # No existing themes, all are new
-            return [
-                {
-                    "new_theme": theme,
-                    "action": "create",
-                    "match_id": None,
-                    "is_evolution": False
-                }
-                for theme in new_themes
-            ]
+            return [self._create_match(theme) for theme in new_themes]
+
+        index = TermIndex({theme.get("id"): stored_terms(theme) for theme in existing_themes})
+        by_label: Dict[str, Any] = {}
+        for theme in existing_themes:
+            for label in [theme.get("name")] + parse_aliases(theme.get("aliases")):
+                normalized = normalize_name(label)
+                if normalized:
+                    by_label.setdefault(normalized, theme.get("id"))
+
+        resolved: Dict[int, Dict[str, Any]] = {}
+        shortlists: Dict[int, List[Any]] = {}
+        for position, theme in enumerate(new_themes):
+            exact_id = by_label.get(normalize_name(theme.get("name")))
+            if exact_id is not None:
+                resolved[position] = self._update_match(theme, exact_id, 1.0)
+                continue
+
+            candidates = index.nearest(
+                theme_terms(theme.get("name"), theme.get("description")),
+                k=THEME_MATCH_TOP_K,
+                min_score=THEME_CANDIDATE_THRESHOLD
+            )
+            if not candidates:
+                resolved[position] = self._create_match(theme)
+            elif candidates[0][1] >= THEME_MATCH_THRESHOLD:
+                resolved[position] = self._update_match(theme, candidates[0][0], candidates[0][1])
+            else:
+                shortlists[position] = [theme_id for theme_id, _ in candidates]
+
+        logger.info(
+            f"Theme prefilter: {len(resolved)} resolved locally, "
+            f"{len(shortlists)} sent for matching against {len(existing_themes)} existing"
+        )
+        if shortlists:
+            resolved.update(self._match_ambiguous(new_themes, existing_themes, shortlists))
+
+        return [resolved[position] for position in range(len(new_themes))]
+
+    def _match_ambiguous(
+        self,
+        new_themes: List[Dict[str, Any]],
+        existing_themes: List[Dict[str, Any]],
+        shortlists: Dict[int, List[Any]]
+    ) -> Dict[int, Dict[str, Any]]:
+        """Ask Claude to adjudicate ambiguous themes against their shortlisted candidates."""
+        shortlisted_ids = {theme_id for ids in shortlists.values() for theme_id in ids}
+        candidates = [theme for theme in existing_themes if theme.get("id") in shortlisted_ids]
+        ambiguous = [
+            dict(new_themes[position], candidate_theme_ids=ids)
+            for position, ids in shortlists.items()
+        ]
+        positions = {new_themes[position].get("name"): position for position in shortlists}
 
         # Build matching prompt
-        prompt = self._build_matching_prompt(new_themes, existing_themes)
+        prompt = self._build_matching_prompt(ambiguous, candidates)
 
         try:
             response = self.call_claude(
@@ -169,22 +232,48 @@ Respond with JSON:
                 expect_json=True
             )
 
-            matches = response.get("matches", [])
-            logger.info(f"Matched {len(matches)} themes")
-            return matches
+            matched: Dict[int, Dict[str, Any]] = {}
+            for match in response.get("matches", []):
+                position = positions.get(match.get("new_theme_name"))
+                if position is None or position in matched:
+                    continue
+                match.setdefault("new_theme", new_themes[position])
+                matched[position] = match
+            logger.info(f"Matched {len(matched)} themes")
 
         except Exception as e:
             logger.error(f"Theme matching failed: {str(e)}")
             # Fallback: treat all as new
-            return [
-                {
-                    "new_theme": theme,
-                    "action": "create",
-                    "match_id": None,
-                    "is_evolution": False
-                }
-                for theme in new_themes
+            matched = {}
+
+        for position in shortlists:
+            if position not in matched:
+                matched[position] = self._create_match(new_themes[position])
+        return matched
+
+    @staticmethod
+    def _create_match(theme: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "new_theme": theme,
+            "action": "create",
+            "match_id": None,
+            "is_evolution": False
+        }
+
+    @staticmethod
+    def _update_match(theme: Dict[str, Any], match_id: Any, similarity: float) -> Dict[str, Any]:
+        return {
+            "new_theme_name": theme.get("name"),
+            "new_theme": theme,
+            "action": "update",
+            "match_id": match_id,
+            "is_evolution": False,
+            "similarity": similarity,
+            "evidence_to_add": [
+                {"source": source, "summary": summary}
+                for source, summary in (theme.get("sources") or {}).items()
             ]
+        }
 
     def _build_matching_prompt(
         self,
@@ -218,6 +307,9 @@ Respond with JSON:
 
 ---
 
+Each new theme may list candidate_theme_ids: the closest existing themes by wording.
+Only match against existing themes listed here.
+
 For each new theme, determine:
 1. Does it match an existing theme? (same concept, different wording)
 2. Is it an evolution of an existing theme? (concept has developed/changed)
@@ -322,7 +414,8 @@ def extract_and_track_themes(
             "name": theme.name,
             "aliases": aliases,
             "status": theme.status,
-            "description": theme.description
+            "description": theme.description,
+            "similarity_terms": theme.similarity_terms
         })
 
     # Match themes
@@ -393,15 +486,19 @@ def extract_and_track_themes(
                 # Parse existing evidence
                 evidence = json.loads(theme.source_evidence) if theme.source_evidence else {}
 
-                # Add new evidence
-                evidence_to_add = match.get("evidence_to_add", {})
-                source = evidence_to_add.get("source")
-                if source:
+                # Add new evidence (one entry from Claude, one per source from the prefilter)
+                evidence_to_add = match.get("evidence_to_add") or []
+                if isinstance(evidence_to_add, dict):
+                    evidence_to_add = [evidence_to_add]
+                for item in evidence_to_add:
+                    source = item.get("source")
+                    if not source:
+                        continue
                     if source not in evidence:
                         evidence[source] = []
                     evidence[source].append({
                         "date": now.strftime("%Y-%m-%d"),
-                        "summary": evidence_to_add.get("summary", ""),
+                        "summary": item.get("summary", ""),
                         "strength": _evidence_strength_for_source(source)
                     })
 
@@ -6,15 +6,29 @@ Reduces cost by only analyzing charts that are actually discussed in the video.
 
 Use case: 42 Macro videos discuss ~10-15 of 70-80 PDF slides
 Cost reduction: 85% (from $0.40 to $0.06 per video)
+
+The transcript is tagged in one pass with a precompiled scanner (chart
+keywords + asset aliases as a single alternation); chart topics are then
+matched against a PageTextIndex (inverted index of PDF page text -> images)
+built while the PDF's images are extracted.
 """
 
+import bisect
 import logging
+import math
 import re
-from typing import Dict, Any, List, Optional
-from difflib import SequenceMatcher
+from collections import Counter
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from backend.utils.text_similarity import tokenize
 
 logger = logging.getLogger(__name__)
 
+# Words that describe the slide itself rather than its subject
+_SLIDE_WORDS = frozenset({"chart", "graph", "slide", "data", "page", "showing", "look", "looking"})
+
+_SEGMENT = re.compile(r"[^.!?]+")
+
 
 class TranscriptChartMatcher:
     """
@@ -54,6 +68,25 @@ class TranscriptChartMatcher:
         r"\b(?:Fed|FOMC|rates|policy)\b",
     ]
 
+    # Canonical tag per ASSET_PATTERNS entry, shared by transcript and page text
+    ASSET_TAGS = ["spx", "qqq", "dxy", "vix", "tlt", "gld", "btc", "cpi", "gdp", "fed"]
+
+    # Precompiled scanners (built once per process)
+    _CHART_RES = [re.compile(pattern, re.IGNORECASE) for pattern in CHART_PATTERNS]
+    _ASSET_RE = re.compile(
+        "|".join(f"(?P<{tag}>{pattern})" for tag, pattern in zip(ASSET_TAGS, ASSET_PATTERNS)),
+        re.IGNORECASE
+    )
+    # Keywords keep their substring semantics; assets get one named group each
+    _SCANNER = re.compile(
+        "(?P<keyword>" + "|".join(re.escape(kw) for kw in sorted(CHART_KEYWORDS, key=len, reverse=True)) + ")|"
+        + _ASSET_RE.pattern,
+        re.IGNORECASE
+    )
+
+    # Normalized page-text score at or above which an image is high priority
+    HIGH_PRIORITY_SCORE = 0.5
+
     def __init__(self):
         """Initialize the matcher."""
         logger.info("Initialized TranscriptChartMatcher")
@@ -74,25 +107,22 @@ class TranscriptChartMatcher:
             mentions = []
 
             # Split transcript into segments (by sentence or time if available)
-            segments = self._segment_transcript(transcript)
-
-            for i, segment in enumerate(segments):
-                segment_lower = segment.lower()
+            segments, starts = self._segment_spans(transcript)
+            keywords, assets = self._scan(transcript, starts)
 
-                # Check if this segment discusses a chart
-                has_chart_keyword = any(kw in segment_lower for kw in self.CHART_KEYWORDS)
+            for i in sorted(keywords):
+                segment = segments[i]
 
-                if has_chart_keyword:
-                    # Extract what chart is being discussed
-                    chart_topics = self._extract_topics(segment)
+                # Segment discusses a chart: extract what chart is being discussed
+                chart_topics = self._extract_topics(segment, assets.get(i, []))
 
-                    if chart_topics:
-                        mentions.append({
-                            "segment_index": i,
-                            "topics": chart_topics,
-                            "text_snippet": segment[:200],  # First 200 chars
-                            "confidence": self._calculate_confidence(segment)
-                        })
+                if chart_topics:
+                    mentions.append({
+                        "segment_index": i,
+                        "topics": chart_topics,
+                        "text_snippet": segment[:200],  # First 200 chars
+                        "confidence": self._calculate_confidence(segment, keywords[i])
+                    })
 
             logger.info(f"Found {len(mentions)} chart mentions")
             return mentions
@@ -116,12 +146,60 @@ class TranscriptChartMatcher:
         sentences = re.split(r'[.!?]+', transcript)
         return [s.strip() for s in sentences if s.strip()]
 
-    def _extract_topics(self, text: str) -> List[str]:
+    def _segment_spans(self, transcript: str) -> Tuple[List[str], List[int]]:
+        """
+        Segments as in _segment_transcript, plus each segment's start offset.
+
+        Args:
+            transcript: Full transcript
+
+        Returns:
+            (segments, start offsets) in transcript order
+        """
+        segments, starts = [], []
+        for match in _SEGMENT.finditer(transcript):
+            text = match.group(0)
+            stripped = text.strip()
+            if stripped:
+                segments.append(stripped)
+                starts.append(match.start() + (len(text) - len(text.lstrip())))
+        return segments, starts
+
+    def _scan(
+        self,
+        transcript: str,
+        starts: List[int]
+    ) -> Tuple[Dict[int, set], Dict[int, List[str]]]:
+        """
+        Tag the whole transcript in one pass of the combined scanner.
+
+        Args:
+            transcript: Full transcript
+            starts: Segment start offsets from _segment_spans
+
+        Returns:
+            (chart keywords per segment index, asset mentions per segment index)
+        """
+        keywords: Dict[int, set] = {}
+        assets: Dict[int, List[str]] = {}
+        for match in self._SCANNER.finditer(transcript):
+            segment = bisect.bisect_right(starts, match.start()) - 1
+            if segment < 0:
+                continue
+            if match.lastgroup == "keyword":
+                keywords.setdefault(segment, set()).add(match.group(0).lower())
+            else:
+                assets.setdefault(segment, []).append(match.group(0))
+        return keywords, assets
+
+    def _extract_topics(self, text: str, assets: Optional[List[str]] = None) -> List[str]:
         """
         Extract chart topics from text segment.
 
         Args:
             text: Text segment
+            assets: Asset mentions already found by the transcript scan
+                (scanned here when not given)
 
         Returns:
             List of extracted topics
@@ -129,31 +207,29 @@ class TranscriptChartMatcher:
         topics = []
 
         # Try pattern matching first
-        for pattern in self.CHART_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in self._CHART_RES:
+            for match in pattern.finditer(text):
                 topic = match.group(1).strip()
                 if topic and len(topic) > 3:  # Ignore very short matches
                     topics.append(topic)
 
         # Also look for specific assets
-        for pattern in self.ASSET_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                asset = match.group(0).strip()
-                topics.append(asset)
+        if assets is None:
+            assets = [match.group(0) for match in self._ASSET_RE.finditer(text)]
+        topics.extend(asset.strip() for asset in assets)
 
         # Deduplicate and clean
         topics = list(set([t.lower() for t in topics]))
 
         return topics
 
-    def _calculate_confidence(self, text: str) -> float:
+    def _calculate_confidence(self, text: str, keywords: Optional[Iterable[str]] = None) -> float:
         """
         Calculate confidence score for a chart mention.
 
         Args:
             text: Text segment
+            keywords: Distinct chart keywords found in the segment (scanned here when not given)
 
         Returns:
             Confidence score 0.0-1.0
@@ -167,26 +243,50 @@ class TranscriptChartMatcher:
             confidence += 0.3
 
         # Boost for multiple chart keywords
-        keyword_count = sum(1 for kw in self.CHART_KEYWORDS if kw in text_lower)
+        if keywords is None:
+            keyword_count = sum(1 for kw in self.CHART_KEYWORDS if kw in text_lower)
+        else:
+            keyword_count = len(set(keywords))
         confidence += min(keyword_count * 0.1, 0.2)
 
         return min(confidence, 1.0)
 
+    @classmethod
+    def topic_terms(cls, text: str) -> List[str]:
+        """
+        Index terms for a topic or page text: content words plus asset tags.
+
+        Asset aliases map to one tag ("S&P 500", "SPY" -> asset:spx) so a
+        transcript mention finds a slide that uses a different alias.
+        """
+        terms = [term for term in tokenize(text) if len(term) > 2 and term not in _SLIDE_WORDS]
+        terms.extend(f"asset:{match.lastgroup}" for match in cls._ASSET_RE.finditer(text))
+        return terms
+
     def match_to_images(
         self,
         chart_mentions: List[Dict[str, Any]],
-        image_metadata: List[Dict[str, Any]]
+        image_metadata: List[Dict[str, Any]],
+        page_index: Optional["PageTextIndex"] = None
     ) -> List[Dict[str, Any]]:
         """
         Match chart mentions to PDF image metadata.
 
+        With a page_index, images are scored by how strongly their page's
+        text matches the mentioned topics; otherwise by topic substrings in
+        the image filename.
+
         Args:
             chart_mentions: List of extracted chart mentions
             image_metadata: List of image metadata from PDF extraction
+            page_index: Page text index built during PDF image extraction
 
         Returns:
             Prioritized list of images to analyze
         """
+        if page_index is not None and page_index.page_count:
+            return self._match_by_page_text(chart_mentions, image_metadata, page_index)
+
         try:
             logger.info(
                 f"Matching {len(chart_mentions)} mentions to {len(image_metadata)} images"
@@ -242,11 +342,58 @@ class TranscriptChartMatcher:
             logger.error(f"Failed to match images: {e}")
             return []
 
+    def _match_by_page_text(
+        self,
+        chart_mentions: List[Dict[str, Any]],
+        image_metadata: List[Dict[str, Any]],
+        page_index: "PageTextIndex"
+    ) -> List[Dict[str, Any]]:
+        """
+        Score images through the page text index.
+
+        Each topic term is weighted by the confidence of the mentions that
+        used it; page scores are normalized to the best page (1.0), and
+        pages scoring at least HIGH_PRIORITY_SCORE are high priority.
+        """
+        weights: Dict[str, float] = {}
+        for mention in chart_mentions:
+            for topic in mention["topics"]:
+                for term in set(self.topic_terms(topic)):
+                    weights[term] = weights.get(term, 0.0) + mention.get("confidence", 0.5)
+
+        page_scores = page_index.score_pages(weights)
+        if not page_scores:
+            logger.info("No page text matched the mentioned topics")
+            return []
+        best = max(score for score, _ in page_scores.values())
+
+        prioritized_images = []
+        for image in image_metadata:
+            scored = page_scores.get(image.get("page_number"))
+            if not scored:
+                continue
+            score, terms = scored
+            match_score = round(score / best, 3)
+            prioritized_images.append({
+                "image_metadata": image,
+                "match_score": match_score,
+                "matched_topics": terms,
+                "priority": "high" if match_score >= self.HIGH_PRIORITY_SCORE else "medium"
+            })
+
+        prioritized_images.sort(key=lambda x: (-x["match_score"], x["image_metadata"].get("page_number", 0)))
+        logger.info(
+            f"Matched {len(prioritized_images)} images on {len(page_scores)} pages via page text "
+            f"(high priority: {sum(1 for i in prioritized_images if i['priority'] == 'high')})"
+        )
+        return prioritized_images
+
     def prioritize_for_analysis(
         self,
         transcript: str,
         all_images: List[Dict[str, Any]],
-        max_analyze: int = 15
+        max_analyze: int = 15,
+        page_index: Optional["PageTextIndex"] = None
     ) -> Dict[str, Any]:
         """
         Complete pipeline: Extract mentions → Match → Prioritize.
@@ -255,6 +402,7 @@ class TranscriptChartMatcher:
             transcript: Video transcript
             all_images: All extracted PDF images
             max_analyze: Maximum number of images to analyze
+            page_index: Page text index from PDFAnalyzerAgent.extract_images
 
         Returns:
             Prioritization results with images to analyze
@@ -279,7 +427,7 @@ class TranscriptChartMatcher:
                 }
 
             # Step 2: Match mentions to images
-            matched_images = self.match_to_images(chart_mentions, all_images)
+            matched_images = self.match_to_images(chart_mentions, all_images, page_index=page_index)
 
             if not matched_images:
                 logger.warning("No matches found - analyzing first N images")
@@ -334,3 +482,53 @@ class TranscriptChartMatcher:
                 "images_to_analyze": all_images[:max_analyze],  # Fallback
                 "fallback_reason": f"Error: {str(e)}"
             }
+
+
+class PageTextIndex:
+    """
+    Inverted index from PDF page text to the images on that page.
+
+    Filled by PDFAnalyzerAgent.extract_images while it walks the pages, so
+    chart prioritization is a postings lookup rather than a rescan of the
+    PDF (or a guess from image filenames).
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.page_images: Dict[int, List[str]] = {}
+
+    @property
+    def page_count(self) -> int:
+        return len(self.page_images)
+
+    def add_page(self, page_number: int, text: Optional[str]):
+        """Index one page's text (call once per page)."""
+        self.page_images.setdefault(page_number, [])
+        for term, count in Counter(TranscriptChartMatcher.topic_terms(text or "")).items():
+            self.postings.setdefault(term, {})[page_number] = count
+
+    def add_image(self, page_number: int, image_path: str):
+        """Record an image extracted from a page."""
+        self.page_images.setdefault(page_number, []).append(image_path)
+
+    def score_pages(self, weights: Dict[str, float]) -> Dict[int, Tuple[float, List[str]]]:
+        """
+        TF-IDF style page scores for weighted query terms.
+
+        Args:
+            weights: Term -> query weight
+
+        Returns:
+            Page number -> (score, matched terms), for pages with any match
+        """
+        scores: Dict[int, float] = {}
+        matched: Dict[int, List[str]] = {}
+        for term, weight in weights.items():
+            pages = self.postings.get(term)
+            if not pages:
+                continue
+            idf = math.log(1 + self.page_count / len(pages))
+            for page, count in pages.items():
+                scores[page] = scores.get(page, 0.0) + weight * idf * (1 + math.log(count))
+                matched.setdefault(page, []).append(term)
+        return {page: (score, sorted(matched[page])) for page, score in scores.items()}
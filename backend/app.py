@@ -21,6 +21,7 @@ Background Processing (PRD-052):
 Version: 1.0.3 - PRD-052 Background Transcription Processing
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -95,11 +96,70 @@ from backend.utils.rate_limiter import limiter, rate_limit_exceeded_handler
 # Enable/disable background processor via environment variable
 ENABLE_TRANSCRIPTION_PROCESSOR = os.getenv("ENABLE_TRANSCRIPTION_PROCESSOR", "true").lower() == "true"
 
+# PRD-048: Periodic symbol staleness sweep
+ENABLE_STALENESS_SWEEPER = os.getenv("ENABLE_STALENESS_SWEEPER", "true").lower() == "true"
+
+# PRD-045: Periodic reconciliation of incrementally maintained SourceHealth
+ENABLE_SOURCE_HEALTH_RECONCILER = os.getenv("ENABLE_SOURCE_HEALTH_RECONCILER", "true").lower() == "true"
+
+
+def _backfill_derived_tables():
+    """Fill index / rollup tables that their migrations create empty."""
+    from backend.models import SessionLocal
+    from backend.services.activity_rollup import backfill_activity_rollups
+    from backend.services.mention_index import backfill_mention_index
+    from backend.services.theme_rollup import backfill_theme_rollups
+
+    db = SessionLocal()
+    try:
+        rows = backfill_activity_rollups(db)
+        if rows:
+            logger.info(f"Backfilled {rows} content activity rollup rows")
+        counts = backfill_mention_index(db)
+        if counts:
+            logger.info(f"Backfilled mention index for {counts['analyses']} analyses")
+        # Theme rollups are grouped from theme_mentions, so they follow the index
+        rows = backfill_theme_rollups(db)
+        if rows:
+            logger.info(f"Backfilled {rows} theme rollup rows")
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle - startup and shutdown."""
     # Startup
+    # Start listening for real-time events published by other processes
+    try:
+        from backend.routes.websocket import manager
+        await manager.pubsub.start()
+        logger.info(f"Real-time pub/sub started ({manager.pubsub.name})")
+    except Exception as e:
+        logger.error(f"Failed to start real-time pub/sub: {e}")
+
+    # Existing data must be indexed before the endpoints that read it are served
+    try:
+        await asyncio.to_thread(_backfill_derived_tables)
+    except Exception as e:
+        logger.error(f"Failed to backfill derived tables: {e}")
+
+    # Jobs left queued/running by a previous process can never finish
+    try:
+        from backend.models import SessionLocal
+        from backend.services.jobs import fail_interrupted_jobs
+        db = SessionLocal()
+        try:
+            fail_interrupted_jobs(db)
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error(f"Failed to reconcile interrupted jobs: {e}")
+
     if ENABLE_TRANSCRIPTION_PROCESSOR:
         try:
             from backend.workers import start_processor
@@ -110,9 +170,37 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("Transcription processor disabled via ENABLE_TRANSCRIPTION_PROCESSOR=false")
 
+    if ENABLE_STALENESS_SWEEPER:
+        try:
+            from backend.workers import start_sweeper
+            await start_sweeper()
+        except Exception as e:
+            logger.error(f"Failed to start staleness sweeper: {e}")
+
+    if ENABLE_SOURCE_HEALTH_RECONCILER:
+        try:
+            from backend.workers import start_reconciler
+            await start_reconciler()
+        except Exception as e:
+            logger.error(f"Failed to start source health reconciler: {e}")
+
     yield  # App is running
 
     # Shutdown
+    if ENABLE_SOURCE_HEALTH_RECONCILER:
+        try:
+            from backend.workers import stop_reconciler
+            await stop_reconciler()
+        except Exception as e:
+            logger.error(f"Error stopping source health reconciler: {e}")
+
+    if ENABLE_STALENESS_SWEEPER:
+        try:
+            from backend.workers import stop_sweeper
+            await stop_sweeper()
+        except Exception as e:
+            logger.error(f"Error stopping staleness sweeper: {e}")
+
     if ENABLE_TRANSCRIPTION_PROCESSOR:
         try:
             from backend.workers import stop_processor
@@ -121,6 +209,12 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error stopping transcription processor: {e}")
 
+    try:
+        from backend.routes.websocket import manager
+        await manager.pubsub.stop()
+    except Exception as e:
+        logger.error(f"Error stopping real-time pub/sub: {e}")
+
 
 # Initialize FastAPI app with lifespan
 app = FastAPI(
@@ -251,7 +345,7 @@ async def health_check():
 
 
 # Import and include route modules
-from backend.routes import dashboard, websocket, heartbeat, confluence, synthesis, trigger, search, collect, analyze, themes, auth, engagement, symbols, health, quality, content
+from backend.routes import dashboard, websocket, heartbeat, confluence, synthesis, trigger, search, collect, analyze, themes, auth, engagement, symbols, health, quality, content, jobs
 
 app.include_router(auth.router, prefix="/api/auth", tags=["auth"])  # PRD-036: JWT Auth
 app.include_router(engagement.router, prefix="/api", tags=["engagement"])  # PRD-038: User Engagement
@@ -269,6 +363,7 @@ app.include_router(heartbeat.router, prefix="/api", tags=["heartbeat"])
 app.include_router(health.router, prefix="/api", tags=["health"])  # PRD-045: Collection Monitoring
 app.include_router(quality.router, prefix="/api/quality", tags=["quality"])  # PRD-044: Synthesis Quality
 app.include_router(content.router, prefix="/api/content", tags=["content"])  # Content detail retrieval
+app.include_router(jobs.router, prefix="/api/jobs", tags=["jobs"])  # Background job status and progress streams
 
 # Mount static files for frontend assets
 frontend_path = Path(__file__).parent.parent / "frontend"
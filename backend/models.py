@@ -9,7 +9,7 @@ PRD-035: Supports both sync and async sessions for migration.
 """
 
 import logging
-from sqlalchemy import create_engine, event, Column, Integer, String, Float, DateTime, Text, ForeignKey, Boolean, CheckConstraint, Index
+from sqlalchemy import create_engine, event, Column, Integer, String, Float, Date, DateTime, Text, ForeignKey, Boolean, CheckConstraint, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
@@ -148,6 +148,7 @@ class RawContent(Base):
     __table_args__ = (
         Index('idx_source_url', 'source_id', 'url'),
         Index('idx_source_content_type', 'source_id', 'content_type'),
+        Index('idx_raw_collected_at', 'collected_at'),
     )
 
     def __repr__(self):
@@ -174,11 +175,104 @@ class AnalyzedContent(Base):
     confluence_scores = relationship("ConfluenceScore", back_populates="analyzed_content", cascade="all, delete-orphan")
     theme_evidence_items = relationship("ThemeEvidence", back_populates="analyzed_content", cascade="all, delete-orphan")
     bayesian_updates = relationship("BayesianUpdate", back_populates="analyzed_content")
+    ticker_mentions = relationship("TickerMention", back_populates="analyzed_content", cascade="all, delete-orphan")
+    theme_mentions = relationship("ThemeMention", back_populates="analyzed_content", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        Index('idx_analyzed_at', 'analyzed_at'),
+    )
 
     def __repr__(self):
         return f"<AnalyzedContent(id={self.id}, agent='{self.agent_type}', raw_id={self.raw_content_id})>"
 
 
+class TickerMention(Base):
+    """
+    Normalized ticker -> analyzed_content association.
+
+    One row per canonical ticker (SymbolLevelExtractor.SYMBOL_ALIASES applied)
+    per analysis, kept in sync with AnalyzedContent.tickers_mentioned by
+    backend/services/mention_index.py. mentioned_at copies analyzed_at so a
+    per-ticker timeline is a single index range scan.
+    """
+    __tablename__ = "ticker_mentions"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    ticker = Column(String(20), nullable=False)
+    analyzed_content_id = Column(Integer, ForeignKey("analyzed_content.id", ondelete="CASCADE"), nullable=False)
+    mentioned_at = Column(DateTime, nullable=False)
+
+    analyzed_content = relationship("AnalyzedContent", back_populates="ticker_mentions")
+
+    __table_args__ = (
+        Index('idx_ticker_mention_timeline', 'ticker', 'mentioned_at'),
+        Index('idx_ticker_mention_content', 'analyzed_content_id', 'ticker', unique=True),
+    )
+
+    def __repr__(self):
+        return f"<TickerMention(ticker='{self.ticker}', analyzed_content_id={self.analyzed_content_id})>"
+
+
+class ThemeMention(Base):
+    """
+    Normalized theme keyword -> analyzed_content association.
+
+    Keywords are AnalyzedContent.key_themes entries lowercased with
+    whitespace collapsed; maintained alongside TickerMention.
+    """
+    __tablename__ = "theme_mentions"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    keyword = Column(String(200), nullable=False)
+    analyzed_content_id = Column(Integer, ForeignKey("analyzed_content.id", ondelete="CASCADE"), nullable=False)
+    mentioned_at = Column(DateTime, nullable=False)
+
+    analyzed_content = relationship("AnalyzedContent", back_populates="theme_mentions")
+
+    __table_args__ = (
+        Index('idx_theme_mention_timeline', 'keyword', 'mentioned_at'),
+        Index('idx_theme_mention_content', 'analyzed_content_id', 'keyword', unique=True),
+    )
+
+    def __repr__(self):
+        return f"<ThemeMention(keyword='{self.keyword}', analyzed_content_id={self.analyzed_content_id})>"
+
+
+class ThemeDailyRollup(Base):
+    """
+    Daily theme mentions per source.
+
+    One row per (theme keyword, source, day of analyzed_at) counting the
+    analyses that mention the theme, their sentiment mix and conviction.
+    Maintained from ORM flushes (backend/services/theme_rollup.py) so the
+    aggregated themes endpoint groups a few rows per theme and day instead
+    of re-reading every analysis in its lookback window.
+    """
+    __tablename__ = "theme_daily_rollups"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    keyword = Column(String(200), nullable=False)
+    source_id = Column(Integer, ForeignKey("sources.id", ondelete="CASCADE"), nullable=False)
+    day = Column(Date, nullable=False)
+
+    mention_count = Column(Integer, nullable=False, default=0)
+    bullish_count = Column(Integer, nullable=False, default=0)
+    bearish_count = Column(Integer, nullable=False, default=0)
+    neutral_count = Column(Integer, nullable=False, default=0)
+    conviction_sum = Column(Integer, nullable=False, default=0)
+    conviction_count = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index('idx_theme_rollup_key', 'keyword', 'source_id', 'day', unique=True),
+        Index('idx_theme_rollup_day', 'day'),
+    )
+
+    def __repr__(self):
+        return f"<ThemeDailyRollup(keyword='{self.keyword}', source_id={self.source_id}, day={self.day})>"
+
+
 class ConfluenceScore(Base):
     """Pillar-by-pillar confluence scores"""
     __tablename__ = "confluence_scores"
@@ -226,6 +320,44 @@ class ConfluenceScore(Base):
         return f"<ConfluenceScore(id={self.id}, total={self.total_score}, meets_threshold={self.meets_threshold})>"
 
 
+class ContentDailyRollup(Base):
+    """
+    Daily content activity per source and content type.
+
+    Maintained from ORM flushes (backend/services/activity_rollup.py) so
+    dashboard and collection stats read a few aggregate rows instead of
+    counting raw_content / analyzed_content / confluence_scores per request.
+
+    Each counter is bucketed by the day of its own event: collected and
+    processed by raw_content.collected_at, analyzed and conviction by
+    analyzed_at, scored by scored_at.
+    """
+    __tablename__ = "content_daily_rollups"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    source_id = Column(Integer, ForeignKey("sources.id", ondelete="CASCADE"), nullable=False)
+    day = Column(Date, nullable=False)
+    content_type = Column(String, nullable=False)
+
+    collected_count = Column(Integer, nullable=False, default=0)
+    processed_count = Column(Integer, nullable=False, default=0)
+    analyzed_count = Column(Integer, nullable=False, default=0)
+    scored_count = Column(Integer, nullable=False, default=0)
+    conviction_sum = Column(Integer, nullable=False, default=0)
+    conviction_count = Column(Integer, nullable=False, default=0)
+
+    last_collected_at = Column(DateTime)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index('idx_content_rollup_key', 'source_id', 'day', 'content_type', unique=True),
+        Index('idx_content_rollup_day', 'day'),
+    )
+
+    def __repr__(self):
+        return f"<ContentDailyRollup(source_id={self.source_id}, day={self.day}, type='{self.content_type}')>"
+
+
 class Theme(Base):
     """Investment themes being tracked (PRD-024)"""
     __tablename__ = "themes"
@@ -265,6 +397,9 @@ class Theme(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Weighted name/alias/description terms for the local similarity prefilter
+    similarity_terms = Column(Text)  # JSON: {"term": weight}
+
     # Relationships
     evidence_items = relationship("ThemeEvidence", back_populates="theme", cascade="all, delete-orphan")
     bayesian_updates = relationship("BayesianUpdate", back_populates="theme", cascade="all, delete-orphan")
@@ -560,12 +695,50 @@ class SynthesisQualityScore(Base):
         Index('idx_quality_synthesis', 'synthesis_id'),
         Index('idx_quality_score', 'quality_score'),
         Index('idx_quality_grade', 'grade'),
+        Index('idx_quality_created_at', 'created_at'),
     )
 
     def __repr__(self):
         return f"<SynthesisQualityScore(id={self.id}, synthesis_id={self.synthesis_id}, grade='{self.grade}', score={self.quality_score})>"
 
 
+class QualityDailyRollup(Base):
+    """
+    Daily quality score aggregates per grade (PRD-044).
+
+    One row per (day, grade), bumped by an upsert whenever an evaluation is
+    stored, so trend queries read a few rows per day instead of every score.
+    Criterion columns hold sums; divide by evaluations for averages.
+    """
+    __tablename__ = "quality_daily_rollups"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    day = Column(Date, nullable=False)
+    grade = Column(String(2), nullable=False)
+
+    evaluations = Column(Integer, nullable=False, default=0)
+    score_sum = Column(Integer, nullable=False, default=0)
+    score_min = Column(Integer)
+    score_max = Column(Integer)
+
+    confluence_detection_sum = Column(Integer, nullable=False, default=0)
+    evidence_preservation_sum = Column(Integer, nullable=False, default=0)
+    source_attribution_sum = Column(Integer, nullable=False, default=0)
+    youtube_channel_granularity_sum = Column(Integer, nullable=False, default=0)
+    nuance_retention_sum = Column(Integer, nullable=False, default=0)
+    actionability_sum = Column(Integer, nullable=False, default=0)
+    theme_continuity_sum = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index('idx_quality_rollup_day_grade', 'day', 'grade', unique=True),
+    )
+
+    def __repr__(self):
+        return f"<QualityDailyRollup(day={self.day}, grade='{self.grade}', evaluations={self.evaluations})>"
+
+
 class SymbolLevel(Base):
     """
     Price levels per symbol from various sources (PRD-039).
@@ -615,6 +788,7 @@ class SymbolLevel(Base):
     last_confirmed_at = Column(DateTime, default=datetime.utcnow)
     is_stale = Column(Boolean, default=False)
     stale_reason = Column(String(100))
+    stale_since = Column(DateTime)  # Set by the staleness sweep when marked stale
 
     # Relationships
     raw_content = relationship("RawContent", foreign_keys=[extracted_from_content_id])
@@ -680,6 +854,12 @@ class SymbolState(Base):
 
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Read-time staleness (SYMBOL_STALENESS_HOURS), stamped by the staleness sweep
+    # so reads are column fetches; NULL means fresh
+    stale_since = Column(DateTime)
+    kt_stale_since = Column(DateTime)
+    discord_stale_since = Column(DateTime)
+
     # Relationships
     kt_source_content = relationship("RawContent", foreign_keys=[kt_source_content_id])
     discord_source_content = relationship("RawContent", foreign_keys=[discord_source_content_id])
@@ -737,8 +917,10 @@ class SourceHealth(Base):
     """
     Cached health metrics per source (PRD-045).
 
-    Provides at-a-glance health status for each data source,
-    updated periodically or on collection events.
+    Provides at-a-glance health status for each data source. Counters are
+    bumped by ingestion, transcription and collection-run events and
+    recomputed by the periodic reconciliation in backend.services.alerting,
+    so the health endpoint reads this table alone.
     """
     __tablename__ = "source_health"
 
@@ -757,8 +939,17 @@ class SourceHealth(Base):
     items_transcribed_24h = Column(Integer, default=0)
     errors_24h = Column(Integer, default=0)
 
+    # Transcription queue for the source's content ("pending" includes in-flight)
+    transcription_pending = Column(Integer, default=0)
+    transcription_completed = Column(Integer, default=0)
+    transcription_failed = Column(Integer, default=0)
+    transcription_backlog = Column(Integer, default=0)  # Pending >24h, set by reconciliation
+
     # Failure tracking
     consecutive_failures = Column(Integer, default=0)
+    last_failure_at = Column(DateTime)
+
+    reconciled_at = Column(DateTime)
 
     # Staleness (no new content in 48+ hours)
     is_stale = Column(Boolean, default=False)
@@ -825,6 +1016,98 @@ class Alert(Base):
         return f"<Alert(id={self.id}, type='{self.alert_type}', severity='{self.severity}', ack={self.is_acknowledged})>"
 
 
+# ============================================================================
+# API Usage Tracking Model
+# ============================================================================
+
+class ApiUsage(Base):
+    """
+    Daily API usage counters for budget caps.
+
+    One row per UTC day. Counters are only ever incremented through
+    additive upserts so that concurrent workers never lose updates.
+    """
+    __tablename__ = "api_usage"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    date = Column(String, nullable=False, unique=True)  # YYYY-MM-DD (UTC)
+    vision_analyses = Column(Integer, default=0)
+    transcript_analyses = Column(Integer, default=0)
+    text_analyses = Column(Integer, default=0)
+    estimated_cost_usd = Column(Float, default=0.0)
+    notes = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index('idx_api_usage_date', 'date'),
+    )
+
+    def __repr__(self):
+        return f"<ApiUsage(date='{self.date}', cost={self.estimated_cost_usd})>"
+
+
+class ApiTokenUsage(Base):
+    """
+    Daily Claude token counts per agent, including prompt-cache reads/writes.
+
+    One row per (UTC day, agent class). Like api_usage, only ever
+    incremented through additive upserts.
+    """
+    __tablename__ = "api_token_usage"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    date = Column(String, nullable=False)  # YYYY-MM-DD (UTC)
+    agent = Column(String, nullable=False)  # Agent class name
+    calls = Column(Integer, default=0)
+    input_tokens = Column(Integer, default=0)  # Uncached input
+    output_tokens = Column(Integer, default=0)
+    cache_creation_input_tokens = Column(Integer, default=0)  # Written to the prompt cache
+    cache_read_input_tokens = Column(Integer, default=0)  # Served from the prompt cache
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index('idx_api_token_usage_date_agent', 'date', 'agent', unique=True),
+    )
+
+    def __repr__(self):
+        return f"<ApiTokenUsage(date='{self.date}', agent='{self.agent}', calls={self.calls})>"
+
+
+class Job(Base):
+    """
+    Long-running background work (synthesis, batch classification).
+
+    Endpoints return the job id immediately; progress is persisted here so
+    any API worker can report it, and streamed as job_progress events
+    (see backend.services.jobs).
+    """
+    __tablename__ = "jobs"
+
+    id = Column(String, primary_key=True)  # uuid4 hex
+    kind = Column(String, nullable=False)  # "synthesis", "classify_batch"
+    status = Column(String, nullable=False, default="queued")  # queued, running, succeeded, failed
+    params = Column(Text)  # JSON request parameters
+    steps = Column(Text)  # JSON [{"name", "status"}]
+    current_step = Column(String)
+    result = Column(Text)  # JSON summary on success
+    error = Column(Text)
+    created_by = Column(String)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime)
+
+    __table_args__ = (
+        Index('idx_jobs_kind_created', 'kind', 'created_at'),
+        Index('idx_jobs_status', 'status'),
+    )
+
+    def __repr__(self):
+        return f"<Job(id={self.id}, kind={self.kind}, status={self.status})>"
+
+
 # ============================================================================
 # Utility Functions
 # ============================================================================
@@ -874,3 +1157,7 @@ def init_db():
 def drop_all_tables():
     """Drop all tables (use with caution!)"""
     Base.metadata.drop_all(bind=engine)
+
+
+# Register the rollup, mention-index and theme-similarity listeners wherever models are used
+from backend.services import activity_rollup, mention_index, theme_rollup, theme_similarity  # noqa: E402,F401
@@ -4,17 +4,19 @@ Content Analysis Routes
 API endpoints for triggering AI analysis of raw content.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Request
-from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from sqlalchemy.orm import Session, sessionmaker
+from typing import List, Dict, Any, Tuple
+import asyncio
 import logging
 import json
 import os
 
 from backend.models import get_db, RawContent, AnalyzedContent, Source
+from backend.services.jobs import JobTracker, start_job
 from backend.utils.auth import verify_jwt_or_basic
 from backend.utils.rate_limiter import limiter
-from agents.content_classifier import ContentClassifierAgent
+from agents.content_classifier import ContentClassifierAgent, get_pre_route_stats
 from agents.image_intelligence import ImageIntelligenceAgent
 from agents.pdf_analyzer import PDFAnalyzerAgent
 from agents.symbol_level_extractor import SymbolLevelExtractor, CompassType
@@ -22,6 +24,10 @@ from agents.symbol_level_extractor import SymbolLevelExtractor, CompassType
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/analyze", tags=["analyze"])
 
+# Background batch classification: item cap per job and items per progress step
+CLASSIFY_JOB_MAX_ITEMS = int(os.getenv("CLASSIFY_JOB_MAX_ITEMS", "500"))
+CLASSIFY_JOB_CHUNK = int(os.getenv("CLASSIFY_JOB_CHUNK", "25"))
+
 
 # Initialize agents (singletons)
 classifier_agent = None
@@ -79,15 +85,15 @@ def run_symbol_extraction(raw_content, db: Session) -> Dict:
     source_name = raw_content.source.name if raw_content.source else ""
 
     # Only run for KT Technical and Discord sources
-    if source_name not in ('kt_technical', 'discord'):
+    if source_name not in SymbolLevelExtractor.TEXT_SOURCES:
         return {"skipped": True, "reason": f"Source {source_name} not eligible for symbol extraction"}
 
     # Only run for content types with text
-    if raw_content.content_type not in ('blog_post', 'discord_message', 'transcript', 'video'):
+    if raw_content.content_type not in SymbolLevelExtractor.TEXT_CONTENT_TYPES:
         return {"skipped": True, "reason": f"Content type {raw_content.content_type} not eligible"}
 
     content_text = raw_content.content_text
-    if not content_text or len(content_text.strip()) < 100:
+    if not content_text or len(content_text.strip()) < SymbolLevelExtractor.MIN_TEXT_CHARS:
         return {"skipped": True, "reason": "Insufficient text content"}
 
     try:
@@ -424,6 +430,121 @@ def run_pdf_analysis(raw_content, metadata: Dict, db: Session) -> Dict:
         return {"error": str(e)}
 
 
+def content_input(raw_content, source_name: str = None) -> Dict[str, Any]:
+    """Classifier input dict for a RawContent row."""
+    return {
+        "raw_content_id": raw_content.id,
+        "source": source_name or (raw_content.source.name if raw_content.source else "unknown"),
+        "content_type": raw_content.content_type,
+        "content_text": raw_content.content_text,
+        "file_path": raw_content.file_path,
+        "url": raw_content.url,
+        "metadata": json.loads(raw_content.json_metadata) if raw_content.json_metadata else {}
+    }
+
+
+def _save_classification(db: Session, raw_content, result: Dict) -> AnalyzedContent:
+    """Add the classifier AnalyzedContent record for a classification result."""
+    analyzed_content = AnalyzedContent(
+        raw_content_id=raw_content.id,
+        agent_type="classifier",
+        analysis_result=json.dumps(result),
+        key_themes=",".join(result.get("detected_topics", [])),
+        sentiment=None,  # Classifier doesn't determine sentiment
+        conviction=None,  # Classifier doesn't score conviction
+        time_horizon=None
+    )
+    db.add(analyzed_content)
+    return analyzed_content
+
+
+def classify_and_route(db: Session, items: List) -> Tuple[List[Dict], Dict]:
+    """
+    Classify RawContent rows in packed batches, then run the routed agents.
+
+    Items whose input cannot be prepared, or whose routed processing fails,
+    get an error entry; the rest are marked processed. Does not commit.
+
+    Returns:
+        (per-item results, classifier batch stats)
+    """
+    results = []
+    inputs = []
+    for raw_content in items:
+        try:
+            inputs.append((raw_content, content_input(raw_content)))
+        except Exception as e:
+            logger.error(f"Failed to classify content {raw_content.id}: {str(e)}")
+            results.append({"raw_content_id": raw_content.id, "error": str(e)})
+
+    batch = get_classifier().classify_many([content_dict for _, content_dict in inputs])
+
+    for (raw_content, content_dict), result in zip(inputs, batch["results"]):
+        try:
+            # Save classification to database
+            _save_classification(db, raw_content, result)
+
+            # Run specialized agents based on routing
+            route_to = result.get("route_to_agents", [])
+            metadata = content_dict.get("metadata", {})
+            image_results = []
+            pdf_result = {}
+
+            if "pdf_analyzer" in route_to:
+                pdf_result = run_pdf_analysis(raw_content, metadata, db)
+
+            if "image_intelligence" in route_to:
+                image_results = run_image_analysis(raw_content, metadata, db)
+
+            # Analyze text content for blog posts (KT Technical, etc.)
+            # Blog posts route to image_intelligence for charts, but also need
+            # text analysis for themes/sentiment/conviction
+            text_result = {}
+            if raw_content.content_type == "blog_post" and raw_content.content_text:
+                logger.info(f"Running text analysis for blog_post {raw_content.id}")
+                text_result = run_text_analysis(raw_content, metadata, db)
+
+            # PRD-039: Run symbol level extraction for KT Technical and Discord content
+            symbol_result = run_symbol_extraction(raw_content, db)
+            symbols_extracted = symbol_result.get("save_summary", {}).get("symbols_processed", 0)
+
+            # PRD-043: Run compass image extraction for Discord images
+            compass_result = {}
+            compass_symbols = 0
+            if raw_content.content_type == "image":
+                source_name = raw_content.source.name if raw_content.source else ""
+                if source_name == "discord":
+                    try:
+                        compass_result = run_compass_extraction(raw_content, metadata, db)
+                        compass_symbols = compass_result.get("save_summary", {}).get("symbols_processed", 0)
+                    except Exception as compass_err:
+                        logger.warning(f"Compass extraction failed for {raw_content.id} (non-fatal): {compass_err}")
+
+            # Mark as processed
+            raw_content.processed = True
+
+            results.append({
+                "raw_content_id": raw_content.id,
+                "classification": result["classification"],
+                "priority": result["priority"],
+                "route_to": route_to,
+                "pdf_analyzed": "analysis" in pdf_result,
+                "images_analyzed": len([r for r in image_results if "analysis" in r]),
+                "text_analyzed": "analysis" in text_result,
+                "symbols_extracted": symbols_extracted,
+                "compass_symbols": compass_symbols
+            })
+
+        except Exception as e:
+            logger.error(f"Failed to classify content {raw_content.id}: {str(e)}")
+            results.append({
+                "raw_content_id": raw_content.id,
+                "error": str(e)
+            })
+
+    return results, batch["stats"]
+
+
 @router.post("/classify/{raw_content_id}")
 @limiter.limit("10/minute")
 async def classify_content(request: Request, raw_content_id: int, db: Session = Depends(get_db), user: str = Depends(verify_jwt_or_basic)):
@@ -443,34 +564,12 @@ async def classify_content(request: Request, raw_content_id: int, db: Session =
         if not raw_content:
             raise HTTPException(status_code=404, detail=f"Raw content {raw_content_id} not found")
 
-        # Prepare content for classification
-        content_dict = {
-            "raw_content_id": raw_content.id,
-            "source": raw_content.source.name if raw_content.source else "unknown",
-            "content_type": raw_content.content_type,
-            "content_text": raw_content.content_text,
-            "file_path": raw_content.file_path,
-            "url": raw_content.url,
-            "metadata": json.loads(raw_content.json_metadata) if raw_content.json_metadata else {}
-        }
-
         # Run classification
         classifier = get_classifier()
-        result = classifier.classify(content_dict)
+        result = classifier.classify(content_input(raw_content))
 
-        # Save classification result to database
-        analyzed_content = AnalyzedContent(
-            raw_content_id=raw_content.id,
-            agent_type="classifier",
-            analysis_result=json.dumps(result),
-            key_themes=",".join(result.get("detected_topics", [])),
-            sentiment=None,  # Classifier doesn't determine sentiment
-            conviction=None,  # Classifier doesn't score conviction
-            time_horizon=None,
-            # analyzed_at uses default from model
-        )
-
-        db.add(analyzed_content)
+        # Save classification result to database (analyzed_at uses default from model)
+        analyzed_content = _save_classification(db, raw_content, result)
 
         # Mark raw content as processed
         raw_content.processed = True
@@ -507,6 +606,8 @@ async def classify_batch(
     """
     Classify multiple raw content items in batch.
 
+    Runs inline; use POST /classify-batch/jobs for larger batches.
+
     Args:
         limit: Maximum number of items to process
         only_unprocessed: Only process items not yet analyzed
@@ -527,97 +628,8 @@ async def classify_batch(
         if not items:
             return {"message": "No items to process", "count": 0}
 
-        # Process each item
-        results = []
-        classifier = get_classifier()
-
-        for raw_content in items:
-            try:
-                # Prepare content
-                content_dict = {
-                    "raw_content_id": raw_content.id,
-                    "source": raw_content.source.name if raw_content.source else "unknown",
-                    "content_type": raw_content.content_type,
-                    "content_text": raw_content.content_text,
-                    "file_path": raw_content.file_path,
-                    "url": raw_content.url,
-                    "metadata": json.loads(raw_content.json_metadata) if raw_content.json_metadata else {}
-                }
-
-                # Classify
-                result = classifier.classify(content_dict)
-
-                # Save classification to database
-                analyzed_content = AnalyzedContent(
-                    raw_content_id=raw_content.id,
-                    agent_type="classifier",
-                    analysis_result=json.dumps(result),
-                    key_themes=",".join(result.get("detected_topics", [])),
-                    sentiment=None,
-                    conviction=None,
-                    time_horizon=None
-                )
-
-                db.add(analyzed_content)
-
-                # Run specialized agents based on routing
-                route_to = result.get("route_to_agents", [])
-                metadata = content_dict.get("metadata", {})
-                image_results = []
-                pdf_result = {}
-
-                if "pdf_analyzer" in route_to:
-                    pdf_result = run_pdf_analysis(raw_content, metadata, db)
-
-                if "image_intelligence" in route_to:
-                    image_results = run_image_analysis(raw_content, metadata, db)
-
-                # Analyze text content for blog posts (KT Technical, etc.)
-                # Blog posts route to image_intelligence for charts, but also need
-                # text analysis for themes/sentiment/conviction
-                text_result = {}
-                if raw_content.content_type == "blog_post" and raw_content.content_text:
-                    logger.info(f"Running text analysis for blog_post {raw_content.id}")
-                    text_result = run_text_analysis(raw_content, metadata, db)
-
-                # PRD-039: Run symbol level extraction for KT Technical and Discord content
-                symbol_result = run_symbol_extraction(raw_content, db)
-                symbols_extracted = symbol_result.get("save_summary", {}).get("symbols_processed", 0)
-
-                # PRD-043: Run compass image extraction for Discord images
-                compass_result = {}
-                compass_symbols = 0
-                if raw_content.content_type == "image":
-                    source_name = raw_content.source.name if raw_content.source else ""
-                    if source_name == "discord":
-                        try:
-                            compass_result = run_compass_extraction(raw_content, metadata, db)
-                            compass_symbols = compass_result.get("save_summary", {}).get("symbols_processed", 0)
-                        except Exception as compass_err:
-                            logger.warning(f"Compass extraction failed for {raw_content.id} (non-fatal): {compass_err}")
-
-                # Mark as processed
-                raw_content.processed = True
-
-                results.append({
-                    "raw_content_id": raw_content.id,
-                    "classification": result["classification"],
-                    "priority": result["priority"],
-                    "route_to": route_to,
-                    "pdf_analyzed": "analysis" in pdf_result,
-                    "images_analyzed": len([r for r in image_results if "analysis" in r]),
-                    "text_analyzed": "analysis" in text_result,
-                    "symbols_extracted": symbols_extracted,
-                    "compass_symbols": compass_symbols
-                })
-
-            except Exception as e:
-                logger.error(f"Failed to classify content {raw_content.id}: {str(e)}")
-                results.append({
-                    "raw_content_id": raw_content.id,
-                    "error": str(e)
-                })
-
+        # Classify (packed prompts) and run the routed agents
+        results, stats = classify_and_route(db, items)
         # Commit all changes
         db.commit()
 
@@ -625,7 +637,8 @@ async def classify_batch(
 
         return {
             "count": len(results),
-            "results": results
+            "results": results,
+            "classification_stats": stats
         }
 
     except Exception as e:
@@ -634,6 +647,91 @@ async def classify_batch(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _classify_chunk(session_factory, item_ids: List[int]) -> Tuple[List[Dict], Dict]:
+    """Classify and route one chunk of a background job in its own session."""
+    db = session_factory()
+    try:
+        items = db.query(RawContent).filter(RawContent.id.in_(item_ids)).order_by(RawContent.id).all()
+        results, stats = classify_and_route(db, items)
+        db.commit()
+        return results, stats
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _merge_classification_stats(total: Dict, stats: Dict) -> None:
+    for key, value in stats.items():
+        if isinstance(value, list):
+            total.setdefault(key, []).extend(value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            total[key] = total.get(key, 0) + value
+
+
+async def _run_classify_job(session_factory, limit: int, only_unprocessed: bool, tracker: JobTracker) -> Dict:
+    """Classify up to `limit` items in chunks of CLASSIFY_JOB_CHUNK, one job step per chunk."""
+    db = session_factory()
+    try:
+        query = db.query(RawContent.id).order_by(RawContent.id)
+        if only_unprocessed:
+            query = query.filter(RawContent.processed == False)
+        item_ids = [row.id for row in query.limit(limit).all()]
+    finally:
+        db.close()
+
+    chunks = [item_ids[i:i + CLASSIFY_JOB_CHUNK] for i in range(0, len(item_ids), CLASSIFY_JOB_CHUNK)]
+    names = [f"Classifying items {i * CLASSIFY_JOB_CHUNK + 1}-{i * CLASSIFY_JOB_CHUNK + len(chunk)}"
+             for i, chunk in enumerate(chunks)]
+    tracker.set_steps(names)
+
+    results: List[Dict] = []
+    stats: Dict[str, Any] = {}
+    for name, chunk in zip(names, chunks):
+        tracker.step(name)
+        # Agents call Claude synchronously; keep them off the event loop
+        chunk_results, chunk_stats = await asyncio.to_thread(_classify_chunk, session_factory, chunk)
+        results.extend(chunk_results)
+        _merge_classification_stats(stats, chunk_stats)
+        tracker.step(name, "complete")
+
+    logger.info(f"Classification job {tracker.job_id} classified {len(results)} items")
+    return {
+        "count": len(results),
+        "errors": sum(1 for r in results if "error" in r),
+        "results": results,
+        "classification_stats": stats
+    }
+
+
+@router.post("/classify-batch/jobs", status_code=202)
+@limiter.limit("5/minute")
+async def start_classify_batch_job(
+    request: Request,
+    limit: int = Query(100, ge=1),
+    only_unprocessed: bool = True,
+    db: Session = Depends(get_db),
+    user: str = Depends(verify_jwt_or_basic)
+):
+    """
+    Classify a larger batch of raw content in the background.
+
+    Returns a job handle immediately; items are classified and routed in
+    chunks, each reported as a job step (GET /api/jobs/{job_id}).
+
+    Args:
+        limit: Maximum number of items to process (capped at CLASSIFY_JOB_MAX_ITEMS)
+        only_unprocessed: Only process items not yet analyzed
+    """
+    limit = min(limit, CLASSIFY_JOB_MAX_ITEMS)
+    params = {"limit": limit, "only_unprocessed": only_unprocessed}
+    tracker = JobTracker.create(db, "classify_batch", params, user=user)
+    session_factory = sessionmaker(bind=db.get_bind())
+    start_job(tracker, lambda t: _run_classify_job(session_factory, limit, only_unprocessed, t))
+    return {"job_id": tracker.job_id, "status": "queued", "kind": "classify_batch", **params}
+
+
 @router.post("/reclassify-source/{source_name}")
 @limiter.limit("5/minute")
 async def reclassify_source(
@@ -670,12 +768,16 @@ async def reclassify_source(
         if not items:
             return {"message": f"No content found for source '{source_name}'", "count": 0}
 
-        # Delete old classifier AnalyzedContent records for these items
+        # Delete old classifier AnalyzedContent records for these items, through
+        # the session so the rollup listeners and theme_mentions cascade see them
         item_ids = [item.id for item in items]
-        deleted = db.query(AnalyzedContent).filter(
+        deleted = 0
+        for old in db.query(AnalyzedContent).filter(
             AnalyzedContent.raw_content_id.in_(item_ids),
             AnalyzedContent.agent_type == "classifier"
-        ).delete(synchronize_session=False)
+        ):
+            db.delete(old)
+            deleted += 1
 
         logger.info(f"Deleted {deleted} old classifier records for {source_name}")
 
@@ -687,45 +789,26 @@ async def reclassify_source(
 
         logger.info(f"Reset {len(items)} items from {source_name} for reclassification")
 
-        # Now run classification on these items
-        classifier = get_classifier()
-        results = []
-
+        # Now run classification on these items (packed prompts)
+        inputs = []
         for raw_content in items:
             try:
-                content_dict = {
-                    "raw_content_id": raw_content.id,
-                    "source": source_name,
-                    "content_type": raw_content.content_type,
-                    "content_text": raw_content.content_text,
-                    "file_path": raw_content.file_path,
-                    "url": raw_content.url,
-                    "metadata": json.loads(raw_content.json_metadata) if raw_content.json_metadata else {}
-                }
-
-                result = classifier.classify(content_dict)
-
-                analyzed_content = AnalyzedContent(
-                    raw_content_id=raw_content.id,
-                    agent_type="classifier",
-                    analysis_result=json.dumps(result),
-                    key_themes=",".join(result.get("detected_topics", [])),
-                    sentiment=None,
-                    conviction=None,
-                    time_horizon=None
-                )
-                db.add(analyzed_content)
-                raw_content.processed = True
-
-                results.append({
-                    "raw_content_id": raw_content.id,
-                    "classification": result["classification"],
-                    "priority": result["priority"]
-                })
-
+                inputs.append((raw_content, content_input(raw_content, source_name)))
             except Exception as e:
                 logger.error(f"Failed to reclassify item {raw_content.id}: {e}")
-                continue
+
+        batch = get_classifier().classify_many([content_dict for _, content_dict in inputs])
+        results = []
+
+        for (raw_content, _), result in zip(inputs, batch["results"]):
+            _save_classification(db, raw_content, result)
+            raw_content.processed = True
+
+            results.append({
+                "raw_content_id": raw_content.id,
+                "classification": result["classification"],
+                "priority": result["priority"]
+            })
 
         db.commit()
 
@@ -734,6 +817,7 @@ async def reclassify_source(
             "source": source_name,
             "old_records_deleted": deleted,
             "items_reclassified": len(results),
+            "classification_stats": batch["stats"],
             "results": results[:10]  # Show first 10
         }
 
@@ -806,7 +890,8 @@ async def get_analysis_stats(db: Session = Depends(get_db), user: str = Depends(
             "total_processed": total_processed,
             "total_analyzed": total_analyzed,
             "by_agent_type": by_agent,
-            "processing_rate": round(total_processed / total_raw * 100, 2) if total_raw > 0 else 0
+            "processing_rate": round(total_processed / total_raw * 100, 2) if total_raw > 0 else 0,
+            "pre_routing": get_pre_route_stats()
         }
 
     except Exception as e:
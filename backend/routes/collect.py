@@ -30,9 +30,12 @@ from backend.models import (
     AnalyzedContent, TranscriptionStatus, AsyncSessionLocal
 )
 from backend.utils.auth import verify_jwt_or_basic
-from backend.utils.deduplication import check_duplicate
+from backend.utils.deduplication import check_duplicate, existing_report_keys
 from backend.utils.sanitization import sanitize_content_text, sanitize_url
 from backend.utils.rate_limiter import limiter, RATE_LIMITS
+from backend.services.activity_rollup import content_type_counts, rebuild_activity_rollups, source_activity
+from backend.services.theme_rollup import rebuild_theme_rollups
+from backend.services.alerting import items_collected_event, transcription_event
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/collect", tags=["collect"])
@@ -250,6 +253,7 @@ async def _transcribe_video_with_tracking(
             status = result.scalar_one_or_none()
 
             if status:
+                previous_status = status.status
                 if transcribe_result.get("success"):
                     status.status = "completed"
                     status.completed_at = datetime.utcnow()
@@ -261,6 +265,10 @@ async def _transcribe_video_with_tracking(
                     status.retry_count += 1
                     logger.error(f"Transcription failed for content_id={content_id}: {status.error_message}")
 
+                if source != "unknown":
+                    await db.execute(transcription_event(
+                        db, source, previous_status, status.status, status.completed_at
+                    ))
                 await db.commit()
 
         except Exception as e:
@@ -281,6 +289,8 @@ async def _queue_transcription_with_tracking(
     Create TranscriptionStatus record and queue transcription (PRD-045).
 
     Supports both sync and async modes based on SYNC_TRANSCRIPTION env var.
+    In async mode the background processor is notified so it picks the item
+    up right away; without a running processor the item is started inline.
 
     Args:
         db: Database session (sync)
@@ -301,6 +311,7 @@ async def _queue_transcription_with_tracking(
     db.add(status)
     db.flush()  # Get the ID
     status_id = status.id
+    db.execute(transcription_event(db, source, None, "pending"))
 
     logger.info(f"Created TranscriptionStatus {status_id} for content {content_id}")
 
@@ -331,6 +342,19 @@ async def _queue_transcription_with_tracking(
     else:
         # Async mode: Queue for background processing
         db.commit()  # Commit status before queueing
+
+        # Hand off to the background processor when it's running: it starts
+        # the item immediately (within its concurrency limit) and any replica
+        # can claim it
+        from backend.workers import get_processor, notify_transcription_queued
+        if get_processor().running:
+            await notify_transcription_queued()
+            return {
+                "status_id": status_id,
+                "mode": "async",
+                "result": None  # Will complete in background
+            }
+
         asyncio.create_task(_transcribe_video_with_tracking(
             content_id=content_id,
             status_id=status_id,
@@ -346,7 +370,7 @@ async def _queue_transcription_with_tracking(
         }
 
 
-def _reconcile_transcription_status(db: Session, content_id: int):
+def _reconcile_transcription_status(db: Session, content_id: int, source_name: Optional[str] = None):
     """
     Reconcile TranscriptionStatus for a content item that has been transcribed.
 
@@ -356,11 +380,15 @@ def _reconcile_transcription_status(db: Session, content_id: int):
     Args:
         db: Database session
         content_id: ID of the RawContent that was transcribed
+        source_name: Source of the content, for the SourceHealth counters
     """
     status = db.query(TranscriptionStatus).filter(
         TranscriptionStatus.content_id == content_id
     ).first()
 
+    if source_name:
+        db.execute(transcription_event(db, source_name, status.status if status else None, "completed"))
+
     if status:
         status.status = "completed"
         status.completed_at = datetime.utcnow()
@@ -492,7 +520,8 @@ async def ingest_discord_data(
                 errors.append(error_msg)
                 continue
 
-        # Commit all changes
+        # Commit all changes (with the SourceHealth counter update)
+        db.execute(items_collected_event(db, "discord", saved_count, source.last_collected_at))
         db.commit()
         logger.info(f"Committed {saved_count}/{len(messages)} Discord messages to database (skipped {skipped_duplicates} duplicates)")
 
@@ -552,6 +581,25 @@ async def ingest_discord_data(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/42macro/report-keys")
+async def get_42macro_report_keys(
+    db: Session = Depends(get_db),
+    user: str = Depends(verify_jwt_or_basic)
+):
+    """
+    (report_type, date) pairs of the 42 Macro PDF reports already stored.
+
+    dev/scripts/macro42_local.py passes these to the collector so reports
+    already uploaded are skipped before they are downloaded.
+
+    Returns:
+        {"reports": [[report_type, date], ...]}
+    """
+    source = db.query(Source).filter(Source.name == "42macro").first()
+    keys = existing_report_keys(db, source.id) if source else set()
+    return {"reports": sorted([report_type, date] for report_type, date in keys)}
+
+
 @router.post("/42macro")
 @limiter.limit("10/minute")
 async def ingest_42macro_data(
@@ -672,7 +720,8 @@ async def ingest_42macro_data(
                 errors.append(error_msg)
                 continue
 
-        # Commit all changes
+        # Commit all changes (with the SourceHealth counter update)
+        db.execute(items_collected_event(db, "42macro", saved_count, source.last_collected_at))
         db.commit()
         logger.info(f"Committed {saved_count}/{len(items)} 42macro items to database (skipped {skipped_duplicates} duplicates)")
 
@@ -776,10 +825,14 @@ async def trigger_collection(
 
     # Run collection in background for supported sources
     try:
-        collected_items = await _run_collector(source_name)
+        collector = _make_collector(source_name)
+        collected_items = await collector.collect()
 
         # Save collected items to database
         saved_count = await _save_collected_items(db, source_name, collected_items)
+        if hasattr(collector, "commit_validators"):
+            # Only remember page versions once their posts are stored
+            collector.commit_validators()
 
         return {
             "status": "success",
@@ -796,15 +849,15 @@ async def trigger_collection(
         raise HTTPException(status_code=500, detail=f"Collection failed: {str(e)}")
 
 
-async def _run_collector(source_name: str) -> List[Dict[str, Any]]:
+def _make_collector(source_name: str):
     """
-    Initialize and run the appropriate collector.
+    Initialize the appropriate collector.
 
     Args:
         source_name: Name of source to collect from
 
     Returns:
-        List of collected content items
+        Collector instance
     """
     if source_name == "youtube":
         from collectors.youtube_api import YouTubeCollector
@@ -813,14 +866,12 @@ async def _run_collector(source_name: str) -> List[Dict[str, Any]]:
         if not api_key:
             raise ValueError("YOUTUBE_API_KEY not configured")
 
-        collector = YouTubeCollector(api_key=api_key)
-        return await collector.collect()
+        return YouTubeCollector(api_key=api_key)
 
     elif source_name == "substack":
         from collectors.substack_rss import SubstackCollector
 
-        collector = SubstackCollector()
-        return await collector.collect()
+        return SubstackCollector()
 
     elif source_name == "42macro":
         from collectors.macro42_selenium import Macro42Collector
@@ -830,15 +881,13 @@ async def _run_collector(source_name: str) -> List[Dict[str, Any]]:
         if not email or not password:
             raise ValueError("MACRO42_EMAIL and MACRO42_PASSWORD not configured")
 
-        collector = Macro42Collector(email=email, password=password, headless=True)
-        return await collector.collect()
+        return Macro42Collector(email=email, password=password, headless=True)
 
     elif source_name == "kt_technical":
         from collectors.kt_technical import KTTechnicalCollector
 
         # Credentials default to env vars in the collector
-        collector = KTTechnicalCollector()
-        return await collector.collect()
+        return KTTechnicalCollector()
 
     else:
         raise ValueError(f"Unknown source: {source_name}")
@@ -928,6 +977,7 @@ async def _save_collected_items(
             logger.error(f"Error saving item from {source_name}: {e}")
             continue
 
+    db.execute(items_collected_event(db, source_name, saved_count, source.last_collected_at))
     db.commit()
     if skipped_duplicates > 0:
         logger.info(f"Saved {saved_count}/{len(items)} items from {source_name} (skipped {skipped_duplicates} duplicates)")
@@ -968,27 +1018,18 @@ async def get_collection_status(db: Session = Depends(get_db), user: str = Depen
     """
     try:
         sources = db.query(Source).all()
+        activity = source_activity(db)
 
         status_list = []
         for source in sources:
-            # Count raw content
-            raw_count = db.query(RawContent).filter(
-                RawContent.source_id == source.id
-            ).count()
-
-            # Count unprocessed
-            unprocessed_count = db.query(RawContent).filter(
-                RawContent.source_id == source.id,
-                RawContent.processed == False
-            ).count()
-
+            stats = activity.get(source.id, {})
             status_list.append({
                 "source": source.name,
                 "type": source.type,
                 "active": source.active,
                 "last_collected_at": source.last_collected_at.isoformat() if source.last_collected_at else None,
-                "total_content": raw_count,
-                "unprocessed": unprocessed_count
+                "total_content": stats.get("total_items", 0),
+                "unprocessed": stats.get("unprocessed_items", 0)
             })
 
         return {
@@ -1023,15 +1064,9 @@ async def get_source_stats(
             raise HTTPException(status_code=404, detail=f"Source '{source_name}' not found")
 
         # Get content by type
-        content_by_type = {}
+        type_counts = content_type_counts(db, source.id)
         types = ["text", "pdf", "video", "image"]
-
-        for content_type in types:
-            count = db.query(RawContent).filter(
-                RawContent.source_id == source.id,
-                RawContent.content_type == content_type
-            ).count()
-            content_by_type[content_type] = count
+        content_by_type = {content_type: type_counts.get(content_type, 0) for content_type in types}
 
         # Get recent collection dates
         recent_content = db.query(RawContent.collected_at).filter(
@@ -1099,6 +1134,10 @@ async def clear_source_data(
         # Delete all content for this source
         db.query(RawContent).filter(RawContent.source_id == source.id).delete()
 
+        # Bulk delete skips the flush listeners; recompute this source's rollups
+        rebuild_activity_rollups(db, source_ids=[source.id])
+        rebuild_theme_rollups(db, source_ids=[source.id])
+
         # Reset last_collected_at so fresh collection works
         source.last_collected_at = None
 
@@ -1396,7 +1435,9 @@ async def update_transcript(
         db.add(analyzed_content)
 
         # Reconcile TranscriptionStatus record
-        _reconcile_transcription_status(db, content_id)
+        _reconcile_transcription_status(
+            db, content_id, raw_content.source.name if raw_content.source else None
+        )
 
         db.commit()
 
@@ -1568,7 +1609,7 @@ async def retranscribe_videos(
                         db.add(analyzed_content)
 
                         # Reconcile TranscriptionStatus record
-                        _reconcile_transcription_status(db, video["raw_content_id"])
+                        _reconcile_transcription_status(db, video["raw_content_id"], source_name)
 
                         db.commit()
 
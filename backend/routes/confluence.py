@@ -27,6 +27,7 @@ from backend.models import (
     Source,
     RawContent
 )
+from backend.services.bulk_analysis import confluence_score_row
 from backend.utils.auth import verify_jwt_or_basic
 from backend.utils.rate_limiter import limiter, RATE_LIMITS
 
@@ -300,22 +301,7 @@ async def score_content(
 
         # Save to database
         pillar_scores = result.get("pillar_scores", {})
-
-        new_score = ConfluenceScore(
-            analyzed_content_id=analyzed_content_id,
-            macro_score=pillar_scores.get("macro", 0),
-            fundamentals_score=pillar_scores.get("fundamentals", 0),
-            valuation_score=pillar_scores.get("valuation", 0),
-            positioning_score=pillar_scores.get("positioning", 0),
-            policy_score=pillar_scores.get("policy", 0),
-            price_action_score=pillar_scores.get("price_action", 0),
-            options_vol_score=pillar_scores.get("options_vol", 0),
-            core_total=result.get("core_total", 0),
-            total_score=result.get("total_score", 0),
-            meets_threshold=result.get("meets_threshold", False),
-            reasoning=json.dumps(result.get("reasoning", {})),
-            falsification_criteria=json.dumps(result.get("falsification_criteria", []))
-        )
+        new_score = confluence_score_row(analyzed_content_id, result)
 
         db.add(new_score)
         db.commit()
@@ -583,6 +569,7 @@ async def run_cross_reference(
     """
     try:
         from agents.cross_reference import CrossReferenceAgent
+        from backend.services.mention_index import tickers_by_content
 
         # Get recent confluence scores
         cutoff = datetime.utcnow() - timedelta(days=time_window_days)
@@ -597,6 +584,9 @@ async def run_cross_reference(
                 "message": f"No confluence scores found in the last {time_window_days} days"
             }
 
+        # Canonical tickers per analysis for contradiction grouping (one query)
+        tickers = tickers_by_content(db, [score.analyzed_content_id for score in scores])
+
         # Build confluence score data for agent
         confluence_data = []
         for score in scores:
@@ -628,6 +618,7 @@ async def run_cross_reference(
                 "meets_threshold": score.meets_threshold,
                 "confluence_level": "strong" if score.meets_threshold else ("medium" if score.core_total >= 4 else "weak"),
                 "primary_thesis": primary_thesis,
+                "tickers": tickers.get(score.analyzed_content_id, []),
                 "variant_view": "",
                 "p_and_l_mechanism": "",
                 "falsification_criteria": []
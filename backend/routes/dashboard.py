@@ -26,6 +26,7 @@ from backend.models import (
     Source,
     RawContent
 )
+from backend.services.activity_rollup import content_totals, recent_activity, source_activity
 from backend.utils.auth import verify_jwt_or_basic
 from backend.utils.rate_limiter import limiter, RATE_LIMITS
 
@@ -321,30 +322,22 @@ async def get_all_sources(
 ):
     """Get list of all sources with recent activity stats."""
     sources = db.query(Source).all()
+    activity = source_activity(db)
 
     result = []
     for source in sources:
-        # Count content items
-        total_content = db.query(RawContent).filter(RawContent.source_id == source.id).count()
-
-        # Get latest collection time
-        latest = db.query(RawContent).filter(
-            RawContent.source_id == source.id
-        ).order_by(desc(RawContent.collected_at)).first()
-
-        # Count analyzed items
-        analyzed_count = db.query(AnalyzedContent).join(RawContent).filter(
-            RawContent.source_id == source.id
-        ).count()
+        stats = activity.get(source.id, {})
+        last_collected = stats.get("last_collected_at")
 
         result.append({
             "id": source.id,
             "name": source.name,
             "type": source.type,
             "active": source.active,
-            "total_items": total_content,
-            "analyzed_items": analyzed_count,
-            "last_collected": latest.collected_at.isoformat() if latest and latest.collected_at else None,
+            "total_items": stats.get("total_items", 0),
+            "analyzed_items": stats.get("analyzed_items", 0),
+            "avg_conviction": stats.get("avg_conviction"),
+            "last_collected": last_collected.isoformat() if last_collected else None,
             "created_at": source.created_at.isoformat() if source.created_at else None
         })
 
@@ -618,17 +611,14 @@ async def get_dashboard_stats(
     db: Session = Depends(get_db),
     user: str = Depends(verify_jwt_or_basic)
 ):
-    """Get overall dashboard statistics."""
+    """Get overall dashboard statistics (content counts read from daily rollups)."""
+    recent = recent_activity(db, hours=24)
     return {
         "sources": {
             "total": db.query(Source).count(),
             "active": db.query(Source).filter(Source.active == True).count()
         },
-        "content": {
-            "total_raw": db.query(RawContent).count(),
-            "analyzed": db.query(AnalyzedContent).count(),
-            "scored": db.query(ConfluenceScore).count()
-        },
+        "content": content_totals(db),
         "themes": {
             "total": db.query(Theme).count(),
             "active": db.query(Theme).filter(Theme.status == 'active').count(),
@@ -638,11 +628,7 @@ async def get_dashboard_stats(
             ).count()
         },
         "recent_activity": {
-            "last_24h_collected": db.query(RawContent).filter(
-                RawContent.collected_at >= datetime.utcnow() - timedelta(hours=24)
-            ).count(),
-            "last_24h_analyzed": db.query(AnalyzedContent).filter(
-                AnalyzedContent.analyzed_at >= datetime.utcnow() - timedelta(hours=24)
-            ).count()
+            "last_24h_collected": recent["collected"],
+            "last_24h_analyzed": recent["analyzed"]
         }
     }
@@ -21,7 +21,7 @@ from backend.models import (
     RawContent, Source, ServiceHeartbeat
 )
 from backend.utils.auth import verify_jwt_or_basic
-from backend.services.alerting import check_and_create_alerts, record_collection_result
+from backend.services.alerting import check_and_create_alerts, record_collection_result, transcription_event
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/health", tags=["health"])
@@ -49,6 +49,72 @@ def _calculate_overall_status(sources: Dict[str, Any]) -> str:
         return "healthy"
 
 
+def _source_health_info(
+    health: Optional[SourceHealth],
+    source_name: str,
+    cutoff_staleness: datetime
+) -> Dict[str, Any]:
+    """Build one source's health entry from its SourceHealth row."""
+    if not health:
+        return {
+            "status": "unknown",
+            "last_collection": None,
+            "items_24h": 0,
+            "errors_24h": 0,
+            "is_stale": True,
+            "message": f"Source '{source_name}' not configured"
+        }
+
+    consecutive_failures = health.consecutive_failures or 0
+    errors_24h = health.errors_24h or 0
+    is_stale = (
+        health.last_collection_at is None or
+        health.last_collection_at < cutoff_staleness
+    )
+
+    source_info = {
+        "last_collection": health.last_collection_at.isoformat() if health.last_collection_at else None,
+        "items_24h": health.items_collected_24h or 0,
+        "errors_24h": errors_24h,
+        "consecutive_failures": consecutive_failures,
+        "is_stale": is_stale,
+    }
+
+    # Determine status
+    if consecutive_failures >= 2:
+        source_info["status"] = "critical"
+        source_info["message"] = f"{consecutive_failures} consecutive collection failures"
+    elif is_stale:
+        source_info["status"] = "stale"
+        source_info["message"] = f"No new content in {STALENESS_THRESHOLD_HOURS}+ hours"
+    elif errors_24h > 5:
+        source_info["status"] = "degraded"
+        source_info["message"] = f"{errors_24h} errors in last 24 hours"
+    else:
+        source_info["status"] = "healthy"
+        source_info["message"] = "Operating normally"
+
+    # Add video-specific metrics
+    if source_name in VIDEO_SOURCES:
+        source_info["transcription"] = {
+            "pending": max(health.transcription_pending or 0, 0),
+            "completed": health.transcription_completed or 0,
+            "failed": health.transcription_failed or 0
+        }
+
+        if health.last_transcription_at:
+            source_info["last_transcription"] = health.last_transcription_at.isoformat()
+
+        # Transcription backlog, counted by the reconciliation
+        old_pending = health.transcription_backlog or 0
+        if old_pending > 0:
+            source_info["status"] = "degraded" if source_info["status"] == "healthy" else source_info["status"]
+            source_info["transcription"]["backlog"] = old_pending
+            source_info["message"] = f"{old_pending} transcriptions pending >24h"
+
+    return source_info
+
+
 @router.get("/sources")
 async def get_all_source_health(
     db: AsyncSession = Depends(get_async_db),
@@ -57,6 +123,9 @@ async def get_all_source_health(
     """
     Get health status for all monitored sources.
 
+    Served from the SourceHealth table (plus the active alert list) rather
+    than aggregating content tables per request.
+
     Returns per-source metrics including:
     - Collection status and timing
     - Transcription status (for video sources)
@@ -76,132 +145,19 @@ async def get_all_source_health(
     """
     try:
         now = datetime.utcnow()
-        cutoff_24h = now - timedelta(hours=24)
         cutoff_staleness = now - timedelta(hours=STALENESS_THRESHOLD_HOURS)
 
-        sources_health = {}
-
-        for source_name in MONITORED_SOURCES:
-            # Get source record
-            result = await db.execute(
-                select(Source).where(Source.name == source_name)
-            )
-            source = result.scalar_one_or_none()
-
-            if not source:
-                sources_health[source_name] = {
-                    "status": "unknown",
-                    "last_collection": None,
-                    "items_24h": 0,
-                    "errors_24h": 0,
-                    "is_stale": True,
-                    "message": f"Source '{source_name}' not configured"
-                }
-                continue
-
-            # Count items collected in last 24h
-            result = await db.execute(
-                select(func.count(RawContent.id)).where(
-                    and_(
-                        RawContent.source_id == source.id,
-                        RawContent.collected_at >= cutoff_24h
-                    )
-                )
-            )
-            items_24h = result.scalar() or 0
-
-            # Check staleness
-            is_stale = (
-                source.last_collected_at is None or
-                source.last_collected_at < cutoff_staleness
-            )
-
-            # Get cached health metrics if available
-            result = await db.execute(
-                select(SourceHealth).where(SourceHealth.source_name == source_name)
-            )
-            health_record = result.scalar_one_or_none()
-
-            consecutive_failures = health_record.consecutive_failures if health_record else 0
-            errors_24h = health_record.errors_24h if health_record else 0
-
-            # Build source health info
-            source_info = {
-                "last_collection": source.last_collected_at.isoformat() if source.last_collected_at else None,
-                "items_24h": items_24h,
-                "errors_24h": errors_24h,
-                "consecutive_failures": consecutive_failures,
-                "is_stale": is_stale,
-            }
-
-            # Determine status
-            if consecutive_failures >= 2:
-                source_info["status"] = "critical"
-                source_info["message"] = f"{consecutive_failures} consecutive collection failures"
-            elif is_stale:
-                source_info["status"] = "stale"
-                source_info["message"] = f"No new content in {STALENESS_THRESHOLD_HOURS}+ hours"
-            elif errors_24h > 5:
-                source_info["status"] = "degraded"
-                source_info["message"] = f"{errors_24h} errors in last 24 hours"
-            else:
-                source_info["status"] = "healthy"
-                source_info["message"] = "Operating normally"
-
-            # Add video-specific metrics
-            if source_name in VIDEO_SOURCES:
-                # Get transcription stats
-                result = await db.execute(
-                    select(
-                        func.count(TranscriptionStatus.id).filter(
-                            TranscriptionStatus.status == "pending"
-                        ),
-                        func.count(TranscriptionStatus.id).filter(
-                            TranscriptionStatus.status == "completed"
-                        ),
-                        func.count(TranscriptionStatus.id).filter(
-                            TranscriptionStatus.status == "failed"
-                        ),
-                    ).select_from(TranscriptionStatus).join(
-                        RawContent, TranscriptionStatus.content_id == RawContent.id
-                    ).where(
-                        RawContent.source_id == source.id
-                    )
-                )
-                row = result.one()
-                pending, completed, failed = row
-
-                source_info["transcription"] = {
-                    "pending": pending,
-                    "completed": completed,
-                    "failed": failed
-                }
-
-                # Get last transcription time
-                if health_record and health_record.last_transcription_at:
-                    source_info["last_transcription"] = health_record.last_transcription_at.isoformat()
-
-                # Check for transcription backlog
-                result = await db.execute(
-                    select(func.count(TranscriptionStatus.id)).where(
-                        and_(
-                            TranscriptionStatus.status == "pending",
-                            TranscriptionStatus.created_at < now - timedelta(hours=TRANSCRIPTION_BACKLOG_THRESHOLD_HOURS)
-                        )
-                    ).select_from(TranscriptionStatus).join(
-                        RawContent, TranscriptionStatus.content_id == RawContent.id
-                    ).where(
-                        RawContent.source_id == source.id
-                    )
-                )
-                old_pending = result.scalar() or 0
-
-                if old_pending > 0:
-                    source_info["status"] = "degraded" if source_info["status"] == "healthy" else source_info["status"]
-                    source_info["transcription"]["backlog"] = old_pending
-                    source_info["message"] = f"{old_pending} transcriptions pending >24h"
+        # One read: SourceHealth is kept current by ingestion/transcription/
+        # collection events and the periodic reconciliation
+        result = await db.execute(
+            select(SourceHealth).where(SourceHealth.source_name.in_(MONITORED_SOURCES))
+        )
+        health_records = {h.source_name: h for h in result.scalars().all()}
 
-            sources_health[source_name] = source_info
+        sources_health = {
+            source_name: _source_health_info(health_records.get(source_name), source_name, cutoff_staleness)
+            for source_name in MONITORED_SOURCES
+        }
 
         # Get active alerts
         result = await db.execute(
@@ -399,7 +355,7 @@ async def get_transcription_queue_status(
         # Cross-check: if the RawContent already has a transcript (content_text > 200 chars),
         # the TranscriptionStatus is stale — fix it in-place and exclude from backlog
         result = await db.execute(
-            select(TranscriptionStatus, RawContent).join(
+            select(TranscriptionStatus, RawContent, Source.name).join(
                 RawContent, TranscriptionStatus.content_id == RawContent.id
             ).join(
                 Source, RawContent.source_id == Source.id
@@ -412,13 +368,14 @@ async def get_transcription_queue_status(
         )
         backlog_items = []
         stale_reconciled = 0
-        for ts, rc in result.all():
+        for ts, rc, source_name in result.all():
             # Check if video is actually already transcribed (stale status record)
             content_text = rc.content_text or ""
             if len(content_text) > 200:
                 # Content already has transcript — reconcile stale status
                 ts.status = "completed"
                 ts.completed_at = now
+                await db.execute(transcription_event(db, source_name, "pending", "completed", now))
                 stale_reconciled += 1
                 continue
 
@@ -427,7 +384,7 @@ async def get_transcription_queue_status(
                 "content_id": rc.id,
                 "title": metadata.get("title", rc.url or "Unknown"),
                 "url": rc.url,
-                "source": rc.source.name if rc.source else "unknown",
+                "source": source_name or "unknown",
                 "pending_since": ts.created_at.isoformat(),
                 "hours_pending": round((now - ts.created_at).total_seconds() / 3600, 1)
             })
@@ -0,0 +1,90 @@
+"""
+Background Job Routes
+
+Status and progress of background jobs started by endpoints such as
+POST /api/synthesis/jobs and POST /api/analyze/classify-batch/jobs.
+
+Progress can be followed by polling GET /api/jobs/{job_id}, by the
+server-sent event stream at /api/jobs/{job_id}/events, or as job_progress
+messages on the /ws WebSocket.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, sessionmaker
+from typing import Optional
+import json
+import logging
+
+from backend.models import get_db
+from backend.services.jobs import follow_job, get_job, list_jobs
+from backend.utils.auth import verify_jwt_or_basic
+from backend.utils.rate_limiter import limiter, RATE_LIMITS
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+@router.get("")
+@limiter.limit(RATE_LIMITS["default"])
+async def get_jobs(
+    request: Request,
+    kind: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    user: str = Depends(verify_jwt_or_basic)
+):
+    """List recent jobs, newest first."""
+    jobs = list_jobs(db, kind=kind, status=status, limit=limit)
+    return {"jobs": jobs, "count": len(jobs)}
+
+
+@router.get("/{job_id}")
+@limiter.limit(RATE_LIMITS["default"])
+async def get_job_status(
+    request: Request,
+    job_id: str,
+    db: Session = Depends(get_db),
+    user: str = Depends(verify_jwt_or_basic)
+):
+    """Get a job's state, per-step progress and result."""
+    job = get_job(db, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    return job
+
+
+@router.get("/{job_id}/events")
+@limiter.limit(RATE_LIMITS["default"])
+async def stream_job_events(
+    request: Request,
+    job_id: str,
+    db: Session = Depends(get_db),
+    user: str = Depends(verify_jwt_or_basic)
+):
+    """
+    Stream a job's progress as server-sent events.
+
+    Sends the current state first, then a `progress` event per update, and
+    closes after the job succeeds or fails. Comment lines keep idle
+    connections open.
+    """
+    if get_job(db, job_id) is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
+    session_factory = sessionmaker(bind=db.get_bind())
+
+    async def events():
+        async for snapshot in follow_job(job_id, session_factory):
+            if await request.is_disconnected():
+                break
+            if snapshot is None:
+                yield ": keepalive\n\n"
+            else:
+                yield f"event: progress\ndata: {json.dumps(snapshot, default=str)}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
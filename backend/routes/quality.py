@@ -7,9 +7,8 @@ Provides access to quality metrics, trends, and flagged issues.
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
+from sqlalchemy import desc
 from typing import Optional
-from datetime import datetime, timedelta
 import json
 import logging
 
@@ -18,6 +17,7 @@ from backend.models import (
     Synthesis,
     SynthesisQualityScore
 )
+from backend.services.quality_rollup import quality_trends
 from backend.utils.auth import verify_jwt_or_basic
 from backend.utils.rate_limiter import limiter, RATE_LIMITS
 
@@ -163,69 +163,10 @@ async def get_quality_trends(
     """
     Get quality score trends over time.
 
-    Returns aggregate statistics and trend data for quality scores.
+    Returns aggregate statistics and trend data for quality scores, read
+    from the daily rollups plus windowed queries over the period.
     """
-    cutoff = datetime.utcnow() - timedelta(days=days)
-
-    scores = db.query(SynthesisQualityScore).filter(
-        SynthesisQualityScore.created_at >= cutoff
-    ).order_by(SynthesisQualityScore.created_at).all()
-
-    if not scores:
-        return {
-            "period_days": days,
-            "total_evaluations": 0,
-            "message": "No quality evaluations found in this period"
-        }
-
-    # Calculate statistics
-    quality_scores = [s.quality_score for s in scores]
-    avg_score = sum(quality_scores) / len(quality_scores)
-
-    # Count grades
-    grade_counts = {}
-    for s in scores:
-        grade_counts[s.grade] = grade_counts.get(s.grade, 0) + 1
-
-    # Calculate criterion averages
-    criterion_avgs = {
-        "confluence_detection": sum(s.confluence_detection for s in scores) / len(scores),
-        "evidence_preservation": sum(s.evidence_preservation for s in scores) / len(scores),
-        "source_attribution": sum(s.source_attribution for s in scores) / len(scores),
-        "youtube_channel_granularity": sum(s.youtube_channel_granularity for s in scores) / len(scores),
-        "nuance_retention": sum(s.nuance_retention for s in scores) / len(scores),
-        "actionability": sum(s.actionability for s in scores) / len(scores),
-        "theme_continuity": sum(s.theme_continuity for s in scores) / len(scores)
-    }
-
-    # Find weakest and strongest criteria
-    weakest = min(criterion_avgs, key=criterion_avgs.get)
-    strongest = max(criterion_avgs, key=criterion_avgs.get)
-
-    # Calculate trend (compare first half to second half)
-    mid = len(scores) // 2
-    if mid > 0:
-        first_half_avg = sum(s.quality_score for s in scores[:mid]) / mid
-        second_half_avg = sum(s.quality_score for s in scores[mid:]) / (len(scores) - mid)
-        trend = "improving" if second_half_avg > first_half_avg else "declining" if second_half_avg < first_half_avg else "stable"
-        trend_delta = round(second_half_avg - first_half_avg, 1)
-    else:
-        trend = "insufficient_data"
-        trend_delta = 0
-
-    return {
-        "period_days": days,
-        "total_evaluations": len(scores),
-        "average_score": round(avg_score, 1),
-        "min_score": min(quality_scores),
-        "max_score": max(quality_scores),
-        "grade_distribution": grade_counts,
-        "criterion_averages": {k: round(v, 2) for k, v in criterion_avgs.items()},
-        "weakest_criterion": weakest,
-        "strongest_criterion": strongest,
-        "trend": trend,
-        "trend_delta": trend_delta
-    }
+    return quality_trends(db, days)
 
 
 @router.get("/{synthesis_id}")
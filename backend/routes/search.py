@@ -28,6 +28,7 @@ from backend.models import (
     AnalyzedContent,
     Source
 )
+from backend.services.theme_rollup import aggregated_themes
 from backend.utils.auth import verify_jwt_or_basic
 from backend.utils.rate_limiter import limiter, RATE_LIMITS
 from backend.utils.sanitization import sanitize_search_query
@@ -343,9 +344,9 @@ async def get_aggregated_themes(
     """
     Get aggregated themes from analyzed content.
 
-    This endpoint aggregates themes directly from analyzed_content records
-    rather than the Theme table. Useful for getting a real-time view of
-    what themes are being discussed.
+    Themes are read from theme_daily_rollups, which is kept up to date as
+    content is analyzed, rather than from the Theme table. Useful for
+    getting a real-time view of what themes are being discussed.
 
     Args:
         active_only: Only include themes from recent content (default True)
@@ -355,105 +356,7 @@ async def get_aggregated_themes(
     Returns:
         Dictionary with aggregated themes and metadata
     """
-    # Calculate cutoff
-    if active_only:
-        cutoff = datetime.utcnow() - timedelta(days=days)
-    else:
-        cutoff = datetime(1970, 1, 1)
-
-    # Query analyzed content with themes
-    stmt = (
-        select(AnalyzedContent, RawContent, Source)
-        .join(RawContent, AnalyzedContent.raw_content_id == RawContent.id)
-        .join(Source, RawContent.source_id == Source.id)
-        .where(
-            AnalyzedContent.analyzed_at >= cutoff,
-            AnalyzedContent.key_themes.isnot(None),
-            AnalyzedContent.key_themes != ""
-        )
-        .order_by(desc(AnalyzedContent.analyzed_at))
-    )
-
-    result = await db.execute(stmt)
-    results = result.all()
-
-    # Aggregate themes across sources
-    theme_data = {}
-
-    for analyzed, raw, source in results:
-        themes = analyzed.key_themes.split(",") if analyzed.key_themes else []
-
-        for theme in themes:
-            theme = theme.strip()
-            if not theme:
-                continue
-
-            if theme not in theme_data:
-                theme_data[theme] = {
-                    "name": theme,
-                    "sources": set(),
-                    "first_seen": analyzed.analyzed_at,
-                    "last_seen": analyzed.analyzed_at,
-                    "mention_count": 0,
-                    "sentiments": [],
-                    "convictions": []
-                }
-
-            theme_data[theme]["sources"].add(source.name)
-            theme_data[theme]["mention_count"] += 1
-
-            if analyzed.analyzed_at < theme_data[theme]["first_seen"]:
-                theme_data[theme]["first_seen"] = analyzed.analyzed_at
-            if analyzed.analyzed_at > theme_data[theme]["last_seen"]:
-                theme_data[theme]["last_seen"] = analyzed.analyzed_at
-
-            if analyzed.sentiment is not None:
-                try:
-                    theme_data[theme]["sentiments"].append(float(analyzed.sentiment))
-                except (ValueError, TypeError):
-                    pass
-            if analyzed.conviction is not None:
-                try:
-                    theme_data[theme]["convictions"].append(float(analyzed.conviction))
-                except (ValueError, TypeError):
-                    pass
-
-    # Filter by min_sources and format output
-    themes_list = []
-    for theme, data in theme_data.items():
-        if len(data["sources"]) >= min_sources:
-            # Calculate averages
-            avg_sentiment = None
-            if data["sentiments"]:
-                avg_sentiment = sum(data["sentiments"]) / len(data["sentiments"])
-
-            avg_conviction = None
-            if data["convictions"]:
-                avg_conviction = sum(data["convictions"]) / len(data["convictions"])
-
-            # Determine conviction trend
-            conviction_trend = "stable"
-            if len(data["convictions"]) >= 3:
-                recent = data["convictions"][-3:]
-                if all(recent[i] <= recent[i+1] for i in range(len(recent)-1)):
-                    conviction_trend = "rising"
-                elif all(recent[i] >= recent[i+1] for i in range(len(recent)-1)):
-                    conviction_trend = "falling"
-
-            themes_list.append({
-                "name": data["name"],
-                "sources": list(data["sources"]),
-                "source_count": len(data["sources"]),
-                "mention_count": data["mention_count"],
-                "first_seen": data["first_seen"].strftime("%Y-%m-%d") if data["first_seen"] else None,
-                "last_seen": data["last_seen"].strftime("%Y-%m-%d") if data["last_seen"] else None,
-                "avg_sentiment": round(avg_sentiment, 2) if avg_sentiment else None,
-                "avg_conviction": round(avg_conviction, 2) if avg_conviction else None,
-                "conviction_trend": conviction_trend
-            })
-
-    # Sort by mention count
-    themes_list.sort(key=lambda x: x["mention_count"], reverse=True)
+    themes_list = await aggregated_themes(db, days=days if active_only else None, min_sources=min_sources)
 
     return {
         "themes": themes_list,
@@ -5,6 +5,7 @@ Endpoints for accessing symbol levels, state, and confluence analysis.
 
 PRD-036: Uses verify_jwt_or_basic for JWT + Basic Auth compatibility.
 PRD-048: Added staleness validation on read and concurrency lock on refresh.
+Staleness is read from stale_since columns kept by the staleness sweep.
 """
 
 import logging
@@ -13,11 +14,14 @@ import os
 from typing import Optional, List, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc
+from sqlalchemy import and_
 from datetime import datetime, timedelta
 from pydantic import BaseModel
 
 from backend.models import get_db, SymbolLevel, SymbolState, RawContent
+from backend.services.level_index import get_level_index
+from backend.services.mention_index import ticker_timeline
+from backend.services.symbol_snapshot import get_symbol_snapshot
 from backend.utils.auth import verify_jwt_or_basic
 
 logger = logging.getLogger(__name__)
@@ -26,6 +30,7 @@ router = APIRouter(prefix="/api/symbols", tags=["symbols"])
 # ============================================================================
 # PRD-048: Staleness Configuration
 # ============================================================================
+# Same env var as staleness_manager, which stamps stale_since with it
 STALENESS_THRESHOLD_HOURS = int(os.getenv("SYMBOL_STALENESS_HOURS", "48"))
 
 # ============================================================================
@@ -89,10 +94,76 @@ def calculate_staleness(last_updated: Optional[datetime]) -> Dict[str, Any]:
     }
 
 
+def read_staleness(last_updated: Optional[datetime], stale_since: Optional[datetime]) -> Dict[str, Any]:
+    """
+    Staleness info from the stored stale_since column.
+
+    The staleness sweep stamps stale_since once data passes the threshold,
+    so the decision is a column fetch; only the display age is derived.
+    Same shape as calculate_staleness().
+    """
+    if not last_updated:
+        return calculate_staleness(None)
+
+    hours_since = (datetime.utcnow() - last_updated).total_seconds() / 3600
+    is_stale = stale_since is not None
+    message = None
+
+    if is_stale:
+        if hours_since < 168:  # Less than a week
+            message = f"Data is {round(hours_since)}h old - may be outdated"
+        else:
+            days = round(hours_since / 24)
+            message = f"Data is {days} days old - may be outdated"
+
+    return {
+        "is_stale": is_stale,
+        "hours_since_update": round(hours_since, 1),
+        "staleness_message": message
+    }
+
+
 # ============================================================================
 # Endpoints
 # ============================================================================
 
+def _symbol_summary(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the dashboard summary for one snapshot entry."""
+    # PRD-048: Staleness from stored stale_since columns
+    overall_staleness = read_staleness(entry["updated_at"], entry["stale_since"])
+    kt_staleness = read_staleness(entry["kt_last_updated"], entry["kt_stale_since"])
+    discord_staleness = read_staleness(entry["discord_last_updated"], entry["discord_stale_since"])
+
+    return {
+        "symbol": entry["symbol"],
+        "kt_view": {
+            "wave_position": entry["kt_wave_position"],
+            "wave_phase": entry["kt_wave_phase"],
+            "bias": entry["kt_bias"],
+            "last_updated": entry["kt_last_updated"].isoformat() if entry["kt_last_updated"] else None,
+            "is_stale": kt_staleness["is_stale"],
+            "hours_since_update": kt_staleness["hours_since_update"],
+            "stale_warning": kt_staleness["staleness_message"] or entry["kt_stale_warning"]
+        },
+        "discord_view": {
+            "quadrant": entry["discord_quadrant"],
+            "iv_regime": entry["discord_iv_regime"],
+            "last_updated": entry["discord_last_updated"].isoformat() if entry["discord_last_updated"] else None,
+            "is_stale": discord_staleness["is_stale"],
+            "hours_since_update": discord_staleness["hours_since_update"],
+            "stale_warning": discord_staleness["staleness_message"]
+        },
+        "confluence": {
+            "score": entry["confluence_score"],
+            "aligned": entry["sources_directionally_aligned"]
+        },
+        "active_levels_count": entry["active_levels_count"],
+        "updated_at": entry["updated_at"].isoformat() if entry["updated_at"] else None,
+        # PRD-048: Overall symbol staleness
+        **overall_staleness
+    }
+
+
 @router.get("")
 async def get_all_symbols(
     user: str = Depends(verify_jwt_or_basic),
@@ -105,56 +176,15 @@ async def get_all_symbols(
     - KT Technical view (wave position, bias)
     - Discord view (quadrant, IV regime)
     - Confluence score
-    - Staleness warnings (PRD-048: calculated on read)
+    - Staleness warnings (PRD-048: stored by the staleness sweep)
+
+    Served from the materialized symbol snapshot; a cold snapshot costs
+    two queries (states + grouped level counts).
     """
 
     try:
-        # Get all symbol states
-        states = db.query(SymbolState).all()
-
-        symbols = []
-        for state in states:
-            # Count active levels
-            level_count = db.query(SymbolLevel).filter(
-                and_(
-                    SymbolLevel.symbol == state.symbol,
-                    SymbolLevel.is_active == True
-                )
-            ).count()
-
-            # PRD-048: Calculate staleness on read for overall symbol
-            overall_staleness = calculate_staleness(state.updated_at)
-            kt_staleness = calculate_staleness(state.kt_last_updated)
-            discord_staleness = calculate_staleness(state.discord_last_updated)
-
-            symbols.append({
-                "symbol": state.symbol,
-                "kt_view": {
-                    "wave_position": state.kt_wave_position,
-                    "wave_phase": state.kt_wave_phase,
-                    "bias": state.kt_bias,
-                    "last_updated": state.kt_last_updated.isoformat() if state.kt_last_updated else None,
-                    "is_stale": kt_staleness["is_stale"],
-                    "hours_since_update": kt_staleness["hours_since_update"],
-                    "stale_warning": kt_staleness["staleness_message"] or state.kt_stale_warning
-                },
-                "discord_view": {
-                    "quadrant": state.discord_quadrant,
-                    "iv_regime": state.discord_iv_regime,
-                    "last_updated": state.discord_last_updated.isoformat() if state.discord_last_updated else None,
-                    "is_stale": discord_staleness["is_stale"],
-                    "hours_since_update": discord_staleness["hours_since_update"],
-                    "stale_warning": discord_staleness["staleness_message"]
-                },
-                "confluence": {
-                    "score": state.confluence_score,
-                    "aligned": state.sources_directionally_aligned
-                },
-                "active_levels_count": level_count,
-                "updated_at": state.updated_at.isoformat() if state.updated_at else None,
-                # PRD-048: Overall symbol staleness
-                **overall_staleness
-            })
+        entries = get_symbol_snapshot().entries(db)
+        symbols = [_symbol_summary(entry) for entry in entries]
 
         return {
             "symbols": symbols,
@@ -181,7 +211,7 @@ async def get_symbol_detail(
     - All active price levels
     - Confluence analysis
     - Trade setup suggestion
-    - Staleness info (PRD-048: calculated on read)
+    - Staleness info (PRD-048: stored by the staleness sweep)
     """
     symbol = symbol.upper()
 
@@ -199,10 +229,10 @@ async def get_symbol_detail(
             )
         ).order_by(SymbolLevel.price.desc()).all()
 
-        # PRD-048: Calculate staleness on read
-        overall_staleness = calculate_staleness(state.updated_at)
-        kt_staleness = calculate_staleness(state.kt_last_updated)
-        discord_staleness = calculate_staleness(state.discord_last_updated)
+        # PRD-048: Staleness from stored stale_since columns
+        overall_staleness = read_staleness(state.updated_at, state.stale_since)
+        kt_staleness = read_staleness(state.kt_last_updated, state.kt_stale_since)
+        discord_staleness = read_staleness(state.discord_last_updated, state.discord_stale_since)
 
         return {
             "symbol": symbol,
@@ -273,6 +303,38 @@ async def get_symbol_detail(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/{symbol}/timeline")
+async def get_ticker_timeline(
+    symbol: str,
+    days: int = 30,
+    limit: int = 50,
+    user: str = Depends(verify_jwt_or_basic),
+    db: Session = Depends(get_db)
+):
+    """
+    Get analyses mentioning a ticker, newest first.
+
+    Reads the ticker mention index, so any ticker works (not only tracked
+    symbols) and aliases resolve (google -> GOOGL, /ES -> SPX).
+
+    Args:
+        symbol: Ticker or alias
+        days: Lookback window in days (1-365)
+        limit: Maximum mentions to return (1-200)
+    """
+    if days < 1 or days > 365:
+        raise HTTPException(status_code=400, detail="days must be between 1 and 365")
+    if limit < 1 or limit > 200:
+        raise HTTPException(status_code=400, detail="limit must be between 1 and 200")
+
+    try:
+        return ticker_timeline(db, symbol, days=days, limit=limit)
+
+    except Exception as e:
+        logger.error(f"Error fetching timeline for {symbol}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/{symbol}/levels")
 async def get_symbol_levels(
     symbol: str,
@@ -327,6 +389,96 @@ async def get_symbol_levels(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/{symbol}/levels/nearest")
+async def get_nearest_levels(
+    symbol: str,
+    price: float,
+    k: int = 5,
+    within_pct: Optional[float] = None,
+    source: Optional[str] = None,
+    user: str = Depends(verify_jwt_or_basic),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the k active, non-stale levels closest to a price.
+
+    Args:
+        symbol: Symbol ticker
+        price: Reference price
+        k: Maximum number of levels to return (1-50)
+        within_pct: Optional band, e.g. 1.0 for levels within 1% of price
+        source: Optional filter by source (kt_technical or discord)
+    """
+    symbol = symbol.upper()
+    if k < 1 or k > 50:
+        raise HTTPException(status_code=400, detail="k must be between 1 and 50")
+    if within_pct is not None and within_pct < 0:
+        raise HTTPException(status_code=400, detail="within_pct must be non-negative")
+
+    try:
+        levels = get_level_index().nearest(db, symbol, price, k, within_pct, source)
+
+        return {
+            "symbol": symbol,
+            "price": price,
+            "within_pct": within_pct,
+            "source": source,
+            "levels": levels,
+            "count": len(levels)
+        }
+
+    except Exception as e:
+        logger.error(f"Error fetching nearest levels for {symbol}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{symbol}/levels/overlaps")
+async def get_overlapping_levels(
+    symbol: str,
+    low: Optional[float] = None,
+    high: Optional[float] = None,
+    tolerance_pct: float = 0.0,
+    user: str = Depends(verify_jwt_or_basic),
+    db: Session = Depends(get_db)
+):
+    """
+    Range-overlap queries over active, non-stale levels.
+
+    With low/high: levels whose range intersects [low, high].
+    Without: KT Technical and Discord levels that overlap each other,
+    optionally padded by tolerance_pct percent.
+    """
+    symbol = symbol.upper()
+    if (low is None) != (high is None):
+        raise HTTPException(status_code=400, detail="Provide both low and high, or neither")
+    if tolerance_pct < 0:
+        raise HTTPException(status_code=400, detail="tolerance_pct must be non-negative")
+
+    try:
+        index = get_level_index()
+        if low is not None:
+            levels = index.overlapping(db, symbol, low, high)
+            return {
+                "symbol": symbol,
+                "low": min(low, high),
+                "high": max(low, high),
+                "levels": levels,
+                "count": len(levels)
+            }
+
+        overlaps = index.cross_source_overlaps(db, symbol, tolerance_pct)
+        return {
+            "symbol": symbol,
+            "tolerance_pct": tolerance_pct,
+            "overlaps": overlaps,
+            "count": len(overlaps)
+        }
+
+    except Exception as e:
+        logger.error(f"Error fetching overlapping levels for {symbol}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/confluence/opportunities")
 async def get_confluence_opportunities(
     user: str = Depends(verify_jwt_or_basic),
@@ -343,29 +495,31 @@ async def get_confluence_opportunities(
     """
 
     try:
-        states = db.query(SymbolState).filter(
-            and_(
-                SymbolState.confluence_score >= 0.7,
-                SymbolState.sources_directionally_aligned == True
-            )
-        ).order_by(desc(SymbolState.confluence_score)).all()
+        entries = sorted(
+            (
+                e for e in get_symbol_snapshot().entries(db)
+                if (e["confluence_score"] or 0) >= 0.7 and e["sources_directionally_aligned"]
+            ),
+            key=lambda e: e["confluence_score"],
+            reverse=True
+        )
 
         opportunities = []
-        for state in states:
-            # PRD-048: Calculate staleness on read
-            overall_staleness = calculate_staleness(state.updated_at)
-            kt_staleness = calculate_staleness(state.kt_last_updated)
-            discord_staleness = calculate_staleness(state.discord_last_updated)
+        for entry in entries:
+            # PRD-048: Staleness from stored stale_since columns
+            overall_staleness = read_staleness(entry["updated_at"], entry["stale_since"])
+            kt_staleness = read_staleness(entry["kt_last_updated"], entry["kt_stale_since"])
+            discord_staleness = read_staleness(entry["discord_last_updated"], entry["discord_stale_since"])
 
             opportunities.append({
-                "symbol": state.symbol,
-                "confluence_score": state.confluence_score,
-                "kt_bias": state.kt_bias,
-                "discord_quadrant": state.discord_quadrant,
-                "summary": state.confluence_summary,
-                "trade_setup": state.trade_setup_suggestion,
-                "kt_last_updated": state.kt_last_updated.isoformat() if state.kt_last_updated else None,
-                "discord_last_updated": state.discord_last_updated.isoformat() if state.discord_last_updated else None,
+                "symbol": entry["symbol"],
+                "confluence_score": entry["confluence_score"],
+                "kt_bias": entry["kt_bias"],
+                "discord_quadrant": entry["discord_quadrant"],
+                "summary": entry["confluence_summary"],
+                "trade_setup": entry["trade_setup_suggestion"],
+                "kt_last_updated": entry["kt_last_updated"].isoformat() if entry["kt_last_updated"] else None,
+                "discord_last_updated": entry["discord_last_updated"].isoformat() if entry["discord_last_updated"] else None,
                 # PRD-048: Staleness info
                 **overall_staleness,
                 "kt_is_stale": kt_staleness["is_stale"],
@@ -409,22 +563,24 @@ async def refresh_symbol_data(
         try:
             from backend.utils.staleness_manager import (
                 check_and_mark_stale_data,
-                update_symbol_confluence
+                apply_confluence
             )
 
             # Run staleness check
             staleness_results = check_and_mark_stale_data(db)
 
-            # Recalculate confluence for all symbols
+            # Recalculate confluence for all symbols in one pass and one commit
             confluence_updates = []
             states = db.query(SymbolState).all()
             for state in states:
-                result = update_symbol_confluence(db, state.symbol)
-                if result.get("confluence", {}).get("aligned"):
+                confluence = apply_confluence(state)
+                if confluence["aligned"]:
                     confluence_updates.append({
                         "symbol": state.symbol,
-                        "score": result["confluence"]["score"]
+                        "score": confluence["score"]
                     })
+            db.commit()
+            get_symbol_snapshot().invalidate()
 
             logger.info(f"Manual symbol refresh completed. "
                        f"Staleness: {len(staleness_results.get('kt_stale_symbols', []))} KT, "
@@ -437,7 +593,9 @@ async def refresh_symbol_data(
                 "staleness_check": {
                     "kt_stale_symbols": staleness_results.get("kt_stale_symbols", []),
                     "discord_stale_symbols": staleness_results.get("discord_stale_symbols", []),
-                    "levels_marked_stale": staleness_results.get("stale_levels_marked", 0)
+                    "levels_marked_stale": staleness_results.get("stale_levels_marked", 0),
+                    "states_updated": staleness_results.get("states_updated", 0),
+                    "duration_ms": staleness_results.get("duration_ms")
                 },
                 "confluence_updated": confluence_updates,
                 "total_symbols_checked": len(states)
@@ -508,6 +666,8 @@ async def extract_symbols_from_content(
                 SymbolLevel.extracted_from_content_id == content_id
             ).delete()
             logger.info(f"Force re-extraction: cleared {deleted} existing levels for content {content_id}")
+            get_symbol_snapshot().invalidate()
+            get_level_index().invalidate()
 
         # Run extraction
         extractor = SymbolLevelExtractor()
@@ -754,6 +914,8 @@ async def update_level(
         level.invalidation_reason = "User edited"
 
         db.commit()
+        get_symbol_snapshot().refresh(db, [level.symbol])
+        get_level_index().invalidate([level.symbol])
 
         logger.info(f"Level {level_id} updated by user")
 
@@ -788,6 +950,8 @@ async def dismiss_level(
         level.invalidation_reason = "User dismissed"
 
         db.commit()
+        get_symbol_snapshot().refresh(db, [level.symbol])
+        get_level_index().remove_level(level.symbol, level_id)
 
         logger.info(f"Level {level_id} dismissed by user")
 
@@ -6,7 +6,7 @@ Single pipeline — one generation method, one output schema, no versions or tie
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks, Request
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy import desc, func
 from typing import Optional
 from datetime import datetime, timedelta
@@ -24,17 +24,17 @@ from backend.models import (
     AnalyzedContent,
     RawContent,
     Source,
-    SynthesisQualityScore,
     SymbolState,
     ConfluenceScore,
     Theme
 )
+from backend.services.bulk_analysis import confluence_score_row
+from backend.services.jobs import JobTracker, list_jobs, run_job, start_job
+from backend.services.synthesis_pipeline import StageFailed, run_pipeline, stage_timings, synthesis_stages
 from backend.utils.auth import verify_jwt_or_basic
 from backend.utils.rate_limiter import limiter, RATE_LIMITS
 from backend.utils.sanitization import sanitize_search_query
 from backend.utils.data_helpers import safe_get_analysis_result, safe_get_analysis_preview
-from agents.theme_extractor import extract_and_track_themes
-from agents.synthesis_evaluator import SynthesisEvaluatorAgent
 from agents.confluence_scorer import ConfluenceScorerAgent
 
 logger = logging.getLogger(__name__)
@@ -44,28 +44,6 @@ router = APIRouter()
 SYNTHESIS_TIMEOUT_SECONDS = int(os.getenv("SYNTHESIS_TIMEOUT", "600"))
 synthesis_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="synthesis_")
 
-# Module-level progress tracker for active synthesis runs
-_synthesis_progress: dict = {"active": False, "steps": [], "current_step": None}
-
-
-def _update_progress(step_name: str, status: str = "in_progress") -> None:
-    """Update the active synthesis progress tracker."""
-    for step in _synthesis_progress["steps"]:
-        if step["name"] == step_name:
-            step["status"] = status
-            break
-    if status == "in_progress":
-        _synthesis_progress["current_step"] = step_name
-
-
-async def _run_in_executor(func, *args, **kwargs):
-    """Run a synchronous function in the thread pool to avoid blocking the event loop."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(
-        synthesis_executor,
-        lambda: func(*args, **kwargs)
-    )
-
 # YouTube channel display names (maps collector keys to human-readable names)
 YOUTUBE_CHANNEL_DISPLAY = {
     "peter_diamandis": "Moonshots",
@@ -85,248 +63,205 @@ class SynthesisGenerateRequest(BaseModel):
 # Synthesis Endpoints
 # ============================================================================
 
-@router.post("/generate")
-@limiter.limit(RATE_LIMITS["synthesis"])
-async def generate_synthesis(
-    request: Request,
-    synthesis_request: SynthesisGenerateRequest,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
-    user: str = Depends(verify_jwt_or_basic)
-):
+TIME_WINDOWS = {
+    "24h": timedelta(hours=24),
+    "7d": timedelta(days=7),
+    "30d": timedelta(days=30)
+}
+
+
+def _validate_time_window(time_window: str) -> None:
+    if time_window not in TIME_WINDOWS:
+        raise HTTPException(status_code=400, detail=f"Invalid time_window. Use: {list(TIME_WINDOWS.keys())}")
+
+
+def _job_summary(response: dict) -> dict:
+    """Compact job result; the synthesis itself is stored in the syntheses table."""
+    return {key: response[key] for key in ("status", "synthesis_id", "content_count", "stage_timings", "message")
+            if key in response}
+
+
+async def _run_synthesis(
+    session_factory,
+    time_window: str,
+    focus_topic: Optional[str],
+    tracker: JobTracker
+) -> dict:
     """
-    Generate a new research synthesis.
+    Run the synthesis pipeline for a time window, reporting steps to the job tracker.
 
-    Single pipeline: main synthesis + per-source breakdowns + content summaries.
+    Returns the /generate response. Raises StageFailed when a pipeline stage fails.
     """
-    time_deltas = {
-        "24h": timedelta(hours=24),
-        "7d": timedelta(days=7),
-        "30d": timedelta(days=30)
-    }
+    cutoff = datetime.utcnow() - TIME_WINDOWS[time_window]
 
-    if synthesis_request.time_window not in time_deltas:
-        raise HTTPException(status_code=400, detail=f"Invalid time_window. Use: {list(time_deltas.keys())}")
+    tracker.step("Loading content")
+    # Get recent content
+    db = session_factory()
+    try:
+        content_items = _get_content_for_synthesis(db, cutoff, focus_topic)
+    finally:
+        db.close()
+    logger.info(f"Found {len(content_items)} content items for synthesis")
 
-    cutoff = datetime.utcnow() - time_deltas[synthesis_request.time_window]
+    if not content_items:
+        tracker.step("Loading content", "complete")
+        return {
+            "status": "no_content",
+            "message": f"No analyzed content found in the past {time_window}",
+            "content_count": 0
+        }
 
-    import traceback
-    try:
-        # Get recent content
-        content_items = _get_content_for_synthesis(db, cutoff, synthesis_request.focus_topic)
-        logger.info(f"Found {len(content_items)} content items for synthesis")
-
-        if not content_items:
-            return {
-                "status": "no_content",
-                "message": f"No analyzed content found in the past {synthesis_request.time_window}",
-                "content_count": 0
-            }
+    # Older content (7-30 days ago) for re-review recommendations
+    older_cutoff_start = datetime.utcnow() - timedelta(days=30)
 
-        # Get older content for re-review recommendations (7-30 days ago)
-        older_cutoff_start = datetime.utcnow() - timedelta(days=30)
+    def load_older(session):
         older_content = _get_content_for_synthesis(
-            db, older_cutoff_start, synthesis_request.focus_topic,
+            session, older_cutoff_start, focus_topic,
             end_date=cutoff
         )
         logger.info(f"Found {len(older_content)} older items for re-review scanning")
+        return older_content
 
-        # Get KT Technical symbol data
-        kt_symbol_data = _get_kt_symbol_data(db)
-
+    def score_content(session, items):
         # Auto-score any unscored content so pillar scores and cross-reference always have data
-        try:
-            scoring_result = await _run_in_executor(_score_unscored_content, db, content_items)
-            if scoring_result["scored"] > 0:
-                logger.info(f"Auto-scored {scoring_result['scored']} items before synthesis")
-        except Exception as scoring_error:
-            logger.warning(f"Auto-scoring failed (non-fatal): {str(scoring_error)}")
-
-        # Get 7-pillar confluence scores for the time window
-        pillar_scores = _get_pillar_scores_for_synthesis(db, cutoff)
+        scoring_result = _score_unscored_content(session, items)
+        if scoring_result["scored"] > 0:
+            logger.info(f"Auto-scored {scoring_result['scored']} items before synthesis")
+        return scoring_result
+
+    def load_pillar_scores(session):
+        # 7-pillar confluence scores for the time window
+        pillar_scores = _get_pillar_scores_for_synthesis(session, cutoff)
         if pillar_scores:
             logger.info(f"Including pillar scores from {len(pillar_scores)} sources in synthesis")
+        return pillar_scores
+
+    # Declare the job's steps (one per source group)
+    from agents.synthesis_agent import SynthesisAgent
+    agent = SynthesisAgent()
+    source_keys: dict = {}
+    for item in content_items:
+        source_keys.setdefault(agent._get_source_key(item), None)
+
+    tracker.set_steps(
+        ["Loading content"]
+        + [f"Analyzing {sk}" for sk in source_keys]
+        + ["Merging analyses", "Cross-referencing", "Evaluating quality", "Extracting themes"],
+        complete=1
+    )
 
-        # Generate synthesis
-        from agents.synthesis_agent import SynthesisAgent
-        agent = SynthesisAgent()
+    # Scoring, cross-reference, quality and themes run as a DAG around the synthesis
+    stages = synthesis_stages(
+        content_items,
+        time_window=time_window,
+        focus_topic=focus_topic,
+        load_older=load_older,
+        load_kt=_get_kt_symbol_data,
+        score_content=score_content,
+        load_pillar_scores=load_pillar_scores,
+        cross_reference=lambda session: _run_cross_reference(session, cutoff, time_window),
+        synthesis_timeout=SYNTHESIS_TIMEOUT_SECONDS,
+        progress_callback=tracker.step
+    )
+    pipeline = await run_pipeline(
+        stages,
+        session_factory=session_factory,
+        executor=synthesis_executor,
+        on_progress=tracker.step
+    )
 
-        # Initialize synthesis progress tracker
-        source_groups_preview: dict = {}
-        for item in content_items:
-            key = agent._get_source_key(item)
-            source_groups_preview.setdefault(key, []).append(item)
-
-        progress_steps = [{"name": "Loading content", "status": "complete"}]
-        for sk in source_groups_preview:
-            progress_steps.append({"name": f"Analyzing {sk}", "status": "pending"})
-        progress_steps += [
-            {"name": "Merging analyses", "status": "pending"},
-            {"name": "Cross-referencing", "status": "pending"},
-            {"name": "Evaluating quality", "status": "pending"},
-            {"name": "Extracting themes", "status": "pending"},
-        ]
-        _synthesis_progress.update({
-            "active": True,
-            "steps": progress_steps,
-            "current_step": "Loading content",
-        })
+    result = pipeline["results"]["synthesis"]
+    saved = pipeline["results"]["save"]
+    quality_evaluation = pipeline["results"].get("quality")
 
-        async def run_synthesis_with_timeout(synthesis_func, *args, **kwargs):
-            """Run synthesis with timeout protection."""
-            loop = asyncio.get_event_loop()
-            try:
-                return await asyncio.wait_for(
-                    loop.run_in_executor(
-                        synthesis_executor,
-                        lambda: synthesis_func(*args, **kwargs)
-                    ),
-                    timeout=SYNTHESIS_TIMEOUT_SECONDS
-                )
-            except asyncio.TimeoutError:
-                logger.error(f"Synthesis generation timed out after {SYNTHESIS_TIMEOUT_SECONDS}s")
-                raise HTTPException(
-                    status_code=504,
-                    detail={
-                        "error": "synthesis_timeout",
-                        "message": f"Synthesis generation timed out after {SYNTHESIS_TIMEOUT_SECONDS} seconds.",
-                        "timeout_seconds": SYNTHESIS_TIMEOUT_SECONDS
-                    }
-                )
-
-        logger.info(f"Generating synthesis for {len(content_items)} items...")
-        result = await run_synthesis_with_timeout(
-            agent.analyze,
-            content_items=content_items,
-            older_content=older_content,
-            time_window=synthesis_request.time_window,
-            focus_topic=synthesis_request.focus_topic,
-            kt_symbol_data=kt_symbol_data,
-            pillar_scores=pillar_scores if pillar_scores else None,
-            progress_callback=_update_progress
-        )
-        logger.info(
-            f"Synthesis complete: {len(result.get('source_breakdowns', {}))} source breakdowns, "
-            f"{len(result.get('content_summaries', []))} content summaries"
-        )
+    response = {
+        "status": "success",
+        "synthesis_id": saved["id"],
+        **result,
+        "generated_at": saved["generated_at"].isoformat(),
+        "stage_timings": stage_timings(pipeline)
+    }
+    if quality_evaluation:
+        response["quality_evaluation"] = quality_evaluation
+    return response
 
-        # Enrich synthesis with CrossReference analysis (Bayesian convictions, contradictions)
-        _update_progress("Cross-referencing", "in_progress")
-        try:
-            cross_ref_result = await _run_in_executor(_run_cross_reference, db, cutoff, synthesis_request.time_window)
-            if cross_ref_result:
-                result["bayesian_convictions"] = cross_ref_result.get("high_conviction_ideas", [])
-                result["structured_contradictions"] = cross_ref_result.get("contradictions", [])
-                result["theme_clusters"] = cross_ref_result.get("confluent_themes", [])
-                logger.info(
-                    f"CrossReference enrichment: {len(result.get('bayesian_convictions', []))} high-conviction ideas, "
-                    f"{len(result.get('structured_contradictions', []))} contradictions"
-                )
-        except Exception as cross_ref_error:
-            logger.warning(f"CrossReference enrichment failed (non-fatal): {str(cross_ref_error)}")
-        finally:
-            _update_progress("Cross-referencing", "complete")
-
-        # Extract summary text for the flat synthesis column (used by /history previews)
-        exec_summary = result.get("executive_summary", {})
-        synthesis_text = ""
-        market_regime_str = "unclear"
-        if isinstance(exec_summary, dict):
-            synthesis_text = exec_summary.get("synthesis_narrative", exec_summary.get("narrative", ""))
-            market_regime_str = exec_summary.get("overall_tone", "unclear")
-
-        # Save to database
-        synthesis = Synthesis(
-            schema_version="5.0",
-            synthesis=synthesis_text,
-            key_themes=json.dumps([t.get("theme", "") for t in result.get("confluence_zones", [])]),
-            high_conviction_ideas=json.dumps(result.get("attention_priorities", [])),
-            contradictions=json.dumps(result.get("conflict_watch", [])),
-            market_regime=market_regime_str,
-            catalysts=json.dumps(result.get("catalyst_calendar", [])),
-            synthesis_json=json.dumps(result),
-            time_window=synthesis_request.time_window,
-            content_count=result.get("content_count", len(content_items)),
-            sources_included=json.dumps(result.get("sources_included", [])),
-            focus_topic=synthesis_request.focus_topic,
-            generated_at=datetime.utcnow()
-        )
-        db.add(synthesis)
-        db.commit()
-        db.refresh(synthesis)
 
-        # Run quality evaluation
-        _update_progress("Evaluating quality", "in_progress")
-        quality_evaluation = None
-        if os.getenv("ENABLE_QUALITY_EVALUATION", "true").lower() == "true":
-            try:
-                logger.info(f"Running quality evaluation for synthesis {synthesis.id}...")
-                evaluator = SynthesisEvaluatorAgent()
-                quality_result = await _run_in_executor(
-                    evaluator.evaluate,
-                    synthesis_output=result,
-                    original_content=content_items
-                )
-
-                quality_score = SynthesisQualityScore(
-                    synthesis_id=synthesis.id,
-                    quality_score=quality_result["quality_score"],
-                    grade=quality_result["grade"],
-                    confluence_detection=quality_result["confluence_detection"],
-                    evidence_preservation=quality_result["evidence_preservation"],
-                    source_attribution=quality_result["source_attribution"],
-                    youtube_channel_granularity=quality_result["youtube_channel_granularity"],
-                    nuance_retention=quality_result["nuance_retention"],
-                    actionability=quality_result["actionability"],
-                    theme_continuity=quality_result["theme_continuity"],
-                    flags=json.dumps(quality_result.get("flags", [])),
-                    prompt_suggestions=json.dumps(quality_result.get("prompt_suggestions", []))
-                )
-                db.add(quality_score)
-                db.commit()
-
-                quality_evaluation = quality_result
-                logger.info(f"Quality evaluation complete: {quality_result['grade']} ({quality_result['quality_score']}/100)")
-            except Exception as quality_error:
-                logger.warning(f"Quality evaluation failed (non-fatal): {str(quality_error)}")
-        _update_progress("Evaluating quality", "complete")
-
-        # Extract and track themes
-        _update_progress("Extracting themes", "in_progress")
-        try:
-            theme_result = await _run_in_executor(extract_and_track_themes, result, db)
-            logger.info(f"Theme extraction complete: {theme_result.get('created', 0)} created, "
-                       f"{theme_result.get('updated', 0)} updated")
-        except Exception as theme_error:
-            db.rollback()
-            logger.warning(f"Theme extraction failed (non-fatal): {str(theme_error)}")
-        _update_progress("Extracting themes", "complete")
-
-        # Mark synthesis as complete
-        _synthesis_progress["active"] = False
-        _synthesis_progress["current_step"] = None
-
-        # Return response
-        response = {
-            "status": "success",
-            "synthesis_id": synthesis.id,
-            **result,
-            "generated_at": synthesis.generated_at.isoformat()
-        }
-        if quality_evaluation:
-            response["quality_evaluation"] = quality_evaluation
-        return response
+@router.post("/generate")
+@limiter.limit(RATE_LIMITS["synthesis"])
+async def generate_synthesis(
+    request: Request,
+    synthesis_request: SynthesisGenerateRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    user: str = Depends(verify_jwt_or_basic)
+):
+    """
+    Generate a new research synthesis.
+
+    Single pipeline: main synthesis + per-source breakdowns + content summaries.
+    Runs inline and returns the synthesis; POST /jobs runs it in the background.
+    """
+    _validate_time_window(synthesis_request.time_window)
 
-    except HTTPException:
-        _synthesis_progress["active"] = False
-        raise
+    import traceback
+    tracker = JobTracker.create(db, "synthesis", synthesis_request.model_dump(), user=user)
+    try:
+        response = await run_job(
+            tracker,
+            lambda t: _run_synthesis(
+                sessionmaker(bind=db.get_bind()), synthesis_request.time_window, synthesis_request.focus_topic, t
+            ),
+            summarize=_job_summary
+        )
+        return {**response, "job_id": tracker.job_id}
+
+    except StageFailed as e:
+        if e.stage == "synthesis" and isinstance(e.error, asyncio.TimeoutError):
+            logger.error(f"Synthesis generation timed out after {SYNTHESIS_TIMEOUT_SECONDS}s")
+            raise HTTPException(
+                status_code=504,
+                detail={
+                    "error": "synthesis_timeout",
+                    "message": f"Synthesis generation timed out after {SYNTHESIS_TIMEOUT_SECONDS} seconds.",
+                    "timeout_seconds": SYNTHESIS_TIMEOUT_SECONDS,
+                    "job_id": tracker.job_id
+                }
+            )
+        error_msg = f"Synthesis generation failed: {str(e.error)}\n{traceback.format_exc()}"
+        logger.error(error_msg)
+        raise HTTPException(status_code=500, detail=error_msg)
     except Exception as e:
-        _synthesis_progress["active"] = False
         error_msg = f"Synthesis generation failed: {str(e)}\n{traceback.format_exc()}"
         logger.error(error_msg)
         raise HTTPException(status_code=500, detail=error_msg)
 
 
+@router.post("/jobs", status_code=202)
+@limiter.limit(RATE_LIMITS["synthesis"])
+async def start_synthesis_job(
+    request: Request,
+    synthesis_request: SynthesisGenerateRequest,
+    db: Session = Depends(get_db),
+    user: str = Depends(verify_jwt_or_basic)
+):
+    """
+    Start synthesis generation in the background.
+
+    Returns a job handle immediately; follow it with GET /api/jobs/{job_id},
+    the /api/jobs/{job_id}/events stream or job_progress events on /ws.
+    """
+    _validate_time_window(synthesis_request.time_window)
+
+    tracker = JobTracker.create(db, "synthesis", synthesis_request.model_dump(), user=user)
+    session_factory = sessionmaker(bind=db.get_bind())
+    start_job(
+        tracker,
+        lambda t: _run_synthesis(session_factory, synthesis_request.time_window, synthesis_request.focus_topic, t),
+        summarize=_job_summary
+    )
+    return {"job_id": tracker.job_id, "status": "queued", "kind": "synthesis"}
+
+
 @router.get("/latest")
 @limiter.limit(RATE_LIMITS["default"])
 async def get_latest_synthesis(
@@ -480,10 +415,25 @@ async def debug_synthesis(
 @limiter.limit(RATE_LIMITS["default"])
 async def get_synthesis_progress(
     request: Request,
+    db: Session = Depends(get_db),
     user: str = Depends(verify_jwt_or_basic)
 ):
-    """Get current synthesis generation progress."""
-    return _synthesis_progress
+    """
+    Get progress of the most recent synthesis run.
+
+    Read from the jobs table, so it reflects runs in any worker.
+    """
+    latest = list_jobs(db, kind="synthesis", limit=1)
+    if not latest:
+        return {"active": False, "steps": [], "current_step": None, "job_id": None}
+    job = latest[0]
+    return {
+        "active": job["status"] in ("queued", "running"),
+        "steps": job["steps"],
+        "current_step": job["current_step"],
+        "job_id": job["job_id"],
+        "status": job["status"]
+    }
 
 
 @router.get("/{synthesis_id}")
@@ -748,7 +698,9 @@ def _score_unscored_content(db: Session, content_items: list) -> dict:
     """
     Score any analyzed content that doesn't yet have a ConfluenceScore.
 
-    Runs ConfluenceScorerAgent on each unscored item and saves the results.
+    Hydrates the unscored items' analyses in one query, scores them with
+    ConfluenceScorerAgent.score_many (short items packed per prompt, prompts
+    run concurrently) and inserts the new rows in one flush.
     Called automatically before synthesis to ensure pillar scores and
     cross-reference data are always available.
 
@@ -766,71 +718,66 @@ def _score_unscored_content(db: Session, content_items: list) -> dict:
         ).all()
     )
 
-    unscored_items = [item for item in content_items if item.get("analyzed_content_id") not in existing_scored]
+    unscored_items = [
+        item for item in content_items
+        if item.get("analyzed_content_id") and item["analyzed_content_id"] not in existing_scored
+    ]
 
     if not unscored_items:
         logger.info("All content already has confluence scores")
         return {"scored": 0, "skipped": len(ac_ids), "failed": 0}
 
     logger.info(f"Auto-scoring {len(unscored_items)} unscored content items...")
-    scorer = ConfluenceScorerAgent()
-    scored = 0
-    failed = 0
 
-    for item in unscored_items:
-        try:
-            # Build analysis_result dict for the scorer
-            analysis_input = {
-                "summary": item.get("analyzed_summary") or item.get("summary", ""),
-                "themes": item.get("themes", []),
-                "tickers": item.get("tickers", []),
-                "sentiment": item.get("sentiment", ""),
-                "conviction": item.get("conviction", ""),
-                "key_quotes": item.get("key_quotes", []),
-                "source": item.get("source", "unknown"),
-                "content_type": item.get("type", "unknown"),
-            }
+    # Hydrate the full analysis_result for every unscored item in one query (richer scoring input)
+    full_results = dict(
+        db.query(AnalyzedContent.id, AnalyzedContent.analysis_result).filter(
+            AnalyzedContent.id.in_([item["analyzed_content_id"] for item in unscored_items])
+        ).all()
+    )
 
-            # Also get the full analysis_result from DB for richer scoring
-            analyzed = db.query(AnalyzedContent).filter(
-                AnalyzedContent.id == item["analyzed_content_id"]
-            ).first()
-            if analyzed and analyzed.analysis_result:
-                try:
-                    full_analysis = json.loads(analyzed.analysis_result)
-                    full_analysis["source"] = item.get("source", "unknown")
-                    full_analysis["content_type"] = item.get("type", "unknown")
-                    analysis_input = full_analysis
-                except json.JSONDecodeError:
-                    pass
-
-            result = scorer.analyze(analysis_input)
-
-            pillar_scores = result.get("pillar_scores", {})
-            new_score = ConfluenceScore(
-                analyzed_content_id=item["analyzed_content_id"],
-                macro_score=pillar_scores.get("macro", 0),
-                fundamentals_score=pillar_scores.get("fundamentals", 0),
-                valuation_score=pillar_scores.get("valuation", 0),
-                positioning_score=pillar_scores.get("positioning", 0),
-                policy_score=pillar_scores.get("policy", 0),
-                price_action_score=pillar_scores.get("price_action", 0),
-                options_vol_score=pillar_scores.get("options_vol", 0),
-                core_total=result.get("core_total", 0),
-                total_score=result.get("total_score", 0),
-                meets_threshold=result.get("meets_threshold", False),
-                reasoning=json.dumps(result.get("reasoning", {})),
-                falsification_criteria=json.dumps(result.get("falsification_criteria", []))
-            )
-            db.add(new_score)
-            scored += 1
-            logger.info(f"Scored content {item['analyzed_content_id']}: {new_score.total_score}/14")
+    scoring_inputs = []
+    for item in unscored_items:
+        # Build analysis_result dict for the scorer
+        analysis_input = {
+            "summary": item.get("analyzed_summary") or item.get("summary", ""),
+            "themes": item.get("themes", []),
+            "tickers": item.get("tickers", []),
+            "sentiment": item.get("sentiment", ""),
+            "conviction": item.get("conviction", ""),
+            "key_quotes": item.get("key_quotes", []),
+            "source": item.get("source", "unknown"),
+            "content_type": item.get("type", "unknown"),
+        }
+        analysis_result = full_results.get(item["analyzed_content_id"])
+        if analysis_result:
+            try:
+                full_analysis = json.loads(analysis_result)
+                full_analysis["source"] = item.get("source", "unknown")
+                full_analysis["content_type"] = item.get("type", "unknown")
+                analysis_input = full_analysis
+            except json.JSONDecodeError:
+                pass
+        scoring_inputs.append(analysis_input)
+
+    # Short items share a prompt; prompts run concurrently
+    scorer = ConfluenceScorerAgent()
+    results = scorer.score_many(scoring_inputs)
 
-        except Exception as e:
-            logger.warning(f"Failed to score content {item.get('analyzed_content_id')}: {e}")
+    new_scores = []
+    failed = 0
+    for item, result in zip(unscored_items, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to score content {item.get('analyzed_content_id')}: {result}")
             failed += 1
+            continue
+
+        new_scores.append(confluence_score_row(item["analyzed_content_id"], result))
 
+    scored = len(new_scores)
     if scored > 0:
+        # One flush inserts every row (ORM objects, so the activity rollup listener still sees them)
+        db.add_all(new_scores)
         db.commit()
         logger.info(f"Auto-scoring complete: {scored} scored, {failed} failed, {len(existing_scored)} already scored")
 
@@ -903,6 +850,7 @@ def _run_cross_reference(db: Session, cutoff: datetime, time_window: str) -> Opt
     the cross-reference analysis result. Returns None if no scores available.
     """
     from agents.cross_reference import CrossReferenceAgent
+    from backend.services.mention_index import tickers_by_content
     from backend.utils.data_helpers import safe_get_analysis_result
 
     # Query confluence scores with related content
@@ -920,6 +868,9 @@ def _run_cross_reference(db: Session, cutoff: datetime, time_window: str) -> Opt
         logger.info("No ConfluenceScore records for cross-reference — skipping enrichment")
         return None
 
+    # Canonical tickers per analysis for contradiction grouping (one query)
+    tickers = tickers_by_content(db, [analyzed.id for _, analyzed, _, _ in results])
+
     # Shape each record into the format CrossReferenceAgent expects
     shaped_scores = []
     for score, analyzed, raw, source in results:
@@ -928,6 +879,7 @@ def _run_cross_reference(db: Session, cutoff: datetime, time_window: str) -> Opt
         shaped_scores.append({
             "primary_thesis": analysis_data.get("primary_thesis", analysis_data.get("summary", "")),
             "content_source": source.name,
+            "tickers": tickers.get(analyzed.id, []),
             "scored_at": score.scored_at.isoformat() if score.scored_at else None,
             "core_total": score.core_total,
             "total_score": score.total_score,
@@ -107,6 +107,7 @@ async def migrate_themes_schema(db: Session = Depends(get_db), user: str = Depen
         ("first_source", "VARCHAR"),
         ("evolved_from_theme_id", "INTEGER"),
         ("last_updated_at", "DATETIME"),
+        ("similarity_terms", "TEXT"),
     ]
 
     for col_name, col_type in columns_to_add:
@@ -158,7 +159,8 @@ async def migrate_themes_constraints(db: Session = Depends(get_db), user: str =
                 evidence_count INTEGER DEFAULT 0,
                 json_metadata TEXT,
                 created_at DATETIME,
-                updated_at DATETIME
+                updated_at DATETIME,
+                similarity_terms TEXT
             )
         """))
         db.commit()
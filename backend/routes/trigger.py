@@ -18,8 +18,9 @@ import logging
 import os
 import asyncio
 
-from backend.models import get_db, CollectionRun, RawContent, Source, TranscriptionStatus, SymbolState, SynthesisQualityScore
+from backend.models import get_db, CollectionRun, RawContent, Source, TranscriptionStatus, SymbolState
 from backend.utils.deduplication import check_duplicate
+from backend.services.alerting import collection_result_event, items_collected_event
 from backend.utils.sanitization import sanitize_search_query
 from backend.utils.data_helpers import safe_get_analysis_result, safe_get_analysis_preview
 
@@ -89,6 +90,7 @@ class AnalyzeRequest(BaseModel):
     """Request model for analysis trigger"""
     time_window: str = "24h"
     focus_topic: Optional[str] = None
+    classify_limit: int = 0  # classify up to this many unprocessed items (batched) before synthesis
 
 
 class TriggerResponse(BaseModel):
@@ -239,6 +241,12 @@ async def _run_collection_job(job_id: Optional[int], sources: List[str], dry_run
                 errors.append(error_msg)
                 failed += 1
 
+        # Per-source run outcome for SourceHealth (consecutive failures, errors)
+        if not dry_run:
+            for source_name, source_result in results.items():
+                db.execute(collection_result_event(db, source_name, source_result["status"] == "success"))
+            db.commit()
+
         # Update collection run record (skip in dry-run mode)
         if not dry_run and job_id:
             collection_run = db.query(CollectionRun).filter(CollectionRun.id == job_id).first()
@@ -333,6 +341,10 @@ async def _collect_from_source(db: Optional[Session], source_name: str, dry_run:
     elif items and dry_run:
         logger.info(f"[DRY RUN] Would save {len(items)} items from {source_name} to database")
 
+    if not dry_run and hasattr(collector, "commit_validators"):
+        # Only remember page versions once their posts are stored
+        collector.commit_validators()
+
     return items
 
 
@@ -399,6 +411,7 @@ async def _save_collected_items(db: Session, source_name: str, items: list) -> d
 
         saved_count += 1
 
+    db.execute(items_collected_event(db, source_name, saved_count, source.last_collected_at))
     db.commit()
 
     if skipped_duplicates > 0:
@@ -463,10 +476,8 @@ async def trigger_analysis(
         )
 
     try:
-        from agents.synthesis_agent import SynthesisAgent
-        from agents.synthesis_evaluator import SynthesisEvaluatorAgent
-        from agents.theme_extractor import extract_and_track_themes
-        from backend.models import Synthesis, AnalyzedContent, SynthesisQualityScore
+        from sqlalchemy.orm import sessionmaker
+        from backend.services.synthesis_pipeline import run_pipeline, stage_timings, synthesis_stages
 
         # Get time cutoff
         time_deltas = {
@@ -476,6 +487,18 @@ async def trigger_analysis(
         }
         cutoff = datetime.utcnow() - time_deltas[request.time_window]
 
+        # Classify pending content first (packed classifier prompts + routed agents)
+        classification_stats = None
+        if request.classify_limit > 0:
+            from backend.routes.analyze import classify_and_route
+
+            pending = db.query(RawContent).filter(
+                RawContent.processed == False
+            ).limit(request.classify_limit).all()
+            if pending:
+                _, classification_stats = classify_and_route(db, pending)
+                db.commit()
+
         # Get analyzed content
         content_items = _get_content_for_synthesis(db, cutoff, request.focus_topic)
 
@@ -483,97 +506,41 @@ async def trigger_analysis(
             return {
                 "status": "no_content",
                 "message": f"No analyzed content found in the past {request.time_window}",
-                "content_count": 0
+                "content_count": 0,
+                "classification_stats": classification_stats
             }
 
-        # Get older content for re-review recommendations
+        # Older content for re-review recommendations
         older_cutoff = datetime.utcnow() - timedelta(days=30)
-        older_content = _get_content_for_synthesis(db, older_cutoff, request.focus_topic, end_date=cutoff)
-
-        # Get KT symbol data
-        kt_symbol_data = _get_kt_symbol_data(db)
-
-        # Generate synthesis
-        agent = SynthesisAgent()
-        result = agent.analyze(
-            content_items=content_items,
-            older_content=older_content,
-            time_window=request.time_window,
-            focus_topic=request.focus_topic,
-            kt_symbol_data=kt_symbol_data
-        )
 
-        # Extract summary for flat columns
-        exec_summary = result.get("executive_summary", {})
-        synthesis_text = ""
-        market_regime_str = "unclear"
-        if isinstance(exec_summary, dict):
-            synthesis_text = exec_summary.get("synthesis_narrative", exec_summary.get("narrative", ""))
-            market_regime_str = exec_summary.get("overall_tone", "unclear")
-
-        # Save synthesis
-        synthesis = Synthesis(
-            schema_version="5.0",
-            synthesis=synthesis_text,
-            key_themes=json.dumps([t.get("theme", "") for t in result.get("confluence_zones", [])]),
-            high_conviction_ideas=json.dumps(result.get("attention_priorities", [])),
-            contradictions=json.dumps(result.get("conflict_watch", [])),
-            market_regime=market_regime_str,
-            catalysts=json.dumps(result.get("catalyst_calendar", [])),
-            synthesis_json=json.dumps(result),
-            time_window=request.time_window,
-            content_count=result.get("content_count", len(content_items)),
-            sources_included=json.dumps(result.get("sources_included", [])),
-            focus_topic=request.focus_topic,
-            generated_at=datetime.utcnow()
+        # Synthesis, quality evaluation and theme tracking run as a stage DAG
+        pipeline = await run_pipeline(
+            synthesis_stages(
+                content_items,
+                time_window=request.time_window,
+                focus_topic=request.focus_topic,
+                load_older=lambda session: _get_content_for_synthesis(
+                    session, older_cutoff, request.focus_topic, end_date=cutoff
+                ),
+                load_kt=_get_kt_symbol_data
+            ),
+            session_factory=sessionmaker(bind=db.get_bind())
         )
-        db.add(synthesis)
-        db.commit()
-        db.refresh(synthesis)
-
-        logger.info(f"Generated synthesis {synthesis.id} with {len(content_items)} content items")
+        result = pipeline["results"]["synthesis"]
+        saved = pipeline["results"]["save"]
 
-        # Run quality evaluation
-        if os.getenv("ENABLE_QUALITY_EVALUATION", "true").lower() == "true":
-            try:
-                evaluator = SynthesisEvaluatorAgent()
-                quality_result = evaluator.evaluate(
-                    synthesis_output=result,
-                    original_content=content_items
-                )
-                quality_score = SynthesisQualityScore(
-                    synthesis_id=synthesis.id,
-                    quality_score=quality_result["quality_score"],
-                    grade=quality_result["grade"],
-                    confluence_detection=quality_result["confluence_detection"],
-                    evidence_preservation=quality_result["evidence_preservation"],
-                    source_attribution=quality_result["source_attribution"],
-                    youtube_channel_granularity=quality_result["youtube_channel_granularity"],
-                    nuance_retention=quality_result["nuance_retention"],
-                    actionability=quality_result["actionability"],
-                    theme_continuity=quality_result["theme_continuity"],
-                    flags=json.dumps(quality_result.get("flags", [])),
-                    prompt_suggestions=json.dumps(quality_result.get("prompt_suggestions", []))
-                )
-                db.add(quality_score)
-                db.commit()
-            except Exception as qe:
-                logger.warning(f"Quality evaluation failed (non-fatal): {qe}")
-
-        # Extract and track themes
-        try:
-            extract_and_track_themes(result, db)
-        except Exception as te:
-            logger.warning(f"Theme extraction failed (non-fatal): {te}")
+        logger.info(f"Generated synthesis {saved['id']} with {len(content_items)} content items")
 
         return {
             "status": "success",
-            "synthesis_id": synthesis.id,
+            "synthesis_id": saved["id"],
             "content_count": len(content_items),
             "time_window": request.time_window,
-            "market_regime": market_regime_str,
+            "market_regime": saved["market_regime"],
             "key_themes": [t.get("theme", "") for t in result.get("confluence_zones", [])][:5],
-            "generated_at": synthesis.generated_at.isoformat()
+            "generated_at": saved["generated_at"].isoformat(),
+            "stage_timings": stage_timings(pipeline),
+            "classification_stats": classification_stats
         }
 
     except ImportError as e:
@@ -593,6 +560,7 @@ async def trigger_analysis(
 def _get_content_for_synthesis(db: Session, cutoff: datetime, focus_topic: Optional[str] = None, end_date: Optional[datetime] = None) -> list:
     """Get analyzed content for synthesis generation."""
     from backend.models import AnalyzedContent, RawContent, Source
+    from backend.services.mention_index import content_matching_topic
     from sqlalchemy import desc
 
     # Query analyzed content with source info
@@ -607,14 +575,11 @@ def _get_content_for_synthesis(db: Session, cutoff: datetime, focus_topic: Optio
     if end_date:
         query = query.filter(AnalyzedContent.analyzed_at < end_date)
 
-    # Filter by topic if provided (PRD-046: sanitize for SQL injection)
-    if focus_topic:
-        safe_topic = sanitize_search_query(focus_topic.lower())
-        if safe_topic:
-            query = query.filter(
-                (AnalyzedContent.key_themes.ilike(f"%{safe_topic}%")) |
-                (AnalyzedContent.tickers_mentioned.ilike(f"%{safe_topic}%"))
-            )
+    # Filter by topic if provided (PRD-046: reject inputs that sanitize to nothing)
+    if focus_topic and sanitize_search_query(focus_topic):
+        # Matched through the ticker / theme mention index, not CSV ilike scans;
+        # content_matching_topic binds the topic and escapes LIKE wildcards itself
+        query = query.filter(AnalyzedContent.id.in_(content_matching_topic(focus_topic.strip()[:100])))
 
     results = query.order_by(desc(AnalyzedContent.analyzed_at)).all()
 
@@ -871,9 +836,7 @@ async def process_pending_transcriptions(
     # Get the processor and trigger processing
     queued = []
     for status, raw_content in pending:
-        # Mark as processing
-        status.status = "processing"
-        status.last_attempt_at = datetime.utcnow()
+        # Left as "pending" - the processor claims each item when it starts it
 
         # Get metadata
         metadata = {}
@@ -894,11 +857,14 @@ async def process_pending_transcriptions(
 
     # Start processing in background
     import asyncio
-    from backend.workers import get_processor
+    from backend.workers import get_processor, notify_transcription_queued
     processor = get_processor()
 
-    # Trigger the processor to pick up items now
-    asyncio.create_task(processor._process_pending())
+    # Wake the processor to pick up items now
+    if processor.running:
+        await notify_transcription_queued()
+    else:
+        asyncio.create_task(processor._process_pending())
 
     return {
         "status": "queued",
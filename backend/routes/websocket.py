@@ -6,51 +6,150 @@ Provides real-time push notifications for:
 - Analysis completed
 - Confluence scores updated
 - Theme changes
+- Background job progress (job_progress)
+
+Fan-out: messages are serialized once, published through the pub/sub
+backbone (backend.services.pubsub), and queued per client so one slow
+connection cannot hold up the others.
 """
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import List
+from typing import Dict, List, Optional
 import logging
 import json
 import asyncio
+import os
+
+from backend.services.jobs import JOB_CHANNEL
+from backend.services.pubsub import PubSubBackend, get_pubsub
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Configuration
+SEND_QUEUE_SIZE = int(os.getenv("WEBSOCKET_SEND_QUEUE_SIZE", "100"))
+SEND_TIMEOUT_SECONDS = float(os.getenv("WEBSOCKET_SEND_TIMEOUT_SECONDS", "10"))
+BROADCAST_CHANNEL = "dashboard_events"
+
+# Close code sent to clients evicted for falling behind ("Try Again Later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+class ClientConnection:
+    """A WebSocket with its bounded outbound queue and sender task."""
+
+    def __init__(self, websocket: WebSocket, queue_size: int):
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.sender_task: Optional[asyncio.Task] = None
+
 
 class ConnectionManager:
-    """Manages active WebSocket connections."""
+    """
+    Manages active WebSocket connections.
+
+    Each client gets a bounded send queue drained by its own sender task, so
+    a slow client only delays itself. Clients whose queue fills up, or whose
+    send stalls past SEND_TIMEOUT_SECONDS, are evicted.
+
+    Broadcasts go through the pub/sub backbone so events published by any
+    process reach the clients connected to every API replica. Job progress
+    events (backend.services.jobs) are relayed to clients the same way.
+    """
 
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
+    def __init__(
+        self,
+        pubsub: Optional[PubSubBackend] = None,
+        queue_size: int = SEND_QUEUE_SIZE,
+        send_timeout: float = SEND_TIMEOUT_SECONDS
+    ):
+        self.connections: Dict[WebSocket, ClientConnection] = {}
+        self.queue_size = queue_size
+        self.send_timeout = send_timeout
+        self.evicted_count = 0
+        self.pubsub = pubsub or get_pubsub()
+        self.pubsub.subscribe(BROADCAST_CHANNEL, self.deliver_local)
+        self.pubsub.subscribe(JOB_CHANNEL, self.deliver_local)
+
+    @property
+    def active_connections(self) -> List[WebSocket]:
+        """Currently connected WebSockets."""
+        return list(self.connections)
 
     async def connect(self, websocket: WebSocket):
         """Accept and track new WebSocket connection."""
         await websocket.accept()
-        self.active_connections.append(websocket)
-        logger.info(f"WebSocket connected. Active connections: {len(self.active_connections)}")
+        client = ClientConnection(websocket, self.queue_size)
+        client.sender_task = asyncio.create_task(self._send_loop(client))
+        self.connections[websocket] = client
+        logger.info(f"WebSocket connected. Active connections: {len(self.connections)}")
 
     def disconnect(self, websocket: WebSocket):
-        """Remove disconnected WebSocket."""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        logger.info(f"WebSocket disconnected. Active connections: {len(self.active_connections)}")
+        """Remove disconnected WebSocket and stop its sender task."""
+        client = self.connections.pop(websocket, None)
+        if client and client.sender_task and client.sender_task is not asyncio.current_task():
+            client.sender_task.cancel()
+        logger.info(f"WebSocket disconnected. Active connections: {len(self.connections)}")
+
+    def send_text(self, websocket: WebSocket, payload: str) -> bool:
+        """
+        Queue a payload for a single client.
+
+        Returns:
+            False if the client was evicted because its queue is full
+        """
+        client = self.connections.get(websocket)
+        if client is None:
+            return False
+        try:
+            client.queue.put_nowait(payload)
+            return True
+        except asyncio.QueueFull:
+            self._evict(websocket, "send queue full")
+            return False
 
     async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients."""
-        disconnected = []
-
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to client: {e}")
-                disconnected.append(connection)
-
-        # Clean up disconnected clients
-        for conn in disconnected:
-            self.disconnect(conn)
+        """Serialize once and publish to all clients on all replicas."""
+        payload = json.dumps(message, separators=(",", ":"), ensure_ascii=False, default=str)
+        await self.pubsub.publish(BROADCAST_CHANNEL, payload)
+
+    async def deliver_local(self, payload: str):
+        """Enqueue a serialized payload for every client in this process."""
+        for websocket in list(self.connections):
+            self.send_text(websocket, payload)
+
+    async def _send_loop(self, client: ClientConnection):
+        """Drain a client's queue, evicting it if a send fails or stalls."""
+        try:
+            while True:
+                payload = await client.queue.get()
+                await asyncio.wait_for(
+                    client.websocket.send_text(payload),
+                    timeout=self.send_timeout
+                )
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            self._evict(client.websocket, f"send stalled for more than {self.send_timeout}s")
+        except Exception as e:
+            logger.error(f"Error sending to WebSocket client: {e}")
+            self.disconnect(client.websocket)
+
+    def _evict(self, websocket: WebSocket, reason: str):
+        """Drop a slow consumer and close its socket in the background."""
+        if websocket not in self.connections:
+            return
+        self.evicted_count += 1
+        logger.warning(f"Evicting slow WebSocket client: {reason}")
+        self.disconnect(websocket)
+        asyncio.get_running_loop().create_task(self._close_quietly(websocket))
+
+    async def _close_quietly(self, websocket: WebSocket):
+        try:
+            await websocket.close(code=SLOW_CONSUMER_CLOSE_CODE)
+        except Exception:
+            pass
 
 
 # Global connection manager
@@ -78,7 +177,7 @@ async def websocket_endpoint(websocket: WebSocket):
 
             # Echo back for heartbeat
             if data == "ping":
-                await websocket.send_text("pong")
+                manager.send_text(websocket, "pong")
 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -0,0 +1,390 @@
+"""
+Content Activity Rollups
+
+Keeps content_daily_rollups (source x day x content_type) in step with
+raw_content, analyzed_content and confluence_scores, and answers the
+dashboard and collection stats queries from it so their cost no longer
+grows with the corpus.
+
+Counters are maintained by an after_flush listener on every ORM Session,
+which covers all ingest and analysis paths without touching each call
+site. Bulk Query.delete() bypasses the listener; callers that use it run
+rebuild_activity_rollups for the affected sources. backfill_activity_rollups
+fills the empty table at startup, and scripts/rebuild_activity_rollups.py
+rebuilds from scratch.
+"""
+import logging
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import Date, and_, case, delete, event, func, insert, inspect, or_, select
+from sqlalchemy.orm import Session
+
+from backend.models import AnalyzedContent, ConfluenceScore, ContentDailyRollup, RawContent
+from backend.utils.upsert import additive_upsert
+
+logger = logging.getLogger(__name__)
+
+COUNTERS = (
+    "collected_count",
+    "processed_count",
+    "analyzed_count",
+    "scored_count",
+    "conviction_sum",
+    "conviction_count",
+)
+
+RollupKey = Tuple[int, Any, str]
+
+
+# ============================================================================
+# Flush tracking
+# ============================================================================
+
+def _loaded(obj, name):
+    """Attribute value without triggering a load (None if not loaded)."""
+    return inspect(obj).dict.get(name)
+
+
+def content_keys(session: Session, raw_ids: Iterable[int]) -> Dict[int, Tuple[int, str]]:
+    """(source_id, content_type) per raw_content id, from the identity map where possible."""
+    keys, missing = {}, []
+    for raw_id in set(raw_ids):
+        obj = session.identity_map.get(inspect(RawContent).identity_key_from_primary_key((raw_id,)))
+        if obj is not None and _loaded(obj, "source_id") is not None:
+            keys[raw_id] = (_loaded(obj, "source_id"), _loaded(obj, "content_type"))
+        else:
+            missing.append(raw_id)
+    if missing:
+        raw = RawContent.__table__
+        rows = session.connection().execute(
+            select(raw.c.id, raw.c.source_id, raw.c.content_type).where(raw.c.id.in_(missing))
+        )
+        keys.update({row.id: (row.source_id, row.content_type) for row in rows})
+    return keys
+
+
+def _analyzed_raw_ids(session: Session, analyzed_ids: Iterable[int]) -> Dict[int, int]:
+    """raw_content_id per analyzed_content id, from the identity map where possible."""
+    raw_ids, missing = {}, []
+    for analyzed_id in set(analyzed_ids):
+        obj = session.identity_map.get(inspect(AnalyzedContent).identity_key_from_primary_key((analyzed_id,)))
+        if obj is not None and _loaded(obj, "raw_content_id") is not None:
+            raw_ids[analyzed_id] = _loaded(obj, "raw_content_id")
+        else:
+            missing.append(analyzed_id)
+    if missing:
+        analyzed = AnalyzedContent.__table__
+        rows = session.connection().execute(
+            select(analyzed.c.id, analyzed.c.raw_content_id).where(analyzed.c.id.in_(missing))
+        )
+        raw_ids.update({row.id: row.raw_content_id for row in rows})
+    return raw_ids
+
+
+def _flush_deltas(session: Session) -> Tuple[Dict[RollupKey, Counter], Dict[RollupKey, datetime]]:
+    """Counter deltas implied by the pending new / deleted / dirty objects."""
+    deltas: Dict[RollupKey, Counter] = defaultdict(Counter)
+    last_collected: Dict[RollupKey, datetime] = {}
+    analyzed, scores = [], []
+
+    def raw_key(obj, at):
+        return (_loaded(obj, "source_id"), at.date(), _loaded(obj, "content_type"))
+
+    for objects, sign in ((session.new, 1), (session.deleted, -1)):
+        for obj in objects:
+            if isinstance(obj, RawContent):
+                collected_at = _loaded(obj, "collected_at")
+                if collected_at is None or _loaded(obj, "source_id") is None:
+                    continue
+                key = raw_key(obj, collected_at)
+                deltas[key]["collected_count"] += sign
+                if _loaded(obj, "processed"):
+                    deltas[key]["processed_count"] += sign
+                if sign > 0:
+                    last_collected[key] = max(collected_at, last_collected.get(key, collected_at))
+            elif isinstance(obj, AnalyzedContent):
+                analyzed.append((obj, sign))
+            elif isinstance(obj, ConfluenceScore):
+                scores.append((obj, sign))
+
+    for obj in session.dirty:
+        if not isinstance(obj, RawContent):
+            continue
+        history = inspect(obj).attrs.processed.history
+        if not history.added:
+            continue
+        before = bool(history.deleted[0]) if history.deleted else False
+        after = bool(history.added[0])
+        collected_at = _loaded(obj, "collected_at")
+        if before != after and collected_at is not None:
+            deltas[raw_key(obj, collected_at)]["processed_count"] += 1 if after else -1
+
+    if scores:
+        score_raw_ids = _analyzed_raw_ids(session, [_loaded(o, "analyzed_content_id") for o, _ in scores])
+    else:
+        score_raw_ids = {}
+    raw_keys = content_keys(
+        session,
+        [_loaded(o, "raw_content_id") for o, _ in analyzed] + list(score_raw_ids.values())
+    )
+
+    for obj, sign in analyzed:
+        content = raw_keys.get(_loaded(obj, "raw_content_id"))
+        analyzed_at = _loaded(obj, "analyzed_at")
+        if content is None or analyzed_at is None:
+            continue
+        key = (content[0], analyzed_at.date(), content[1])
+        deltas[key]["analyzed_count"] += sign
+        conviction = _loaded(obj, "conviction")
+        if conviction is not None:
+            deltas[key]["conviction_sum"] += sign * conviction
+            deltas[key]["conviction_count"] += sign
+
+    for obj, sign in scores:
+        content = raw_keys.get(score_raw_ids.get(_loaded(obj, "analyzed_content_id")))
+        scored_at = _loaded(obj, "scored_at")
+        if content is None or scored_at is None:
+            continue
+        deltas[(content[0], scored_at.date(), content[1])]["scored_count"] += sign
+
+    return deltas, last_collected
+
+
+def activity_upsert(dialect_name: str, key: RollupKey, counts: Dict[str, int],
+                    last_collected_at: Optional[datetime] = None):
+    """
+    Build the upsert that adds counts onto one (source, day, content_type) row.
+
+    Args:
+        dialect_name: Engine dialect name
+        key: (source_id, day, content_type)
+        counts: Deltas for COUNTERS (missing ones are 0)
+        last_collected_at: Newest collected_at in this batch, if any
+    """
+    table = ContentDailyRollup.__table__
+    source_id, day, content_type = key
+    values = {
+        "source_id": source_id,
+        "day": day,
+        "content_type": content_type,
+        "updated_at": datetime.utcnow(),
+        **{col: counts.get(col, 0) for col in COUNTERS},
+    }
+    overrides = None
+    if last_collected_at is not None:
+        values["last_collected_at"] = last_collected_at
+
+        def overrides(stmt):
+            newer = or_(table.c.last_collected_at.is_(None),
+                        stmt.excluded.last_collected_at > table.c.last_collected_at)
+            return {"last_collected_at": case((newer, stmt.excluded.last_collected_at),
+                                              else_=table.c.last_collected_at)}
+
+    return additive_upsert(
+        dialect_name, table, ("source_id", "day", "content_type"), values,
+        increment_columns=COUNTERS, set_overrides=overrides
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _track_activity(session, flush_context):
+    """Apply rollup deltas for the objects just flushed, in the same transaction."""
+    if not (session.new or session.deleted or session.dirty):
+        return
+    deltas, last_collected = _flush_deltas(session)
+    if not deltas:
+        return
+    connection = session.connection()
+    for key, counts in deltas.items():
+        if any(counts.values()) or key in last_collected:
+            connection.execute(activity_upsert(connection.dialect.name, key, counts, last_collected.get(key)))
+
+
+@event.listens_for(RawContent.processed, "set", active_history=True)
+def _load_previous_processed(target, value, oldvalue, initiator):
+    """Registered with active_history so a flip of an expired flag is still seen."""
+    return value
+
+
+# ============================================================================
+# Rebuild
+# ============================================================================
+
+def rebuild_activity_rollups(db: Session, source_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    Recompute content_daily_rollups from the content tables.
+
+    Args:
+        db: Session (not committed)
+        source_ids: Restrict to these sources; all sources when None
+
+    Returns:
+        Number of rollup rows written
+    """
+    raw = RawContent.__table__
+    analyzed = AnalyzedContent.__table__
+    scores = ConfluenceScore.__table__
+    rollups = ContentDailyRollup.__table__
+    source_ids = list(source_ids) if source_ids is not None else None
+
+    def scoped(stmt):
+        return stmt.where(raw.c.source_id.in_(source_ids)) if source_ids is not None else stmt
+
+    def day(column):
+        return func.date(column, type_=Date)
+
+    collected = scoped(select(
+        raw.c.source_id, day(raw.c.collected_at), raw.c.content_type,
+        func.count(),
+        func.sum(case((raw.c.processed == True, 1), else_=0)),  # noqa: E712
+        func.max(raw.c.collected_at),
+    ).where(raw.c.collected_at.isnot(None))
+     .group_by(raw.c.source_id, day(raw.c.collected_at), raw.c.content_type))
+
+    analyses = scoped(select(
+        raw.c.source_id, day(analyzed.c.analyzed_at), raw.c.content_type,
+        func.count(), func.sum(analyzed.c.conviction), func.count(analyzed.c.conviction),
+    ).select_from(analyzed.join(raw, analyzed.c.raw_content_id == raw.c.id))
+     .where(analyzed.c.analyzed_at.isnot(None))
+     .group_by(raw.c.source_id, day(analyzed.c.analyzed_at), raw.c.content_type))
+
+    scored = scoped(select(
+        raw.c.source_id, day(scores.c.scored_at), raw.c.content_type, func.count(),
+    ).select_from(
+        scores.join(analyzed, scores.c.analyzed_content_id == analyzed.c.id)
+        .join(raw, analyzed.c.raw_content_id == raw.c.id)
+    ).where(scores.c.scored_at.isnot(None))
+     .group_by(raw.c.source_id, day(scores.c.scored_at), raw.c.content_type))
+
+    rows: Dict[RollupKey, Dict[str, Any]] = {}
+
+    def row(key):
+        return rows.setdefault(key, {
+            "source_id": key[0], "day": key[1], "content_type": key[2],
+            "last_collected_at": None, "updated_at": datetime.utcnow(),
+            **dict.fromkeys(COUNTERS, 0)
+        })
+
+    for source_id, d, content_type, count, processed, latest in db.execute(collected):
+        entry = row((source_id, d, content_type))
+        entry.update(collected_count=count, processed_count=processed or 0, last_collected_at=latest)
+    for source_id, d, content_type, count, conviction_sum, conviction_count in db.execute(analyses):
+        entry = row((source_id, d, content_type))
+        entry.update(analyzed_count=count, conviction_sum=conviction_sum or 0, conviction_count=conviction_count)
+    for source_id, d, content_type, count in db.execute(scored):
+        row((source_id, d, content_type))["scored_count"] = count
+
+    clear = delete(rollups)
+    if source_ids is not None:
+        clear = clear.where(rollups.c.source_id.in_(source_ids))
+    db.execute(clear)
+    if rows:
+        db.execute(insert(rollups), list(rows.values()))
+    logger.info(f"Rebuilt {len(rows)} content activity rollup rows")
+    return len(rows)
+
+
+def backfill_activity_rollups(db: Session) -> Optional[int]:
+    """
+    Build content_daily_rollups when it is empty but raw_content has rows.
+
+    Migration 011 (and create_all on PostgreSQL) creates the table empty;
+    this runs at application startup so the dashboard counts existing
+    content without a manual step. Does not commit.
+
+    Returns:
+        Rollup rows written, or None if nothing needed backfilling
+    """
+    if db.execute(select(ContentDailyRollup.id).limit(1)).first():
+        return None
+    if not db.execute(select(RawContent.id).limit(1)).first():
+        return None
+    return rebuild_activity_rollups(db)
+
+
+# ============================================================================
+# Reads
+# ============================================================================
+
+def source_activity(db: Session, source_ids: Optional[Iterable[int]] = None) -> Dict[int, Dict[str, Any]]:
+    """
+    All-time activity totals per source, from one grouped rollup query.
+
+    Returns:
+        {source_id: {total_items, processed_items, unprocessed_items,
+        analyzed_items, scored_items, avg_conviction, last_collected_at}}
+    """
+    rollups = ContentDailyRollup.__table__
+    stmt = select(
+        rollups.c.source_id,
+        *[func.sum(rollups.c[col]) for col in COUNTERS],
+        func.max(rollups.c.last_collected_at),
+    ).group_by(rollups.c.source_id)
+    if source_ids is not None:
+        stmt = stmt.where(rollups.c.source_id.in_(list(source_ids)))
+
+    result = {}
+    for source_id, collected, processed, analyzed, scored, conviction_sum, conviction_count, latest in db.execute(stmt):
+        result[source_id] = {
+            "total_items": collected or 0,
+            "processed_items": processed or 0,
+            "unprocessed_items": (collected or 0) - (processed or 0),
+            "analyzed_items": analyzed or 0,
+            "scored_items": scored or 0,
+            "avg_conviction": round(conviction_sum / conviction_count, 2) if conviction_count else None,
+            "last_collected_at": latest,
+        }
+    return result
+
+
+def content_totals(db: Session) -> Dict[str, int]:
+    """Corpus-wide raw / analyzed / scored counts."""
+    rollups = ContentDailyRollup.__table__
+    collected, analyzed, scored = db.execute(select(
+        func.sum(rollups.c.collected_count),
+        func.sum(rollups.c.analyzed_count),
+        func.sum(rollups.c.scored_count),
+    )).one()
+    return {"total_raw": collected or 0, "analyzed": analyzed or 0, "scored": scored or 0}
+
+
+def content_type_counts(db: Session, source_id: int) -> Dict[str, int]:
+    """Collected item count per content type for one source."""
+    rollups = ContentDailyRollup.__table__
+    rows = db.execute(
+        select(rollups.c.content_type, func.sum(rollups.c.collected_count))
+        .where(rollups.c.source_id == source_id)
+        .group_by(rollups.c.content_type)
+    )
+    return {content_type: count or 0 for content_type, count in rows}
+
+
+def recent_activity(db: Session, hours: int = 24, now: Optional[datetime] = None) -> Dict[str, int]:
+    """
+    Items collected and analyzed in the last `hours` hours.
+
+    Whole days after the cutoff come from the rollups; the partial cutoff
+    day is counted from the content tables through their timestamp indexes.
+    """
+    cutoff = (now or datetime.utcnow()) - timedelta(hours=hours)
+    next_midnight = datetime.combine(cutoff.date() + timedelta(days=1), datetime.min.time())
+    rollups = ContentDailyRollup.__table__
+    raw = RawContent.__table__
+    analyzed = AnalyzedContent.__table__
+
+    collected, analyzed_count = db.execute(select(
+        func.sum(rollups.c.collected_count), func.sum(rollups.c.analyzed_count)
+    ).where(rollups.c.day > cutoff.date())).one()
+    partial_collected = db.execute(select(func.count()).select_from(raw).where(
+        and_(raw.c.collected_at >= cutoff, raw.c.collected_at < next_midnight)
+    )).scalar()
+    partial_analyzed = db.execute(select(func.count()).select_from(analyzed).where(
+        and_(analyzed.c.analyzed_at >= cutoff, analyzed.c.analyzed_at < next_midnight)
+    )).scalar()
+
+    return {
+        "collected": (collected or 0) + partial_collected,
+        "analyzed": (analyzed_count or 0) + partial_analyzed,
+    }
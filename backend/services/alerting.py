@@ -12,9 +12,18 @@ Alert Types:
 - transcription_backlog: Pending transcriptions >24h old (high)
 - source_stale: No new content in 48+ hours (medium)
 - error_spike: >5 errors in 24h for a source (high)
+
+SourceHealth rows are maintained incrementally: ingestion, transcription
+status changes and collection runs apply counter upserts (see
+source_health_upsert and the *_event builders) in the caller's own
+transaction, and reconcile_source_health() periodically recomputes every
+counter with a handful of grouped queries to correct drift and age out the
+24-hour windows.
 """
 
-from sqlalchemy import select, func, and_
+import time
+
+from sqlalchemy import select, func, and_, case, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
@@ -24,6 +33,7 @@ from backend.models import (
     Alert, SourceHealth, TranscriptionStatus, RawContent, Source,
     ServiceHeartbeat, AsyncSessionLocal
 )
+from backend.utils.upsert import additive_upsert, dialect_insert
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +50,14 @@ ERROR_SPIKE_THRESHOLD = 5
 # Alert expiry (auto-dismiss after this time if not acknowledged)
 ALERT_EXPIRY_HOURS = 72
 
+# SourceHealth counter for each transcription status ("processing" counts as pending)
+TRANSCRIPTION_COUNTERS = {
+    "pending": "transcription_pending",
+    "processing": "transcription_pending",
+    "completed": "transcription_completed",
+    "failed": "transcription_failed",
+}
+
 
 async def check_and_create_alerts(db: Optional[AsyncSession] = None) -> Dict[str, Any]:
     """
@@ -63,8 +81,16 @@ async def check_and_create_alerts(db: Optional[AsyncSession] = None) -> Dict[str
         created_alerts = []
         checked_sources = []
 
+        # Bring every SourceHealth row up to date, then check from the rows
+        await reconcile_source_health(db)
+        result = await db.execute(
+            select(SourceHealth).where(SourceHealth.source_name.in_(MONITORED_SOURCES))
+            .execution_options(populate_existing=True)
+        )
+        health_rows = {health.source_name: health for health in result.scalars().all()}
+
         for source_name in MONITORED_SOURCES:
-            source_result = await _check_source(db, source_name, now)
+            source_result = _check_source(health_rows.get(source_name), source_name, now)
             checked_sources.append(source_result)
 
             for alert_data in source_result.get("alerts", []):
@@ -102,54 +128,16 @@ async def check_and_create_alerts(db: Optional[AsyncSession] = None) -> Dict[str
             await db.close()
 
 
-async def _check_source(db: AsyncSession, source_name: str, now: datetime) -> Dict[str, Any]:
+def _check_source(health: Optional[SourceHealth], source_name: str, now: datetime) -> Dict[str, Any]:
     """
-    Check a single source for issues and return alert data if needed.
+    Check a single source's reconciled SourceHealth row and return alert data if needed.
     """
     alerts = []
-    cutoff_24h = now - timedelta(hours=24)
-    cutoff_staleness = now - timedelta(hours=STALENESS_THRESHOLD_HOURS)
-
-    # Get source record
-    result = await db.execute(
-        select(Source).where(Source.name == source_name)
-    )
-    source = result.scalar_one_or_none()
-
-    if not source:
-        return {"source": source_name, "status": "not_found", "alerts": []}
-
-    # Get or create SourceHealth record
-    result = await db.execute(
-        select(SourceHealth).where(SourceHealth.source_name == source_name)
-    )
-    health = result.scalar_one_or_none()
 
     if not health:
-        health = SourceHealth(source_name=source_name)
-        db.add(health)
-        await db.flush()
-
-    # Update health metrics
-    # Count items in last 24h
-    result = await db.execute(
-        select(func.count(RawContent.id)).where(
-            and_(
-                RawContent.source_id == source.id,
-                RawContent.collected_at >= cutoff_24h
-            )
-        )
-    )
-    health.items_collected_24h = result.scalar() or 0
+        return {"source": source_name, "status": "not_found", "alerts": []}
 
-    # Check staleness
-    is_stale = (
-        source.last_collected_at is None or
-        source.last_collected_at < cutoff_staleness
-    )
-    health.is_stale = is_stale
-    health.last_collection_at = source.last_collected_at
-    health.updated_at = now
+    is_stale = health.is_stale
 
     # Check 1: Consecutive failures
     if health.consecutive_failures >= CONSECUTIVE_FAILURE_THRESHOLD:
@@ -161,8 +149,8 @@ async def _check_source(db: AsyncSession, source_name: str, now: datetime) -> Di
         })
 
     # Check 2: Staleness
-    if is_stale and source.last_collected_at:
-        hours_stale = (now - source.last_collected_at).total_seconds() / 3600
+    if is_stale and health.last_collection_at:
+        hours_stale = (now - health.last_collection_at).total_seconds() / 3600
         alerts.append({
             "alert_type": "source_stale",
             "source": source_name,
@@ -180,59 +168,13 @@ async def _check_source(db: AsyncSession, source_name: str, now: datetime) -> Di
         })
 
     # Check 4: Transcription backlog (for video sources)
-    if source_name in VIDEO_SOURCES:
-        backlog_cutoff = now - timedelta(hours=TRANSCRIPTION_BACKLOG_HOURS)
-
-        result = await db.execute(
-            select(func.count(TranscriptionStatus.id)).where(
-                and_(
-                    TranscriptionStatus.status == "pending",
-                    TranscriptionStatus.created_at < backlog_cutoff
-                )
-            ).select_from(TranscriptionStatus).join(
-                RawContent, TranscriptionStatus.content_id == RawContent.id
-            ).where(
-                RawContent.source_id == source.id
-            )
-        )
-        backlog_count = result.scalar() or 0
-
-        if backlog_count > 0:
-            alerts.append({
-                "alert_type": "transcription_backlog",
-                "source": source_name,
-                "severity": "high",
-                "message": f"{backlog_count} {source_name} videos pending transcription for >{TRANSCRIPTION_BACKLOG_HOURS} hours"
-            })
-
-        # Update transcription metrics
-        result = await db.execute(
-            select(func.count(TranscriptionStatus.id)).where(
-                TranscriptionStatus.status == "completed"
-            ).select_from(TranscriptionStatus).join(
-                RawContent, TranscriptionStatus.content_id == RawContent.id
-            ).where(
-                and_(
-                    RawContent.source_id == source.id,
-                    TranscriptionStatus.completed_at >= cutoff_24h
-                )
-            )
-        )
-        health.items_transcribed_24h = result.scalar() or 0
-
-        # Get last transcription time
-        result = await db.execute(
-            select(TranscriptionStatus.completed_at).where(
-                TranscriptionStatus.status == "completed"
-            ).select_from(TranscriptionStatus).join(
-                RawContent, TranscriptionStatus.content_id == RawContent.id
-            ).where(
-                RawContent.source_id == source.id
-            ).order_by(TranscriptionStatus.completed_at.desc()).limit(1)
-        )
-        last_transcription = result.scalar_one_or_none()
-        if last_transcription:
-            health.last_transcription_at = last_transcription
+    if source_name in VIDEO_SOURCES and health.transcription_backlog:
+        alerts.append({
+            "alert_type": "transcription_backlog",
+            "source": source_name,
+            "severity": "high",
+            "message": f"{health.transcription_backlog} {source_name} videos pending transcription for >{TRANSCRIPTION_BACKLOG_HOURS} hours"
+        })
 
     return {
         "source": source_name,
@@ -310,6 +252,97 @@ async def _expire_old_alerts(db: AsyncSession, now: datetime):
         logger.info(f"Auto-expired alert {alert.id}: {alert.alert_type}")
 
 
+def source_health_upsert(
+    db,
+    source_name: str,
+    increments: Optional[Dict[str, int]] = None,
+    values: Optional[Dict[str, Any]] = None
+):
+    """
+    Build an upsert applying one event to a source's SourceHealth row.
+
+    increments are added onto the stored counters and values overwrite
+    columns; the row is created on first use. Nothing is read back, so
+    concurrent writers never lose updates. Execute it with db.execute
+    (awaited for an AsyncSession) inside the caller's transaction.
+
+    Args:
+        db: Sync or async session (used for the dialect)
+        source_name: Name of the source
+        increments: Counter deltas, e.g. {"items_collected_24h": 3}
+        values: Columns to set, e.g. {"last_collection_at": now}
+    """
+    increments = increments or {}
+    row = {"source_name": source_name, "updated_at": datetime.utcnow()}
+    row.update(values or {})
+    row.update(increments)
+    return additive_upsert(
+        db.get_bind().dialect.name,
+        SourceHealth.__table__,
+        key_columns=["source_name"],
+        values=row,
+        increment_columns=increments.keys()
+    )
+
+
+def items_collected_event(db, source_name: str, count: int, collected_at: Optional[datetime] = None):
+    """SourceHealth upsert for content ingested from a source."""
+    return source_health_upsert(
+        db, source_name,
+        increments={"items_collected_24h": count},
+        values={"last_collection_at": collected_at or datetime.utcnow(), "is_stale": False}
+    )
+
+
+def transcription_event(
+    db,
+    source_name: str,
+    old_status: Optional[str],
+    new_status: str,
+    at: Optional[datetime] = None
+):
+    """
+    SourceHealth upsert for a transcription status change.
+
+    Moves one item between the transcription counters (old_status is None
+    for a newly queued item) and records completions.
+    """
+    increments: Dict[str, int] = {}
+    old_counter = TRANSCRIPTION_COUNTERS.get(old_status)
+    new_counter = TRANSCRIPTION_COUNTERS.get(new_status)
+    if old_counter != new_counter:
+        if old_counter:
+            increments[old_counter] = -1
+        if new_counter:
+            increments[new_counter] = 1
+
+    values = {}
+    if new_status == "completed" and old_status != "completed":
+        increments["items_transcribed_24h"] = 1
+        values["last_transcription_at"] = at or datetime.utcnow()
+
+    return source_health_upsert(db, source_name, increments=increments, values=values)
+
+
+def collection_result_event(db, source_name: str, success: bool):
+    """
+    SourceHealth upsert for a finished collection run.
+
+    Success resets consecutive_failures; a failure bumps it and errors_24h.
+    """
+    now = datetime.utcnow()
+    if success:
+        return source_health_upsert(
+            db, source_name,
+            values={"last_collection_status": "success", "consecutive_failures": 0}
+        )
+    return source_health_upsert(
+        db, source_name,
+        increments={"consecutive_failures": 1, "errors_24h": 1},
+        values={"last_collection_status": "failed", "last_failure_at": now}
+    )
+
+
 async def record_collection_result(
     source_name: str,
     success: bool,
@@ -320,8 +353,9 @@ async def record_collection_result(
     """
     Record a collection result and update health metrics.
 
-    Called by collection endpoints after each run to track
-    consecutive failures and update health status.
+    Called after each collection run to track consecutive failures and
+    update health status. Items themselves are counted at ingestion
+    (items_collected_event), so items_collected is informational.
 
     Args:
         source_name: Name of the source
@@ -342,35 +376,24 @@ async def record_collection_result(
     try:
         now = datetime.utcnow()
 
-        # Get or create SourceHealth record
         result = await db.execute(
-            select(SourceHealth).where(SourceHealth.source_name == source_name)
+            collection_result_event(db, source_name, success).returning(
+                SourceHealth.last_collection_status, SourceHealth.consecutive_failures
+            )
         )
-        health = result.scalar_one_or_none()
-
-        if not health:
-            health = SourceHealth(source_name=source_name)
-            db.add(health)
-
-        # Update metrics
-        health.last_collection_at = now
-        health.updated_at = now
-
-        if success:
-            health.last_collection_status = "success"
-            health.consecutive_failures = 0
-        else:
-            health.last_collection_status = "failed"
-            health.consecutive_failures += 1
-            health.errors_24h += 1
+        status, consecutive_failures = result.one()
 
         if own_session:
             await db.commit()
 
+        if not success:
+            logger.warning(f"Collection failed for {source_name} "
+                           f"({consecutive_failures} consecutive): {error_message}")
+
         return {
             "source": source_name,
-            "status": health.last_collection_status,
-            "consecutive_failures": health.consecutive_failures,
+            "status": status,
+            "consecutive_failures": consecutive_failures,
             "updated_at": now.isoformat()
         }
 
@@ -384,53 +407,134 @@ async def record_collection_result(
             await db.close()
 
 
-async def update_source_health_metrics(db: AsyncSession, source_name: str):
+async def reconcile_source_health(
+    db: Optional[AsyncSession] = None,
+    source_names: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """
-    Recalculate and update all health metrics for a source.
+    Recompute SourceHealth counters from the content tables.
 
-    Called periodically or after significant events.
+    Corrects any drift in the incrementally maintained counters and ages
+    out the 24-hour windows. Uses one grouped query per table for all
+    sources plus a single upsert, regardless of the number of sources.
+    errors_24h has no backing table; it is cleared once the last failure
+    is more than 24 hours old.
+
+    Args:
+        db: Optional database session (committed only when created here)
+        source_names: Sources to reconcile (default: MONITORED_SOURCES)
+
+    Returns:
+        Dict with sources reconciled and timing
     """
-    now = datetime.utcnow()
-    cutoff_24h = now - timedelta(hours=24)
+    own_session = db is None
+    if own_session:
+        if AsyncSessionLocal is None:
+            return {"error": "Async database not available"}
+        db = AsyncSessionLocal()
 
-    # Get source
-    result = await db.execute(
-        select(Source).where(Source.name == source_name)
-    )
-    source = result.scalar_one_or_none()
+    started = time.perf_counter()
+    try:
+        now = datetime.utcnow()
+        cutoff_24h = now - timedelta(hours=24)
+        backlog_cutoff = now - timedelta(hours=TRANSCRIPTION_BACKLOG_HOURS)
+        staleness_cutoff = now - timedelta(hours=STALENESS_THRESHOLD_HOURS)
+        names = list(source_names or MONITORED_SOURCES)
 
-    if not source:
-        return
+        result = await db.execute(
+            select(Source.id, Source.name, Source.last_collected_at).where(Source.name.in_(names))
+        )
+        sources = result.all()
+        if not sources:
+            return {"sources_reconciled": 0, "duration_ms": 0.0}
+        source_ids = [source.id for source in sources]
 
-    # Get or create health record
-    result = await db.execute(
-        select(SourceHealth).where(SourceHealth.source_name == source_name)
-    )
-    health = result.scalar_one_or_none()
+        result = await db.execute(
+            select(RawContent.source_id, func.count(RawContent.id)).where(
+                and_(
+                    RawContent.source_id.in_(source_ids),
+                    RawContent.collected_at >= cutoff_24h
+                )
+            ).group_by(RawContent.source_id)
+        )
+        items_24h = dict(result.all())
 
-    if not health:
-        health = SourceHealth(source_name=source_name)
-        db.add(health)
+        status = TranscriptionStatus.status
+        result = await db.execute(
+            select(
+                RawContent.source_id,
+                func.count(TranscriptionStatus.id).filter(status.in_(("pending", "processing"))),
+                func.count(TranscriptionStatus.id).filter(status == "completed"),
+                func.count(TranscriptionStatus.id).filter(status == "failed"),
+                func.count(TranscriptionStatus.id).filter(
+                    and_(status == "pending", TranscriptionStatus.created_at < backlog_cutoff)
+                ),
+                func.count(TranscriptionStatus.id).filter(
+                    and_(status == "completed", TranscriptionStatus.completed_at >= cutoff_24h)
+                ),
+                func.max(TranscriptionStatus.completed_at).filter(status == "completed"),
+            ).select_from(TranscriptionStatus).join(
+                RawContent, TranscriptionStatus.content_id == RawContent.id
+            ).where(
+                RawContent.source_id.in_(source_ids)
+            ).group_by(RawContent.source_id)
+        )
+        transcription = {row[0]: tuple(row[1:]) for row in result.all()}
 
-    # Update items_collected_24h
-    result = await db.execute(
-        select(func.count(RawContent.id)).where(
-            and_(
-                RawContent.source_id == source.id,
-                RawContent.collected_at >= cutoff_24h
+        rows = []
+        for source in sources:
+            pending, completed, failed, backlog, transcribed_24h, last_transcription = (
+                transcription.get(source.id, (0, 0, 0, 0, 0, None))
             )
+            rows.append({
+                "source_name": source.name,
+                "last_collection_at": source.last_collected_at,
+                "is_stale": source.last_collected_at is None or source.last_collected_at < staleness_cutoff,
+                "items_collected_24h": items_24h.get(source.id, 0),
+                "items_transcribed_24h": transcribed_24h,
+                "transcription_pending": pending,
+                "transcription_completed": completed,
+                "transcription_failed": failed,
+                "transcription_backlog": backlog,
+                "last_transcription_at": last_transcription,
+                "reconciled_at": now,
+                "updated_at": now,
+            })
+
+        table = SourceHealth.__table__
+        stmt = dialect_insert(db.get_bind().dialect.name, table)
+        set_ = {col: stmt.excluded[col] for col in rows[0] if col != "source_name"}
+        set_["last_transcription_at"] = func.coalesce(
+            stmt.excluded.last_transcription_at, table.c.last_transcription_at
         )
-    )
-    health.items_collected_24h = result.scalar() or 0
+        set_["errors_24h"] = case(
+            (or_(table.c.last_failure_at.is_(None), table.c.last_failure_at < cutoff_24h), 0),
+            else_=table.c.errors_24h
+        )
+        await db.execute(stmt.on_conflict_do_update(index_elements=["source_name"], set_=set_), rows)
 
-    # Check staleness
-    staleness_cutoff = now - timedelta(hours=STALENESS_THRESHOLD_HOURS)
-    health.is_stale = (
-        source.last_collected_at is None or
-        source.last_collected_at < staleness_cutoff
-    )
+        if own_session:
+            await db.commit()
 
-    health.last_collection_at = source.last_collected_at
-    health.updated_at = now
+        duration_ms = round((time.perf_counter() - started) * 1000, 1)
+        logger.debug(f"Reconciled source health for {len(rows)} sources in {duration_ms}ms")
+        return {"sources_reconciled": len(rows), "duration_ms": duration_ms}
 
-    await db.flush()
+    except Exception as e:
+        logger.error(f"Source health reconciliation failed: {e}")
+        if own_session:
+            await db.rollback()
+        raise
+    finally:
+        if own_session:
+            await db.close()
+
+
+async def update_source_health_metrics(db: AsyncSession, source_name: str):
+    """
+    Recalculate and update all health metrics for a source.
+
+    Called after significant events; the periodic reconciliation does the
+    same for every monitored source.
+    """
+    await reconcile_source_health(db, [source_name])
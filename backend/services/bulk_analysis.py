@@ -0,0 +1,325 @@
+"""
+Bulk Analysis Backfills
+
+Offline backfills that send their prompts through BulkAnalysisRunner
+(asynchronous message batches) instead of one synchronous call_claude per
+item, and write the results back as the synchronous paths would:
+
+- bulk_classify: classifier AnalyzedContent records (replacing old ones)
+- bulk_score: ConfluenceScore rows for analyzed content in a time window
+- bulk_extract_symbols: SymbolLevel / SymbolState rows from text content
+
+Prompts are built with each agent's own prompt builders and results go
+through the same validation, so a backfilled row matches one written by
+the live pipeline. Items whose request failed are counted and skipped.
+Run from scripts/bulk_analysis.py.
+"""
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from backend.models import AnalyzedContent, ConfluenceScore, RawContent, Source
+from backend.utils.sanitization import sanitize_content_text, truncate_for_prompt
+
+logger = logging.getLogger(__name__)
+
+# Ids per IN (...) clause when replacing rows
+ID_CHUNK = 500
+
+
+def _chunks(ids: List[int], size: int = ID_CHUNK) -> Iterator[List[int]]:
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+def _run(agent, requests, transport=None, **runner_options) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Run requests through a BulkAnalysisRunner; returns (results, runner stats)."""
+    # Imported lazily: agents pull in the Anthropic client
+    from agents.bulk_runner import BulkAnalysisRunner
+
+    if not requests:
+        return {}, {"requests": 0, "batches": 0, "succeeded": 0, "failed": 0, "seconds": 0}
+    runner = BulkAnalysisRunner(agent, transport=transport, **runner_options)
+    return runner.run(requests), runner.stats
+
+
+def confluence_score_row(analyzed_content_id: int, result: Dict[str, Any]) -> ConfluenceScore:
+    """ConfluenceScore row for a ConfluenceScorerAgent result."""
+    pillar_scores = result.get("pillar_scores", {})
+    return ConfluenceScore(
+        analyzed_content_id=analyzed_content_id,
+        macro_score=pillar_scores.get("macro", 0),
+        fundamentals_score=pillar_scores.get("fundamentals", 0),
+        valuation_score=pillar_scores.get("valuation", 0),
+        positioning_score=pillar_scores.get("positioning", 0),
+        policy_score=pillar_scores.get("policy", 0),
+        price_action_score=pillar_scores.get("price_action", 0),
+        options_vol_score=pillar_scores.get("options_vol", 0),
+        core_total=result.get("core_total", 0),
+        total_score=result.get("total_score", 0),
+        meets_threshold=result.get("meets_threshold", False),
+        reasoning=json.dumps(result.get("reasoning", {})),
+        falsification_criteria=json.dumps(result.get("falsification_criteria", []))
+    )
+
+
+# ============================================================================
+# Classification
+# ============================================================================
+
+def bulk_classify(
+    db: Session,
+    agent=None,
+    transport=None,
+    source: Optional[str] = None,
+    limit: Optional[int] = None,
+    **runner_options
+) -> Dict[str, Any]:
+    """
+    Reclassify raw content, replacing its classifier records.
+
+    Pre-routed items are resolved locally; the rest are batched. Routed
+    agents are not run and processed flags are left as they are.
+
+    Returns:
+        {"items", "pre_routed", "classified", "failed", "runner": runner stats}
+    """
+    if agent is None:
+        from agents.content_classifier import ContentClassifierAgent
+        agent = ContentClassifierAgent()
+    from agents.bulk_runner import BulkRequest
+    from backend.routes.analyze import content_input
+
+    query = (
+        db.query(RawContent, Source.name)
+        .outerjoin(Source, Source.id == RawContent.source_id)
+        .order_by(RawContent.id)
+    )
+    if source:
+        query = query.filter(Source.name == source)
+    if limit:
+        query = query.limit(limit)
+    inputs = {raw.id: content_input(raw, source_name or "unknown") for raw, source_name in query}
+
+    results, requests = {}, []
+    system_prompt = agent._get_system_prompt()
+    for raw_id, item in inputs.items():
+        routed = agent.pre_route(item)
+        if routed is not None:
+            results[raw_id] = routed
+        else:
+            requests.append(BulkRequest(
+                f"raw-{raw_id}", agent._build_classification_prompt(item), system_prompt, max_tokens=2048
+            ))
+    pre_routed = len(results)
+
+    responses, stats = _run(agent, requests, transport, **runner_options)
+    failed = 0
+    for raw_id in [int(r.custom_id.split("-")[1]) for r in requests]:
+        try:
+            response = responses[f"raw-{raw_id}"]
+            if isinstance(response, Exception):
+                raise response
+            results[raw_id] = agent._build_result(inputs[raw_id], response)
+        except Exception as e:
+            logger.warning(f"Bulk classification failed for content {raw_id}: {e}")
+            failed += 1
+
+    # Old classifier records are replaced, as /analyze/reclassify-source does.
+    # Deleted through the session so the activity and theme rollup listeners
+    # take their counts off before the new records are added.
+    for ids in _chunks(sorted(results)):
+        for old in db.query(AnalyzedContent).filter(
+            AnalyzedContent.raw_content_id.in_(ids),
+            AnalyzedContent.agent_type == "classifier"
+        ):
+            db.delete(old)
+    db.flush()
+    db.add_all([
+        AnalyzedContent(
+            raw_content_id=raw_id,
+            agent_type="classifier",
+            analysis_result=json.dumps(result),
+            key_themes=",".join(result.get("detected_topics", []))
+        )
+        for raw_id, result in sorted(results.items())
+    ])
+    db.commit()
+
+    summary = {"items": len(inputs), "pre_routed": pre_routed, "classified": len(results),
+               "failed": failed, "runner": stats}
+    logger.info(f"Bulk classification: {summary}")
+    return summary
+
+
+# ============================================================================
+# Confluence scoring
+# ============================================================================
+
+def bulk_score(
+    db: Session,
+    agent=None,
+    transport=None,
+    days: int = 30,
+    source: Optional[str] = None,
+    rescore: bool = False,
+    limit: Optional[int] = None,
+    **runner_options
+) -> Dict[str, Any]:
+    """
+    Score analyzed content from the last `days` days.
+
+    Only unscored content is sent unless rescore is set, in which case the
+    existing scores of successfully rescored items are replaced.
+
+    Returns:
+        {"items", "scored", "failed", "replaced", "runner": runner stats}
+    """
+    if agent is None:
+        from agents.confluence_scorer import ConfluenceScorerAgent
+        agent = ConfluenceScorerAgent()
+    from agents.bulk_runner import BulkRequest
+
+    query = (
+        db.query(AnalyzedContent.id, AnalyzedContent.analysis_result, Source.name, RawContent.content_type)
+        .join(RawContent, RawContent.id == AnalyzedContent.raw_content_id)
+        .outerjoin(Source, Source.id == RawContent.source_id)
+        .filter(
+            AnalyzedContent.agent_type != "classifier",
+            AnalyzedContent.analyzed_at >= datetime.utcnow() - timedelta(days=days)
+        )
+        .order_by(AnalyzedContent.id)
+    )
+    if source:
+        query = query.filter(Source.name == source)
+    if not rescore:
+        scored = db.query(ConfluenceScore.id).filter(ConfluenceScore.analyzed_content_id == AnalyzedContent.id)
+        query = query.filter(~scored.exists())
+    if limit:
+        query = query.limit(limit)
+
+    inputs, requests = {}, []
+    system_prompt = agent._get_system_prompt()
+    instructions = agent._get_scoring_instructions()
+    for ac_id, analysis_result, source_name, content_type in query:
+        try:
+            analysis = json.loads(analysis_result) if analysis_result else {}
+        except json.JSONDecodeError:
+            analysis = {"raw_text": analysis_result}
+        if not isinstance(analysis, dict):
+            analysis = {"raw_text": analysis_result}
+        analysis["source"] = source_name or "unknown"
+        analysis["content_type"] = content_type or "unknown"
+        inputs[ac_id] = analysis
+        requests.append(BulkRequest(
+            f"ac-{ac_id}", agent._build_scoring_prompt(analysis, {}), system_prompt,
+            max_tokens=4096, cached_context=instructions
+        ))
+
+    responses, stats = _run(agent, requests, transport, **runner_options)
+    rows, failed = [], 0
+    for ac_id, analysis in inputs.items():
+        try:
+            response = responses[f"ac-{ac_id}"]
+            if isinstance(response, Exception):
+                raise response
+            agent.validate_response_schema(response, ["pillar_scores", "reasoning", "falsification_criteria"])
+            agent._validate_pillar_scores(response["pillar_scores"])
+            rows.append(confluence_score_row(ac_id, agent._finalize(response, analysis)))
+        except Exception as e:
+            logger.warning(f"Bulk scoring failed for analyzed content {ac_id}: {e}")
+            failed += 1
+
+    replaced = 0
+    if rescore:
+        # Deleted through the session so the activity rollup listener sees them
+        for ids in _chunks([row.analyzed_content_id for row in rows]):
+            for old in db.query(ConfluenceScore).filter(ConfluenceScore.analyzed_content_id.in_(ids)):
+                db.delete(old)
+                replaced += 1
+        db.flush()
+    # ORM objects in one flush, so the activity rollup listener still sees them
+    db.add_all(rows)
+    db.commit()
+
+    summary = {"items": len(inputs), "scored": len(rows), "failed": failed, "replaced": replaced, "runner": stats}
+    logger.info(f"Bulk scoring: {summary}")
+    return summary
+
+
+# ============================================================================
+# Symbol level extraction
+# ============================================================================
+
+def bulk_extract_symbols(
+    db: Session,
+    agent=None,
+    transport=None,
+    days: Optional[int] = None,
+    source: Optional[str] = None,
+    limit: Optional[int] = None,
+    **runner_options
+) -> Dict[str, Any]:
+    """
+    Re-extract symbol levels from eligible text content.
+
+    Extractions are saved oldest first with save_extraction_to_db, so the
+    latest content ends up in SymbolState as it would in the live pipeline.
+
+    Returns:
+        {"items", "extracted", "levels_created", "failed", "runner": runner stats}
+    """
+    if agent is None:
+        from agents.symbol_level_extractor import SymbolLevelExtractor
+        agent = SymbolLevelExtractor()
+    from agents.bulk_runner import BulkRequest
+
+    query = (
+        db.query(RawContent.id, RawContent.content_text, Source.name)
+        .join(Source, Source.id == RawContent.source_id)
+        .filter(
+            Source.name.in_([source] if source else agent.TEXT_SOURCES),
+            RawContent.content_type.in_(agent.TEXT_CONTENT_TYPES),
+            func.length(func.trim(RawContent.content_text)) >= agent.MIN_TEXT_CHARS
+        )
+        .order_by(RawContent.id)
+    )
+    if days:
+        query = query.filter(RawContent.collected_at >= datetime.utcnow() - timedelta(days=days))
+    if limit:
+        query = query.limit(limit)
+
+    sources, requests = {}, []
+    system_prompt = agent._get_transcript_extraction_system_prompt()
+    instructions = agent._get_transcript_extraction_instructions()
+    for raw_id, content_text, source_name in query:
+        transcript = truncate_for_prompt(sanitize_content_text(content_text), max_chars=agent.MAX_TRANSCRIPT_CHARS)
+        sources[raw_id] = source_name
+        requests.append(BulkRequest(
+            f"raw-{raw_id}", agent._build_transcript_content_prompt(transcript), system_prompt,
+            max_tokens=16384, cached_context=instructions
+        ))
+
+    responses, stats = _run(agent, requests, transport, **runner_options)
+    extracted = levels = failed = 0
+    for raw_id, source_name in sources.items():
+        response = responses[f"raw-{raw_id}"]
+        if isinstance(response, Exception):
+            logger.warning(f"Bulk symbol extraction failed for content {raw_id}: {response}")
+            failed += 1
+            continue
+        result = agent._validate_extraction(response, raw_id, "transcript")
+        if not result.get("symbols"):
+            continue
+        saved = agent.save_extraction_to_db(db, result, source_name, content_id=raw_id)
+        extracted += 1
+        levels += saved["levels_created"]
+
+    summary = {"items": len(sources), "extracted": extracted, "levels_created": levels,
+               "failed": failed, "runner": stats}
+    logger.info(f"Bulk symbol extraction: {summary}")
+    return summary
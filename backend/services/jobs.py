@@ -0,0 +1,399 @@
+"""
+Background Jobs
+
+Persisted handles for long-running work (synthesis generation, batch
+classification). An endpoint creates a Job row and returns its id straight
+away; the work runs as a task on the event loop and reports progress
+through a JobTracker, which writes state and per-step progress to the jobs
+table and publishes a job_progress event on the pub/sub backbone.
+
+Because state lives in the database, any API worker can answer status
+requests. follow_job streams a job's progress from pub/sub events and
+re-reads the row every JOB_STREAM_POLL_SECONDS, so a stream still advances
+when the job runs in a worker whose events it cannot receive (in-memory
+pub/sub).
+
+A running job touches its row every JOB_HEARTBEAT_SECONDS. A queued or
+running job whose row has not changed for JOB_STALE_SECONDS belonged to a
+process that has gone away (restart, rolling deploy) and is marked failed;
+jobs other containers or workers are still running keep their heartbeat
+fresh and are left alone.
+"""
+import asyncio
+import json
+import logging
+import os
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.models import Job
+from backend.services.pubsub import get_pubsub
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+JOB_CHANNEL = "job_events"
+JOB_STREAM_POLL_SECONDS = float(os.getenv("JOB_STREAM_POLL_SECONDS", "5"))
+JOB_HEARTBEAT_SECONDS = float(os.getenv("JOB_HEARTBEAT_SECONDS", "30"))
+JOB_STALE_SECONDS = float(os.getenv("JOB_STALE_SECONDS", "120"))
+
+TERMINAL_STATUSES = ("succeeded", "failed")
+
+# Running job tasks (kept referenced so they are not garbage collected)
+_tasks: Set[asyncio.Task] = set()
+
+
+def _loads(text: Optional[str], default):
+    if not text:
+        return default
+    try:
+        return json.loads(text)
+    except (json.JSONDecodeError, TypeError):
+        return default
+
+
+def job_snapshot(job: Job) -> Dict[str, Any]:
+    """API representation of a job row."""
+    return {
+        "job_id": job.id,
+        "kind": job.kind,
+        "status": job.status,
+        "params": _loads(job.params, {}),
+        "steps": _loads(job.steps, []),
+        "current_step": job.current_step,
+        "result": _loads(job.result, None),
+        "error": job.error,
+        "created_by": job.created_by,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "updated_at": job.updated_at.isoformat() if job.updated_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+
+def get_job(db: Session, job_id: str) -> Optional[Dict[str, Any]]:
+    """Snapshot of one job, or None."""
+    job = db.get(Job, job_id)
+    return job_snapshot(job) if job else None
+
+
+def list_jobs(db: Session, kind: Optional[str] = None, status: Optional[str] = None,
+              limit: int = 20) -> List[Dict[str, Any]]:
+    """Most recent jobs first."""
+    query = db.query(Job)
+    if kind:
+        query = query.filter(Job.kind == kind)
+    if status:
+        query = query.filter(Job.status == status)
+    return [job_snapshot(job) for job in query.order_by(Job.created_at.desc()).limit(limit).all()]
+
+
+# ============================================================================
+# Tracking
+# ============================================================================
+
+class JobTracker:
+    """
+    Persists and publishes one job's progress.
+
+    step() has the (step_name, status) signature of the synthesis progress
+    callbacks and may be called from the event loop or from executor
+    threads. Progress is not written by the caller: each change is queued
+    on the event loop the tracker was created on and written in order with
+    asyncio.to_thread, so callbacks never block the loop on the database.
+    flush() waits for the queued writes. Without a running loop, writes are
+    made directly.
+    """
+
+    def __init__(self, job_id: str, session_factory: Callable[[], Session],
+                 loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.job_id = job_id
+        self.session_factory = session_factory
+        self.steps: List[Dict[str, str]] = []
+        self.current_step: Optional[str] = None
+        self._lock = threading.Lock()
+        self._pending: Optional[asyncio.Task] = None
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+        self.loop = loop
+
+    @classmethod
+    def create(
+        cls,
+        db: Session,
+        kind: str,
+        params: Optional[Dict[str, Any]] = None,
+        user: Optional[str] = None,
+        session_factory: Optional[Callable[[], Session]] = None
+    ) -> "JobTracker":
+        """Insert a queued job and return its tracker."""
+        job = Job(id=uuid.uuid4().hex, kind=kind, status="queued", params=json.dumps(params or {}),
+                  steps="[]", created_by=user, created_at=datetime.utcnow(), updated_at=datetime.utcnow())
+        db.add(job)
+        db.commit()
+        return cls(job.id, session_factory or sessionmaker(bind=db.get_bind()))
+
+    def set_steps(self, names: List[str], complete: int = 0):
+        """Declare the job's steps; the first `complete` are already done."""
+        with self._lock:
+            self.steps = [{"name": name, "status": "complete" if i < complete else "pending"}
+                          for i, name in enumerate(names)]
+        self._save()
+
+    def step(self, step_name: str, status: str = "in_progress"):
+        """Mark a step in_progress / complete (unknown steps are appended)."""
+        with self._lock:
+            for step in self.steps:
+                if step["name"] == step_name:
+                    step["status"] = status
+                    break
+            else:
+                self.steps.append({"name": step_name, "status": status})
+            if status == "in_progress":
+                self.current_step = step_name
+        self._save()
+
+    def start(self):
+        self._save(status="running", started_at=datetime.utcnow())
+
+    def finish(self, result: Optional[Dict[str, Any]] = None):
+        self.current_step = None
+        self._save(status="succeeded", result=json.dumps(result, default=str) if result is not None else None,
+                   finished_at=datetime.utcnow())
+
+    def fail(self, error: BaseException):
+        self.current_step = None
+        message = str(error) or type(error).__name__
+        self._save(status="failed", error=message[:4000], finished_at=datetime.utcnow())
+
+    def heartbeat(self):
+        """Refresh updated_at so other processes see the job is still running."""
+        self._save()
+
+    async def flush(self):
+        """Wait until every change made so far has been written."""
+        if self._pending is not None:
+            await self._pending
+
+    def _save(self, **fields):
+        with self._lock:
+            fields["steps"] = json.dumps(self.steps)
+            fields["current_step"] = self.current_step
+        if self.loop is None or self.loop.is_closed():
+            self._write(fields)
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            self._enqueue(fields)
+        elif self.loop.is_running():
+            self.loop.call_soon_threadsafe(self._enqueue, fields)
+        else:
+            self._write(fields)
+
+    def _enqueue(self, fields: Dict[str, Any]):
+        """Chain a write after the pending ones (runs on the tracker's loop)."""
+        self._pending = self.loop.create_task(self._write_after(self._pending, fields))
+
+    async def _write_after(self, previous: Optional[asyncio.Task], fields: Dict[str, Any]):
+        if previous is not None:
+            await asyncio.wait([previous])
+        await asyncio.to_thread(self._write, fields)
+
+    def _write(self, fields: Dict[str, Any]):
+        db = self.session_factory()
+        try:
+            job = db.get(Job, self.job_id)
+            if job is None:
+                return
+            for name, value in fields.items():
+                setattr(job, name, value)
+            job.updated_at = datetime.utcnow()
+            db.commit()
+            snapshot = job_snapshot(job)
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Could not save progress for job {self.job_id}: {e}")
+            return
+        finally:
+            db.close()
+        self._publish(snapshot)
+
+    def _publish(self, snapshot: Dict[str, Any]):
+        """Publish a job_progress event from the loop thread or any worker thread."""
+        if self.loop is None or self.loop.is_closed():
+            return
+        # Results can outgrow a NOTIFY payload; events carry state, the row has the result
+        event = {key: value for key, value in snapshot.items() if key != "result"}
+        payload = json.dumps({"type": "job_progress", "data": event}, default=str)
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            self.loop.create_task(get_pubsub().publish(JOB_CHANNEL, payload))
+        elif self.loop.is_running():
+            asyncio.run_coroutine_threadsafe(get_pubsub().publish(JOB_CHANNEL, payload), self.loop)
+
+
+# ============================================================================
+# Running
+# ============================================================================
+
+async def run_job(
+    tracker: JobTracker,
+    work: Callable[[JobTracker], Awaitable[Any]],
+    summarize: Optional[Callable[[Any], Dict[str, Any]]] = None
+) -> Any:
+    """
+    Run work(tracker), recording the job as running, then succeeded or failed.
+
+    The job's stored result is summarize(result) (default: the result);
+    exceptions are recorded and re-raised. While the work runs the job's
+    row gets a heartbeat, and the final state is written before returning.
+    """
+    async def heartbeat():
+        while True:
+            await asyncio.sleep(JOB_HEARTBEAT_SECONDS)
+            tracker.heartbeat()
+
+    tracker.start()
+    beat = asyncio.get_running_loop().create_task(heartbeat())
+    try:
+        result = await work(tracker)
+    except BaseException as e:
+        tracker.fail(e)
+        raise
+    else:
+        tracker.finish(summarize(result) if summarize else result)
+    finally:
+        beat.cancel()
+        await tracker.flush()
+    return result
+
+
+def start_job(
+    tracker: JobTracker,
+    work: Callable[[JobTracker], Awaitable[Any]],
+    summarize: Optional[Callable[[Any], Dict[str, Any]]] = None
+) -> asyncio.Task:
+    """Run a job in the background on the current event loop."""
+    async def background():
+        try:
+            await run_job(tracker, work, summarize)
+        except Exception as e:
+            logger.error(f"Job {tracker.job_id} failed: {e}")
+
+    task = asyncio.get_running_loop().create_task(background(), name=f"job:{tracker.job_id}")
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return task
+
+
+def _stale_before() -> datetime:
+    return datetime.utcnow() - timedelta(seconds=JOB_STALE_SECONDS)
+
+
+def fail_interrupted_jobs(db: Session, job_id: Optional[str] = None) -> int:
+    """
+    Mark queued or running jobs without a recent heartbeat as failed.
+
+    Jobs run on the event loop of the API process that started them, so
+    after a restart their rows would otherwise stay non-terminal forever
+    and follow_job streams would never end. Only rows untouched for
+    JOB_STALE_SECONDS are failed, so a new container does not fail jobs an
+    old one is still running during a rolling deploy, nor one worker fail
+    another's. Called at application startup, and by follow_job for the
+    job it streams (job_id).
+    """
+    live = {task.get_name().split(":", 1)[1] for task in _tasks if task.get_name().startswith("job:")}
+    now = datetime.utcnow()
+    query = db.query(Job).filter(Job.status.notin_(TERMINAL_STATUSES), Job.updated_at < _stale_before())
+    if job_id:
+        query = query.filter(Job.id == job_id)
+    interrupted = 0
+    for job in query.all():
+        if job.id in live:
+            continue
+        job.status = "failed"
+        job.error = "interrupted"
+        job.current_step = None
+        job.finished_at = now
+        job.updated_at = now
+        interrupted += 1
+    db.commit()
+    if interrupted:
+        logger.warning(f"Marked {interrupted} interrupted job(s) as failed")
+    return interrupted
+
+
+# ============================================================================
+# Streaming
+# ============================================================================
+
+async def follow_job(
+    job_id: str,
+    session_factory: Callable[[], Session],
+    poll_interval: Optional[float] = None
+) -> AsyncIterator[Optional[Dict[str, Any]]]:
+    """
+    Yield job snapshots as the job progresses, ending after a terminal state.
+
+    Yields None when nothing changed for poll_interval seconds (keepalive).
+    Progress events omit the result; the final snapshot is re-read so it
+    includes it. A job whose heartbeat has stopped is failed as interrupted,
+    so the stream ends when the process running it goes away.
+    Yields nothing if the job does not exist.
+    """
+    poll_interval = JOB_STREAM_POLL_SECONDS if poll_interval is None else poll_interval
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def on_event(payload: str):
+        data = _loads(payload, {}).get("data") or {}
+        if data.get("job_id") == job_id:
+            queue.put_nowait(data)
+
+    def load():
+        db = session_factory()
+        try:
+            job = db.get(Job, job_id)
+            if job is None:
+                return None
+            if job.status not in TERMINAL_STATUSES and job.updated_at and job.updated_at < _stale_before():
+                fail_interrupted_jobs(db, job_id=job_id)
+            return job_snapshot(job)
+        finally:
+            db.close()
+
+    pubsub = get_pubsub()
+    pubsub.subscribe(JOB_CHANNEL, on_event)
+    try:
+        snapshot = load()
+        if snapshot is None:
+            return
+        yield snapshot
+        last = snapshot["updated_at"]
+        while snapshot["status"] not in TERMINAL_STATUSES:
+            try:
+                snapshot = await asyncio.wait_for(queue.get(), timeout=poll_interval)
+            except asyncio.TimeoutError:
+                snapshot = load() or snapshot
+            if snapshot["updated_at"] == last and snapshot["status"] not in TERMINAL_STATUSES:
+                yield None
+                continue
+            if snapshot["updated_at"] != last:
+                last = snapshot["updated_at"]
+                if snapshot["status"] in TERMINAL_STATUSES and "result" not in snapshot:
+                    snapshot = load() or snapshot
+                yield snapshot
+    finally:
+        pubsub.unsubscribe(JOB_CHANNEL, on_event)
@@ -0,0 +1,249 @@
+"""
+Price-Proximity Index over Symbol Levels (PRD-039)
+
+Per-symbol sorted arrays of active, non-stale SymbolLevel intervals
+([price, price_upper], or a point when there is no upper bound), answering:
+
+- k-nearest levels to a price (optionally within a percentage band)
+- levels overlapping a price range
+- KT Technical vs Discord levels that overlap each other
+
+Each symbol is loaded lazily with one query and then kept current:
+inserted levels are merged in and invalidated levels (dismissed, edited,
+marked stale) are dropped or force a reload of that symbol. Updates build
+a new array and swap it in, so readers never take a lock. Like the symbol
+snapshot, a loaded symbol expires after SYMBOL_SNAPSHOT_TTL_SECONDS so
+levels written or dismissed by other processes are seen.
+
+Queries are O(log n + m) using bisect over the interval lows plus the
+widest interval per symbol to bound the scan.
+"""
+
+import bisect
+import heapq
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import and_
+from sqlalchemy.orm import Session
+
+from backend.models import SymbolLevel
+from backend.services.symbol_snapshot import SYMBOL_SNAPSHOT_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+def level_entry(level: SymbolLevel) -> Dict[str, Any]:
+    """Index entry for a level; build it before commit to avoid reloads."""
+    low = level.price
+    high = level.price_upper if level.price_upper is not None else level.price
+    if low is not None and high < low:
+        low, high = high, low
+    return {
+        "id": level.id,
+        "symbol": level.symbol,
+        "source": level.source,
+        "type": level.level_type,
+        "price": level.price,
+        "price_upper": level.price_upper,
+        "direction": level.direction,
+        "significance": level.significance,
+        "confidence": level.confidence,
+        "low": low,
+        "high": high,
+    }
+
+
+def _distance(entry: Dict[str, Any], price: float) -> float:
+    """Distance from price to the interval (0 when price falls inside it)."""
+    if price < entry["low"]:
+        return entry["low"] - price
+    if price > entry["high"]:
+        return price - entry["high"]
+    return 0.0
+
+
+class SymbolIntervals:
+    """Sorted interval array for one symbol."""
+
+    def __init__(self, entries: Iterable[Dict[str, Any]] = ()):
+        self.entries: List[Dict[str, Any]] = sorted(entries, key=lambda e: (e["low"], e["id"]))
+        self.lows: List[float] = [e["low"] for e in self.entries]
+        self.max_width = max((e["high"] - e["low"] for e in self.entries), default=0.0)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def overlapping(self, low: float, high: float) -> List[Dict[str, Any]]:
+        """Intervals intersecting [low, high]."""
+        # An interval can only reach `low` if it starts within max_width below it
+        start = bisect.bisect_left(self.lows, low - self.max_width)
+        end = bisect.bisect_right(self.lows, high)
+        return [e for e in self.entries[start:end] if e["high"] >= low]
+
+    def nearest(self, price: float, k: int, max_distance: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Up to k intervals closest to price, nearest first."""
+        if k <= 0 or not self.entries:
+            return []
+        pivot = bisect.bisect_right(self.lows, price)
+        heap = []  # max-heap of (-distance, -id) keeping the k best
+
+        def consider(entry):
+            distance = _distance(entry, price)
+            if max_distance is not None and distance > max_distance:
+                return
+            item = (-distance, -entry["id"], entry)
+            if len(heap) < k:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+
+        def worst():
+            return -heap[0][0] if len(heap) == k else float("inf")
+
+        # Right of price: distance grows with low, so stop at the first miss
+        for entry in self.entries[pivot:]:
+            if entry["low"] - price > min(worst(), max_distance if max_distance is not None else float("inf")):
+                break
+            consider(entry)
+
+        # Left of price: distance is at least price - low - max_width
+        for i in range(pivot - 1, -1, -1):
+            entry = self.entries[i]
+            lower_bound = price - entry["low"] - self.max_width
+            if lower_bound > worst() or (max_distance is not None and lower_bound > max_distance):
+                break
+            consider(entry)
+
+        ordered = sorted(heap, key=lambda item: (-item[0], -item[1]))
+        return [dict(item[2], distance=round(-item[0], 4)) for item in ordered]
+
+    def cross_source_overlaps(self, tolerance_pct: float = 0.0,
+                              sources=("kt_technical", "discord")) -> List[Dict[str, Any]]:
+        """Pairs of levels from different sources whose (padded) intervals overlap."""
+        left_source, right_source = sources
+        pad = tolerance_pct / 100.0
+        padded = sorted(
+            (
+                (e["low"] * (1 - pad), e["high"] * (1 + pad), e)
+                for e in self.entries if e["source"] in sources
+            ),
+            key=lambda item: item[0]
+        )
+
+        # Sweep by low; active[source] holds intervals not yet closed
+        active = {left_source: [], right_source: []}
+        pairs = []
+        for low, high, entry in padded:
+            other = right_source if entry["source"] == left_source else left_source
+            active[other] = [item for item in active[other] if item[1] >= low]
+            for _, _, match in active[other]:
+                kt, discord = (entry, match) if entry["source"] == left_source else (match, entry)
+                pairs.append({
+                    left_source: kt,
+                    right_source: discord,
+                    "overlap_low": max(kt["low"], discord["low"]),
+                    "overlap_high": min(kt["high"], discord["high"]),
+                })
+            active[entry["source"]].append((low, high, entry))
+        return pairs
+
+
+class LevelIndex:
+    """Lazily built per-symbol interval index over active, non-stale levels."""
+
+    def __init__(self, ttl_seconds: int = SYMBOL_SNAPSHOT_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._symbols: Dict[str, SymbolIntervals] = {}
+        self._loaded_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def _load(self, db: Session, symbol: str) -> SymbolIntervals:
+        levels = db.query(SymbolLevel).filter(
+            and_(
+                SymbolLevel.symbol == symbol,
+                SymbolLevel.is_active == True,
+                SymbolLevel.is_stale == False
+            )
+        ).all()
+        intervals = SymbolIntervals(level_entry(level) for level in levels if level.price is not None)
+        with self._lock:
+            self._symbols[symbol] = intervals
+            self._loaded_at[symbol] = time.monotonic()
+            self.loads += 1
+        return intervals
+
+    def intervals(self, db: Session, symbol: str) -> SymbolIntervals:
+        """Intervals for a symbol, loading first if cold or expired."""
+        intervals = self._symbols.get(symbol)
+        if intervals is None or time.monotonic() - self._loaded_at.get(symbol, 0.0) >= self.ttl_seconds:
+            return self._load(db, symbol)
+        return intervals
+
+    def nearest(self, db: Session, symbol: str, price: float, k: int = 5,
+                within_pct: Optional[float] = None, source: Optional[str] = None) -> List[Dict[str, Any]]:
+        """k nearest levels to price, optionally limited to within_pct percent of it."""
+        max_distance = abs(price) * within_pct / 100.0 if within_pct is not None else None
+        intervals = self.intervals(db, symbol)
+        if source:
+            intervals = SymbolIntervals(e for e in intervals.entries if e["source"] == source)
+        return intervals.nearest(price, k, max_distance)
+
+    def overlapping(self, db: Session, symbol: str, low: float, high: float,
+                    source: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Levels whose range intersects [low, high]."""
+        if high < low:
+            low, high = high, low
+        matches = self.intervals(db, symbol).overlapping(low, high)
+        return [e for e in matches if not source or e["source"] == source]
+
+    def cross_source_overlaps(self, db: Session, symbol: str, tolerance_pct: float = 0.0) -> List[Dict[str, Any]]:
+        """KT Technical / Discord level pairs that overlap (within tolerance_pct)."""
+        return self.intervals(db, symbol).cross_source_overlaps(tolerance_pct)
+
+    def add_levels(self, entries: Iterable[Dict[str, Any]]):
+        """Insert newly committed levels (from level_entry) into loaded symbols."""
+        by_symbol: Dict[str, List[Dict[str, Any]]] = {}
+        for entry in entries:
+            if entry["low"] is not None:
+                by_symbol.setdefault(entry["symbol"], []).append(entry)
+        with self._lock:
+            for symbol, new_entries in by_symbol.items():
+                intervals = self._symbols.get(symbol)
+                if intervals is not None:
+                    self._symbols[symbol] = SymbolIntervals(intervals.entries + new_entries)
+
+    def remove_level(self, symbol: str, level_id: int):
+        """Drop an invalidated level."""
+        with self._lock:
+            intervals = self._symbols.get(symbol)
+            if intervals is not None:
+                self._symbols[symbol] = SymbolIntervals(
+                    e for e in intervals.entries if e["id"] != level_id
+                )
+
+    def invalidate(self, symbols: Optional[Iterable[str]] = None):
+        """Forget the given symbols (or all); they reload on next query."""
+        with self._lock:
+            if symbols is None:
+                self._symbols.clear()
+                self._loaded_at.clear()
+            else:
+                for symbol in symbols:
+                    self._symbols.pop(symbol, None)
+                    self._loaded_at.pop(symbol, None)
+
+
+# Global index instance
+_level_index: Optional[LevelIndex] = None
+
+
+def get_level_index() -> LevelIndex:
+    """Get or create the global level index."""
+    global _level_index
+    if _level_index is None:
+        _level_index = LevelIndex()
+    return _level_index
@@ -0,0 +1,349 @@
+"""
+Ticker / Theme Mention Index
+
+Normalized association tables behind AnalyzedContent.tickers_mentioned and
+key_themes (comma-separated or JSON-list text). Tickers are canonicalized
+with SymbolLevelExtractor.SYMBOL_ALIASES (Google -> GOOGL, /ES -> SPX);
+theme keywords are lowercased with whitespace collapsed.
+
+A before_flush listener keeps ticker_mentions / theme_mentions in step with
+every new or edited AnalyzedContent, so all analysis paths populate them
+without per-call-site changes. rebuild_mention_index backfills existing rows;
+backfill_mention_index runs it at startup while the index is still empty
+(scripts/rebuild_mention_index.py forces a rebuild).
+"""
+import json
+import logging
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, desc, event, func, inspect, insert, select
+from sqlalchemy.orm import Session
+
+from backend.models import AnalyzedContent, RawContent, Source, ThemeMention, TickerMention
+
+logger = logging.getLogger(__name__)
+
+MAX_TICKER_LENGTH = 20
+MAX_KEYWORD_LENGTH = 200
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+# ============================================================================
+# Normalization
+# ============================================================================
+
+@lru_cache(maxsize=1)
+def _symbol_aliases() -> Dict[str, str]:
+    # Imported lazily: agents pull in the Anthropic client
+    from agents.symbol_level_extractor import SymbolLevelExtractor
+    return dict(SymbolLevelExtractor.SYMBOL_ALIASES)
+
+
+def normalize_ticker(text: Optional[str]) -> Optional[str]:
+    """
+    Canonical ticker for a mention, or None if it is empty / too long.
+
+    Aliases and futures notation map to the tracked symbol; other tickers
+    are kept as upper-case text without a leading $ or /.
+    """
+    if not text:
+        return None
+    clean = text.strip().upper().lstrip("$")
+    aliases = _symbol_aliases()
+    if clean in aliases:
+        return aliases[clean]
+    if clean.startswith("/"):
+        clean = clean[1:]
+        clean = aliases.get(clean, clean)
+    if not clean or len(clean) > MAX_TICKER_LENGTH:
+        return None
+    return clean
+
+
+def normalize_theme(text: Optional[str]) -> Optional[str]:
+    """Lowercased, whitespace-collapsed theme keyword, or None if empty / too long."""
+    if not text:
+        return None
+    clean = _WHITESPACE.sub(" ", text).strip().lower()
+    if not clean or len(clean) > MAX_KEYWORD_LENGTH:
+        return None
+    return clean
+
+
+def parse_list(value: Optional[str]) -> List[str]:
+    """Split a stored comma-separated or JSON-list column into items."""
+    if not value:
+        return []
+    text = value.strip()
+    if text.startswith("["):
+        try:
+            items = json.loads(text)
+        except ValueError:
+            items = text.strip("[]").split(",")
+        if not isinstance(items, list):
+            items = [items]
+    else:
+        items = text.split(",")
+    return [str(item).strip() for item in items if item is not None and str(item).strip()]
+
+
+def _normalized(values: Iterable[str], normalize) -> List[str]:
+    seen = []
+    for value in values:
+        normalized = normalize(value)
+        if normalized and normalized not in seen:
+            seen.append(normalized)
+    return seen
+
+
+def content_tickers(tickers_mentioned: Optional[str]) -> List[str]:
+    """Canonical tickers for an AnalyzedContent.tickers_mentioned value."""
+    return _normalized(parse_list(tickers_mentioned), normalize_ticker)
+
+
+def content_themes(key_themes: Optional[str]) -> List[str]:
+    """Normalized keywords for an AnalyzedContent.key_themes value."""
+    return _normalized(parse_list(key_themes), normalize_theme)
+
+
+# ============================================================================
+# Flush sync
+# ============================================================================
+
+def sync_mentions(analyzed: AnalyzedContent):
+    """
+    Point the analysis' mention collections at its current tickers / themes.
+
+    Unchanged mentions are kept (so the unique index never sees a delete and
+    re-insert of the same pair); mentioned_at follows analyzed_at.
+    """
+    if analyzed.analyzed_at is None:
+        analyzed.analyzed_at = datetime.utcnow()
+    at = analyzed.analyzed_at
+
+    existing = {m.ticker: m for m in analyzed.ticker_mentions}
+    analyzed.ticker_mentions = [
+        existing.get(ticker) or TickerMention(ticker=ticker, mentioned_at=at)
+        for ticker in content_tickers(analyzed.tickers_mentioned)
+    ]
+    existing = {m.keyword: m for m in analyzed.theme_mentions}
+    analyzed.theme_mentions = [
+        existing.get(keyword) or ThemeMention(keyword=keyword, mentioned_at=at)
+        for keyword in content_themes(analyzed.key_themes)
+    ]
+    for mention in analyzed.ticker_mentions + analyzed.theme_mentions:
+        mention.mentioned_at = at
+
+
+def _mentions_changed(analyzed: AnalyzedContent) -> bool:
+    attrs = inspect(analyzed).attrs
+    return any(attrs[name].history.has_changes() for name in ("tickers_mentioned", "key_themes", "analyzed_at"))
+
+
+@event.listens_for(Session, "before_flush")
+def _index_mentions(session, flush_context, instances):
+    """Sync mentions for new analyses and ones whose tickers / themes changed."""
+    for obj in list(session.new):
+        if isinstance(obj, AnalyzedContent):
+            sync_mentions(obj)
+    for obj in list(session.dirty):
+        if isinstance(obj, AnalyzedContent) and obj not in session.deleted and _mentions_changed(obj):
+            sync_mentions(obj)
+
+
+# ============================================================================
+# Backfill
+# ============================================================================
+
+def rebuild_mention_index(db: Session, batch_size: int = 1000) -> Dict[str, int]:
+    """
+    Recreate ticker_mentions and theme_mentions from analyzed_content.
+
+    Walks analyzed_content in id order (keyset batches) and bulk-inserts the
+    mention rows. Does not commit.
+    """
+    analyzed = AnalyzedContent.__table__
+    db.execute(delete(TickerMention.__table__))
+    db.execute(delete(ThemeMention.__table__))
+
+    counts = {"analyses": 0, "ticker_mentions": 0, "theme_mentions": 0}
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(analyzed.c.id, analyzed.c.tickers_mentioned, analyzed.c.key_themes, analyzed.c.analyzed_at)
+            .where(analyzed.c.id > last_id)
+            .order_by(analyzed.c.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+
+        tickers, themes = [], []
+        for row in rows:
+            at = row.analyzed_at or datetime.utcnow()
+            tickers += [{"ticker": t, "analyzed_content_id": row.id, "mentioned_at": at}
+                        for t in content_tickers(row.tickers_mentioned)]
+            themes += [{"keyword": k, "analyzed_content_id": row.id, "mentioned_at": at}
+                       for k in content_themes(row.key_themes)]
+        if tickers:
+            db.execute(insert(TickerMention.__table__), tickers)
+        if themes:
+            db.execute(insert(ThemeMention.__table__), themes)
+
+        counts["analyses"] += len(rows)
+        counts["ticker_mentions"] += len(tickers)
+        counts["theme_mentions"] += len(themes)
+        last_id = rows[-1].id
+
+    logger.info(
+        f"Rebuilt mention index: {counts['ticker_mentions']} ticker and "
+        f"{counts['theme_mentions']} theme mentions over {counts['analyses']} analyses"
+    )
+    return counts
+
+
+def backfill_mention_index(db: Session, batch_size: int = 1000) -> Optional[Dict[str, int]]:
+    """
+    Build the index when it is empty but analyses mention tickers or themes.
+
+    Migration 012 (and create_all on PostgreSQL) creates the tables empty;
+    this runs at application startup so existing analyses are indexed
+    without a manual step. Does not commit.
+
+    Returns:
+        rebuild_mention_index counts, or None if nothing needed backfilling
+    """
+    analyzed = AnalyzedContent.__table__
+    indexed = (db.execute(select(TickerMention.id).limit(1)).first()
+               or db.execute(select(ThemeMention.id).limit(1)).first())
+    if indexed:
+        return None
+    has_mentions = db.execute(
+        select(analyzed.c.id).where(
+            (func.coalesce(analyzed.c.tickers_mentioned, "") != "")
+            | (func.coalesce(analyzed.c.key_themes, "") != "")
+        ).limit(1)
+    ).first()
+    if not has_mentions:
+        return None
+    return rebuild_mention_index(db, batch_size=batch_size)
+
+
+# ============================================================================
+# Reads
+# ============================================================================
+
+def tickers_by_content(db: Session, analyzed_ids: Iterable[int]) -> Dict[int, List[str]]:
+    """Canonical tickers per analyzed_content id, in one query."""
+    ids = list(set(analyzed_ids))
+    if not ids:
+        return {}
+    result: Dict[int, List[str]] = {}
+    rows = db.execute(
+        select(TickerMention.analyzed_content_id, TickerMention.ticker)
+        .where(TickerMention.analyzed_content_id.in_(ids))
+        .order_by(TickerMention.id)
+    )
+    for analyzed_id, ticker in rows:
+        result.setdefault(analyzed_id, []).append(ticker)
+    return result
+
+
+def _like_escape(text: str) -> str:
+    """Escape LIKE wildcards so user text matches literally (with escape="\\")."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def content_matching_topic(topic: str):
+    """
+    Subquery of analyzed_content ids whose ticker or theme matches a topic.
+
+    A ticker matches after normalization (so "google" finds GOOGL); a theme
+    matches when the keyword contains the topic (% and _ match literally).
+    """
+    keyword = _like_escape(normalize_theme(topic) or topic.lower())
+    clauses = [
+        select(ThemeMention.analyzed_content_id)
+        .where(ThemeMention.keyword.like(f"%{keyword}%", escape="\\"))
+    ]
+    ticker = normalize_ticker(topic)
+    if ticker:
+        clauses.append(select(TickerMention.analyzed_content_id).where(TickerMention.ticker == ticker))
+    return clauses[0].union(*clauses[1:]) if len(clauses) > 1 else clauses[0]
+
+
+def ticker_timeline(
+    db: Session,
+    ticker: str,
+    days: int = 30,
+    limit: int = 50,
+    now: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    Mentions of one ticker, newest first, with per-source and sentiment counts.
+
+    Both queries are range scans on idx_ticker_mention_timeline plus primary
+    key joins, so cost follows the ticker's mentions in the window rather
+    than the corpus.
+    """
+    canonical = normalize_ticker(ticker) or ticker.upper()
+    cutoff = (now or datetime.utcnow()) - timedelta(days=days)
+    in_window = (TickerMention.ticker == canonical, TickerMention.mentioned_at >= cutoff)
+
+    def joined(stmt):
+        return stmt.select_from(TickerMention).join(
+            AnalyzedContent, TickerMention.analyzed_content_id == AnalyzedContent.id
+        ).join(
+            RawContent, AnalyzedContent.raw_content_id == RawContent.id
+        ).join(
+            Source, RawContent.source_id == Source.id
+        ).where(*in_window)
+
+    counts = db.execute(joined(select(
+        Source.name, AnalyzedContent.sentiment, func.count()
+    )).group_by(Source.name, AnalyzedContent.sentiment)).all()
+
+    rows = db.execute(joined(select(
+        TickerMention.mentioned_at, AnalyzedContent.id, AnalyzedContent.sentiment,
+        AnalyzedContent.conviction, AnalyzedContent.time_horizon, AnalyzedContent.key_themes,
+        RawContent.id, RawContent.content_type, RawContent.json_metadata, Source.name
+    )).order_by(desc(TickerMention.mentioned_at), desc(TickerMention.id)).limit(limit)).all()
+
+    by_source: Dict[str, int] = {}
+    by_sentiment: Dict[str, int] = {}
+    for source, sentiment, count in counts:
+        by_source[source] = by_source.get(source, 0) + count
+        by_sentiment[sentiment or "unknown"] = by_sentiment.get(sentiment or "unknown", 0) + count
+
+    mentions = []
+    for (mentioned_at, analyzed_id, sentiment, conviction, horizon, key_themes,
+         raw_id, content_type, json_metadata, source) in rows:
+        try:
+            metadata = json.loads(json_metadata) if json_metadata else {}
+        except json.JSONDecodeError:
+            metadata = {}
+        mentions.append({
+            "mentioned_at": mentioned_at.isoformat(),
+            "analyzed_content_id": analyzed_id,
+            "content_id": raw_id,
+            "source": source,
+            "content_type": content_type,
+            "title": metadata.get("title"),
+            "sentiment": sentiment,
+            "conviction": conviction,
+            "time_horizon": horizon,
+            "themes": parse_list(key_themes),
+        })
+
+    return {
+        "ticker": canonical,
+        "period_days": days,
+        "total_mentions": sum(by_source.values()),
+        "by_source": by_source,
+        "by_sentiment": by_sentiment,
+        "mentions": mentions,
+    }
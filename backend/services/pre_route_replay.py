@@ -0,0 +1,149 @@
+"""
+Pre-Router Replay
+
+Replays ContentClassifierAgent.pre_route over historical raw_content and
+compares its decisions with the classifier records Claude produced at the
+time. Reports how much content the rules would resolve without a Claude
+call (hit rate) and how often they agree on classification and routing,
+overall and per rule (scripts/replay_pre_router.py).
+
+Only Claude classifications are used as ground truth: records written by
+the rule-based fallback or by the pre-router itself are skipped.
+"""
+import json
+import logging
+from typing import Any, Dict, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from backend.models import AnalyzedContent, RawContent, Source
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Replay
+# ============================================================================
+
+def _agreement(agree: int, total: int) -> Optional[float]:
+    return round(agree / total, 4) if total else None
+
+
+def replay_pre_router(
+    db: Session,
+    classifier=None,
+    limit: Optional[int] = None,
+    source: Optional[str] = None,
+    sample_size: int = 20
+) -> Dict[str, Any]:
+    """
+    Compare pre-router decisions with the latest Claude classification per item.
+
+    Args:
+        db: Database session
+        classifier: ContentClassifierAgent (one is created if omitted)
+        limit: Most recent N classified items only
+        source: Restrict to one source name
+        sample_size: Disagreements to include in the report
+
+    Returns:
+        {"items", "skipped", "pre_routed", "hit_rate",
+         "classification_agreement", "routing_agreement",
+         "by_rule": {rule: {"hits", "classification_agreement", "routing_agreement"}},
+         "disagreements": [{raw_content_id, rule, predicted, past}]}
+    """
+    # Imported lazily: agents pull in the Anthropic client
+    from backend.routes.analyze import content_input
+
+    if classifier is None:
+        from agents.content_classifier import ContentClassifierAgent
+        classifier = ContentClassifierAgent()
+
+    latest = (
+        db.query(func.max(AnalyzedContent.id).label("id"))
+        .filter(AnalyzedContent.agent_type == "classifier")
+        .group_by(AnalyzedContent.raw_content_id)
+        .subquery()
+    )
+    query = (
+        db.query(RawContent, AnalyzedContent.analysis_result, Source.name)
+        .join(AnalyzedContent, AnalyzedContent.raw_content_id == RawContent.id)
+        .join(latest, latest.c.id == AnalyzedContent.id)
+        .outerjoin(Source, Source.id == RawContent.source_id)
+        .order_by(RawContent.id.desc())
+    )
+    if source:
+        query = query.filter(Source.name == source)
+    if limit:
+        query = query.limit(limit)
+
+    items = skipped = 0
+    by_rule: Dict[str, Dict[str, int]] = {}
+    disagreements = []
+
+    for raw, analysis_result, source_name in query:
+        try:
+            past = json.loads(analysis_result)
+        except (json.JSONDecodeError, TypeError):
+            skipped += 1
+            continue
+        raw_analysis = past.get("raw_analysis") or {}
+        if raw_analysis.get("fallback") or raw_analysis.get("pre_routed"):
+            skipped += 1
+            continue
+
+        try:
+            item = content_input(raw, source_name or "unknown")
+        except (json.JSONDecodeError, TypeError):
+            skipped += 1
+            continue
+
+        items += 1
+        # Not recorded: historical rows must not count towards the live hit rate
+        routed = classifier.pre_route(item, record=False)
+        if routed is None:
+            continue
+
+        rule = routed["raw_analysis"]["rule"]
+        counts = by_rule.setdefault(rule, {"hits": 0, "classification": 0, "routing": 0})
+        counts["hits"] += 1
+        same_class = routed["classification"] == past.get("classification")
+        same_route = set(routed["route_to_agents"]) == set(past.get("route_to_agents") or [])
+        counts["classification"] += same_class
+        counts["routing"] += same_route
+
+        if not (same_class and same_route) and len(disagreements) < sample_size:
+            disagreements.append({
+                "raw_content_id": raw.id,
+                "rule": rule,
+                "predicted": {"classification": routed["classification"],
+                              "route_to_agents": routed["route_to_agents"]},
+                "past": {"classification": past.get("classification"),
+                         "route_to_agents": past.get("route_to_agents")},
+            })
+
+    hits = sum(c["hits"] for c in by_rule.values())
+    report = {
+        "items": items,
+        "skipped": skipped,
+        "pre_routed": hits,
+        "hit_rate": _agreement(hits, items) or 0.0,
+        "classification_agreement": _agreement(sum(c["classification"] for c in by_rule.values()), hits),
+        "routing_agreement": _agreement(sum(c["routing"] for c in by_rule.values()), hits),
+        "by_rule": {
+            rule: {
+                "hits": c["hits"],
+                "classification_agreement": _agreement(c["classification"], c["hits"]),
+                "routing_agreement": _agreement(c["routing"], c["hits"]),
+            }
+            for rule, c in sorted(by_rule.items(), key=lambda kv: -kv[1]["hits"])
+        },
+        "disagreements": disagreements,
+    }
+    logger.info(
+        f"Pre-router replay: {hits}/{items} items pre-routed ({report['hit_rate']:.1%}), "
+        f"classification agreement {report['classification_agreement']}, "
+        f"routing agreement {report['routing_agreement']}"
+    )
+    return report
@@ -0,0 +1,184 @@
+"""
+Pub/Sub Backbone for Real-Time Events
+
+Carries dashboard events (new analysis, collection complete, etc.) between
+processes so that every API replica can push them to its own WebSocket
+clients, no matter which process produced the event.
+
+Backends:
+- memory: In-process delivery only (default, used for SQLite / local dev)
+- postgres: LISTEN/NOTIFY over a dedicated asyncpg connection
+
+Select with PUBSUB_BACKEND=memory|postgres|auto (default: auto, which picks
+postgres when DATABASE_URL points at PostgreSQL and asyncpg is installed).
+
+Payloads are pre-serialized JSON strings so each event is encoded once.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+PUBSUB_BACKEND = os.getenv("PUBSUB_BACKEND", "auto").lower()
+
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+POSTGRES_NOTIFY_MAX_BYTES = 7900
+
+Handler = Callable[[str], Awaitable[None]]
+
+
+class PubSubBackend:
+    """Base class for pub/sub transports."""
+
+    name = "base"
+
+    def __init__(self):
+        self._handlers: Dict[str, List[Handler]] = {}
+
+    def subscribe(self, channel: str, handler: Handler):
+        """Register a coroutine handler for payloads published on channel."""
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def unsubscribe(self, channel: str, handler: Handler):
+        """Remove a previously registered handler."""
+        handlers = self._handlers.get(channel, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    async def start(self):
+        """Open any connections needed to receive events."""
+
+    async def stop(self):
+        """Close connections opened by start()."""
+
+    async def publish(self, channel: str, payload: str):
+        """Publish a serialized payload to every subscriber of channel."""
+        raise NotImplementedError
+
+    async def _dispatch(self, channel: str, payload: str):
+        """Deliver a payload to local handlers, isolating handler errors."""
+        for handler in list(self._handlers.get(channel, [])):
+            try:
+                await handler(payload)
+            except Exception as e:
+                logger.error(f"Pub/sub handler error on '{channel}': {e}")
+
+
+class InMemoryPubSub(PubSubBackend):
+    """Delivers events to handlers registered in the current process."""
+
+    name = "memory"
+
+    async def publish(self, channel: str, payload: str):
+        await self._dispatch(channel, payload)
+
+
+class PostgresPubSub(PubSubBackend):
+    """
+    PostgreSQL LISTEN/NOTIFY transport.
+
+    Every process LISTENs on the channels it subscribes to, and publishers
+    NOTIFY through a separate connection. The publishing process receives
+    its own notifications too, so local delivery happens exactly once via
+    the listener callback.
+    """
+
+    name = "postgres"
+
+    def __init__(self, dsn: str):
+        super().__init__()
+        self.dsn = dsn
+        self._listen_conn = None
+        self._publish_conn = None
+        self._publish_lock = asyncio.Lock()
+
+    def subscribe(self, channel: str, handler: Handler):
+        is_new_channel = channel not in self._handlers
+        super().subscribe(channel, handler)
+        if is_new_channel and self._listen_conn is not None:
+            asyncio.get_running_loop().create_task(
+                self._listen_conn.add_listener(channel, self._on_notify)
+            )
+
+    async def start(self):
+        import asyncpg
+
+        self._listen_conn = await asyncpg.connect(self.dsn)
+        for channel in self._handlers:
+            await self._listen_conn.add_listener(channel, self._on_notify)
+        logger.info(f"Postgres pub/sub listening on {list(self._handlers)}")
+
+    async def stop(self):
+        for conn in (self._listen_conn, self._publish_conn):
+            if conn is not None:
+                try:
+                    await conn.close()
+                except Exception as e:
+                    logger.warning(f"Error closing pub/sub connection: {e}")
+        self._listen_conn = None
+        self._publish_conn = None
+
+    def _on_notify(self, connection, pid, channel, payload):
+        asyncio.get_running_loop().create_task(self._dispatch(channel, payload))
+
+    async def publish(self, channel: str, payload: str):
+        if len(payload.encode("utf-8")) > POSTGRES_NOTIFY_MAX_BYTES:
+            # Too large for NOTIFY - deliver locally rather than drop it
+            logger.warning(f"Pub/sub payload on '{channel}' exceeds NOTIFY limit, delivering locally only")
+            await self._dispatch(channel, payload)
+            return
+
+        import asyncpg
+
+        async with self._publish_lock:
+            try:
+                if self._publish_conn is None or self._publish_conn.is_closed():
+                    self._publish_conn = await asyncpg.connect(self.dsn)
+                await self._publish_conn.execute("SELECT pg_notify($1, $2)", channel, payload)
+            except Exception as e:
+                logger.error(f"Postgres NOTIFY failed on '{channel}', delivering locally: {e}")
+                self._publish_conn = None
+                await self._dispatch(channel, payload)
+
+
+def _postgres_dsn() -> Optional[str]:
+    """Return a plain postgresql:// DSN from DATABASE_URL, if configured."""
+    url = os.getenv("DATABASE_URL", "")
+    if url.startswith("postgres://"):
+        url = url.replace("postgres://", "postgresql://", 1)
+    if not url.startswith("postgresql"):
+        return None
+    # asyncpg doesn't understand SQLAlchemy driver suffixes
+    scheme, rest = url.split("://", 1)
+    return f"postgresql://{rest}"
+
+
+def create_pubsub(backend: str = PUBSUB_BACKEND) -> PubSubBackend:
+    """Build the configured pub/sub backend, falling back to in-memory."""
+    if backend in ("postgres", "auto"):
+        dsn = _postgres_dsn()
+        if dsn:
+            try:
+                import asyncpg  # noqa: F401
+                return PostgresPubSub(dsn)
+            except ImportError:
+                logger.warning("asyncpg not installed, using in-memory pub/sub")
+        elif backend == "postgres":
+            logger.warning("PUBSUB_BACKEND=postgres but DATABASE_URL is not PostgreSQL, using in-memory pub/sub")
+    return InMemoryPubSub()
+
+
+# Global pub/sub instance
+_pubsub: Optional[PubSubBackend] = None
+
+
+def get_pubsub() -> PubSubBackend:
+    """Get or create the global pub/sub backend."""
+    global _pubsub
+    if _pubsub is None:
+        _pubsub = create_pubsub()
+    return _pubsub
@@ -0,0 +1,266 @@
+"""
+Synthesis Quality Rollups (PRD-044)
+
+Stores SynthesisEvaluatorAgent results and keeps quality_daily_rollups in
+step with them, so trend statistics are computed from a handful of
+aggregate rows plus two windowed queries instead of loading every score.
+"""
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import and_, case, delete, func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from backend.models import QualityDailyRollup, SynthesisQualityScore
+from backend.utils.upsert import additive_upsert
+
+logger = logging.getLogger(__name__)
+
+CRITERIA = (
+    "confluence_detection",
+    "evidence_preservation",
+    "source_attribution",
+    "youtube_channel_granularity",
+    "nuance_retention",
+    "actionability",
+    "theme_continuity",
+)
+
+# Nearest-rank percentiles reported by quality_trends
+PERCENTILES = (25, 50, 75, 90)
+
+_SUM_COLUMNS = ("evaluations", "score_sum") + tuple(f"{c}_sum" for c in CRITERIA)
+
+
+def rollup_upsert(db: Session, quality_score: SynthesisQualityScore):
+    """
+    Build the upsert that folds one stored score into its (day, grade) rollup.
+
+    Args:
+        db: Session (used for the dialect)
+        quality_score: Score row; created_at decides the day
+    """
+    table = QualityDailyRollup.__table__
+    created_at = quality_score.created_at or datetime.utcnow()
+    values = {
+        "day": created_at.date(),
+        "grade": quality_score.grade,
+        "evaluations": 1,
+        "score_sum": quality_score.quality_score,
+        "score_min": quality_score.quality_score,
+        "score_max": quality_score.quality_score,
+        "updated_at": datetime.utcnow(),
+    }
+    for criterion in CRITERIA:
+        values[f"{criterion}_sum"] = getattr(quality_score, criterion)
+
+    def extremes(stmt):
+        excluded = stmt.excluded
+        return {
+            "score_min": case(
+                (or_(table.c.score_min.is_(None), excluded.score_min < table.c.score_min), excluded.score_min),
+                else_=table.c.score_min
+            ),
+            "score_max": case(
+                (or_(table.c.score_max.is_(None), excluded.score_max > table.c.score_max), excluded.score_max),
+                else_=table.c.score_max
+            ),
+        }
+
+    return additive_upsert(
+        db.get_bind().dialect.name, table, ("day", "grade"), values,
+        increment_columns=_SUM_COLUMNS, set_overrides=extremes
+    )
+
+
+def record_quality_score(db: Session, synthesis_id: int, quality_result: Dict[str, Any]) -> SynthesisQualityScore:
+    """
+    Add an evaluator result and bump its daily rollup.
+
+    Does not commit; callers commit alongside the rest of their work.
+
+    Args:
+        db: Session
+        synthesis_id: Evaluated synthesis
+        quality_result: SynthesisEvaluatorAgent.evaluate() output
+    """
+    quality_score = SynthesisQualityScore(
+        synthesis_id=synthesis_id,
+        quality_score=quality_result["quality_score"],
+        grade=quality_result["grade"],
+        flags=json.dumps(quality_result.get("flags", [])),
+        prompt_suggestions=json.dumps(quality_result.get("prompt_suggestions", [])),
+        created_at=datetime.utcnow(),
+        **{criterion: quality_result[criterion] for criterion in CRITERIA}
+    )
+    db.add(quality_score)
+    db.execute(rollup_upsert(db, quality_score))
+    return quality_score
+
+
+def rebuild_quality_rollups(db: Session) -> int:
+    """
+    Recompute quality_daily_rollups from synthesis_quality_scores.
+
+    Used to backfill after the table is introduced or to repair drift.
+    Does not commit. Returns the number of rollup rows written.
+    """
+    scores = SynthesisQualityScore.__table__
+    rollups = QualityDailyRollup.__table__
+    grouped = select(
+        func.date(scores.c.created_at).label("day"),
+        scores.c.grade,
+        func.count().label("evaluations"),
+        func.sum(scores.c.quality_score).label("score_sum"),
+        func.min(scores.c.quality_score).label("score_min"),
+        func.max(scores.c.quality_score).label("score_max"),
+        *[func.sum(scores.c[c]).label(f"{c}_sum") for c in CRITERIA],
+        func.max(scores.c.created_at).label("updated_at"),
+    ).where(scores.c.created_at.isnot(None)).group_by(func.date(scores.c.created_at), scores.c.grade)
+
+    db.execute(delete(rollups))
+    columns = ["day", "grade", "evaluations", "score_sum", "score_min", "score_max",
+               *[f"{c}_sum" for c in CRITERIA], "updated_at"]
+    result = db.execute(insert(rollups).from_select(columns, grouped))
+    logger.info(f"Rebuilt {result.rowcount} quality rollup rows")
+    return result.rowcount
+
+
+def _grade_aggregates(db: Session, cutoff: datetime) -> Dict[str, Dict[str, Any]]:
+    """
+    Per-grade sums for scores created at or after cutoff.
+
+    Whole days after the cutoff come from the rollup table; the partial
+    cutoff day is aggregated from raw scores so the window stays exact.
+    """
+    rollups = QualityDailyRollup.__table__
+    scores = SynthesisQualityScore.__table__
+    next_midnight = datetime.combine(cutoff.date() + timedelta(days=1), datetime.min.time())
+
+    from_rollups = select(
+        rollups.c.grade,
+        func.sum(rollups.c.evaluations),
+        func.sum(rollups.c.score_sum),
+        func.min(rollups.c.score_min),
+        func.max(rollups.c.score_max),
+        *[func.sum(rollups.c[f"{c}_sum"]) for c in CRITERIA],
+    ).where(rollups.c.day > cutoff.date()).group_by(rollups.c.grade)
+
+    from_scores = select(
+        scores.c.grade,
+        func.count(),
+        func.sum(scores.c.quality_score),
+        func.min(scores.c.quality_score),
+        func.max(scores.c.quality_score),
+        *[func.sum(scores.c[c]) for c in CRITERIA],
+    ).where(and_(scores.c.created_at >= cutoff, scores.c.created_at < next_midnight)).group_by(scores.c.grade)
+
+    grades: Dict[str, Dict[str, Any]] = {}
+    for row in [*db.execute(from_rollups), *db.execute(from_scores)]:
+        grade, count, score_sum, score_min, score_max, *criterion_sums = row
+        if not count:
+            continue
+        agg = grades.setdefault(grade, {
+            "count": 0, "score_sum": 0, "min": score_min, "max": score_max,
+            "criteria": dict.fromkeys(CRITERIA, 0)
+        })
+        agg["count"] += count
+        agg["score_sum"] += score_sum
+        agg["min"] = min(agg["min"], score_min)
+        agg["max"] = max(agg["max"], score_max)
+        for criterion, total in zip(CRITERIA, criterion_sums):
+            agg["criteria"][criterion] += total or 0
+    return grades
+
+
+def _half_averages(db: Session, cutoff: datetime) -> Dict[str, float]:
+    """Average score of the earlier and later half of the window (by creation order)."""
+    scores = SynthesisQualityScore.__table__
+    ranked = select(
+        scores.c.quality_score,
+        func.row_number().over(order_by=(scores.c.created_at, scores.c.id)).label("rn"),
+        func.count().over().label("n"),
+    ).where(scores.c.created_at >= cutoff).subquery()
+
+    # rn * 2 <= n matches the first n // 2 rows without integer division
+    half = case((ranked.c.rn * 2 <= ranked.c.n, "first"), else_="second").label("half")
+    rows = db.execute(select(half, func.avg(ranked.c.quality_score)).group_by(half))
+    return {name: float(avg) for name, avg in rows}
+
+
+def _percentiles(db: Session, cutoff: datetime) -> Dict[str, int]:
+    """Nearest-rank score percentiles for the window, picked out by a window query."""
+    scores = SynthesisQualityScore.__table__
+    ranked = select(
+        scores.c.quality_score,
+        func.row_number().over(order_by=scores.c.quality_score).label("rn"),
+        func.count().over().label("n"),
+    ).where(scores.c.created_at >= cutoff).subquery()
+
+    def at_rank(p):
+        # rn == ceil(p * n / 100)
+        return and_(ranked.c.rn * 100 >= p * ranked.c.n, (ranked.c.rn - 1) * 100 < p * ranked.c.n)
+
+    rows = db.execute(select(
+        ranked.c.quality_score,
+        *[case((at_rank(p), 1), else_=0) for p in PERCENTILES]
+    ).where(or_(*[at_rank(p) for p in PERCENTILES])))
+
+    result = {}
+    for score, *hits in rows:
+        for p, hit in zip(PERCENTILES, hits):
+            if hit:
+                result[f"p{p}"] = score
+    return result
+
+
+def quality_trends(db: Session, days: int, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Aggregate quality statistics for the last `days` days.
+
+    Statement count is fixed (four queries); the raw-score queries are
+    bounded by the window through idx_quality_created_at.
+    """
+    cutoff = (now or datetime.utcnow()) - timedelta(days=days)
+    grades = _grade_aggregates(db, cutoff)
+    total = sum(agg["count"] for agg in grades.values())
+
+    if not total:
+        return {
+            "period_days": days,
+            "total_evaluations": 0,
+            "message": "No quality evaluations found in this period"
+        }
+
+    criterion_avgs = {
+        criterion: sum(agg["criteria"][criterion] for agg in grades.values()) / total
+        for criterion in CRITERIA
+    }
+    weakest = min(criterion_avgs, key=criterion_avgs.get)
+    strongest = max(criterion_avgs, key=criterion_avgs.get)
+
+    halves = _half_averages(db, cutoff)
+    if "first" in halves and "second" in halves:
+        first_half_avg, second_half_avg = halves["first"], halves["second"]
+        trend = "improving" if second_half_avg > first_half_avg else "declining" if second_half_avg < first_half_avg else "stable"
+        trend_delta = round(second_half_avg - first_half_avg, 1)
+    else:
+        trend = "insufficient_data"
+        trend_delta = 0
+
+    return {
+        "period_days": days,
+        "total_evaluations": total,
+        "average_score": round(sum(agg["score_sum"] for agg in grades.values()) / total, 1),
+        "min_score": min(agg["min"] for agg in grades.values()),
+        "max_score": max(agg["max"] for agg in grades.values()),
+        "score_percentiles": _percentiles(db, cutoff),
+        "grade_distribution": {grade: agg["count"] for grade, agg in grades.items()},
+        "criterion_averages": {k: round(v, 2) for k, v in criterion_avgs.items()},
+        "weakest_criterion": weakest,
+        "strongest_criterion": strongest,
+        "trend": trend,
+        "trend_delta": trend_delta
+    }
@@ -0,0 +1,146 @@
+"""
+Materialized Symbol Snapshot (PRD-039)
+
+Keeps a per-process copy of every SymbolState row plus its active level
+count, so the symbols dashboard and MCP listing are served without touching
+the database.
+
+- Cold load: two queries (all states + one grouped level count)
+- Writers (extraction, compass, confluence, level edits) refresh only the
+  symbols they touched
+- Staleness sweeps invalidate the whole snapshot; it reloads on next read
+- SYMBOL_SNAPSHOT_TTL_SECONDS bounds how long writes made by other
+  processes can go unseen
+
+Readers get an immutable dict that is swapped atomically on update, so no
+lock is taken on the read path.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from backend.models import SymbolLevel, SymbolState
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+SYMBOL_SNAPSHOT_TTL_SECONDS = int(os.getenv("SYMBOL_SNAPSHOT_TTL_SECONDS", "300"))
+
+# SymbolState columns copied into each snapshot entry
+SNAPSHOT_FIELDS = [
+    c.name for c in SymbolState.__table__.columns if c.name != "id"
+]
+
+
+def active_level_counts(db: Session, symbols: Optional[Iterable[str]] = None) -> Dict[str, int]:
+    """
+    Count active levels per symbol with one grouped query.
+
+    Args:
+        db: Database session
+        symbols: Optional subset of symbols to count
+
+    Returns:
+        Dict mapping symbol -> active level count (symbols without levels omitted)
+    """
+    query = db.query(SymbolLevel.symbol, func.count(SymbolLevel.id)).filter(
+        SymbolLevel.is_active == True
+    )
+    if symbols is not None:
+        query = query.filter(SymbolLevel.symbol.in_(list(symbols)))
+    return dict(query.group_by(SymbolLevel.symbol).all())
+
+
+def _state_entry(state: SymbolState, level_count: int) -> Dict[str, Any]:
+    entry = {field: getattr(state, field) for field in SNAPSHOT_FIELDS}
+    entry["active_levels_count"] = level_count
+    return entry
+
+
+class SymbolSnapshot:
+    """Copy-on-write snapshot of symbol states keyed by symbol."""
+
+    def __init__(self, ttl_seconds: int = SYMBOL_SNAPSHOT_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._entries is not None and (
+            time.monotonic() - self._loaded_at < self.ttl_seconds
+        )
+
+    def load(self, db: Session) -> Dict[str, Dict[str, Any]]:
+        """Rebuild the whole snapshot from the database."""
+        states = db.query(SymbolState).all()
+        counts = active_level_counts(db)
+        entries = {s.symbol: _state_entry(s, counts.get(s.symbol, 0)) for s in states}
+        with self._lock:
+            self._entries = entries
+            self._loaded_at = time.monotonic()
+            self.loads += 1
+        logger.debug(f"Symbol snapshot loaded: {len(entries)} symbols")
+        return entries
+
+    def entries(self, db: Session) -> List[Dict[str, Any]]:
+        """All snapshot entries, loading first if cold or expired."""
+        entries = self._entries if self.is_loaded else self.load(db)
+        return list(entries.values())
+
+    def get(self, db: Session, symbol: str) -> Optional[Dict[str, Any]]:
+        entries = self._entries if self.is_loaded else self.load(db)
+        return entries.get(symbol)
+
+    def refresh(self, db: Session, symbols: Iterable[str]):
+        """Re-read the given symbols (states + level counts) into the snapshot."""
+        symbols = list(set(symbols))
+        if not symbols or self._entries is None:
+            return
+        states = db.query(SymbolState).filter(SymbolState.symbol.in_(symbols)).all()
+        counts = active_level_counts(db, symbols)
+        with self._lock:
+            if self._entries is None:
+                return
+            entries = dict(self._entries)
+            for symbol in symbols:
+                entries.pop(symbol, None)
+            for state in states:
+                entries[state.symbol] = _state_entry(state, counts.get(state.symbol, 0))
+            self._entries = entries
+
+    def update_state(self, state: SymbolState):
+        """Apply an in-memory SymbolState change whose level count is unchanged."""
+        with self._lock:
+            if self._entries is None:
+                return
+            previous = self._entries.get(state.symbol)
+            level_count = previous["active_levels_count"] if previous else 0
+            entries = dict(self._entries)
+            entries[state.symbol] = _state_entry(state, level_count)
+            self._entries = entries
+
+    def invalidate(self):
+        """Drop the snapshot; the next read reloads it."""
+        with self._lock:
+            self._entries = None
+
+
+# Global snapshot instance
+_snapshot: Optional[SymbolSnapshot] = None
+
+
+def get_symbol_snapshot() -> SymbolSnapshot:
+    """Get or create the global symbol snapshot."""
+    global _snapshot
+    if _snapshot is None:
+        _snapshot = SymbolSnapshot()
+    return _snapshot
@@ -0,0 +1,367 @@
+"""
+Synthesis Pipeline
+
+Post-collection synthesis modelled as a DAG of stages with declared
+dependencies. A stage starts as soon as the stages it depends on have
+finished, so independent work (auto-scoring next to the older-content and
+KT loads, cross-referencing next to SynthesisAgent, quality evaluation next
+to theme extraction) overlaps and wall time follows the critical path
+rather than the sum of the stages.
+
+Stages run in an executor thread with their own Session (a Session must not
+be shared across threads). Per-stage timings are returned with the results.
+
+Used by POST /api/synthesis/generate, POST /api/trigger/analyze and the
+scheduler's post-collection synthesis.
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from backend.models import Synthesis
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Orchestrator
+# ============================================================================
+
+class Stage:
+    """
+    One pipeline stage.
+
+    Args:
+        name: Unique stage name (its result is stored under this key)
+        func: Callable(db, results) -> result; results holds every finished stage
+        after: Names of stages that must finish first
+        required: A failure aborts the pipeline (otherwise the result is None
+            and dependents still run)
+        label: Progress step name reported through on_progress
+        timeout: Seconds before the stage counts as failed
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Session, Dict[str, Any]], Any],
+        after: Iterable[str] = (),
+        required: bool = False,
+        label: Optional[str] = None,
+        timeout: Optional[float] = None
+    ):
+        self.name = name
+        self.func = func
+        self.after = tuple(after)
+        self.required = required
+        self.label = label
+        self.timeout = timeout
+
+
+class StageFailed(Exception):
+    """A required stage failed; the original exception is the __cause__."""
+
+    def __init__(self, stage: str, error: BaseException):
+        super().__init__(f"Pipeline stage '{stage}' failed: {error}")
+        self.stage = stage
+        self.error = error
+
+
+def _check_graph(stages: List[Stage]) -> Dict[str, Stage]:
+    by_name = {}
+    for stage in stages:
+        if stage.name in by_name:
+            raise ValueError(f"Duplicate pipeline stage: {stage.name}")
+        by_name[stage.name] = stage
+    for stage in stages:
+        missing = [dep for dep in stage.after if dep not in by_name]
+        if missing:
+            raise ValueError(f"Stage '{stage.name}' depends on unknown stages: {missing}")
+
+    # Kahn's algorithm: every stage must be reachable without a cycle
+    remaining = {stage.name: set(stage.after) for stage in stages}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Pipeline stages form a cycle: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    return by_name
+
+
+def _call_stage(stage: Stage, results: Dict[str, Any], session_factory: Callable[[], Session]) -> Any:
+    db = session_factory()
+    try:
+        return stage.func(db, results)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+async def run_pipeline(
+    stages: List[Stage],
+    session_factory: Callable[[], Session],
+    executor=None,
+    on_progress: Optional[Callable[[str, str], None]] = None
+) -> Dict[str, Any]:
+    """
+    Run stages in dependency order, each as soon as its dependencies finish.
+
+    Args:
+        stages: Pipeline stages
+        session_factory: Creates the Session each stage runs with
+        executor: Executor for stage threads (loop default when None)
+        on_progress: Callback(label, status) for stages that have a label
+
+    Returns:
+        {"results": {stage: result}, "timings": [...], "failed": [...],
+         "wall_seconds", "critical_path_seconds", "serial_seconds"}
+
+    Raises:
+        StageFailed: A required stage raised or timed out
+    """
+    by_name = _check_graph(stages)
+    loop = asyncio.get_running_loop()
+    origin = time.perf_counter()
+    results: Dict[str, Any] = {}
+    timings: Dict[str, Dict[str, Any]] = {}
+    failed: List[str] = []
+
+    async def run(stage: Stage):
+        if on_progress and stage.label:
+            on_progress(stage.label, "in_progress")
+        started = time.perf_counter()
+        error = None
+        future = loop.run_in_executor(executor, _call_stage, stage, results, session_factory)
+        try:
+            results[stage.name] = await asyncio.wait_for(future, timeout=stage.timeout)
+        except Exception as e:
+            error = e
+            results[stage.name] = None
+            logger.warning(f"Pipeline stage '{stage.name}' failed{'' if stage.required else ' (non-fatal)'}: "
+                           f"{type(e).__name__}: {e}")
+        finally:
+            if on_progress and stage.label:
+                on_progress(stage.label, "complete")
+        return {
+            "stage": stage.name,
+            "status": "failed" if error else "complete",
+            "started_at": round(started - origin, 3),
+            "seconds": round(time.perf_counter() - started, 3),
+            "error": str(error) if error else None,
+        }, error
+
+    pending = dict(by_name)
+    running: Dict[asyncio.Future, Stage] = {}
+    while pending or running:
+        for name, stage in list(pending.items()):
+            if all(dep in timings for dep in stage.after):
+                del pending[name]
+                running[asyncio.ensure_future(run(stage))] = stage
+
+        done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        for future in done:
+            stage = running.pop(future)
+            timing, error = future.result()
+            timings[stage.name] = timing
+            if error is not None:
+                failed.append(stage.name)
+                if stage.required:
+                    for other in running:
+                        other.cancel()
+                    raise StageFailed(stage.name, error) from error
+
+    # Finish time of each stage if it had started the moment its dependencies ended
+    path: Dict[str, float] = {}
+    for name in (t["stage"] for t in sorted(timings.values(), key=lambda t: t["started_at"])):
+        path[name] = timings[name]["seconds"] + max((path[dep] for dep in by_name[name].after), default=0.0)
+
+    run_info = {
+        "results": results,
+        "timings": [timings[stage.name] for stage in stages],
+        "failed": failed,
+        "wall_seconds": round(time.perf_counter() - origin, 3),
+        "critical_path_seconds": round(max(path.values(), default=0.0), 3),
+        "serial_seconds": round(sum(t["seconds"] for t in timings.values()), 3),
+    }
+    logger.info(
+        f"Pipeline finished in {run_info['wall_seconds']}s "
+        f"(critical path {run_info['critical_path_seconds']}s, serial {run_info['serial_seconds']}s): "
+        + ", ".join(f"{t['stage']}={t['seconds']}s" for t in run_info["timings"])
+    )
+    return run_info
+
+
+def stage_timings(run_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Timing summary of a run_pipeline result (for API responses)."""
+    return {key: value for key, value in run_info.items() if key != "results"}
+
+
+# ============================================================================
+# Post-collection synthesis
+# ============================================================================
+
+def save_synthesis(
+    db: Session,
+    result: Dict[str, Any],
+    time_window: str,
+    content_count: int,
+    focus_topic: Optional[str] = None
+) -> Synthesis:
+    """Store a SynthesisAgent result with its flat summary columns. Commits."""
+    exec_summary = result.get("executive_summary", {})
+    synthesis_text = ""
+    market_regime_str = "unclear"
+    if isinstance(exec_summary, dict):
+        synthesis_text = exec_summary.get("synthesis_narrative", exec_summary.get("narrative", ""))
+        market_regime_str = exec_summary.get("overall_tone", "unclear")
+
+    synthesis = Synthesis(
+        schema_version="5.0",
+        synthesis=synthesis_text,
+        key_themes=json.dumps([t.get("theme", "") for t in result.get("confluence_zones", [])]),
+        high_conviction_ideas=json.dumps(result.get("attention_priorities", [])),
+        contradictions=json.dumps(result.get("conflict_watch", [])),
+        market_regime=market_regime_str,
+        catalysts=json.dumps(result.get("catalyst_calendar", [])),
+        synthesis_json=json.dumps(result),
+        time_window=time_window,
+        content_count=result.get("content_count", content_count),
+        sources_included=json.dumps(result.get("sources_included", [])),
+        focus_topic=focus_topic,
+        generated_at=datetime.utcnow()
+    )
+    db.add(synthesis)
+    db.commit()
+    db.refresh(synthesis)
+    return synthesis
+
+
+def synthesis_stages(
+    content_items: List[Dict[str, Any]],
+    time_window: str,
+    focus_topic: Optional[str] = None,
+    load_older: Optional[Callable[[Session], list]] = None,
+    load_kt: Optional[Callable[[Session], list]] = None,
+    score_content: Optional[Callable[[Session, list], dict]] = None,
+    load_pillar_scores: Optional[Callable[[Session], dict]] = None,
+    cross_reference: Optional[Callable[[Session], Optional[dict]]] = None,
+    synthesis_timeout: Optional[float] = None,
+    progress_callback: Optional[Callable[[str, str], None]] = None
+) -> List[Stage]:
+    """
+    Stage graph for synthesis over already-loaded content_items.
+
+    older_content ─┐
+    kt_symbols ────┼─> synthesis ─┐
+    scoring ─> pillar_scores ─┘   ├─> save ─> quality
+          └──> cross_reference ───┘       └─> themes
+
+    Optional loaders / steps that are not given are left out of the graph.
+    The saved synthesis is {"id", "generated_at", "market_regime"} under "save";
+    the (cross-reference enriched) SynthesisAgent result is under "synthesis".
+    """
+    stages: List[Stage] = []
+    synthesis_after = []
+
+    if load_older:
+        stages.append(Stage("older_content", lambda db, _: load_older(db)))
+        synthesis_after.append("older_content")
+    if load_kt:
+        stages.append(Stage("kt_symbols", lambda db, _: load_kt(db)))
+        synthesis_after.append("kt_symbols")
+    if score_content:
+        stages.append(Stage("scoring", lambda db, _: score_content(db, content_items)))
+    if load_pillar_scores:
+        stages.append(Stage("pillar_scores", lambda db, _: load_pillar_scores(db),
+                            after=["scoring"] if score_content else []))
+        synthesis_after.append("pillar_scores")
+
+    def run_synthesis(db, results):
+        from agents.synthesis_agent import SynthesisAgent
+
+        logger.info(f"Generating synthesis for {len(content_items)} items...")
+        kwargs = {}
+        if progress_callback:
+            kwargs["progress_callback"] = progress_callback
+        result = SynthesisAgent().analyze(
+            content_items=content_items,
+            older_content=results.get("older_content") or [],
+            time_window=time_window,
+            focus_topic=focus_topic,
+            kt_symbol_data=results.get("kt_symbols") or [],
+            pillar_scores=results.get("pillar_scores") or None,
+            **kwargs
+        )
+        logger.info(
+            f"Synthesis complete: {len(result.get('source_breakdowns', {}))} source breakdowns, "
+            f"{len(result.get('content_summaries', []))} content summaries"
+        )
+        return result
+
+    stages.append(Stage("synthesis", run_synthesis, after=synthesis_after, required=True,
+                        timeout=synthesis_timeout))
+
+    save_after = ["synthesis"]
+    if cross_reference:
+        stages.append(Stage("cross_reference", lambda db, _: cross_reference(db),
+                            after=["scoring"] if score_content else [], label="Cross-referencing"))
+        save_after.append("cross_reference")
+
+    def save(db, results):
+        result = results["synthesis"]
+        cross_ref_result = results.get("cross_reference")
+        if cross_ref_result:
+            # Enrich synthesis with CrossReference analysis (Bayesian convictions, contradictions)
+            result["bayesian_convictions"] = cross_ref_result.get("high_conviction_ideas", [])
+            result["structured_contradictions"] = cross_ref_result.get("contradictions", [])
+            result["theme_clusters"] = cross_ref_result.get("confluent_themes", [])
+            logger.info(
+                f"CrossReference enrichment: {len(result['bayesian_convictions'])} high-conviction ideas, "
+                f"{len(result['structured_contradictions'])} contradictions"
+            )
+        synthesis = save_synthesis(db, result, time_window, len(content_items), focus_topic)
+        logger.info(f"Synthesis generated and saved (ID: {synthesis.id})")
+        return {"id": synthesis.id, "generated_at": synthesis.generated_at,
+                "market_regime": synthesis.market_regime}
+
+    stages.append(Stage("save", save, after=save_after, required=True))
+
+    def evaluate_quality(db, results):
+        if os.getenv("ENABLE_QUALITY_EVALUATION", "true").lower() != "true":
+            return None
+        from agents.synthesis_evaluator import SynthesisEvaluatorAgent
+        from backend.services.quality_rollup import record_quality_score
+
+        synthesis_id = results["save"]["id"]
+        logger.info(f"Running quality evaluation for synthesis {synthesis_id}...")
+        quality_result = SynthesisEvaluatorAgent().evaluate(
+            synthesis_output=results["synthesis"],
+            original_content=content_items
+        )
+        record_quality_score(db, synthesis_id, quality_result)
+        db.commit()
+        logger.info(f"Quality evaluation complete: {quality_result['grade']} ({quality_result['quality_score']}/100)")
+        return quality_result
+
+    def track_themes(db, results):
+        from agents.theme_extractor import extract_and_track_themes
+
+        theme_result = extract_and_track_themes(results["synthesis"], db)
+        logger.info(f"Theme extraction complete: {theme_result.get('created', 0)} created, "
+                    f"{theme_result.get('updated', 0)} updated")
+        return theme_result
+
+    stages.append(Stage("quality", evaluate_quality, after=["save"], label="Evaluating quality"))
+    stages.append(Stage("themes", track_themes, after=["save"], label="Extracting themes"))
+    return stages
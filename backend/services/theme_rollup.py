@@ -0,0 +1,339 @@
+"""
+Theme Mention Rollups
+
+Keeps theme_daily_rollups (theme keyword x source x day) in step with
+analyzed_content and answers the aggregated themes endpoint from it, so a
+90-day lookback groups about as many rows per theme as a 7-day one instead
+of re-reading and re-splitting every analysis in the window.
+
+Keywords are the normalized theme_mentions keywords (mention_index). A
+before_flush listener reads the stored contribution of every edited or
+deleted analysis, and an after_flush listener applies it negated together
+with the contribution of every new or edited one, in the same transaction.
+Bulk Query.delete() bypasses the listeners; callers that use it run
+rebuild_theme_rollups for the affected sources. backfill_theme_rollups
+fills the empty table at startup after the mention index;
+scripts/rebuild_mention_index.py forces a rebuild of both.
+"""
+import logging
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import Date, case, delete, event, func, inspect, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from backend.models import AnalyzedContent, RawContent, Source, ThemeDailyRollup, ThemeMention
+from backend.services.activity_rollup import content_keys
+from backend.services.mention_index import content_themes
+from backend.utils.upsert import additive_upsert
+
+logger = logging.getLogger(__name__)
+
+COUNTERS = (
+    "mention_count",
+    "bullish_count",
+    "bearish_count",
+    "neutral_count",
+    "conviction_sum",
+    "conviction_count",
+)
+
+SENTIMENT_COUNTERS = {
+    "bullish": "bullish_count",
+    "bearish": "bearish_count",
+    "neutral": "neutral_count",
+}
+
+# Change in average conviction between the earlier and recent half of the
+# window that counts as a rising / falling trend
+CONVICTION_TREND_DELTA = 0.5
+MIN_TREND_CONVICTIONS = 3
+
+TRACKED_ATTRIBUTES = ("key_themes", "sentiment", "conviction", "analyzed_at", "raw_content_id")
+
+RollupKey = Tuple[str, int, date]
+
+_PENDING_KEY = "theme_rollup_pending"
+
+
+# ============================================================================
+# Flush tracking
+# ============================================================================
+
+def _contribution(sentiment, conviction) -> Counter:
+    """Counter deltas one analysis adds to each of its keywords' rows."""
+    counts = Counter(mention_count=1)
+    counter = SENTIMENT_COUNTERS.get((sentiment or "").strip().lower())
+    if counter:
+        counts[counter] = 1
+    if conviction is not None:
+        counts["conviction_sum"] = conviction
+        counts["conviction_count"] = 1
+    return counts
+
+
+def _affected(session: Session) -> Tuple[List[AnalyzedContent], List[AnalyzedContent]]:
+    """(analyses whose stored rows must be removed, analyses to add afterwards)."""
+    removed, added = [], []
+    for obj in session.new:
+        if isinstance(obj, AnalyzedContent):
+            added.append(obj)
+    for obj in session.deleted:
+        if isinstance(obj, AnalyzedContent) and inspect(obj).persistent:
+            removed.append(obj)
+    for obj in session.dirty:
+        if not isinstance(obj, AnalyzedContent) or obj in session.deleted:
+            continue
+        attrs = inspect(obj).attrs
+        if any(attrs[name].history.has_changes() for name in TRACKED_ATTRIBUTES):
+            removed.append(obj)
+            added.append(obj)
+    return removed, added
+
+
+def _stored_deltas(session: Session, analyzed_ids: List[int]) -> Dict[RollupKey, Counter]:
+    """Negative deltas for the analyses' contributions as currently stored."""
+    deltas: Dict[RollupKey, Counter] = defaultdict(Counter)
+    if not analyzed_ids:
+        return deltas
+    analyzed = AnalyzedContent.__table__
+    raw = RawContent.__table__
+    mentions = ThemeMention.__table__
+    rows = session.connection().execute(
+        select(mentions.c.keyword, raw.c.source_id, analyzed.c.analyzed_at,
+               analyzed.c.sentiment, analyzed.c.conviction)
+        .select_from(
+            mentions.join(analyzed, mentions.c.analyzed_content_id == analyzed.c.id)
+            .join(raw, analyzed.c.raw_content_id == raw.c.id)
+        )
+        .where(analyzed.c.id.in_(analyzed_ids), analyzed.c.analyzed_at.isnot(None))
+    )
+    for keyword, source_id, analyzed_at, sentiment, conviction in rows:
+        deltas[(keyword, source_id, analyzed_at.date())].subtract(_contribution(sentiment, conviction))
+    return deltas
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_theme_changes(session, flush_context, instances):
+    """Read the stored contributions of changed analyses before they are overwritten."""
+    session.info.pop(_PENDING_KEY, None)
+    removed, added = _affected(session)
+    if not (removed or added):
+        return
+    deltas = _stored_deltas(session, [obj.id for obj in removed])
+    # New state is read here, where unloaded attributes may still be loaded
+    pending = [
+        (obj, content_themes(obj.key_themes), obj.sentiment, obj.conviction, obj.analyzed_at)
+        for obj in added
+    ]
+    session.info[_PENDING_KEY] = (deltas, pending)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_themes(session, flush_context):
+    """Apply the theme rollup deltas for the analyses just flushed."""
+    deltas, pending = session.info.pop(_PENDING_KEY, (None, None))
+    if deltas is None:
+        return
+
+    sources = content_keys(session, [inspect(obj).dict.get("raw_content_id") for obj, *_ in pending])
+    for obj, keywords, sentiment, conviction, analyzed_at in pending:
+        content = sources.get(inspect(obj).dict.get("raw_content_id"))
+        analyzed_at = analyzed_at or inspect(obj).dict.get("analyzed_at")
+        if content is None or analyzed_at is None:
+            continue
+        counts = _contribution(sentiment, conviction)
+        for keyword in keywords:
+            deltas[(keyword, content[0], analyzed_at.date())].update(counts)
+
+    connection = session.connection()
+    for key, counts in deltas.items():
+        if any(counts.values()):
+            connection.execute(theme_upsert(connection.dialect.name, key, counts))
+
+
+def theme_upsert(dialect_name: str, key: RollupKey, counts: Dict[str, int]):
+    """
+    Build the upsert that adds counts onto one (keyword, source, day) row.
+
+    Args:
+        dialect_name: Engine dialect name
+        key: (keyword, source_id, day)
+        counts: Deltas for COUNTERS (missing ones are 0)
+    """
+    keyword, source_id, day = key
+    values = {
+        "keyword": keyword,
+        "source_id": source_id,
+        "day": day,
+        "updated_at": datetime.utcnow(),
+        **{col: counts.get(col, 0) for col in COUNTERS},
+    }
+    return additive_upsert(
+        dialect_name, ThemeDailyRollup.__table__, ("keyword", "source_id", "day"), values,
+        increment_columns=COUNTERS
+    )
+
+
+# ============================================================================
+# Rebuild
+# ============================================================================
+
+def rebuild_theme_rollups(db: Session, source_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    Recompute theme_daily_rollups from theme_mentions with one grouped query.
+
+    Args:
+        db: Session (not committed)
+        source_ids: Restrict to these sources; all sources when None
+
+    Returns:
+        Number of rollup rows written
+    """
+    analyzed = AnalyzedContent.__table__
+    raw = RawContent.__table__
+    mentions = ThemeMention.__table__
+    sentiment = func.lower(func.trim(analyzed.c.sentiment))
+    day = func.date(mentions.c.mentioned_at, type_=Date)
+
+    stmt = select(
+        mentions.c.keyword, raw.c.source_id, day,
+        func.count(),
+        *[func.sum(case((sentiment == name, 1), else_=0)) for name in SENTIMENT_COUNTERS],
+        func.sum(analyzed.c.conviction), func.count(analyzed.c.conviction),
+    ).select_from(
+        mentions.join(analyzed, mentions.c.analyzed_content_id == analyzed.c.id)
+        .join(raw, analyzed.c.raw_content_id == raw.c.id)
+    ).group_by(mentions.c.keyword, raw.c.source_id, day)
+    clear = delete(ThemeDailyRollup.__table__)
+    if source_ids is not None:
+        source_ids = list(source_ids)
+        stmt = stmt.where(raw.c.source_id.in_(source_ids))
+        clear = clear.where(ThemeDailyRollup.__table__.c.source_id.in_(source_ids))
+
+    now = datetime.utcnow()
+    rows = [
+        {"keyword": keyword, "source_id": source_id, "day": d, "updated_at": now,
+         **dict(zip(COUNTERS, [count, bullish, bearish, neutral, conviction_sum or 0, conviction_count]))}
+        for keyword, source_id, d, count, bullish, bearish, neutral, conviction_sum, conviction_count
+        in db.execute(stmt)
+    ]
+
+    db.execute(clear)
+    if rows:
+        db.execute(insert(ThemeDailyRollup.__table__), rows)
+    logger.info(f"Rebuilt {len(rows)} theme rollup rows")
+    return len(rows)
+
+
+def backfill_theme_rollups(db: Session) -> Optional[int]:
+    """
+    Build theme_daily_rollups when it is empty but theme_mentions has rows.
+
+    Migration 016 (and create_all on PostgreSQL) creates the table empty;
+    this runs at application startup, after backfill_mention_index. Does
+    not commit.
+
+    Returns:
+        Rollup rows written, or None if nothing needed backfilling
+    """
+    if db.execute(select(ThemeDailyRollup.id).limit(1)).first():
+        return None
+    if not db.execute(select(ThemeMention.id).limit(1)).first():
+        return None
+    return rebuild_theme_rollups(db)
+
+
+# ============================================================================
+# Reads
+# ============================================================================
+
+def _conviction_trend(earlier_sum, earlier_count, recent_sum, recent_count) -> str:
+    """Compare average conviction in the recent half of the window with the earlier half."""
+    if earlier_count + recent_count < MIN_TREND_CONVICTIONS or not (earlier_count and recent_count):
+        return "stable"
+    change = recent_sum / recent_count - earlier_sum / earlier_count
+    if change >= CONVICTION_TREND_DELTA:
+        return "rising"
+    if change <= -CONVICTION_TREND_DELTA:
+        return "falling"
+    return "stable"
+
+
+async def aggregated_themes(
+    db: AsyncSession,
+    days: Optional[int] = 7,
+    min_sources: int = 1,
+    today: Optional[date] = None
+) -> List[Dict[str, Any]]:
+    """
+    Themes mentioned in the last `days` days (all time when None), most mentioned first.
+
+    One grouped query over theme_daily_rollups per (keyword, source); its
+    cost follows the number of theme / source / day rows in the window,
+    not the number of analyses. The window is whole days, including the
+    day `days` days ago. Conviction trend compares the recent half of the
+    window with the earlier half.
+    """
+    rollups = ThemeDailyRollup.__table__
+    today = today or datetime.utcnow().date()
+    if days is not None:
+        since = today - timedelta(days=days)
+    else:
+        since = (await db.execute(
+            select(func.min(rollups.c.day)).where(rollups.c.mention_count > 0)
+        )).scalar() or today
+    midpoint = since + (today - since) / 2
+    recent = rollups.c.day > midpoint
+
+    stmt = select(
+        rollups.c.keyword, Source.name,
+        func.min(rollups.c.day), func.max(rollups.c.day),
+        *[func.sum(rollups.c[col]) for col in COUNTERS],
+        func.sum(case((recent, rollups.c.conviction_sum), else_=0)),
+        func.sum(case((recent, rollups.c.conviction_count), else_=0)),
+    ).join(Source, rollups.c.source_id == Source.id).where(
+        rollups.c.mention_count > 0
+    ).group_by(rollups.c.keyword, Source.name)
+    if days is not None:
+        stmt = stmt.where(rollups.c.day >= since)
+
+    themes: Dict[str, Dict[str, Any]] = {}
+    for keyword, source, first, last, *sums in (await db.execute(stmt)).all():
+        theme = themes.setdefault(keyword, {"sources": [], "first": first, "last": last,
+                                            "sums": Counter()})
+        theme["sources"].append(source)
+        theme["first"] = min(theme["first"], first)
+        theme["last"] = max(theme["last"], last)
+        theme["sums"].update(dict(zip(COUNTERS + ("recent_conviction_sum", "recent_conviction_count"),
+                                      [value or 0 for value in sums])))
+
+    result = []
+    for keyword, theme in themes.items():
+        if len(theme["sources"]) < min_sources:
+            continue
+        sums = theme["sums"]
+        mix = {name: sums[counter] for name, counter in SENTIMENT_COUNTERS.items()}
+        rated = sum(mix.values())
+        conviction_count = sums["conviction_count"]
+        result.append({
+            "name": keyword,
+            "sources": sorted(theme["sources"]),
+            "source_count": len(theme["sources"]),
+            "mention_count": sums["mention_count"],
+            "first_seen": theme["first"].strftime("%Y-%m-%d"),
+            "last_seen": theme["last"].strftime("%Y-%m-%d"),
+            "avg_sentiment": round((mix["bullish"] - mix["bearish"]) / rated, 2) if rated else None,
+            "sentiment_mix": mix,
+            "avg_conviction": round(sums["conviction_sum"] / conviction_count, 2) if conviction_count else None,
+            "conviction_trend": _conviction_trend(
+                sums["conviction_sum"] - sums["recent_conviction_sum"],
+                conviction_count - sums["recent_conviction_count"],
+                sums["recent_conviction_sum"], sums["recent_conviction_count"]
+            ),
+        })
+
+    result.sort(key=lambda t: (-t["mention_count"], t["name"]))
+    return result
@@ -0,0 +1,69 @@
+"""
+Theme Similarity Terms
+
+Keeps themes.similarity_terms (weighted name / alias / description terms,
+JSON) current for the local theme prefilter in backend/utils/text_similarity.py:
+mapper listeners refresh it whenever a Theme is inserted or updated, so every
+write path (theme extraction, the themes API, merges) stays covered.
+IDF weights are computed across the candidate set at query time, so stored
+terms never go stale as the theme corpus grows.
+
+rebuild_theme_terms backfills existing rows (scripts/rebuild_theme_terms.py).
+"""
+import json
+import logging
+
+from sqlalchemy import event, select, update
+from sqlalchemy.orm import Session
+
+from backend.models import Theme
+from backend.utils.text_similarity import theme_terms
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Stored terms
+# ============================================================================
+
+@event.listens_for(Theme, "before_insert")
+@event.listens_for(Theme, "before_update")
+def _refresh_theme_terms(mapper, connection, target):
+    """Keep similarity_terms in step with name / aliases / description."""
+    target.similarity_terms = json.dumps(
+        theme_terms(target.name, target.description, target.aliases), sort_keys=True
+    )
+
+
+def rebuild_theme_terms(db: Session, batch_size: int = 500) -> int:
+    """
+    Recompute similarity_terms for every theme (backfill). Does not commit.
+
+    Uses Core updates (keeping updated_at as is), so backfilling does not
+    look like an edit to every theme.
+    """
+    themes = Theme.__table__
+    updated = 0
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(themes.c.id, themes.c.name, themes.c.description, themes.c.aliases)
+            .where(themes.c.id > last_id)
+            .order_by(themes.c.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        for row in rows:
+            db.execute(
+                update(themes).where(themes.c.id == row.id).values(
+                    similarity_terms=json.dumps(theme_terms(row.name, row.description, row.aliases),
+                                                sort_keys=True),
+                    updated_at=themes.c.updated_at
+                )
+            )
+        updated += len(rows)
+        last_id = rows[-1].id
+
+    logger.info(f"Rebuilt similarity terms for {updated} themes")
+    return updated
@@ -5,7 +5,9 @@ Provides consistent duplicate detection across all collection paths.
 """
 
 from sqlalchemy.orm import Session
+from typing import Set, Tuple
 from backend.models import RawContent
+import json
 import logging
 
 logger = logging.getLogger(__name__)
@@ -79,6 +81,30 @@ def check_duplicate(
     return False
 
 
+def existing_report_keys(db: Session, source_id: int) -> Set[Tuple[str, str]]:
+    """
+    (report_type, date) pairs of the PDF reports already stored for a source.
+
+    Lets the 42 Macro collector skip known reports before downloading them;
+    the pairs match the report_type + date check in check_duplicate.
+    """
+    rows = db.query(RawContent.json_metadata).filter(
+        RawContent.source_id == source_id,
+        RawContent.content_type == "pdf",
+        RawContent.json_metadata.contains('"report_type"')
+    ).all()
+
+    keys = set()
+    for (json_metadata,) in rows:
+        try:
+            metadata = json.loads(json_metadata)
+        except (json.JSONDecodeError, TypeError):
+            continue
+        if metadata.get("report_type") and metadata.get("date"):
+            keys.add((metadata["report_type"], metadata["date"]))
+    return keys
+
+
 def add_dedup_indexes(db_engine):
     """
     Add database indexes for efficient duplicate lookups.
@@ -3,102 +3,170 @@ Staleness Manager (PRD-039)
 
 Manages staleness tracking for symbol levels and states.
 Marks data as stale after 14 days without update.
+
+PRD-048: The sweep also stores stale_since timestamps (48h read threshold)
+so symbol reads are plain column fetches instead of per-request math.
 """
 
 import logging
+import os
+import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, case, func, or_, select
 
 from backend.models import SymbolLevel, SymbolState
+from backend.services.level_index import get_level_index
+from backend.services.symbol_snapshot import get_symbol_snapshot
 
 logger = logging.getLogger(__name__)
 
 # Default staleness threshold
 STALENESS_DAYS = 14
 
+# Read-time staleness threshold (PRD-048), stored as stale_since by the sweep
+SYMBOL_STALENESS_HOURS = int(os.getenv("SYMBOL_STALENESS_HOURS", "48"))
+
+KT_STALE_WARNING = f"No KT update in {STALENESS_DAYS}+ days - levels may be invalidated"
+
+
+def _stale_since_expr(column, timestamp, cutoff, now, null_is_stale: bool = False):
+    """
+    New value for a stored stale_since column: keep/set it while the
+    timestamp is past the cutoff, clear it once the data is fresh again.
+    """
+    is_stale = timestamp < cutoff
+    if null_is_stale:
+        is_stale = or_(timestamp.is_(None), is_stale)
+    return case((is_stale, func.coalesce(column, now)), else_=None)
+
+
+def _stale_since_changes(column, timestamp, cutoff, null_is_stale: bool = False):
+    """Rows where _stale_since_expr would change the stored value."""
+    is_stale = timestamp < cutoff
+    if null_is_stale:
+        is_stale = or_(timestamp.is_(None), is_stale)
+    return or_(
+        and_(column.is_(None), is_stale),
+        and_(column.isnot(None), timestamp.isnot(None), timestamp >= cutoff)
+    )
+
 
 def check_and_mark_stale_data(db: Session) -> Dict[str, Any]:
     """
-    Check all symbol levels and states for staleness.
-    Mark data as stale if no update in STALENESS_DAYS.
+    Set-based staleness sweep over all symbol states and levels.
+
+    One UPDATE on symbol_states marks sources with no update in
+    STALENESS_DAYS and stamps/clears the stored stale_since columns used
+    by reads (SYMBOL_STALENESS_HOURS); one UPDATE on symbol_levels marks
+    active levels of stale sources. Runs on a schedule and after each
+    extraction.
 
     Args:
         db: Database session
 
     Returns:
-        Summary of stale data found
+        Summary of stale data found, rows touched and timing
     """
+    started = time.perf_counter()
     try:
-        cutoff = datetime.utcnow() - timedelta(days=STALENESS_DAYS)
+        now = datetime.utcnow()
+        cutoff = now - timedelta(days=STALENESS_DAYS)
+        read_cutoff = now - timedelta(hours=SYMBOL_STALENESS_HOURS)
+
+        kt_newly_stale = and_(
+            SymbolState.kt_last_updated.isnot(None),
+            SymbolState.kt_last_updated < cutoff,
+            SymbolState.kt_is_stale == False
+        )
+        discord_newly_stale = and_(
+            SymbolState.discord_last_updated.isnot(None),
+            SymbolState.discord_last_updated < cutoff,
+            SymbolState.discord_is_stale == False
+        )
+
+        # Symbols crossing the 14-day threshold, for reporting
+        newly_stale = db.query(
+            SymbolState.symbol,
+            case((kt_newly_stale, True), else_=False),
+            case((discord_newly_stale, True), else_=False)
+        ).filter(or_(kt_newly_stale, discord_newly_stale)).all()
+
         results = {
-            "kt_stale_symbols": [],
-            "discord_stale_symbols": [],
-            "stale_levels_marked": 0
+            "kt_stale_symbols": [symbol for symbol, kt, _ in newly_stale if kt],
+            "discord_stale_symbols": [symbol for symbol, _, discord in newly_stale if discord],
+            "stale_levels_marked": 0,
+            "states_updated": 0
         }
 
-        # Check KT Technical staleness per symbol
-        kt_stale = db.query(SymbolState).filter(
-            and_(
-                SymbolState.kt_last_updated.isnot(None),
-                SymbolState.kt_last_updated < cutoff,
-                SymbolState.kt_is_stale == False
+        states_updated = db.query(SymbolState).filter(
+            or_(
+                kt_newly_stale,
+                discord_newly_stale,
+                _stale_since_changes(SymbolState.stale_since, SymbolState.updated_at, read_cutoff, True),
+                _stale_since_changes(SymbolState.kt_stale_since, SymbolState.kt_last_updated, read_cutoff),
+                _stale_since_changes(SymbolState.discord_stale_since, SymbolState.discord_last_updated, read_cutoff)
             )
-        ).all()
-
-        for state in kt_stale:
-            state.kt_is_stale = True
-            state.kt_stale_warning = f"No KT update since {state.kt_last_updated.strftime('%b %d')} - levels may be invalidated"
-            results["kt_stale_symbols"].append(state.symbol)
-
-            # Mark associated levels as stale
-            levels_updated = db.query(SymbolLevel).filter(
-                and_(
-                    SymbolLevel.symbol == state.symbol,
-                    SymbolLevel.source == 'kt_technical',
-                    SymbolLevel.is_stale == False,
-                    SymbolLevel.is_active == True
-                )
-            ).update({
-                'is_stale': True,
-                'stale_reason': 'No source update in 14+ days'
-            })
-            results["stale_levels_marked"] += levels_updated
-
-        # Check Discord staleness per symbol
-        discord_stale = db.query(SymbolState).filter(
+        ).update({
+            # Keep updated_at as-is; the column's onupdate would make swept symbols look fresh
+            SymbolState.updated_at: SymbolState.updated_at,
+            SymbolState.kt_stale_warning: case(
+                (kt_newly_stale, KT_STALE_WARNING), else_=SymbolState.kt_stale_warning
+            ),
+            SymbolState.kt_is_stale: case(
+                (kt_newly_stale, True), else_=SymbolState.kt_is_stale
+            ),
+            SymbolState.discord_is_stale: case(
+                (discord_newly_stale, True), else_=SymbolState.discord_is_stale
+            ),
+            SymbolState.stale_since: _stale_since_expr(
+                SymbolState.stale_since, SymbolState.updated_at, read_cutoff, now, null_is_stale=True
+            ),
+            SymbolState.kt_stale_since: _stale_since_expr(
+                SymbolState.kt_stale_since, SymbolState.kt_last_updated, read_cutoff, now
+            ),
+            SymbolState.discord_stale_since: _stale_since_expr(
+                SymbolState.discord_stale_since, SymbolState.discord_last_updated, read_cutoff, now
+            ),
+        }, synchronize_session=False)
+        results["states_updated"] = states_updated
+
+        # Mark active levels of every stale source in one statement
+        kt_stale_symbols = select(SymbolState.symbol).where(SymbolState.kt_is_stale == True)
+        discord_stale_symbols = select(SymbolState.symbol).where(SymbolState.discord_is_stale == True)
+        levels_updated = db.query(SymbolLevel).filter(
             and_(
-                SymbolState.discord_last_updated.isnot(None),
-                SymbolState.discord_last_updated < cutoff,
-                SymbolState.discord_is_stale == False
-            )
-        ).all()
-
-        for state in discord_stale:
-            state.discord_is_stale = True
-            results["discord_stale_symbols"].append(state.symbol)
-
-            # Mark associated levels as stale
-            levels_updated = db.query(SymbolLevel).filter(
-                and_(
-                    SymbolLevel.symbol == state.symbol,
-                    SymbolLevel.source == 'discord',
-                    SymbolLevel.is_stale == False,
-                    SymbolLevel.is_active == True
+                SymbolLevel.is_stale == False,
+                SymbolLevel.is_active == True,
+                or_(
+                    and_(SymbolLevel.source == 'kt_technical', SymbolLevel.symbol.in_(kt_stale_symbols)),
+                    and_(SymbolLevel.source == 'discord', SymbolLevel.symbol.in_(discord_stale_symbols))
                 )
-            ).update({
-                'is_stale': True,
-                'stale_reason': 'No source update in 14+ days'
-            })
-            results["stale_levels_marked"] += levels_updated
+            )
+        ).update({
+            'is_stale': True,
+            'stale_reason': 'No source update in 14+ days',
+            'stale_since': now
+        }, synchronize_session=False)
+        results["stale_levels_marked"] = levels_updated
 
         db.commit()
 
-        if results["kt_stale_symbols"] or results["discord_stale_symbols"]:
+        results["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+        if states_updated or levels_updated:
+            get_symbol_snapshot().invalidate()
+            get_level_index().invalidate(
+                results["kt_stale_symbols"] + results["discord_stale_symbols"]
+            )
+
+        if results["kt_stale_symbols"] or results["discord_stale_symbols"] or levels_updated:
             logger.info(f"Staleness check: KT stale={results['kt_stale_symbols']}, "
                        f"Discord stale={results['discord_stale_symbols']}, "
                        f"levels marked={results['stale_levels_marked']}")
+        logger.debug(f"Staleness sweep: {states_updated} states, {levels_updated} levels "
+                     f"in {results['duration_ms']}ms")
 
         return results
 
@@ -134,11 +202,14 @@ def refresh_staleness_for_symbol(
             state.kt_last_updated = now
             state.kt_is_stale = False
             state.kt_stale_warning = None
+            state.kt_stale_since = None
         elif source == 'discord':
             state.discord_last_updated = now
             state.discord_is_stale = False
+            state.discord_stale_since = None
 
         state.updated_at = now
+        state.stale_since = None
 
         # Refresh level confirmation dates and clear stale flag
         db.query(SymbolLevel).filter(
@@ -150,10 +221,13 @@ def refresh_staleness_for_symbol(
         ).update({
             'last_confirmed_at': now,
             'is_stale': False,
-            'stale_reason': None
+            'stale_reason': None,
+            'stale_since': None
         })
 
         db.commit()
+        get_symbol_snapshot().update_state(state)
+        get_level_index().invalidate([symbol])
         logger.info(f"Refreshed staleness for {symbol} from {source}")
 
     except Exception as e:
@@ -223,6 +297,74 @@ def calculate_confluence_score(
         }
 
 
+def apply_confluence(state: SymbolState) -> Dict[str, Any]:
+    """
+    Recalculate confluence fields on a loaded SymbolState (no commit).
+
+    Args:
+        state: SymbolState to update in place
+
+    Returns:
+        Confluence assessment from calculate_confluence_score
+    """
+    confluence = calculate_confluence_score(
+        kt_bias=state.kt_bias,
+        discord_quadrant=state.discord_quadrant
+    )
+
+    # Update state
+    state.confluence_score = confluence["score"]
+    state.sources_directionally_aligned = confluence["aligned"]
+    state.confluence_summary = confluence["reason"]
+    state.updated_at = datetime.utcnow()
+    state.stale_since = None
+
+    # Generate trade setup if aligned
+    if confluence["aligned"]:
+        direction = state.kt_bias
+        structure = "long" if direction == "bullish" else "short"
+
+        # Build setup suggestion
+        setup_parts = []
+        if state.kt_primary_target:
+            setup_parts.append(f"Target: {state.kt_primary_target}")
+        if state.kt_primary_support:
+            setup_parts.append(f"Support: {state.kt_primary_support}")
+        if state.kt_invalidation:
+            setup_parts.append(f"Stop: {state.kt_invalidation}")
+        if state.discord_strategy_rec:
+            setup_parts.append(f"Strategy: {state.discord_strategy_rec}")
+
+        state.trade_setup_suggestion = f"{structure.upper()} setup. " + " | ".join(setup_parts) if setup_parts else None
+
+    return confluence
+
+
+def apply_confluence_for_symbols(db: Session, symbols: List[str]) -> List[SymbolState]:
+    """
+    Recalculate confluence for several symbols with one query (no commit).
+
+    Rows are re-read with populate_existing so values written by bulk
+    upserts in the same session are picked up.
+
+    Args:
+        db: Database session
+        symbols: Symbol tickers to recalculate
+
+    Returns:
+        The updated SymbolState rows
+    """
+    symbols = list(set(symbols))
+    if not symbols:
+        return []
+    states = db.query(SymbolState).filter(
+        SymbolState.symbol.in_(symbols)
+    ).populate_existing().all()
+    for state in states:
+        apply_confluence(state)
+    return states
+
+
 def update_symbol_confluence(db: Session, symbol: str) -> Dict[str, Any]:
     """
     Recalculate and update confluence score for a symbol.
@@ -239,37 +381,10 @@ def update_symbol_confluence(db: Session, symbol: str) -> Dict[str, Any]:
         if not state:
             return {"error": f"Symbol {symbol} not found"}
 
-        # Calculate confluence
-        confluence = calculate_confluence_score(
-            kt_bias=state.kt_bias,
-            discord_quadrant=state.discord_quadrant
-        )
-
-        # Update state
-        state.confluence_score = confluence["score"]
-        state.sources_directionally_aligned = confluence["aligned"]
-        state.confluence_summary = confluence["reason"]
-        state.updated_at = datetime.utcnow()
-
-        # Generate trade setup if aligned
-        if confluence["aligned"]:
-            direction = state.kt_bias
-            structure = "long" if direction == "bullish" else "short"
-
-            # Build setup suggestion
-            setup_parts = []
-            if state.kt_primary_target:
-                setup_parts.append(f"Target: {state.kt_primary_target}")
-            if state.kt_primary_support:
-                setup_parts.append(f"Support: {state.kt_primary_support}")
-            if state.kt_invalidation:
-                setup_parts.append(f"Stop: {state.kt_invalidation}")
-            if state.discord_strategy_rec:
-                setup_parts.append(f"Strategy: {state.discord_strategy_rec}")
-
-            state.trade_setup_suggestion = f"{structure.upper()} setup. " + " | ".join(setup_parts) if setup_parts else None
+        confluence = apply_confluence(state)
 
         db.commit()
+        get_symbol_snapshot().update_state(state)
 
         return {
             "symbol": symbol,
@@ -0,0 +1,208 @@
+"""
+Text similarity helpers for the theme prefilter.
+
+Pure-Python TF-IDF cosine similarity (with an inverted index) and a small
+union-find, used by ThemeExtractorAgent.match_themes and
+CrossReferenceAgent.cluster_themes to settle obvious theme matches locally
+and send Claude only the ambiguous ones. Theme rows keep their term counts
+in themes.similarity_terms (see backend/services/theme_similarity.py).
+"""
+import json
+import math
+import re
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+NAME_WEIGHT = 2.0
+DESCRIPTION_WEIGHT = 1.0
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in into is it its of on or over
+the their this to under vs was were will with likely may
+""".split())
+
+
+# ============================================================================
+# Terms
+# ============================================================================
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercased word tokens without stopwords or single letters, with plural 's' stripped."""
+    tokens = []
+    for token in _TOKEN.findall((text or "").lower()):
+        if len(token) < 2 or token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def _add_terms(terms: Dict[str, float], text: Optional[str], weight: float):
+    tokens = tokenize(text)
+    for token in tokens:
+        terms[token] = terms.get(token, 0.0) + weight
+    # Bigrams keep "rate cut" apart from "rate hike"
+    for first, second in zip(tokens, tokens[1:]):
+        bigram = f"{first} {second}"
+        terms[bigram] = terms.get(bigram, 0.0) + weight
+
+
+def parse_aliases(aliases: Any) -> List[str]:
+    """Alias list from a Theme.aliases JSON value (or an already-parsed list)."""
+    if not aliases:
+        return []
+    if isinstance(aliases, str):
+        try:
+            aliases = json.loads(aliases)
+        except ValueError:
+            return []
+    if not isinstance(aliases, list):
+        return []
+    return [str(alias) for alias in aliases if alias]
+
+
+def theme_terms(
+    name: Optional[str],
+    description: Optional[str] = None,
+    aliases: Any = None
+) -> Dict[str, float]:
+    """Weighted term counts for a theme; name and aliases outweigh description."""
+    terms: Dict[str, float] = {}
+    _add_terms(terms, name, NAME_WEIGHT)
+    for alias in parse_aliases(aliases):
+        _add_terms(terms, alias, NAME_WEIGHT)
+    _add_terms(terms, description, DESCRIPTION_WEIGHT)
+    return terms
+
+
+def stored_terms(theme: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Terms for a theme dict, preferring the stored similarity_terms column.
+
+    Falls back to computing them from name / aliases / description, e.g. for
+    rows written before the column existed.
+    """
+    stored = theme.get("similarity_terms")
+    if stored:
+        try:
+            terms = json.loads(stored) if isinstance(stored, str) else stored
+            if isinstance(terms, dict) and terms:
+                return terms
+        except ValueError:
+            pass
+    return theme_terms(theme.get("name"), theme.get("description"), theme.get("aliases"))
+
+
+def normalize_name(text: Optional[str]) -> str:
+    """Token-joined name used for exact name / alias equality."""
+    return " ".join(tokenize(text))
+
+
+# ============================================================================
+# Index
+# ============================================================================
+
+class TermIndex:
+    """
+    In-memory TF-IDF index with cosine lookups through an inverted index.
+
+    Only documents sharing at least one term with the query are scored, so a
+    lookup costs the postings of the query's terms rather than the corpus.
+    """
+
+    def __init__(self, documents: Dict[Hashable, Dict[str, float]]):
+        doc_freq: Dict[str, int] = {}
+        for terms in documents.values():
+            for term in terms:
+                doc_freq[term] = doc_freq.get(term, 0) + 1
+
+        count = len(documents)
+        # Smoothed IDF; unseen query terms get the rarest weight but match nothing
+        self.idf = {term: math.log((1 + count) / (1 + df)) + 1.0 for term, df in doc_freq.items()}
+        self._unseen_idf = math.log(1 + count) + 1.0
+
+        self.vectors: Dict[Hashable, Dict[str, float]] = {}
+        self.postings: Dict[str, List[Tuple[Hashable, float]]] = {}
+        for key, terms in documents.items():
+            vector = self.vector(terms)
+            self.vectors[key] = vector
+            for term, weight in vector.items():
+                self.postings.setdefault(term, []).append((key, weight))
+
+    def vector(self, terms: Dict[str, float]) -> Dict[str, float]:
+        """L2-normalized TF-IDF vector for a term-count dict."""
+        weighted = {
+            term: (1.0 + math.log(tf)) * self.idf.get(term, self._unseen_idf)
+            for term, tf in terms.items() if tf > 0
+        }
+        norm = math.sqrt(sum(w * w for w in weighted.values()))
+        if not norm:
+            return {}
+        return {term: w / norm for term, w in weighted.items()}
+
+    def scores(self, vector: Dict[str, float]) -> Dict[Hashable, float]:
+        """Cosine similarity to every document sharing a term with the vector."""
+        scores: Dict[Hashable, float] = {}
+        for term, weight in vector.items():
+            for key, doc_weight in self.postings.get(term, ()):
+                scores[key] = scores.get(key, 0.0) + weight * doc_weight
+        return scores
+
+    def nearest(
+        self,
+        terms: Dict[str, float],
+        k: int,
+        min_score: float = 0.0,
+        exclude: Optional[Hashable] = None
+    ) -> List[Tuple[Hashable, float]]:
+        """Top-k (key, score) pairs at or above min_score, best first."""
+        scores = self.scores(self.vector(terms))
+        scores.pop(exclude, None)
+        ranked = sorted(
+            ((key, round(score, 4)) for key, score in scores.items() if score >= min_score),
+            key=lambda item: (-item[1], str(item[0]))
+        )
+        return ranked[:k]
+
+    def pairs(self, min_score: float) -> List[Tuple[Hashable, Hashable, float]]:
+        """All document pairs at or above min_score, most similar first."""
+        keys = list(self.vectors)
+        position = {key: i for i, key in enumerate(keys)}
+        found = []
+        for key in keys:
+            for other, score in self.scores(self.vectors[key]).items():
+                if position[other] > position[key] and score >= min_score:
+                    found.append((key, other, round(score, 4)))
+        found.sort(key=lambda item: (-item[2], position[item[0]], position[item[1]]))
+        return found
+
+
+class DisjointSet:
+    """Union-find over hashable keys, used to grow clusters from pair links."""
+
+    def __init__(self, keys: Iterable[Hashable]):
+        self.parent = {key: key for key in keys}
+
+    def find(self, key: Hashable) -> Hashable:
+        root = key
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[key] != root:
+            self.parent[key], key = root, self.parent[key]
+        return root
+
+    def union(self, a: Hashable, b: Hashable) -> bool:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        self.parent[root_b] = root_a
+        return True
+
+    def groups(self) -> List[List[Hashable]]:
+        """Members per set, in first-seen key order."""
+        grouped: Dict[Hashable, List[Hashable]] = {}
+        for key in self.parent:
+            grouped.setdefault(self.find(key), []).append(key)
+        return list(grouped.values())
@@ -0,0 +1,59 @@
+"""
+Dialect-aware INSERT ... ON CONFLICT helpers.
+
+SQLite (3.24+) and PostgreSQL both support ON CONFLICT upserts, but
+SQLAlchemy exposes them through dialect-specific insert() constructs.
+"""
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import Table, func
+
+
+def dialect_insert(dialect_name: str, table: Table):
+    """
+    Return an insert() for table that supports on_conflict_do_update().
+
+    Args:
+        dialect_name: engine.dialect.name ("sqlite" or "postgresql")
+        table: Target table
+    """
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise ValueError(f"Upsert not supported for dialect: {dialect_name}")
+    return insert(table)
+
+
+def additive_upsert(
+    dialect_name: str,
+    table: Table,
+    key_columns: Iterable[str],
+    values: Dict[str, Any],
+    increment_columns: Iterable[str],
+    set_overrides: Optional[Dict[str, Any]] = None
+):
+    """
+    Build an upsert that adds values onto existing counters.
+
+    Inserts the row if the key doesn't exist yet; otherwise each column in
+    increment_columns becomes existing + excluded. Safe to run concurrently
+    from several processes since no read-modify-write happens in Python.
+
+    set_overrides may supply custom update expressions; it can also be a
+    callable taking the insert statement (to reference stmt.excluded).
+    """
+    key_columns = list(key_columns)
+    stmt = dialect_insert(dialect_name, table).values(**values)
+    set_ = {
+        col: func.coalesce(table.c[col], 0) + stmt.excluded[col]
+        for col in increment_columns
+    }
+    for col in values:
+        if col not in set_ and col not in key_columns:
+            set_[col] = stmt.excluded[col]
+    if set_overrides:
+        overrides = set_overrides(stmt) if callable(set_overrides) else set_overrides
+        set_.update(overrides)
+    return stmt.on_conflict_do_update(index_elements=key_columns, set_=set_)
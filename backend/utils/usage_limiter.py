@@ -10,13 +10,35 @@ All dates use UTC for consistency. This means:
 - On Railway (UTC), limits reset at midnight server time
 - Locally, limits reset at midnight UTC regardless of your timezone
 """
+import atexit
 import logging
+import os
+import threading
+import time
 from datetime import datetime, timezone
-from typing import Dict, Optional, Tuple
-from backend.utils.db import get_db
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select
 
 logger = logging.getLogger(__name__)
 
+# Configuration
+# How often (seconds) pending counts are flushed and other workers' usage is pulled in
+USAGE_FLUSH_INTERVAL_SECONDS = float(os.getenv("USAGE_FLUSH_INTERVAL_SECONDS", "30"))
+# Once local usage reaches this fraction of a limit, sync with the DB before every check
+USAGE_SYNC_THRESHOLD = float(os.getenv("USAGE_SYNC_THRESHOLD", "0.8"))
+
+COUNTER_FIELDS = ("vision_analyses", "transcript_analyses", "text_analyses")
+
+# Per-agent Claude token counters (api_token_usage), fed by BaseAgent
+TOKEN_FIELDS = (
+    "calls",
+    "input_tokens",
+    "output_tokens",
+    "cache_creation_input_tokens",
+    "cache_read_input_tokens",
+)
+
 
 class UsageLimiter:
     """
@@ -31,6 +53,19 @@ class UsageLimiter:
 
     Note: Actual costs may vary based on content length and complexity.
     Estimates based on Claude Sonnet 4 pricing ($3/1M input, $15/1M output).
+
+    Counting:
+    Usage is counted in memory and checked without touching the database.
+    Pending increments are flushed to the api_usage table (via DATABASE_URL)
+    with an additive upsert every USAGE_FLUSH_INTERVAL_SECONDS, which also
+    pulls in usage recorded by other workers. Near a limit the limiter syncs
+    before each check so workers don't collectively overshoot.
+
+    Token usage:
+    BaseAgent reports input / output / prompt-cache tokens per agent class
+    after every Claude call; they are kept per (day, agent) in
+    api_token_usage through the same flush, so cache savings show up in
+    get_budget_status()["tokens"].
     """
 
     # Daily limits
@@ -46,37 +81,42 @@ class UsageLimiter:
     COST_PER_SYNTHESIS = 1.70   # Full synthesis run (5 source analyses + merge on Opus)
     COST_PER_EVALUATION = 0.02  # Quality evaluation (Sonnet)
 
-    def __init__(self):
-        self.db = get_db()
+    def __init__(self, engine=None, flush_interval: float = USAGE_FLUSH_INTERVAL_SECONDS):
+        if engine is None:
+            from backend.models import engine
+        self.engine = engine
+        self.flush_interval = flush_interval
+
+        # Totals for today as of the last sync (all workers), plus local
+        # increments not yet written to the database
+        self._day = self._get_today_utc()
+        self._synced: Dict[str, float] = self._empty_counts()
+        self._pending: Dict[str, float] = self._empty_counts()
+        self._pending_notes: List[str] = []
+        self._synced_tokens: Dict[str, Dict[str, int]] = {}
+        self._pending_tokens: Dict[str, Dict[str, int]] = {}
+        self._last_sync = 0.0
+
+        # Only writers and syncs take the lock; checks read plain ints
+        self._lock = threading.Lock()
+
         self._ensure_table_exists()
+        self.sync()
+
+    @staticmethod
+    def _empty_counts() -> Dict[str, float]:
+        counts = {field: 0 for field in COUNTER_FIELDS}
+        counts["estimated_cost_usd"] = 0.0
+        return counts
 
     def _ensure_table_exists(self):
-        """Create api_usage table if it doesn't exist."""
-        try:
-            self.db.execute_query(
-                "SELECT COUNT(*) FROM api_usage LIMIT 1",
-                fetch="one"
-            )
-        except Exception:
-            # Table doesn't exist, create it
-            logger.info("Creating api_usage table...")
-            migration_sql = """
-            CREATE TABLE IF NOT EXISTS api_usage (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT NOT NULL UNIQUE,
-                vision_analyses INTEGER DEFAULT 0,
-                transcript_analyses INTEGER DEFAULT 0,
-                text_analyses INTEGER DEFAULT 0,
-                estimated_cost_usd REAL DEFAULT 0.0,
-                notes TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-            CREATE INDEX IF NOT EXISTS idx_api_usage_date ON api_usage(date DESC);
-            """
-            with self.db.get_connection() as conn:
-                conn.executescript(migration_sql)
-            logger.info("api_usage table created successfully")
+        """Create api_usage and api_token_usage tables if they don't exist."""
+        from backend.models import ApiTokenUsage, ApiUsage
+        for table in (ApiUsage.__table__, ApiTokenUsage.__table__):
+            try:
+                table.create(bind=self.engine, checkfirst=True)
+            except Exception as e:
+                logger.warning(f"Could not ensure {table.name} table exists: {e}")
 
     def _get_today_utc(self) -> str:
         """
@@ -95,28 +135,34 @@ class UsageLimiter:
         Returns:
             Dict with keys: vision_analyses, transcript_analyses, text_analyses, estimated_cost_usd
         """
-        today = self._get_today_utc()
+        self._maybe_sync()
+        synced, pending = self._synced, self._pending
+        return {
+            "vision_analyses": synced["vision_analyses"] + pending["vision_analyses"],
+            "transcript_analyses": synced["transcript_analyses"] + pending["transcript_analyses"],
+            "text_analyses": synced["text_analyses"] + pending["text_analyses"],
+            "estimated_cost_usd": synced["estimated_cost_usd"] + pending["estimated_cost_usd"]
+        }
 
-        row = self.db.execute_query(
-            "SELECT * FROM api_usage WHERE date = ?",
-            (today,),
-            fetch="one"
-        )
+    def _current(self, field: str) -> int:
+        """Lock-free read of today's count for a field."""
+        return self._synced[field] + self._pending[field]
 
-        if row:
-            return {
-                "vision_analyses": row["vision_analyses"],
-                "transcript_analyses": row["transcript_analyses"],
-                "text_analyses": row["text_analyses"],
-                "estimated_cost_usd": row["estimated_cost_usd"]
-            }
-        else:
-            return {
-                "vision_analyses": 0,
-                "transcript_analyses": 0,
-                "text_analyses": 0,
-                "estimated_cost_usd": 0.0
-            }
+    def _check(self, field: str, limit: int, count: int, label: str) -> Tuple[bool, str]:
+        """Check a counter against its daily limit, syncing first when close to it."""
+        self._maybe_sync()
+        current = self._current(field)
+
+        # Other workers may have used the remaining budget since the last sync
+        if current + count > limit * USAGE_SYNC_THRESHOLD:
+            self.sync()
+            current = self._current(field)
+
+        if current + count > limit:
+            reason = f"{label} limit reached: {current}/{limit} used today. Skipping to prevent cost overrun."
+            return False, reason
+
+        return True, "OK"
 
     def can_use_vision(self, count: int = 1) -> Tuple[bool, str]:
         """
@@ -128,14 +174,7 @@ class UsageLimiter:
         Returns:
             (allowed, reason) tuple
         """
-        usage = self.get_today_usage()
-        current = usage["vision_analyses"]
-
-        if current + count > self.MAX_VISION_DAILY:
-            reason = f"Vision limit reached: {current}/{self.MAX_VISION_DAILY} used today. Skipping to prevent cost overrun."
-            return False, reason
-
-        return True, "OK"
+        return self._check("vision_analyses", self.MAX_VISION_DAILY, count, "Vision")
 
     def can_use_transcript(self, count: int = 1) -> Tuple[bool, str]:
         """
@@ -147,14 +186,7 @@ class UsageLimiter:
         Returns:
             (allowed, reason) tuple
         """
-        usage = self.get_today_usage()
-        current = usage["transcript_analyses"]
-
-        if current + count > self.MAX_TRANSCRIPT_DAILY:
-            reason = f"Transcript limit reached: {current}/{self.MAX_TRANSCRIPT_DAILY} used today. Skipping to prevent cost overrun."
-            return False, reason
-
-        return True, "OK"
+        return self._check("transcript_analyses", self.MAX_TRANSCRIPT_DAILY, count, "Transcript")
 
     def can_use_text(self, count: int = 1) -> Tuple[bool, str]:
         """
@@ -166,14 +198,7 @@ class UsageLimiter:
         Returns:
             (allowed, reason) tuple
         """
-        usage = self.get_today_usage()
-        current = usage["text_analyses"]
-
-        if current + count > self.MAX_TEXT_DAILY:
-            reason = f"Text analysis limit reached: {current}/{self.MAX_TEXT_DAILY} used today. Skipping to prevent cost overrun."
-            return False, reason
-
-        return True, "OK"
+        return self._check("text_analyses", self.MAX_TEXT_DAILY, count, "Text analysis")
 
     def record_vision_use(self, count: int = 1, notes: Optional[str] = None):
         """Record vision API usage."""
@@ -191,51 +216,238 @@ class UsageLimiter:
         """
         Increment usage counter for today (UTC).
 
+        The increment is applied in memory immediately and written to the
+        database on the next flush.
+
         Args:
             field: 'vision_analyses', 'transcript_analyses', or 'text_analyses'
             count: Number to increment by
             cost_per_unit: Estimated cost per unit
             notes: Optional notes about this usage
         """
-        today = self._get_today_utc()
+        self._roll_day_if_needed()
 
-        # Get or create today's record
-        row = self.db.execute_query(
-            "SELECT * FROM api_usage WHERE date = ?",
-            (today,),
-            fetch="one"
+        with self._lock:
+            self._pending[field] += count
+            self._pending["estimated_cost_usd"] += count * cost_per_unit
+            if notes:
+                self._pending_notes.append(
+                    f"{datetime.now(timezone.utc).strftime('%H:%M:%S')} UTC: {notes}"
+                )
+
+        logger.info(
+            f"API usage recorded: {field} +{count} (total: {self._current(field)}, "
+            f"est. cost today: ${self._synced['estimated_cost_usd'] + self._pending['estimated_cost_usd']:.2f})"
         )
+        self._maybe_sync()
 
-        if row:
-            # Update existing record
-            new_count = row[field] + count
-            new_cost = row["estimated_cost_usd"] + (count * cost_per_unit)
+    def record_token_usage(self, agent: str, usage: Dict[str, int]):
+        """
+        Record Claude token counts for one or more calls by an agent.
 
-            update_data = {
-                field: new_count,
-                "estimated_cost_usd": new_cost,
-                "updated_at": datetime.now().isoformat()
-            }
+        Args:
+            agent: Agent class name
+            usage: Counts keyed by TOKEN_FIELDS (missing keys count as 0)
+        """
+        self._roll_day_if_needed()
 
-            if notes:
-                existing_notes = row["notes"] or ""
-                update_data["notes"] = f"{existing_notes}\n{datetime.now(timezone.utc).strftime('%H:%M:%S')} UTC: {notes}"
+        with self._lock:
+            pending = self._pending_tokens.setdefault(agent, dict.fromkeys(TOKEN_FIELDS, 0))
+            for field in TOKEN_FIELDS:
+                pending[field] += int(usage.get(field) or 0)
+
+        self._maybe_sync()
+
+    def get_token_usage(self) -> Dict[str, Dict[str, float]]:
+        """
+        Today's token counts per agent (UTC), with the share of input served from cache.
+
+        Returns:
+            Dict of agent -> TOKEN_FIELDS counts plus cache_read_ratio
+        """
+        self._maybe_sync()
+        with self._lock:
+            agents = set(self._synced_tokens) | set(self._pending_tokens)
+            totals = {}
+            for agent in sorted(agents):
+                synced = self._synced_tokens.get(agent, {})
+                pending = self._pending_tokens.get(agent, {})
+                totals[agent] = {field: synced.get(field, 0) + pending.get(field, 0) for field in TOKEN_FIELDS}
+
+        for counts in totals.values():
+            total_input = (counts["input_tokens"] + counts["cache_creation_input_tokens"]
+                           + counts["cache_read_input_tokens"])
+            counts["cache_read_ratio"] = (
+                round(counts["cache_read_input_tokens"] / total_input, 3) if total_input else 0.0
+            )
+        return totals
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _maybe_sync(self):
+        """Sync with the database if the flush interval has elapsed."""
+        self._roll_day_if_needed()
+        if time.monotonic() - self._last_sync >= self.flush_interval:
+            self.sync()
 
-            self.db.update("api_usage", row["id"], update_data)
+    def _roll_day_if_needed(self):
+        """Flush yesterday's pending counts and reset when the UTC day changes."""
+        today = self._get_today_utc()
+        if today == self._day:
+            return
+        self.flush()
+        with self._lock:
+            self._day = today
+            self._synced = self._empty_counts()
+            self._synced_tokens = {}
+        self.sync()
+
+    def flush(self) -> bool:
+        """
+        Write pending increments to the database with additive upserts.
+
+        Returns:
+            True if nothing was pending or the writes succeeded
+        """
+        counts_ok = self._flush_counts()
+        tokens_ok = self._flush_tokens()
+        return counts_ok and tokens_ok
+
+    def _flush_counts(self) -> bool:
+        """Upsert pending api_usage counters and notes."""
+        from backend.models import ApiUsage
+        from backend.utils.upsert import additive_upsert
+
+        with self._lock:
+            if not any(self._pending.values()) and not self._pending_notes:
+                return True
+            day = self._day
+            pending = self._pending
+            notes = "\n".join(self._pending_notes) or None
+            self._pending = self._empty_counts()
+            self._pending_notes = []
+            # Keep the local view intact until the next read from the DB
+            for key, value in pending.items():
+                self._synced[key] += value
+
+        table = ApiUsage.__table__
+        now = datetime.utcnow()
+        values = {"date": day, "updated_at": now, "created_at": now, **pending}
+        if notes:
+            values["notes"] = notes
+
+        def notes_update(stmt):
+            overrides = {"created_at": table.c.created_at}
+            if notes:
+                existing = func.coalesce(table.c.notes.op("||")("\n"), "")
+                overrides["notes"] = existing.op("||")(stmt.excluded.notes)
+            return overrides
+
+        stmt = additive_upsert(
+            self.engine.dialect.name,
+            table,
+            key_columns=["date"],
+            values=values,
+            increment_columns=list(pending),
+            set_overrides=notes_update
+        )
 
-            logger.info(f"API usage recorded: {field} +{count} (total: {new_count}, est. cost today: ${new_cost:.2f})")
-        else:
-            # Create new record for today
-            insert_data = {
-                "date": today,
-                field: count,
-                "estimated_cost_usd": count * cost_per_unit,
-                "notes": notes if notes else None
-            }
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(stmt)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to flush API usage, will retry: {e}")
+            with self._lock:
+                for key, value in pending.items():
+                    self._synced[key] -= value
+                    self._pending[key] += value
+                if notes:
+                    self._pending_notes.insert(0, notes)
+            return False
+
+    def _flush_tokens(self) -> bool:
+        """Upsert pending per-agent token counts into api_token_usage."""
+        from backend.models import ApiTokenUsage
+        from backend.utils.upsert import additive_upsert
+
+        with self._lock:
+            if not self._pending_tokens:
+                return True
+            day = self._day
+            pending = self._pending_tokens
+            self._pending_tokens = {}
+            for agent, counts in pending.items():
+                synced = self._synced_tokens.setdefault(agent, dict.fromkeys(TOKEN_FIELDS, 0))
+                for field, value in counts.items():
+                    synced[field] += value
+
+        table = ApiTokenUsage.__table__
+        now = datetime.utcnow()
 
-            self.db.insert("api_usage", insert_data)
+        try:
+            with self.engine.begin() as conn:
+                for agent, counts in pending.items():
+                    conn.execute(additive_upsert(
+                        self.engine.dialect.name,
+                        table,
+                        key_columns=["date", "agent"],
+                        values={"date": day, "agent": agent, "created_at": now, "updated_at": now, **counts},
+                        increment_columns=TOKEN_FIELDS,
+                        set_overrides={"created_at": table.c.created_at}
+                    ))
+            return True
+        except Exception as e:
+            logger.error(f"Failed to flush token usage, will retry: {e}")
+            with self._lock:
+                for agent, counts in pending.items():
+                    synced = self._synced_tokens[agent]
+                    restored = self._pending_tokens.setdefault(agent, dict.fromkeys(TOKEN_FIELDS, 0))
+                    for field, value in counts.items():
+                        synced[field] -= value
+                        restored[field] += value
+            return False
+
+    def sync(self):
+        """Flush pending increments, then reload today's totals from all workers."""
+        from backend.models import ApiTokenUsage, ApiUsage
+
+        self.flush()
+        self._last_sync = time.monotonic()
 
-            logger.info(f"API usage recorded: {field} +{count} (est. cost today: ${count * cost_per_unit:.2f})")
+        try:
+            with self.engine.connect() as conn:
+                row = conn.execute(
+                    select(
+                        ApiUsage.vision_analyses,
+                        ApiUsage.transcript_analyses,
+                        ApiUsage.text_analyses,
+                        ApiUsage.estimated_cost_usd
+                    ).where(ApiUsage.date == self._day)
+                ).first()
+                token_rows = conn.execute(
+                    select(ApiTokenUsage.agent, *(ApiTokenUsage.__table__.c[f] for f in TOKEN_FIELDS))
+                    .where(ApiTokenUsage.date == self._day)
+                ).all()
+        except Exception as e:
+            logger.error(f"Failed to load API usage: {e}")
+            return
+
+        synced = self._empty_counts()
+        if row:
+            synced["vision_analyses"] = row.vision_analyses or 0
+            synced["transcript_analyses"] = row.transcript_analyses or 0
+            synced["text_analyses"] = row.text_analyses or 0
+            synced["estimated_cost_usd"] = row.estimated_cost_usd or 0.0
+        synced_tokens = {
+            token_row.agent: {field: getattr(token_row, field) or 0 for field in TOKEN_FIELDS}
+            for token_row in token_rows
+        }
+        with self._lock:
+            self._synced = synced
+            self._synced_tokens = synced_tokens
 
     def get_budget_status(self) -> Dict:
         """
@@ -278,6 +490,7 @@ class UsageLimiter:
                 "max_daily": round(max_daily_budget, 2),
                 "max_monthly": round(max_daily_budget * 30, 2)
             },
+            "tokens": self.get_token_usage(),
             "warnings": self._get_warnings(usage)
         }
 
@@ -322,4 +535,6 @@ def get_usage_limiter() -> UsageLimiter:
     global _limiter_instance
     if _limiter_instance is None:
         _limiter_instance = UsageLimiter()
+        # Don't lose counts recorded since the last periodic flush
+        atexit.register(_limiter_instance.flush)
     return _limiter_instance
@@ -2,18 +2,42 @@
 Background Workers
 
 PRD-052: Background processing for async tasks.
+PRD-048: Periodic symbol staleness sweep.
+PRD-045: Periodic SourceHealth reconciliation.
 """
 
 from .transcription_processor import (
     TranscriptionProcessor,
     get_processor,
     start_processor,
-    stop_processor
+    stop_processor,
+    notify_transcription_queued
+)
+from .staleness_sweeper import (
+    StalenessSweeper,
+    get_sweeper,
+    start_sweeper,
+    stop_sweeper
+)
+from .source_health_reconciler import (
+    SourceHealthReconciler,
+    get_reconciler,
+    start_reconciler,
+    stop_reconciler
 )
 
 __all__ = [
     "TranscriptionProcessor",
     "get_processor",
     "start_processor",
-    "stop_processor"
+    "stop_processor",
+    "notify_transcription_queued",
+    "StalenessSweeper",
+    "get_sweeper",
+    "start_sweeper",
+    "stop_sweeper",
+    "SourceHealthReconciler",
+    "get_reconciler",
+    "start_reconciler",
+    "stop_reconciler"
 ]
@@ -0,0 +1,93 @@
+"""
+Background Source Health Reconciler
+
+PRD-045: Keeps the incrementally maintained SourceHealth counters honest.
+
+Ingestion, transcription and collection-run events bump SourceHealth
+counters as they happen; this worker periodically recomputes them with
+backend.services.alerting.reconcile_source_health so drift is corrected
+and the 24-hour windows age out.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+SOURCE_HEALTH_RECONCILE_INTERVAL_SECONDS = int(os.getenv("SOURCE_HEALTH_RECONCILE_INTERVAL_SECONDS", "600"))
+STARTUP_DELAY_SECONDS = 20  # Let the app initialize before the first run
+
+
+class SourceHealthReconciler:
+    """Periodic runner for the SourceHealth reconciliation."""
+
+    def __init__(self, interval_seconds: int = SOURCE_HEALTH_RECONCILE_INTERVAL_SECONDS):
+        self.interval_seconds = interval_seconds
+        self.running = False
+        self.runs = 0
+        self.last_result: Optional[Dict[str, Any]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start the background reconciler."""
+        if self.running:
+            logger.warning("Source health reconciler already running")
+            return
+        self.running = True
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info(f"Source health reconciler started (interval: {self.interval_seconds}s)")
+
+    async def stop(self):
+        """Stop the background reconciler."""
+        self.running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Source health reconciler stopped")
+
+    async def _run_loop(self):
+        await asyncio.sleep(STARTUP_DELAY_SECONDS)
+        while self.running:
+            try:
+                await self.reconcile()
+            except Exception as e:
+                logger.error(f"Error in source health reconciler loop: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    async def reconcile(self) -> Dict[str, Any]:
+        """Run one reconciliation and record its result."""
+        from backend.services.alerting import reconcile_source_health
+
+        result = await reconcile_source_health()
+        self.runs += 1
+        self.last_result = result
+        logger.info(f"Source health reconciliation #{self.runs}: {result}")
+        return result
+
+
+# Global reconciler instance
+_reconciler: Optional[SourceHealthReconciler] = None
+
+
+def get_reconciler() -> SourceHealthReconciler:
+    """Get or create the global reconciler instance."""
+    global _reconciler
+    if _reconciler is None:
+        _reconciler = SourceHealthReconciler()
+    return _reconciler
+
+
+async def start_reconciler():
+    """Start the background source health reconciler."""
+    await get_reconciler().start()
+
+
+async def stop_reconciler():
+    """Stop the background source health reconciler."""
+    await get_reconciler().stop()
@@ -0,0 +1,102 @@
+"""
+Background Staleness Sweeper
+
+PRD-048: Keeps stored symbol staleness current without per-read math.
+
+Runs the set-based sweep in backend.utils.staleness_manager on a fixed
+interval (extractions also sweep right after saving). Each sweep's rows
+touched and duration are logged and kept in last_result.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+STALENESS_SWEEP_INTERVAL_SECONDS = int(os.getenv("STALENESS_SWEEP_INTERVAL_SECONDS", "900"))
+STARTUP_DELAY_SECONDS = 15  # Let the app initialize before the first sweep
+
+
+class StalenessSweeper:
+    """Periodic runner for the symbol staleness sweep."""
+
+    def __init__(self, interval_seconds: int = STALENESS_SWEEP_INTERVAL_SECONDS):
+        self.interval_seconds = interval_seconds
+        self.running = False
+        self.sweeps = 0
+        self.last_result: Optional[Dict[str, Any]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start the background sweeper."""
+        if self.running:
+            logger.warning("Staleness sweeper already running")
+            return
+        self.running = True
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info(f"Staleness sweeper started (interval: {self.interval_seconds}s)")
+
+    async def stop(self):
+        """Stop the background sweeper."""
+        self.running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Staleness sweeper stopped")
+
+    async def _run_loop(self):
+        await asyncio.sleep(STARTUP_DELAY_SECONDS)
+        while self.running:
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.error(f"Error in staleness sweeper loop: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    async def sweep(self) -> Dict[str, Any]:
+        """Run one sweep off the event loop and record its result."""
+        result = await asyncio.to_thread(_run_sweep)
+        self.sweeps += 1
+        self.last_result = result
+        logger.info(f"Staleness sweep #{self.sweeps}: {result['states_updated']} states, "
+                    f"{result['stale_levels_marked']} levels in {result['duration_ms']}ms")
+        return result
+
+
+def _run_sweep() -> Dict[str, Any]:
+    from backend.models import SessionLocal
+    from backend.utils.staleness_manager import check_and_mark_stale_data
+
+    db = SessionLocal()
+    try:
+        return check_and_mark_stale_data(db)
+    finally:
+        db.close()
+
+
+# Global sweeper instance
+_sweeper: Optional[StalenessSweeper] = None
+
+
+def get_sweeper() -> StalenessSweeper:
+    """Get or create the global sweeper instance."""
+    global _sweeper
+    if _sweeper is None:
+        _sweeper = StalenessSweeper()
+    return _sweeper
+
+
+async def start_sweeper():
+    """Start the background staleness sweeper."""
+    await get_sweeper().start()
+
+
+async def stop_sweeper():
+    """Stop the background staleness sweeper."""
+    await get_sweeper().stop()
@@ -7,7 +7,12 @@ This processor runs as a background task and picks up pending transcriptions
 from the TranscriptionStatus table. It processes them reliably even if the
 original HTTP request that queued them has completed.
 
-The processor runs on startup and periodically checks for pending items.
+The processor runs on startup and wakes up as soon as new items are queued:
+- In-process: notify_transcription_queued() sets an asyncio.Event
+- Across processes: the notification travels over the pub/sub backbone
+  (PostgreSQL LISTEN/NOTIFY when available)
+Periodic polling remains only as a slow fallback that also recovers items
+stuck in "processing".
 """
 
 import asyncio
@@ -22,10 +27,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 logger = logging.getLogger(__name__)
 
 # Configuration
-PROCESSOR_INTERVAL_SECONDS = int(os.getenv("TRANSCRIPTION_PROCESSOR_INTERVAL", "60"))
+# Fallback poll interval - new items normally wake the processor immediately
+PROCESSOR_INTERVAL_SECONDS = int(os.getenv("TRANSCRIPTION_PROCESSOR_INTERVAL", "600"))
 MAX_CONCURRENT_TRANSCRIPTIONS = int(os.getenv("MAX_CONCURRENT_TRANSCRIPTIONS", "2"))
 MAX_RETRIES = int(os.getenv("TRANSCRIPTION_MAX_RETRIES", "3"))
 STALE_PROCESSING_THRESHOLD_MINUTES = 30  # Mark "processing" items as stuck after this
+STARTUP_DELAY_SECONDS = 10  # Let the app initialize before the first pass
+
+# Pub/sub channel used to wake processors in every process
+TRANSCRIPTION_QUEUED_CHANNEL = "transcription_queued"
 
 
 class TranscriptionProcessor:
@@ -35,6 +45,17 @@ class TranscriptionProcessor:
         self.running = False
         self.current_tasks = 0
         self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        # True when the last pass filled every slot, i.e. more may be pending
+        self._backlog_possible = False
+        self._subscribed = False
+
+    def notify(self):
+        """Wake the processor to look for pending items now."""
+        self._wakeup.set()
+
+    async def _on_queued_event(self, payload: str):
+        self.notify()
 
     async def start(self):
         """Start the background processor."""
@@ -42,13 +63,22 @@ class TranscriptionProcessor:
             logger.warning("Transcription processor already running")
             return
 
+        from backend.services.pubsub import get_pubsub
+        if not self._subscribed:
+            get_pubsub().subscribe(TRANSCRIPTION_QUEUED_CHANNEL, self._on_queued_event)
+            self._subscribed = True
+
         self.running = True
         self._task = asyncio.create_task(self._run_loop())
-        logger.info(f"Transcription processor started (interval: {PROCESSOR_INTERVAL_SECONDS}s, max concurrent: {MAX_CONCURRENT_TRANSCRIPTIONS})")
+        logger.info(f"Transcription processor started (fallback interval: {PROCESSOR_INTERVAL_SECONDS}s, max concurrent: {MAX_CONCURRENT_TRANSCRIPTIONS})")
 
     async def stop(self):
         """Stop the background processor."""
         self.running = False
+        if self._subscribed:
+            from backend.services.pubsub import get_pubsub
+            get_pubsub().unsubscribe(TRANSCRIPTION_QUEUED_CHANNEL, self._on_queued_event)
+            self._subscribed = False
         if self._task:
             self._task.cancel()
             try:
@@ -60,18 +90,35 @@ class TranscriptionProcessor:
     async def _run_loop(self):
         """Main processing loop."""
         # Wait a bit on startup to let the app initialize
-        await asyncio.sleep(10)
+        await asyncio.sleep(STARTUP_DELAY_SECONDS)
 
+        # The first pass and every fallback poll also recover stuck items
+        recover_stuck = True
         while self.running:
+            # Clear before processing so notifications during the pass aren't lost
+            self._wakeup.clear()
             try:
-                await self._process_pending()
+                await self._process_pending(recover_stuck=recover_stuck)
             except Exception as e:
                 logger.error(f"Error in transcription processor loop: {e}")
 
-            # Wait before next check
-            await asyncio.sleep(PROCESSOR_INTERVAL_SECONDS)
+            woken = await self._wait_for_wakeup(PROCESSOR_INTERVAL_SECONDS)
+            recover_stuck = not woken
+
+    async def _wait_for_wakeup(self, timeout: float) -> bool:
+        """
+        Sleep until notified or until the fallback interval elapses.
+
+        Returns:
+            True if woken by a notification, False on timeout
+        """
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
 
-    async def _process_pending(self):
+    async def _process_pending(self, recover_stuck: bool = True):
         """Find and process pending transcriptions."""
         from backend.models import get_async_db, TranscriptionStatus, RawContent
         import json
@@ -79,7 +126,8 @@ class TranscriptionProcessor:
         async for db in get_async_db():
             try:
                 # First, recover any stuck "processing" items
-                await self._recover_stuck_items(db)
+                if recover_stuck:
+                    await self._recover_stuck_items(db)
 
                 # Find pending items that can be processed
                 available_slots = MAX_CONCURRENT_TRANSCRIPTIONS - self.current_tasks
@@ -103,6 +151,7 @@ class TranscriptionProcessor:
 
                 result = await db.execute(stmt)
                 items = result.all()
+                self._backlog_possible = len(items) == available_slots
 
                 if not items:
                     logger.debug("No pending transcriptions to process")
@@ -112,10 +161,21 @@ class TranscriptionProcessor:
 
                 # Process each item
                 for status, raw_content in items:
-                    # Mark as processing first
-                    status.status = "processing"
-                    status.last_attempt_at = datetime.utcnow()
+                    # Claim atomically so other processes/replicas skip it
+                    claim = await db.execute(
+                        update(TranscriptionStatus)
+                        .where(
+                            and_(
+                                TranscriptionStatus.id == status.id,
+                                TranscriptionStatus.status == "pending"
+                            )
+                        )
+                        .values(status="processing", last_attempt_at=datetime.utcnow())
+                    )
                     await db.commit()
+                    if claim.rowcount != 1:
+                        logger.debug(f"TranscriptionStatus {status.id} already claimed elsewhere")
+                        continue
 
                     # Start transcription in background
                     asyncio.create_task(
@@ -152,10 +212,12 @@ class TranscriptionProcessor:
 
     async def _transcribe_item(self, status_id: int, raw_content):
         """Transcribe a single item."""
-        from backend.models import get_async_db, TranscriptionStatus, RawContent, AnalyzedContent, Source
-        from agents.transcript_harvester import TranscriptHarvesterAgent
+        from backend.models import get_async_db, TranscriptionStatus, Source
+        from backend.routes.collect import _transcribe_video_with_tracking
+        from backend.services.alerting import transcription_event
         import json
 
+        source_name = "unknown"
         try:
             logger.info(f"Starting transcription for status_id={status_id}, content_id={raw_content.id}")
 
@@ -173,7 +235,6 @@ class TranscriptionProcessor:
                 raise ValueError("No video URL found")
 
             # Get source name
-            source_name = "unknown"
             async for db in get_async_db():
                 try:
                     result = await db.execute(
@@ -185,66 +246,16 @@ class TranscriptionProcessor:
                 finally:
                     break
 
-            # Run transcription
-            harvester = TranscriptHarvesterAgent()
-            result = harvester.process_video(
+            # Same harvest pipeline and status lifecycle as collection-time transcription
+            await _transcribe_video_with_tracking(
+                content_id=raw_content.id,
+                status_id=status_id,
                 video_url=video_url,
                 source=source_name,
-                title=metadata.get("title", ""),
+                title=metadata.get("title"),
                 source_metadata=metadata
             )
 
-            # Update database with results
-            async for db in get_async_db():
-                try:
-                    # Get status record
-                    status_result = await db.execute(
-                        select(TranscriptionStatus).where(TranscriptionStatus.id == status_id)
-                    )
-                    status = status_result.scalar_one_or_none()
-
-                    if not status:
-                        logger.error(f"TranscriptionStatus {status_id} not found")
-                        return
-
-                    if result and result.get("transcript"):
-                        # Success - update raw content with transcript
-                        await db.execute(
-                            update(RawContent)
-                            .where(RawContent.id == raw_content.id)
-                            .values(content_text=result["transcript"])
-                        )
-
-                        # Create AnalyzedContent record
-                        analyzed = AnalyzedContent(
-                            raw_content_id=raw_content.id,
-                            agent_type="transcript",
-                            key_themes=",".join(result.get("themes", [])),
-                            tickers_mentioned=",".join(result.get("tickers", [])),
-                            sentiment=result.get("sentiment"),
-                            conviction=result.get("conviction"),
-                            analysis_result=json.dumps(result.get("analysis", {})),
-                            analyzed_at=datetime.utcnow()
-                        )
-                        db.add(analyzed)
-
-                        # Update status
-                        status.status = "completed"
-                        status.completed_at = datetime.utcnow()
-                        status.error_message = None
-
-                        logger.info(f"Transcription completed for content_id={raw_content.id}: {len(result['transcript'])} chars")
-                    else:
-                        # No transcript returned
-                        status.status = "failed"
-                        status.error_message = "No transcript returned from harvester"
-                        status.retry_count += 1
-                        logger.warning(f"Transcription returned no transcript for content_id={raw_content.id}")
-
-                    await db.commit()
-                finally:
-                    break
-
         except Exception as e:
             logger.error(f"Transcription failed for status_id={status_id}: {e}")
 
@@ -260,12 +271,17 @@ class TranscriptionProcessor:
                             retry_count=TranscriptionStatus.retry_count + 1
                         )
                     )
+                    if source_name != "unknown":
+                        await db.execute(transcription_event(db, source_name, "processing", "failed"))
                     await db.commit()
                 finally:
                     break
 
         finally:
             self.current_tasks -= 1
+            # A slot freed up - pick up the next item if the last pass was full
+            if self._backlog_possible:
+                self.notify()
 
 
 # Global processor instance
@@ -290,3 +306,18 @@ async def stop_processor():
     """Stop the background transcription processor."""
     processor = get_processor()
     await processor.stop()
+
+
+async def notify_transcription_queued():
+    """
+    Wake transcription processors in every process.
+
+    Published over the pub/sub backbone, so with PostgreSQL this reaches
+    processors on other replicas; the in-memory backend wakes the local one.
+    """
+    from backend.services.pubsub import get_pubsub
+    try:
+        await get_pubsub().publish(TRANSCRIPTION_QUEUED_CHANNEL, "")
+    except Exception as e:
+        logger.warning(f"Failed to publish transcription notification: {e}")
+        get_processor().notify()
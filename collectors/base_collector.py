@@ -142,6 +142,7 @@ class BaseCollector(ABC):
 
         from sqlalchemy.orm import Session
         from backend.models import SessionLocal, RawContent, Source
+        from backend.services.alerting import items_collected_event
         import json
 
         saved_count = 0
@@ -212,6 +213,7 @@ class BaseCollector(ABC):
             # Update last_collected_at to prevent duplicate collection
             if saved_count > 0:
                 source.last_collected_at = datetime.now(timezone.utc)
+                db.execute(items_collected_event(db, self.source_name, saved_count))
 
             db.commit()
             logger.info(f"Saved {saved_count} items to database")
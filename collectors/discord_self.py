@@ -1167,6 +1167,7 @@ class DiscordSelfCollector(BaseCollector):
 
         from sqlalchemy.orm import Session
         from backend.models import SessionLocal, RawContent, Source
+        from backend.services.alerting import items_collected_event
         import json
 
         saved_count = 0
@@ -1237,6 +1238,7 @@ class DiscordSelfCollector(BaseCollector):
             # Update last_collected_at
             if saved_count > 0:
                 source.last_collected_at = datetime.now(timezone.utc)
+                db.execute(items_collected_event(db, self.source_name, saved_count))
 
             db.commit()
             logger.info(f"Saved {saved_count} items to database")
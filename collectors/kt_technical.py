@@ -3,17 +3,33 @@ KT Technical Analysis Website Collector
 
 Collects weekly research blog posts from kttechnicalanalysis.com.
 Simple session-based authentication with blog post scraping.
+
+HTTP is asynchronous (aiohttp) so collection never blocks the event loop:
+- One pooled ClientSession per collect() (at most MAX_CONNECTIONS sockets)
+- Post pages fetched concurrently (POST_CONCURRENCY) and chart images
+  streamed to disk concurrently (IMAGE_CONCURRENCY, across all posts)
+- Conditional requests: ETag / Last-Modified validators of fully processed
+  post pages are kept in HTTP_CACHE_FILE, and posts answering 304 Not
+  Modified are skipped. collect() only gathers validators; callers persist
+  them with commit_validators() once the posts are saved, so a dry run or
+  failed save does not hide those posts from the next run
+
+Benchmark against a local replay of the blog: scripts/benchmark_kt_collector.py
 """
 
 import os
 import re
+import json
+import hashlib
+import asyncio
 import logging
-import pickle
-import requests
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from http.cookies import SimpleCookie
+from typing import List, Dict, Any, Optional, Tuple
+import aiohttp
 from bs4 import BeautifulSoup
+from yarl import URL
 
 from collectors.base_collector import BaseCollector
 
@@ -33,15 +49,37 @@ class KTTechnicalCollector(BaseCollector):
     BASE_URL = "https://kttechnicalanalysis.com"
     LOGIN_URL = f"{BASE_URL}/login"
     BLOG_URL = f"{BASE_URL}/blog-feed/"
-    COOKIE_FILE = os.path.join("config", "kt_cookies.pkl")
-
-    def __init__(self, email: Optional[str] = None, password: Optional[str] = None):
+    COOKIE_FILE = os.path.join("config", "kt_cookies.json")
+    HTTP_CACHE_FILE = os.path.join("config", "kt_http_cache.json")
+
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    MAX_CONNECTIONS = int(os.getenv("KT_MAX_CONNECTIONS", "8"))
+    POST_CONCURRENCY = int(os.getenv("KT_POST_CONCURRENCY", "4"))
+    IMAGE_CONCURRENCY = int(os.getenv("KT_IMAGE_CONCURRENCY", "8"))
+    MAX_IMAGES_PER_POST = 10
+    REQUEST_TIMEOUT = 10  # seconds, pages
+    IMAGE_TIMEOUT = 30  # seconds, per image
+    IMAGE_CHUNK_BYTES = 64 * 1024
+
+    def __init__(
+        self,
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        base_url: Optional[str] = None,
+        post_concurrency: Optional[int] = None,
+        image_concurrency: Optional[int] = None,
+        conditional: bool = True
+    ):
         """
         Initialize KT Technical collector.
 
         Args:
             email: Login email (defaults to KT_EMAIL env var)
             password: Login password (defaults to KT_PASSWORD env var)
+            base_url: Site root (defaults to BASE_URL; used for local replays)
+            post_concurrency: Post pages fetched at once (default POST_CONCURRENCY)
+            image_concurrency: Images downloaded at once (default IMAGE_CONCURRENCY)
+            conditional: Send If-None-Match / If-Modified-Since and skip unchanged posts
         """
         super().__init__(source_name="kt_technical")
 
@@ -51,30 +89,51 @@ class KTTechnicalCollector(BaseCollector):
         if not self.email or not self.password:
             raise ValueError("KT_EMAIL and KT_PASSWORD required")
 
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self.login_url = f"{self.base_url}/login"
+        self.blog_url = f"{self.base_url}/blog-feed/"
+        self.post_concurrency = post_concurrency or self.POST_CONCURRENCY
+        self.image_concurrency = image_concurrency or self.IMAGE_CONCURRENCY
+        self.conditional = conditional
+
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.validators: Dict[str, Dict[str, str]] = {}
+        self.stats: Dict[str, int] = {}
 
         logger.info("Initialized KTTechnicalCollector")
 
-    def close(self):
+    async def close(self):
         """Clean up session resources."""
-        if hasattr(self, 'session'):
-            self.session.close()
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
 
-    def __enter__(self):
+    async def __aenter__(self):
         return self
 
-    def __exit__(self, *args):
-        self.close()
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def _open_session(self) -> aiohttp.ClientSession:
+        """Pooled HTTP session (created inside the running event loop)."""
+        connector = aiohttp.TCPConnector(limit=self.MAX_CONNECTIONS)
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers={'User-Agent': self.USER_AGENT},
+            timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT)
+        )
 
     def save_cookies(self):
-        """Save session cookies for reuse."""
+        """Save session cookies for reuse (JSON, not pickle - PRD-015)."""
         try:
             os.makedirs(os.path.dirname(self.COOKIE_FILE), exist_ok=True)
-            with open(self.COOKIE_FILE, 'wb') as f:
-                pickle.dump(self.session.cookies, f)
+            cookies = [
+                {"name": morsel.key, "value": morsel.value,
+                 "domain": morsel["domain"], "path": morsel["path"] or "/"}
+                for morsel in self.session.cookie_jar
+            ]
+            with open(self.COOKIE_FILE, 'w') as f:
+                json.dump(cookies, f, indent=2)
             logger.debug("Saved session cookies")
         except Exception as e:
             logger.debug(f"Could not save cookies: {e}")
@@ -83,42 +142,87 @@ class KTTechnicalCollector(BaseCollector):
         """Load previously saved cookies."""
         try:
             if os.path.exists(self.COOKIE_FILE):
-                with open(self.COOKIE_FILE, 'rb') as f:
-                    self.session.cookies.update(pickle.load(f))
-                    logger.debug("Loaded saved cookies")
-                    return True
+                with open(self.COOKIE_FILE, 'r') as f:
+                    cookies = json.load(f)
+                for cookie in cookies:
+                    morsel = SimpleCookie()
+                    morsel[cookie["name"]] = cookie["value"]
+                    morsel[cookie["name"]]["path"] = cookie.get("path") or "/"
+                    domain = (cookie.get("domain") or URL(self.base_url).host).lstrip(".")
+                    self.session.cookie_jar.update_cookies(morsel, URL(f"{URL(self.base_url).scheme}://{domain}/"))
+                logger.debug("Loaded saved cookies")
+                return True
         except Exception as e:
             logger.debug(f"Could not load cookies: {e}")
         return False
 
+    def _load_validators(self) -> Dict[str, Dict[str, str]]:
+        """ETag / Last-Modified validators of previously collected post pages."""
+        try:
+            if os.path.exists(self.HTTP_CACHE_FILE):
+                with open(self.HTTP_CACHE_FILE, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.debug(f"Could not load HTTP cache: {e}")
+        return {}
+
+    def commit_validators(self):
+        """
+        Persist the validators gathered by the last collect().
+
+        Call after the collected posts are saved; posts whose validators were
+        never committed are fetched in full again on the next run.
+        """
+        if not self.conditional:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.HTTP_CACHE_FILE), exist_ok=True)
+            with open(self.HTTP_CACHE_FILE, 'w') as f:
+                json.dump(self.validators, f, indent=2)
+        except Exception as e:
+            logger.debug(f"Could not save HTTP cache: {e}")
+
     async def collect(self) -> List[Dict[str, Any]]:
         """
         Collect blog posts from KT Technical Analysis.
 
         Returns:
-            List of blog post content items
+            List of blog post content items (unchanged posts are skipped)
         """
         collected_items = []
+        self.stats = {"posts_found": 0, "posts_collected": 0, "posts_unchanged": 0,
+                      "images_downloaded": 0, "image_bytes": 0}
+        self.validators = self._load_validators() if self.conditional else {}
+        self.session = self._open_session()
 
         try:
             # Login
-            if not self._login():
+            if not await self._login():
                 raise Exception("Login failed")
 
             # Collect blog posts
             logger.info("Collecting blog posts from KT Technical...")
-            posts = self._collect_blog_posts()
+            posts = await self._collect_blog_posts()
             collected_items.extend(posts)
-            logger.info(f"Collected {len(posts)} blog posts")
+            logger.info(f"Collected {len(posts)} blog posts ({self.stats['posts_unchanged']} unchanged, skipped)")
 
         except Exception as e:
             logger.error(f"Error collecting from KT Technical: {e}")
             raise
+        finally:
+            await self.close()
 
         logger.info(f"Total items collected from KT Technical: {len(collected_items)}")
         return collected_items
 
-    def _login(self) -> bool:
+    async def save_to_database(self, content_items: List[Dict[str, Any]]) -> int:
+        """Save collected posts, then commit their validators (not in dry-run mode)."""
+        saved_count = await super().save_to_database(content_items)
+        if not self.dry_run:
+            self.commit_validators()
+        return saved_count
+
+    async def _login(self) -> bool:
         """
         Login to KT Technical Analysis website.
 
@@ -132,14 +236,14 @@ class KTTechnicalCollector(BaseCollector):
             logger.info("Logging in to KT Technical...")
 
             # Get login page first (to get CSRF token if needed)
-            login_page = self.session.get(self.LOGIN_URL, timeout=10)
-
-            if login_page.status_code != 200:
-                logger.error(f"Failed to load login page: {login_page.status_code}")
-                return False
+            async with self.session.get(self.login_url) as login_page:
+                if login_page.status != 200:
+                    logger.error(f"Failed to load login page: {login_page.status}")
+                    return False
+                login_html = await login_page.read()
 
             # Parse login page to find form fields
-            soup = BeautifulSoup(login_page.content, 'html.parser')
+            soup = BeautifulSoup(login_html, 'html.parser')
 
             # Build login payload
             # Note: KT Technical uses 'log' and 'pwd' instead of 'email' and 'password'
@@ -154,7 +258,7 @@ class KTTechnicalCollector(BaseCollector):
                 name = field.get('name')
                 value = field.get('value')
                 if name:
-                    login_data[name] = value
+                    login_data[name] = value or ''
 
             # Look for CSRF token (in addition to hidden fields)
             csrf_token = soup.find('input', {'name': re.compile(r'csrf|token', re.I)})
@@ -162,18 +266,16 @@ class KTTechnicalCollector(BaseCollector):
                 login_data[csrf_token['name']] = csrf_token['value']
 
             # Submit login
-            response = self.session.post(
-                self.LOGIN_URL,
-                data=login_data,
-                timeout=10,
-                allow_redirects=True
-            )
+            async with self.session.post(self.login_url, data=login_data, allow_redirects=True) as response:
+                status = response.status
+                final_url = str(response.url)
+                text = await response.text()
 
             # Check if login was successful
             # Proper AND logic: must be redirected away from login AND have logout link
-            if response.status_code == 200:
-                redirected_away_from_login = 'login' not in response.url.lower()
-                has_logout_link = bool(re.search(r'<a[^>]*href=["\'][^"\']*logout[^"\']*["\']', response.text, re.I))
+            if status == 200:
+                redirected_away_from_login = 'login' not in final_url.lower()
+                has_logout_link = bool(re.search(r'<a[^>]*href=["\'][^"\']*logout[^"\']*["\']', text, re.I))
 
                 if redirected_away_from_login and has_logout_link:
                     logger.info("Login successful - redirected from login page and logout link found")
@@ -187,17 +289,19 @@ class KTTechnicalCollector(BaseCollector):
                     logger.error("Login failed - still on login page")
                     return False
 
-            logger.error(f"Login may have failed (status: {response.status_code}, url: {response.url})")
+            logger.error(f"Login may have failed (status: {status}, url: {final_url})")
             return False
 
         except Exception as e:
             logger.error(f"Login error: {e}")
             return False
 
-    def _collect_blog_posts(self, max_posts: int = 10) -> List[Dict[str, Any]]:
+    async def _collect_blog_posts(self, max_posts: int = 10) -> List[Dict[str, Any]]:
         """
         Collect blog posts from blog feed.
 
+        Posts are fetched concurrently; results keep feed order.
+
         Args:
             max_posts: Maximum number of posts to collect
 
@@ -208,13 +312,13 @@ class KTTechnicalCollector(BaseCollector):
 
         try:
             # Get blog feed page
-            response = self.session.get(self.BLOG_URL, timeout=10)
-
-            if response.status_code != 200:
-                logger.error(f"Failed to load blog feed: {response.status_code}")
-                return posts
+            async with self.session.get(self.blog_url) as response:
+                if response.status != 200:
+                    logger.error(f"Failed to load blog feed: {response.status}")
+                    return posts
+                feed_html = await response.read()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(feed_html, 'html.parser')
 
             # Find blog post elements
             # Common patterns: article tags, divs with class containing "post", "blog", "entry"
@@ -225,32 +329,51 @@ class KTTechnicalCollector(BaseCollector):
             )
 
             logger.info(f"Found {len(post_elements)} potential blog posts")
+            self.stats["posts_found"] = min(len(post_elements), max_posts)
+
+            post_semaphore = asyncio.Semaphore(self.post_concurrency)
+            image_semaphore = asyncio.Semaphore(self.image_concurrency)
 
-            for i, post_elem in enumerate(post_elements[:max_posts]):
+            async def parse(i, post_elem):
                 try:
-                    post_data = self._parse_blog_post(post_elem)
-                    if post_data:
-                        posts.append(post_data)
+                    return await self._parse_blog_post(post_elem, post_semaphore, image_semaphore)
                 except Exception as e:
                     logger.warning(f"Error parsing post {i+1}: {e}")
-                    continue
+                    return None
+
+            results = await asyncio.gather(*[
+                parse(i, post_elem) for i, post_elem in enumerate(post_elements[:max_posts])
+            ])
+            posts = [post_data for post_data in results if post_data]
+            self.stats["posts_collected"] = len(posts)
 
         except Exception as e:
             logger.error(f"Error collecting blog posts: {e}")
 
         return posts
 
-    def _parse_blog_post(self, post_elem) -> Optional[Dict[str, Any]]:
+    async def _parse_blog_post(
+        self,
+        post_elem,
+        post_semaphore: Optional[asyncio.Semaphore] = None,
+        image_semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Parse a blog post element into standardized format.
         Visits individual post page to get full content and images.
 
         Args:
             post_elem: BeautifulSoup element containing post
+            post_semaphore: Limits concurrent post page fetches
+            image_semaphore: Limits concurrent image downloads
 
         Returns:
-            Standardized blog post content item
+            Standardized blog post content item, or None if the post is
+            unchanged since the last collection or could not be parsed
         """
+        post_semaphore = post_semaphore or asyncio.Semaphore(self.post_concurrency)
+        image_semaphore = image_semaphore or asyncio.Semaphore(self.image_concurrency)
+
         try:
             # Extract title
             title_elem = (
@@ -263,21 +386,31 @@ class KTTechnicalCollector(BaseCollector):
 
             # Extract post URL
             link_elem = post_elem.find('a', href=True)
-            post_url = link_elem['href'] if link_elem else self.BLOG_URL
+            post_url = link_elem['href'] if link_elem else self.blog_url
             if post_url.startswith('/'):
-                post_url = self.BASE_URL + post_url
+                post_url = self.base_url + post_url
 
             # Visit individual post page to get full content and images
             logger.info(f"Fetching full post: {title[:50]}...")
-            full_content, images, date_text = self._fetch_full_post(post_url)
+            async with post_semaphore:
+                fetched = await self._fetch_full_post(post_url)
+            if fetched is None:
+                logger.info(f"Post unchanged since last collection: {title[:50]}")
+                self.stats["posts_unchanged"] = self.stats.get("posts_unchanged", 0) + 1
+                return None
+            full_content, images, date_text, validator = fetched
 
-            # Download images (price charts)
-            downloaded_images = []
+            # Download images (price charts), streamed concurrently
             logger.info(f"Found {len(images)} images in post")
-            for img_url in images[:10]:  # Limit to 10 images per post
-                img_path = self._download_image(img_url, title)
-                if img_path:
-                    downloaded_images.append(str(img_path))
+
+            async def download(idx, img_url):
+                async with image_semaphore:
+                    return await self._download_image(img_url, title, idx)
+
+            image_paths = await asyncio.gather(*[
+                download(idx, img_url) for idx, img_url in enumerate(images[:self.MAX_IMAGES_PER_POST])
+            ])
+            downloaded_images = [str(path) for path in image_paths if path]
 
             # Build post data
             post_data = {
@@ -294,6 +427,10 @@ class KTTechnicalCollector(BaseCollector):
                 }
             }
 
+            # Remember the page version only once the post is fully processed
+            if validator:
+                self.validators[post_url] = validator
+
             logger.info(f"Downloaded {len(downloaded_images)} chart images")
             return post_data
 
@@ -301,24 +438,44 @@ class KTTechnicalCollector(BaseCollector):
             logger.error(f"Error parsing blog post: {e}")
             return None
 
-    def _fetch_full_post(self, post_url: str) -> tuple:
+    async def _fetch_full_post(self, post_url: str) -> Optional[Tuple[str, List[str], Optional[str], Dict[str, str]]]:
         """
         Fetch full blog post content from individual post page.
 
+        Sends the stored validators as a conditional request.
+
         Args:
             post_url: URL of individual blog post
 
         Returns:
-            Tuple of (content_text, image_urls, date_text)
+            Tuple of (content_text, image_urls, date_text, validators), or
+            None if the page is unchanged (304 Not Modified)
         """
-        try:
-            response = self.session.get(post_url, timeout=10)
+        headers = {}
+        cached = self.validators.get(post_url, {}) if self.conditional else {}
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
 
-            if response.status_code != 200:
-                logger.warning(f"Failed to fetch post page: {response.status_code}")
-                return ("", [], None)
+        try:
+            async with self.session.get(post_url, headers=headers) as response:
+                if response.status == 304:
+                    return None
+
+                if response.status != 200:
+                    logger.warning(f"Failed to fetch post page: {response.status}")
+                    return ("", [], None, {})
+
+                page_html = await response.read()
+                validator = {
+                    key: value for key, value in (
+                        ("etag", response.headers.get("ETag")),
+                        ("last_modified", response.headers.get("Last-Modified")),
+                    ) if value
+                }
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(page_html, 'html.parser')
 
             # Extract full content
             # Look for main content area (common WordPress patterns)
@@ -354,67 +511,76 @@ class KTTechnicalCollector(BaseCollector):
                     if img_src:
                         # Make URL absolute
                         if img_src.startswith('/'):
-                            img_src = self.BASE_URL + img_src
+                            img_src = self.base_url + img_src
                         elif not img_src.startswith('http'):
-                            img_src = self.BASE_URL + '/' + img_src
+                            img_src = self.base_url + '/' + img_src
 
                         # Filter out small icons/logos (likely not price charts)
                         # Price charts are usually large images
                         if 'icon' not in img_src.lower() and 'logo' not in img_src.lower():
                             images.append(img_src)
 
-            return (content_text, images, date_text)
+            return (content_text, images, date_text, validator)
 
         except Exception as e:
             logger.warning(f"Error fetching full post: {e}")
-            return ("", [], None)
+            return ("", [], None, {})
 
-    def _download_image(self, url: str, post_title: str) -> Optional[Path]:
+    async def _download_image(self, url: str, post_title: str, index: int = 0) -> Optional[Path]:
         """
-        Download a chart image.
+        Download a chart image, streaming it to disk.
 
         Args:
             url: Image URL
             post_title: Blog post title (for filename)
+            index: Position of the image in the post
 
         Returns:
             Path to downloaded image or None
         """
+        file_path = None
         try:
-            # Download image
-            response = self.session.get(url, timeout=30)
-
-            if response.status_code != 200:
-                logger.warning(f"Failed to download image: {response.status_code}")
-                return None
-
-            # Determine file extension
-            content_type = response.headers.get('content-type', '')
-            if 'png' in content_type:
-                ext = 'png'
-            elif 'jpeg' in content_type or 'jpg' in content_type:
-                ext = 'jpg'
-            elif 'gif' in content_type:
-                ext = 'gif'
-            else:
-                # Try to get from URL
-                ext = url.split('.')[-1].lower()
-                if ext not in ['png', 'jpg', 'jpeg', 'gif']:
-                    ext = 'jpg'  # Default
-
-            # Create filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_title = re.sub(r'[^a-zA-Z0-9_-]', '_', post_title)[:30]
-            filename = f"{timestamp}_{safe_title}.{ext}"
-            file_path = self.download_dir / filename
-
-            # Save file
-            with open(file_path, 'wb') as f:
-                f.write(response.content)
-
+            timeout = aiohttp.ClientTimeout(total=self.IMAGE_TIMEOUT)
+            async with self.session.get(url, timeout=timeout) as response:
+                if response.status != 200:
+                    logger.warning(f"Failed to download image: {response.status}")
+                    return None
+
+                # Determine file extension
+                content_type = response.headers.get('content-type', '')
+                if 'png' in content_type:
+                    ext = 'png'
+                elif 'jpeg' in content_type or 'jpg' in content_type:
+                    ext = 'jpg'
+                elif 'gif' in content_type:
+                    ext = 'gif'
+                else:
+                    # Try to get from URL
+                    ext = url.split('.')[-1].lower()
+                    if ext not in ['png', 'jpg', 'jpeg', 'gif']:
+                        ext = 'jpg'  # Default
+
+                # Create filename
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                safe_title = re.sub(r'[^a-zA-Z0-9_-]', '_', post_title)[:30]
+                digest = hashlib.sha1(url.encode()).hexdigest()[:8]
+                filename = f"{timestamp}_{safe_title}_{index}_{digest}.{ext}"
+                file_path = self.download_dir / filename
+
+                # Stream to file
+                size = 0
+                with open(file_path, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(self.IMAGE_CHUNK_BYTES):
+                        f.write(chunk)
+                        size += len(chunk)
+
+            self.stats["images_downloaded"] = self.stats.get("images_downloaded", 0) + 1
+            self.stats["image_bytes"] = self.stats.get("image_bytes", 0) + size
             logger.info(f"Downloaded image: {filename}")
             return file_path
 
         except Exception as e:
             logger.warning(f"Error downloading image: {e}")
+            if file_path is not None:
+                file_path.unlink(missing_ok=True)
             return None
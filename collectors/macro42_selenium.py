@@ -12,6 +12,14 @@ Security (PRD-015):
 
 PRD-017:
 - Added atexit handler to ensure Chrome processes are cleaned up on crash
+
+PDF download modes (MACRO42_PDF_MODE):
+- direct (default): Selenium logs in and discovers the PDF URLs (card links,
+  or the JSON the research page fetches); reports already in raw_content are
+  skipped, and the rest are streamed concurrently over a pooled HTTP session
+  carrying the browser's cookies. Falls back to click when no URLs are found
+  or every direct download fails.
+- click: clicks each card's download button and waits for Chrome to save it.
 """
 
 import logging
@@ -21,9 +29,15 @@ import json
 import random
 import atexit
 import signal
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
+from urllib.parse import urljoin, urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -62,6 +76,62 @@ def extract_pdf_text(pdf_path: str) -> str:
         logger.warning(f"Failed to extract PDF text from {pdf_path}: {e}")
         return ""
 
+# Links that point at a PDF file (optionally with a signed query string)
+PDF_URL_PATTERN = re.compile(r"\.pdf(?:$|[?#])", re.IGNORECASE)
+
+# Field names the research API might use, in order of preference
+API_TYPE_KEYS = ("report_type", "reportType", "type", "category", "title", "name")
+API_DATE_KEYS = ("date", "published_at", "publishedAt", "release_date", "created_at", "createdAt")
+
+
+def _format_report_date(value: str) -> str:
+    """Format ISO dates like the research cards do ("Tuesday, November 18, 2025")."""
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return str(value)
+    return f"{parsed:%A}, {parsed:%B} {parsed.day}, {parsed.year}"
+
+
+def _pdf_url_in(item: Dict[str, Any]) -> Optional[str]:
+    """PDF URL held by an object directly or by one of its nested objects (e.g. {"file": {"url": ...}})."""
+    for value in item.values():
+        if isinstance(value, str) and PDF_URL_PATTERN.search(value):
+            return value
+    for value in item.values():
+        if isinstance(value, dict):
+            nested = next((v for v in value.values() if isinstance(v, str) and PDF_URL_PATTERN.search(v)), None)
+            if nested:
+                return nested
+    return None
+
+
+def reports_from_api(data: Any) -> List[Dict[str, Any]]:
+    """
+    Find PDF reports in a research API response.
+
+    The outermost object holding a PDF URL is a report; its type and date
+    come from the first matching API_TYPE_KEYS / API_DATE_KEYS field.
+    """
+    if isinstance(data, list):
+        return [report for item in data for report in reports_from_api(item)]
+    if not isinstance(data, dict):
+        return []
+
+    pdf_url = _pdf_url_in(data)
+    if pdf_url is None:
+        return [report for value in data.values() for report in reports_from_api(value)]
+
+    report_type = next((data[k] for k in API_TYPE_KEYS if isinstance(data.get(k), str) and data[k]), "")
+    date = next((data[k] for k in API_DATE_KEYS if data.get(k)), "")
+    return [{
+        "report_type": report_type.replace("_", " ").strip().title(),
+        "date": _format_report_date(date) if date else "",
+        "pdf_url": pdf_url,
+        "is_locked": False,
+    }]
+
+
 # Global reference for cleanup handler
 _active_driver = None
 
@@ -112,7 +182,21 @@ class Macro42Collector(BaseCollector):
     LOGIN_URL = f"{BASE_URL}/login"
     COOKIES_FILE = "temp/42macro_cookies.json"  # Cookie persistence file (JSON for security)
 
-    def __init__(self, email: str, password: str, headless: bool = True):
+    MAX_REPORTS = 10  # Most recent research cards considered per run
+    IMPLICIT_WAIT_SECONDS = 10
+    PDF_MODE = os.getenv("MACRO42_PDF_MODE", "direct")  # "direct" or "click"
+    PDF_DOWNLOAD_WORKERS = int(os.getenv("MACRO42_PDF_WORKERS", "4"))
+    PDF_DOWNLOAD_TIMEOUT = 60  # seconds per request (connect / between chunks)
+    PDF_CHUNK_BYTES = 64 * 1024
+
+    def __init__(
+        self,
+        email: str,
+        password: str,
+        headless: bool = True,
+        pdf_mode: Optional[str] = None,
+        known_reports: Optional[Set[Tuple[str, str]]] = None
+    ):
         """
         Initialize 42 Macro collector.
 
@@ -120,12 +204,18 @@ class Macro42Collector(BaseCollector):
             email: 42macro account email
             password: 42macro account password
             headless: Run browser in headless mode (no visible window)
+            pdf_mode: "direct" or "click" (default: MACRO42_PDF_MODE)
+            known_reports: (report_type, date) pairs to skip; loaded from
+                the local raw_content table when omitted (callers that store
+                reports elsewhere, e.g. the Railway upload script, pass them)
         """
         super().__init__(source_name="42macro")
 
         self.email = email
         self.password = password
         self.headless = headless
+        self.pdf_mode = pdf_mode or self.PDF_MODE
+        self.known_reports = known_reports
         self.driver = None
 
         # Ensure temp directory exists for cookies
@@ -262,7 +352,7 @@ class Macro42Collector(BaseCollector):
         # Set page load timeout
         self.driver = webdriver.Chrome(service=service, options=chrome_options)
         self.driver.set_page_load_timeout(30)  # 30 second timeout for page loads
-        self.driver.implicitly_wait(10)  # 10 second implicit wait
+        self.driver.implicitly_wait(self.IMPLICIT_WAIT_SECONDS)
 
         # Store reference for atexit cleanup handler (PRD-017)
         _active_driver = self.driver
@@ -406,6 +496,229 @@ class Macro42Collector(BaseCollector):
             logger.error(f"Failed to load cookies: {e}")
 
     def _collect_pdfs(self) -> List[Dict[str, Any]]:
+        """
+        Collect PDF research reports using the configured download mode.
+
+        Returns:
+            List of PDF content items
+        """
+        if self.known_reports is None:
+            self.known_reports = self._load_known_reports()
+
+        if self.pdf_mode == "direct":
+            pdfs = self._collect_pdfs_direct()
+            if pdfs is not None:
+                return pdfs
+            logger.info("Falling back to click-to-download PDF collection")
+
+        return self._collect_pdfs_click()
+
+    def _load_known_reports(self) -> Set[Tuple[str, str]]:
+        """(report_type, date) pairs already stored in raw_content for 42macro."""
+        try:
+            from backend.models import SessionLocal, Source
+            from backend.utils.deduplication import existing_report_keys
+
+            db = SessionLocal()
+            try:
+                source = db.query(Source).filter(Source.name == self.source_name).first()
+                known = existing_report_keys(db, source.id) if source else set()
+            finally:
+                db.close()
+            logger.info(f"{len(known)} 42macro reports already stored")
+            return known
+        except Exception as e:
+            logger.warning(f"Could not load stored 42macro reports, none will be skipped: {e}")
+            return set()
+
+    def _is_known(self, report_type: str, date_text: str) -> bool:
+        return (report_type, date_text) in (self.known_reports or set())
+
+    @contextmanager
+    def _no_implicit_wait(self):
+        """Make missing-element lookups fail fast instead of waiting IMPLICIT_WAIT_SECONDS."""
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(self.IMPLICIT_WAIT_SECONDS)
+
+    def _open_research_page(self) -> list:
+        """Navigate to /research and return the rendered research cards (newest first)."""
+        self.driver.get(f"{self.BASE_URL}/research")
+
+        # Wait for React app to render content
+        try:
+            WebDriverWait(self.driver, 15).until(EC.presence_of_element_located(
+                (By.CSS_SELECTOR, ".cursor-pointer.bg-card")
+            ))
+        except (NoSuchElementException, TimeoutException, StaleElementReferenceException):
+            logger.warning("Research cards not found - page may not have loaded")
+            return []
+
+        cards = self.driver.find_elements(By.CSS_SELECTOR, ".cursor-pointer.bg-card.p-2.rounded-xl")
+        logger.info(f"Found {len(cards)} research cards")
+        return cards[:self.MAX_REPORTS]
+
+    def _read_card(self, card) -> Dict[str, Any]:
+        """Report type, date, lock state and PDF link (if any) of a research card."""
+        with self._no_implicit_wait():
+            # Report type (e.g., "Leadoff Morning Note") and date (e.g., "Tuesday, November 18, 2025")
+            report_type = card.find_element(By.CSS_SELECTOR, ".capitalize").text.strip()
+            date_text = card.find_element(By.CSS_SELECTOR, ".text-select.font-bold").text.strip()
+
+            # Locked content has a lock icon
+            is_locked = bool(card.find_elements(By.CSS_SELECTOR, "svg.text-white.absolute"))
+
+            pdf_url = None
+            for link in card.find_elements(By.CSS_SELECTOR, "a[href]"):
+                href = link.get_attribute("href") or ""
+                if PDF_URL_PATTERN.search(href):
+                    pdf_url = urljoin(self.BASE_URL, href)
+                    break
+
+        return {"report_type": report_type, "date": date_text, "is_locked": is_locked, "pdf_url": pdf_url}
+
+    def _pdf_item(self, pdf_path: Path, report: Dict[str, Any], url: str, **metadata) -> Dict[str, Any]:
+        """Content item for a downloaded report, with its text extracted."""
+        title = f"{report['report_type']} - {report['date']}"
+
+        # Extract PDF text content for upload to Railway
+        # (Railway can't access local file paths)
+        extracted_text = extract_pdf_text(str(pdf_path))
+        content_text = f"{title}\n\n{extracted_text}" if extracted_text else title
+        logger.info(f"Extracted {len(extracted_text)} chars from {pdf_path.name}")
+
+        return {
+            "content_type": "pdf",
+            "file_path": str(pdf_path),  # Keep for local reference
+            "url": url,
+            "content_text": content_text,  # Full extracted text for Railway
+            "collected_at": datetime.now(timezone.utc).isoformat(),
+            "metadata": {
+                "title": title,
+                "report_type": report["report_type"],
+                "date": report["date"],
+                "is_locked": report.get("is_locked", False),
+                "source_url": f"{self.BASE_URL}/research",
+                "file_size_mb": round(pdf_path.stat().st_size / (1024 * 1024), 2),
+                "text_extracted": len(extracted_text) > 0,
+                **metadata
+            }
+        }
+
+    # ------------------------------------------------------------------
+    # Direct mode: discover URLs, download over pooled HTTP
+    # ------------------------------------------------------------------
+
+    def _collect_pdfs_direct(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Download reports straight from their URLs, concurrently.
+
+        Returns:
+            PDF content items, or None when click mode should be used instead
+            (no PDF URLs discovered, or every download failed)
+        """
+        try:
+            cards = self._open_research_page()
+            reports = []
+            for idx, card in enumerate(cards):
+                try:
+                    reports.append(self._read_card(card))
+                except Exception as e:
+                    logger.warning(f"Error processing research card {idx}: {e}")
+
+            session = self._http_session()
+            if not any(report["pdf_url"] for report in reports):
+                reports = self._reports_from_page_requests(session)[:self.MAX_REPORTS]
+        except Exception as e:
+            logger.warning(f"PDF URL discovery failed: {e}")
+            return None
+
+        reports = [report for report in reports if report["pdf_url"]]
+        if not reports:
+            logger.info("No PDF URLs found on the research page")
+            return None
+
+        pending = []
+        for report in reports:
+            if report["is_locked"]:
+                logger.info(f"Skipping locked content: {report['report_type']} - {report['date']}")
+            elif self._is_known(report["report_type"], report["date"]):
+                logger.info(f"Skipping stored report: {report['report_type']} - {report['date']}")
+            else:
+                pending.append(report)
+        if not pending:
+            return []
+
+        logger.info(f"Downloading {len(pending)} reports ({self.PDF_DOWNLOAD_WORKERS} concurrent)")
+        with ThreadPoolExecutor(max_workers=self.PDF_DOWNLOAD_WORKERS, thread_name_prefix="macro42_pdf") as pool:
+            items = list(pool.map(lambda report: self._fetch_report(report, session), pending))
+        session.close()
+
+        pdfs = [item for item in items if item]
+        if not pdfs:
+            logger.warning(f"All {len(pending)} direct PDF downloads failed")
+            return None
+        return pdfs
+
+    def _http_session(self) -> requests.Session:
+        """HTTP session sharing the browser's cookies and User-Agent, pooled for PDF_DOWNLOAD_WORKERS."""
+        session = requests.Session()
+        retry = Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 502, 503, 504), allowed_methods=["GET"])
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=self.PDF_DOWNLOAD_WORKERS, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        session.headers["User-Agent"] = self.driver.execute_script("return navigator.userAgent")
+        session.headers["Referer"] = f"{self.BASE_URL}/research"
+        for cookie in self.driver.get_cookies():
+            session.cookies.set(cookie["name"], cookie["value"],
+                                domain=cookie.get("domain"), path=cookie.get("path", "/"))
+        return session
+
+    def _reports_from_page_requests(self, session: requests.Session) -> List[Dict[str, Any]]:
+        """Reports found in the JSON responses the research page fetched."""
+        urls = self.driver.execute_script(
+            "return performance.getEntriesByType('resource')"
+            ".filter(e => e.initiatorType === 'fetch' || e.initiatorType === 'xmlhttprequest')"
+            ".map(e => e.name)"
+        ) or []
+
+        reports = []
+        for url in dict.fromkeys(urls):
+            try:
+                response = session.get(url, timeout=15)
+                if response.status_code != 200 or "json" not in response.headers.get("Content-Type", ""):
+                    continue
+                reports.extend(reports_from_api(response.json()))
+            except (requests.RequestException, ValueError) as e:
+                logger.debug(f"Skipping research API response {url}: {e}")
+
+        # Same PDF can appear in several responses
+        unique = {report["pdf_url"]: report for report in reports}
+        logger.info(f"Found {len(unique)} PDF URLs in {len(urls)} research page requests")
+        return list(unique.values())
+
+    def _fetch_report(self, report: Dict[str, Any], session: requests.Session) -> Optional[Dict[str, Any]]:
+        """Download one report and build its content item (runs in a download worker)."""
+        title = f"{report['report_type']} - {report['date']}"
+        try:
+            pdf_path = self._download_pdf(report["pdf_url"], title, session=session)
+            if pdf_path is None:
+                return None
+            # Query strings on signed URLs change per request; keep the stable part
+            url = urlsplit(report["pdf_url"])._replace(query="", fragment="").geturl()
+            return self._pdf_item(pdf_path, report, url, download_mode="direct")
+        except Exception as e:
+            logger.warning(f"Error downloading PDF for '{title}': {e}")
+            return None
+
+    # ------------------------------------------------------------------
+    # Click mode: let Chrome download each card
+    # ------------------------------------------------------------------
+
+    def _collect_pdfs_click(self) -> List[Dict[str, Any]]:
         """
         Collect PDF research reports from React SPA.
 
@@ -416,60 +729,32 @@ class Macro42Collector(BaseCollector):
             List of PDF content items
         """
         import time
-        import os
         from glob import glob
 
         pdfs = []
 
         try:
-            # Navigate to research page
-            research_url = f"{self.BASE_URL}/research"
-            self.driver.get(research_url)
-
-            # Wait for React app to render content
-            wait = WebDriverWait(self.driver, 15)
-
-            # Wait for research cards to appear
-            try:
-                wait.until(EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, ".cursor-pointer.bg-card")
-                ))
-            except (NoSuchElementException, TimeoutException, StaleElementReferenceException):
-                logger.warning("Research cards not found - page may not have loaded")
+            cards = self._open_research_page()
+            if not cards:
                 return pdfs
 
             # Give extra time for all cards to render
             time.sleep(2)
 
-            # Find all research card elements
-            cards = self.driver.find_elements(By.CSS_SELECTOR, ".cursor-pointer.bg-card.p-2.rounded-xl")
-
-            logger.info(f"Found {len(cards)} research cards")
-
-            for idx, card in enumerate(cards[:10]):  # Limit to most recent 10
+            for idx, card in enumerate(cards):
                 try:
-                    # Extract report type (e.g., "Leadoff Morning Note", "Around the Horn")
-                    type_elem = card.find_element(By.CSS_SELECTOR, ".capitalize")
-                    report_type = type_elem.text.strip()
-
-                    # Extract date (e.g., "Tuesday, November 18, 2025")
-                    date_elem = card.find_element(By.CSS_SELECTOR, ".text-select.font-bold")
-                    date_text = date_elem.text.strip()
-
-                    # Check if locked (has lock icon)
-                    is_locked = False
-                    try:
-                        card.find_element(By.CSS_SELECTOR, "svg.text-white.absolute")
-                        is_locked = True
-                    except (NoSuchElementException, TimeoutException, StaleElementReferenceException):
-                        pass
+                    report = self._read_card(card)
+                    title = f"{report['report_type']} - {report['date']}"
 
                     # Skip locked content
-                    if is_locked:
-                        logger.info(f"Skipping locked content: {report_type} - {date_text}")
+                    if report["is_locked"]:
+                        logger.info(f"Skipping locked content: {title}")
+                        continue
+
+                    if self._is_known(report["report_type"], report["date"]):
+                        logger.info(f"Skipping stored report: {title}")
                         continue
 
-                    title = f"{report_type} - {date_text}"
                     logger.info(f"Downloading: {title}")
 
                     # Get list of files before download
@@ -517,29 +802,7 @@ class Macro42Collector(BaseCollector):
                         pdf_path.rename(new_path)
                         logger.info(f"Downloaded and renamed: {new_filename}")
 
-                        # Extract PDF text content for upload to Railway
-                        # (Railway can't access local file paths)
-                        extracted_text = extract_pdf_text(str(new_path))
-                        content_text = f"{title}\n\n{extracted_text}" if extracted_text else title
-                        logger.info(f"Extracted {len(extracted_text)} chars from PDF")
-
-                        # Create content item with extracted text
-                        pdfs.append({
-                            "content_type": "pdf",
-                            "file_path": str(new_path),  # Keep for local reference
-                            "url": research_url,
-                            "content_text": content_text,  # Full extracted text for Railway
-                            "collected_at": datetime.now(timezone.utc).isoformat(),
-                            "metadata": {
-                                "title": title,
-                                "report_type": report_type,
-                                "date": date_text,
-                                "is_locked": is_locked,
-                                "source_url": research_url,
-                                "file_size_mb": round(new_path.stat().st_size / (1024 * 1024), 2),
-                                "text_extracted": len(extracted_text) > 0
-                            }
-                        })
+                        pdfs.append(self._pdf_item(new_path, report, f"{self.BASE_URL}/research"))
 
                     except Exception as e:
                         logger.warning(f"Error downloading PDF for '{title}': {e}")
@@ -731,40 +994,51 @@ class Macro42Collector(BaseCollector):
         logger.info(f"Collected {len(videos)} unique videos")
         return videos
 
-    def _download_pdf(self, url: str, title: str) -> Optional[Path]:
+    def _download_pdf(self, url: str, title: str, session: Optional[requests.Session] = None) -> Optional[Path]:
         """
-        Download a PDF file.
+        Download a PDF file, streaming it to disk.
 
         Args:
             url: URL to download from
             title: Title for filename
+            session: HTTP session to use (carries login cookies); a plain
+                request is made when omitted
 
         Returns:
             Path to downloaded file or None
         """
         try:
-            import requests
-
-            # Download PDF
-            response = requests.get(url, timeout=30)
-
-            if response.status_code != 200:
-                logger.error(f"Failed to download PDF: {response.status_code}")
+            http = session or requests
+            with http.get(url, timeout=self.PDF_DOWNLOAD_TIMEOUT, stream=True) as response:
+                if response.status_code != 200:
+                    logger.error(f"Failed to download PDF '{title}': {response.status_code}")
+                    return None
+
+                # Create filename
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                safe_title = re.sub(r'[^a-zA-Z0-9_-]', '_', title)[:80]
+                file_path = self.download_dir / f"{timestamp}_{safe_title}.pdf"
+                part_path = file_path.with_suffix(".pdf.part")
+
+                # Save file chunk by chunk; an expired session yields an HTML login page
+                size = 0
+                with open(part_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=self.PDF_CHUNK_BYTES):
+                        if size == 0 and not chunk.startswith(b"%PDF"):
+                            logger.error(f"Response for '{title}' is not a PDF "
+                                         f"({response.headers.get('Content-Type', 'unknown type')})")
+                            break
+                        f.write(chunk)
+                        size += len(chunk)
+
+            if size == 0:
+                part_path.unlink(missing_ok=True)
                 return None
 
-            # Create filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_title = re.sub(r'[^a-zA-Z0-9_-]', '_', title)[:50]
-            filename = f"{timestamp}_{safe_title}.pdf"
-            file_path = self.download_dir / filename
-
-            # Save file
-            with open(file_path, 'wb') as f:
-                f.write(response.content)
-
-            logger.info(f"Downloaded PDF: {filename}")
+            part_path.rename(file_path)
+            logger.info(f"Downloaded PDF: {file_path.name} ({size / 1024:.0f} KB)")
             return file_path
 
         except Exception as e:
-            logger.error(f"Error downloading PDF: {e}")
+            logger.error(f"Error downloading PDF '{title}': {e}")
             return None
@@ -0,0 +1,52 @@
+"""
+Migration 008: Add stored staleness timestamps (PRD-048)
+
+Adds columns stamped by the set-based staleness sweep so symbol reads
+no longer recompute staleness:
+- symbol_states.stale_since: overall data older than SYMBOL_STALENESS_HOURS
+- symbol_states.kt_stale_since / discord_stale_since: per-source equivalents
+- symbol_levels.stale_since: when the level was marked stale
+"""
+
+
+def upgrade(db):
+    """
+    Apply the migration (add columns).
+
+    Args:
+        db: DatabaseManager instance
+    """
+    print("Applying migration 008: Add stale_since columns (PRD-048)...")
+
+    def safe_add_column(conn, table, column_name, column_def):
+        """Add column if it doesn't exist."""
+        try:
+            cursor = conn.execute(f"PRAGMA table_info({table})")
+            columns = [row[1] for row in cursor.fetchall()]
+            if column_name not in columns:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column_name} {column_def}")
+                print(f"  Added column: {table}.{column_name}")
+            else:
+                print(f"  Column already exists: {table}.{column_name}")
+        except Exception as e:
+            print(f"  Error adding {table}.{column_name}: {e}")
+
+    with db.get_connection() as conn:
+        safe_add_column(conn, "symbol_states", "stale_since", "TIMESTAMP")
+        safe_add_column(conn, "symbol_states", "kt_stale_since", "TIMESTAMP")
+        safe_add_column(conn, "symbol_states", "discord_stale_since", "TIMESTAMP")
+        safe_add_column(conn, "symbol_levels", "stale_since", "TIMESTAMP")
+
+    print("SUCCESS: Migration 008 applied successfully")
+    print("   - Added symbol_states.stale_since, kt_stale_since, discord_stale_since")
+    print("   - Added symbol_levels.stale_since")
+
+
+def downgrade(db):
+    """
+    Rollback the migration.
+
+    SQLite before 3.35 cannot drop columns; the columns are nullable and
+    ignored by older code, so they are left in place.
+    """
+    print("Rolling back migration 008: stale_since columns are left in place (nullable)")
@@ -0,0 +1,54 @@
+"""
+Migration 009: Add incrementally maintained SourceHealth counters (PRD-045)
+
+Adds the columns the health endpoint now reads instead of aggregating
+raw_content / transcription_status on every request:
+- source_health.transcription_pending / _completed / _failed / _backlog
+- source_health.last_failure_at: lets reconciliation expire errors_24h
+- source_health.reconciled_at: last full recomputation
+"""
+
+
+def upgrade(db):
+    """
+    Apply the migration (add columns).
+
+    Args:
+        db: DatabaseManager instance
+    """
+    print("Applying migration 009: Add SourceHealth counters (PRD-045)...")
+
+    def safe_add_column(conn, table, column_name, column_def):
+        """Add column if it doesn't exist."""
+        try:
+            cursor = conn.execute(f"PRAGMA table_info({table})")
+            columns = [row[1] for row in cursor.fetchall()]
+            if column_name not in columns:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column_name} {column_def}")
+                print(f"  Added column: {table}.{column_name}")
+            else:
+                print(f"  Column already exists: {table}.{column_name}")
+        except Exception as e:
+            print(f"  Error adding {table}.{column_name}: {e}")
+
+    with db.get_connection() as conn:
+        safe_add_column(conn, "source_health", "transcription_pending", "INTEGER DEFAULT 0")
+        safe_add_column(conn, "source_health", "transcription_completed", "INTEGER DEFAULT 0")
+        safe_add_column(conn, "source_health", "transcription_failed", "INTEGER DEFAULT 0")
+        safe_add_column(conn, "source_health", "transcription_backlog", "INTEGER DEFAULT 0")
+        safe_add_column(conn, "source_health", "last_failure_at", "TIMESTAMP")
+        safe_add_column(conn, "source_health", "reconciled_at", "TIMESTAMP")
+
+    print("SUCCESS: Migration 009 applied successfully")
+    print("   - Added source_health transcription counters, last_failure_at, reconciled_at")
+    print("   - Run the source health reconciliation once to populate them")
+
+
+def downgrade(db):
+    """
+    Rollback the migration.
+
+    SQLite before 3.35 cannot drop columns; the columns are nullable and
+    ignored by older code, so they are left in place.
+    """
+    print("Rolling back migration 009: SourceHealth counter columns are left in place (nullable)")
@@ -0,0 +1,98 @@
+"""
+Migration 010: Add daily quality rollups (PRD-044)
+
+Creates quality_daily_rollups, one row per (day, grade) with counts and
+score / criterion sums, so /api/quality/trends no longer loads every
+synthesis_quality_scores row. Also indexes synthesis_quality_scores.created_at
+for the windowed trend and percentile queries, and backfills the rollups
+from existing scores.
+"""
+
+
+def upgrade(db):
+    """
+    Apply the migration (create table, index, backfill).
+
+    Args:
+        db: DatabaseManager instance
+    """
+    print("Applying migration 010: Add quality daily rollups (PRD-044)...")
+
+    with db.get_connection() as conn:
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS quality_daily_rollups (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    day DATE NOT NULL,
+                    grade VARCHAR(2) NOT NULL,
+                    evaluations INTEGER NOT NULL DEFAULT 0,
+                    score_sum INTEGER NOT NULL DEFAULT 0,
+                    score_min INTEGER,
+                    score_max INTEGER,
+                    confluence_detection_sum INTEGER NOT NULL DEFAULT 0,
+                    evidence_preservation_sum INTEGER NOT NULL DEFAULT 0,
+                    source_attribution_sum INTEGER NOT NULL DEFAULT 0,
+                    youtube_channel_granularity_sum INTEGER NOT NULL DEFAULT 0,
+                    nuance_retention_sum INTEGER NOT NULL DEFAULT 0,
+                    actionability_sum INTEGER NOT NULL DEFAULT 0,
+                    theme_continuity_sum INTEGER NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_quality_rollup_day_grade "
+                "ON quality_daily_rollups(day, grade)"
+            )
+            print("  Created table: quality_daily_rollups")
+        except Exception as e:
+            print(f"  Error creating quality_daily_rollups: {e}")
+
+        try:
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_quality_created_at "
+                "ON synthesis_quality_scores(created_at)"
+            )
+            print("  Created index: idx_quality_created_at")
+        except Exception as e:
+            print(f"  Error creating idx_quality_created_at: {e}")
+
+        try:
+            conn.execute("DELETE FROM quality_daily_rollups")
+            cursor = conn.execute("""
+                INSERT INTO quality_daily_rollups (
+                    day, grade, evaluations, score_sum, score_min, score_max,
+                    confluence_detection_sum, evidence_preservation_sum, source_attribution_sum,
+                    youtube_channel_granularity_sum, nuance_retention_sum, actionability_sum,
+                    theme_continuity_sum, updated_at
+                )
+                SELECT date(created_at), grade, COUNT(*), SUM(quality_score),
+                       MIN(quality_score), MAX(quality_score),
+                       SUM(confluence_detection), SUM(evidence_preservation), SUM(source_attribution),
+                       SUM(youtube_channel_granularity), SUM(nuance_retention), SUM(actionability),
+                       SUM(theme_continuity), MAX(created_at)
+                FROM synthesis_quality_scores
+                WHERE created_at IS NOT NULL
+                GROUP BY date(created_at), grade
+            """)
+            print(f"  Backfilled {cursor.rowcount} rollup rows")
+        except Exception as e:
+            print(f"  Error backfilling quality_daily_rollups: {e}")
+
+    print("SUCCESS: Migration 010 applied successfully")
+    print("   - Created quality_daily_rollups and idx_quality_created_at")
+
+
+def downgrade(db):
+    """
+    Rollback the migration.
+
+    Args:
+        db: DatabaseManager instance
+    """
+    print("Rolling back migration 010: Drop quality daily rollups...")
+
+    with db.get_connection() as conn:
+        conn.execute("DROP TABLE IF EXISTS quality_daily_rollups")
+        conn.execute("DROP INDEX IF EXISTS idx_quality_created_at")
+
+    print("SUCCESS: Migration 010 rolled back")
@@ -0,0 +1,78 @@
+"""
+Migration 011: Add daily content activity rollups
+
+Creates content_daily_rollups, one row per (source, day, content_type)
+with collected / processed / analyzed / scored counts and conviction sums,
+read by the dashboard and collection stats endpoints. Also indexes
+raw_content.collected_at and analyzed_content.analyzed_at for the
+partial-day counts in recent activity.
+
+The table is filled at application startup while it is empty
+(backend.services.activity_rollup.backfill_activity_rollups); to force a
+rebuild run:
+    python scripts/rebuild_activity_rollups.py
+"""
+
+
+def upgrade(db):
+    """
+    Apply the migration (create table and indexes).
+
+    Args:
+        db: DatabaseManager instance
+    """
+    print("Applying migration 011: Add content daily rollups...")
+
+    with db.get_connection() as conn:
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS content_daily_rollups (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    source_id INTEGER NOT NULL REFERENCES sources(id) ON DELETE CASCADE,
+                    day DATE NOT NULL,
+                    content_type VARCHAR NOT NULL,
+                    collected_count INTEGER NOT NULL DEFAULT 0,
+                    processed_count INTEGER NOT NULL DEFAULT 0,
+                    analyzed_count INTEGER NOT NULL DEFAULT 0,
+                    scored_count INTEGER NOT NULL DEFAULT 0,
+                    conviction_sum INTEGER NOT NULL DEFAULT 0,
+                    conviction_count INTEGER NOT NULL DEFAULT 0,
+                    last_collected_at TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_content_rollup_key "
+                "ON content_daily_rollups(source_id, day, content_type)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_content_rollup_day ON content_daily_rollups(day)")
+            print("  Created table: content_daily_rollups")
+        except Exception as e:
+            print(f"  Error creating content_daily_rollups: {e}")
+
+        try:
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_raw_collected_at ON raw_content(collected_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_analyzed_at ON analyzed_content(analyzed_at)")
+            print("  Created indexes: idx_raw_collected_at, idx_analyzed_at")
+        except Exception as e:
+            print(f"  Error creating timestamp indexes: {e}")
+
+    print("SUCCESS: Migration 011 applied successfully")
+    print("   - content_daily_rollups is backfilled on the next application startup")
+
+
+def downgrade(db):
+    """
+    Rollback the migration.
+
+    Args:
+        db: DatabaseManager instance
+    """
+    print("Rolling back migration 011: Drop content daily rollups...")
+
+    with db.get_connection() as conn:
+        conn.execute("DROP TABLE IF EXISTS content_daily_rollups")
+        conn.execute("DROP INDEX IF EXISTS idx_raw_collected_at")
+        conn.execute("DROP INDEX IF EXISTS idx_analyzed_at")
+
+    print("SUCCESS: Migration 011 rolled back")
@@ -0,0 +1,85 @@
+"""
+Migration 012: Add ticker / theme mention index
+
+Creates normalized association tables for AnalyzedContent.tickers_mentioned
+and key_themes (comma-separated text):
+1. ticker_mentions: canonical ticker -> analyzed_content (SYMBOL_ALIASES applied)
+2. theme_mentions: normalized theme keyword -> analyzed_content
+
+Existing analyses are indexed at application startup while both tables are
+empty (backend.services.mention_index.backfill_mention_index); to force a
+rebuild run:
+    python scripts/rebuild_mention_index.py
+"""
+
+
+def upgrade(db):
+    """
+    Apply the migration (create tables and indexes).
+
+    Args:
+        db: DatabaseManager instance
+    """
+    print("Applying migration 012: Add ticker / theme mention index...")
+
+    with db.get_connection() as conn:
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ticker_mentions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    ticker VARCHAR(20) NOT NULL,
+                    analyzed_content_id INTEGER NOT NULL REFERENCES analyzed_content(id) ON DELETE CASCADE,
+                    mentioned_at TIMESTAMP NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_ticker_mention_timeline "
+                "ON ticker_mentions(ticker, mentioned_at)"
+            )
+            conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_ticker_mention_content "
+                "ON ticker_mentions(analyzed_content_id, ticker)"
+            )
+            print("  Created table: ticker_mentions")
+        except Exception as e:
+            print(f"  Error creating ticker_mentions: {e}")
+
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS theme_mentions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    keyword VARCHAR(200) NOT NULL,
+                    analyzed_content_id INTEGER NOT NULL REFERENCES analyzed_content(id) ON DELETE CASCADE,
+                    mentioned_at TIMESTAMP NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_theme_mention_timeline "
+                "ON theme_mentions(keyword, mentioned_at)"
+            )
+            conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_theme_mention_content "
+                "ON theme_mentions(analyzed_content_id, keyword)"
+            )
+            print("  Created table: theme_mentions")
+        except Exception as e:
+            print(f"  Error creating theme_mentions: {e}")
+
+    print("SUCCESS: Migration 012 applied successfully")
+    print("   - Existing analyses are indexed on the next application startup")
+
+
+def downgrade(db):
+    """
+    Rollback the migration.
+
+    Args:
+        db: DatabaseManager instance
+    """
+    print("Rolling back migration 012: Drop mention index tables...")
+
+    with db.get_connection() as conn:
+        conn.execute("DROP TABLE IF EXISTS ticker_mentions")
+        conn.execute("DROP TABLE IF EXISTS theme_mentions")
+
+    print("SUCCESS: Migration 012 rolled back")
@@ -0,0 +1,51 @@
+"""
+Migration 013: Add theme similarity terms
+
+Adds themes.similarity_terms: weighted name / alias / description terms
+(JSON) used by the local TF-IDF prefilter that shortlists existing themes
+before Claude theme matching.
+
+Populate it for existing themes with:
+    python scripts/rebuild_theme_terms.py
+Until then, matching computes terms on the fly for rows without them.
+"""
+
+
+def upgrade(db):
+    """
+    Apply the migration (add column).
+
+    Args:
+        db: DatabaseManager instance
+    """
+    print("Applying migration 013: Add theme similarity terms...")
+
+    with db.get_connection() as conn:
+        try:
+            cursor = conn.execute("PRAGMA table_info(themes)")
+            columns = [row[1] for row in cursor.fetchall()]
+            if "similarity_terms" not in columns:
+                conn.execute("ALTER TABLE themes ADD COLUMN similarity_terms TEXT")
+                print("  Added column: similarity_terms")
+            else:
+                print("  Column already exists: similarity_terms")
+        except Exception as e:
+            print(f"  Error adding similarity_terms: {e}")
+
+    print("SUCCESS: Migration 013 applied successfully")
+    print("   - Run scripts/rebuild_theme_terms.py to backfill existing themes")
+
+
+def downgrade(db):
+    """
+    Rollback the migration.
+
+    Args:
+        db: DatabaseManager instance
+    """
+    print("Rolling back migration 013: Drop theme similarity terms...")
+
+    with db.get_connection() as conn:
+        conn.execute("ALTER TABLE themes DROP COLUMN similarity_terms")
+
+    print("SUCCESS: Migration 013 rolled back")
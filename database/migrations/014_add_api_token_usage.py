@@ -0,0 +1,58 @@
+"""
+Migration 014: Add per-agent Claude token usage
+
+Creates api_token_usage: one row per (UTC day, agent class) with call,
+input, output and prompt-cache read / write token counts, maintained by
+UsageLimiter additive upserts (like api_usage).
+"""
+
+
+def upgrade(db):
+    """
+    Apply the migration (create table).
+
+    Args:
+        db: DatabaseManager instance
+    """
+    print("Applying migration 014: Add api_token_usage...")
+
+    with db.get_connection() as conn:
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS api_token_usage (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    date VARCHAR NOT NULL,
+                    agent VARCHAR NOT NULL,
+                    calls INTEGER DEFAULT 0,
+                    input_tokens INTEGER DEFAULT 0,
+                    output_tokens INTEGER DEFAULT 0,
+                    cache_creation_input_tokens INTEGER DEFAULT 0,
+                    cache_read_input_tokens INTEGER DEFAULT 0,
+                    created_at TIMESTAMP,
+                    updated_at TIMESTAMP
+                )
+            """)
+            conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_api_token_usage_date_agent "
+                "ON api_token_usage(date, agent)"
+            )
+            print("  Created table: api_token_usage")
+        except Exception as e:
+            print(f"  Error creating api_token_usage: {e}")
+
+    print("SUCCESS: Migration 014 applied successfully")
+
+
+def downgrade(db):
+    """
+    Rollback the migration.
+
+    Args:
+        db: DatabaseManager instance
+    """
+    print("Rolling back migration 014: Drop api_token_usage...")
+
+    with db.get_connection() as conn:
+        conn.execute("DROP TABLE IF EXISTS api_token_usage")
+
+    print("SUCCESS: Migration 014 rolled back")
@@ -0,0 +1,59 @@
+"""
+Migration 015: Add background jobs
+
+Creates jobs: one row per long-running request (synthesis generation,
+batch classification) with its state, per-step progress and result, so
+job handles can be followed from any API worker.
+"""
+
+
+def upgrade(db):
+    """
+    Apply the migration (create table).
+
+    Args:
+        db: DatabaseManager instance
+    """
+    print("Applying migration 015: Add jobs...")
+
+    with db.get_connection() as conn:
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id VARCHAR PRIMARY KEY,
+                    kind VARCHAR NOT NULL,
+                    status VARCHAR NOT NULL DEFAULT 'queued',
+                    params TEXT,
+                    steps TEXT,
+                    current_step VARCHAR,
+                    result TEXT,
+                    error TEXT,
+                    created_by VARCHAR,
+                    created_at TIMESTAMP,
+                    started_at TIMESTAMP,
+                    updated_at TIMESTAMP,
+                    finished_at TIMESTAMP
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_kind_created ON jobs(kind, created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)")
+            print("  Created table: jobs")
+        except Exception as e:
+            print(f"  Error creating jobs: {e}")
+
+    print("SUCCESS: Migration 015 applied successfully")
+
+
+def downgrade(db):
+    """
+    Rollback the migration.
+
+    Args:
+        db: DatabaseManager instance
+    """
+    print("Rolling back migration 015: Drop jobs...")
+
+    with db.get_connection() as conn:
+        conn.execute("DROP TABLE IF EXISTS jobs")
+
+    print("SUCCESS: Migration 015 rolled back")
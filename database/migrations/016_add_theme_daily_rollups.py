@@ -0,0 +1,66 @@
+"""
+Migration 016: Add daily theme rollups
+
+Creates theme_daily_rollups, one row per (theme keyword, source, day) with
+mention counts, sentiment mix and conviction sums, read by the aggregated
+themes endpoint (/api/search/themes/aggregated).
+
+The table is filled from theme_mentions at application startup while it is
+empty (backend.services.theme_rollup.backfill_theme_rollups, run after the
+mention index backfill); to force a rebuild run:
+    python scripts/rebuild_mention_index.py
+"""
+
+
+def upgrade(db):
+    """
+    Apply the migration (create table and indexes).
+
+    Args:
+        db: DatabaseManager instance
+    """
+    print("Applying migration 016: Add theme daily rollups...")
+
+    with db.get_connection() as conn:
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS theme_daily_rollups (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    keyword VARCHAR(200) NOT NULL,
+                    source_id INTEGER NOT NULL REFERENCES sources(id) ON DELETE CASCADE,
+                    day DATE NOT NULL,
+                    mention_count INTEGER NOT NULL DEFAULT 0,
+                    bullish_count INTEGER NOT NULL DEFAULT 0,
+                    bearish_count INTEGER NOT NULL DEFAULT 0,
+                    neutral_count INTEGER NOT NULL DEFAULT 0,
+                    conviction_sum INTEGER NOT NULL DEFAULT 0,
+                    conviction_count INTEGER NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_theme_rollup_key "
+                "ON theme_daily_rollups(keyword, source_id, day)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_theme_rollup_day ON theme_daily_rollups(day)")
+            print("  Created table: theme_daily_rollups")
+        except Exception as e:
+            print(f"  Error creating theme_daily_rollups: {e}")
+
+    print("SUCCESS: Migration 016 applied successfully")
+    print("   - theme_daily_rollups is backfilled on the next application startup")
+
+
+def downgrade(db):
+    """
+    Rollback the migration.
+
+    Args:
+        db: DatabaseManager instance
+    """
+    print("Rolling back migration 016: Drop theme daily rollups...")
+
+    with db.get_connection() as conn:
+        conn.execute("DROP TABLE IF EXISTS theme_daily_rollups")
+
+    print("SUCCESS: Migration 016 rolled back")
@@ -19,6 +19,7 @@ Usage:
     python macro42_local.py --dry-run        # Test without saving
     python macro42_local.py --headful        # Show browser window (for debugging)
     python macro42_local.py --skip-transcription  # Skip video transcription
+    python macro42_local.py --pdf-mode click     # Click-to-download PDFs instead of direct HTTP
 """
 
 import asyncio
@@ -166,6 +167,36 @@ async def cleanup_temp_files(downloads_dir: Path):
         logger.warning(f"Cleanup failed: {e}")
 
 
+async def fetch_known_reports_from_railway() -> set:
+    """(report_type, date) pairs of the PDF reports already stored on Railway."""
+    import aiohttp
+
+    railway_url = os.getenv("RAILWAY_API_URL")
+    auth_user = os.getenv("AUTH_USERNAME")
+    auth_pass = os.getenv("AUTH_PASSWORD")
+    if not all([railway_url, auth_user, auth_pass]):
+        logger.warning("Railway API not configured; no stored reports will be skipped")
+        return set()
+
+    endpoint = f"{railway_url}/api/collect/42macro/report-keys"
+
+    try:
+        auth = aiohttp.BasicAuth(auth_user, auth_pass)
+        async with aiohttp.ClientSession() as session:
+            async with session.get(endpoint, auth=auth) as response:
+                if response.status != 200:
+                    logger.warning(f"Could not fetch stored reports: {response.status}")
+                    return set()
+                data = await response.json()
+    except Exception as e:
+        logger.warning(f"Could not fetch stored reports: {e}")
+        return set()
+
+    known = {(report_type, date) for report_type, date in data.get("reports", [])}
+    logger.info(f"{len(known)} 42macro reports already stored on Railway")
+    return known
+
+
 async def upload_to_railway(collected_data: list, source: str = "42macro") -> bool:
     """Upload collected data to Railway API."""
     import aiohttp
@@ -216,6 +247,7 @@ async def run_collection(args):
     logger.info(f"Mode: {'Local DB' if use_local_db else 'Railway API'}")
     logger.info(f"Browser: {'Headless' if headless else 'Visible'}")
     logger.info(f"Transcription: {'Disabled' if skip_transcription else 'Enabled (local)'}")
+    logger.info(f"PDF mode: {args.pdf_mode or os.getenv('MACRO42_PDF_MODE', 'direct')}")
     if args.dry_run:
         logger.info("DRY RUN - No data will be saved")
     logger.info("=" * 60)
@@ -223,11 +255,17 @@ async def run_collection(args):
     # Import collector after path setup
     from collectors.macro42_selenium import Macro42Collector
 
+    # Reports already stored are skipped before download: the collector reads
+    # the local database itself; in Railway mode ask the API that stores them
+    known_reports = None if use_local_db else await fetch_known_reports_from_railway()
+
     # Create collector
     collector = Macro42Collector(
         email=email,
         password=password,
-        headless=headless
+        headless=headless,
+        pdf_mode=args.pdf_mode,
+        known_reports=known_reports
     )
 
     # Set dry_run mode if requested
@@ -318,6 +356,12 @@ def main():
         action="store_true",
         help="Skip local video transcription (upload video URLs only)"
     )
+    parser.add_argument(
+        "--pdf-mode",
+        choices=["direct", "click"],
+        default=None,
+        help="PDF download mode (default: MACRO42_PDF_MODE or direct)"
+    )
     args = parser.parse_args()
 
     # Ensure logs directory exists
@@ -5,6 +5,7 @@ Provides access to the research synthesis and content APIs.
 """
 
 import httpx
+import json
 import logging
 import os
 from typing import Optional, List, Dict, Any
@@ -171,6 +172,32 @@ class ConfluenceClient:
             endpoint = f"{endpoint}?{query_string}"
         return self._request("GET", endpoint)
 
+    def get_nearest_levels(
+        self,
+        symbol: str,
+        price: float,
+        k: int = 5,
+        within_pct: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Get the k levels closest to a price."""
+        endpoint = f"/api/symbols/{symbol}/levels/nearest?price={price}&k={k}"
+        if within_pct is not None:
+            endpoint = f"{endpoint}&within_pct={within_pct}"
+        return self._request("GET", endpoint)
+
+    def get_overlapping_levels(
+        self,
+        symbol: str,
+        low: Optional[float] = None,
+        high: Optional[float] = None,
+        tolerance_pct: float = 0.0
+    ) -> Dict[str, Any]:
+        """Get levels overlapping a range, or KT/Discord overlaps when no range is given."""
+        endpoint = f"/api/symbols/{symbol}/levels/overlaps"
+        if low is not None and high is not None:
+            return self._request("GET", f"{endpoint}?low={low}&high={high}")
+        return self._request("GET", f"{endpoint}?tolerance_pct={tolerance_pct}")
+
     def get_confluence_opportunities(self) -> Dict[str, Any]:
         """Get symbols where KT and Discord are aligned (high confluence)."""
         return self._request("GET", "/api/symbols/confluence/opportunities")
@@ -279,6 +306,40 @@ class ConfluenceClient:
         """
         return self._request("GET", f"/api/search/content/{content_id}")
 
+    def get_job(self, job_id: str) -> Dict[str, Any]:
+        """Get a background job's state, per-step progress and result."""
+        return self._request("GET", f"/api/jobs/{job_id}")
+
+    def list_jobs(self, kind: Optional[str] = None, limit: int = 10) -> Dict[str, Any]:
+        """List recent background jobs (synthesis, classify_batch), newest first."""
+        params: Dict[str, Any] = {"limit": limit}
+        if kind:
+            params["kind"] = kind
+        return self._request("GET", "/api/jobs", params=params)
+
+    def wait_for_job(self, job_id: str, timeout: float = 60.0) -> Dict[str, Any]:
+        """
+        Follow a job's progress stream until it finishes or `timeout` passes.
+
+        Reads the server-sent events at /api/jobs/{job_id}/events instead of
+        polling. Returns the last state seen, which is still running if the
+        timeout was reached first.
+        """
+        url = f"{self.base_url}/api/jobs/{job_id}/events"
+        last: Dict[str, Any] = {}
+        try:
+            with httpx.Client(timeout=httpx.Timeout(timeout, connect=10.0)) as client:
+                with client.stream("GET", url, auth=self.auth) as response:
+                    response.raise_for_status()
+                    for line in response.iter_lines():
+                        if line.startswith("data:"):
+                            last = json.loads(line[len("data:"):].strip())
+                            if last.get("status") in ("succeeded", "failed"):
+                                break
+        except httpx.TimeoutException:
+            logger.info(f"Stopped following job {job_id} after {timeout}s")
+        return last or self.get_job(job_id)
+
 
 # Convenience functions for extracting synthesis components
 # PRD-049: Added type validation to return structured errors
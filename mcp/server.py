@@ -342,6 +342,21 @@ Use this for a quick overview of theme tracking status.""",
                 "required": []
             }
         ),
+        Tool(
+            name="get_all_symbols",
+            description="""List all tracked symbols with a state summary (PRD-039).
+
+Returns for each symbol the KT Technical view (wave position, bias),
+Discord view (quadrant, IV regime), confluence score,
+active level count, and staleness flags.
+
+Use this for a quick scan before drilling into one symbol.""",
+            inputSchema={
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        ),
         Tool(
             name="get_symbol_analysis",
             description="""Get complete analysis for a tracked symbol (PRD-039).
@@ -389,6 +404,49 @@ Use this to see specific price levels for trading.""",
                 "required": ["symbol"]
             }
         ),
+        Tool(
+            name="get_nearby_levels",
+            description="""Find price levels near a price or overlapping a range (PRD-039).
+
+Modes:
+- price (+ optional k, within_pct): k nearest active levels,
+  e.g. within_pct=1 for levels within 1% of price
+- low + high: levels whose range intersects [low, high]
+- neither: KT Technical and Discord levels that overlap each other
+
+Use this to answer "what support/resistance is near X?".""",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "symbol": {
+                        "type": "string",
+                        "description": "Symbol ticker"
+                    },
+                    "price": {
+                        "type": "number",
+                        "description": "Reference price for nearest-level search"
+                    },
+                    "k": {
+                        "type": "integer",
+                        "description": "Number of levels to return (default 5)",
+                        "default": 5
+                    },
+                    "within_pct": {
+                        "type": "number",
+                        "description": "Optional: only levels within this percent of price"
+                    },
+                    "low": {
+                        "type": "number",
+                        "description": "Optional: range lower bound"
+                    },
+                    "high": {
+                        "type": "number",
+                        "description": "Optional: range upper bound"
+                    }
+                },
+                "required": ["symbol"]
+            }
+        ),
         Tool(
             name="get_confluence_opportunities",
             description="""Get symbols where KT Technical and Discord are aligned (PRD-039).
@@ -683,6 +741,37 @@ Args:
                 },
                 "required": ["theme_id"]
             }
+        ),
+        Tool(
+            name="get_job_status",
+            description="""Get the status of background jobs (synthesis generation, batch classification).
+
+With a job_id, returns that job's state (queued, running, succeeded, failed),
+per-step progress and result. Without one, lists recent jobs.
+
+Args:
+- job_id: Job ID returned when the job was started (optional)
+- kind: Filter the list by job kind, e.g. "synthesis" (optional)
+- wait_seconds: Follow the job's progress stream for up to this many
+  seconds, returning early when it finishes (optional, max 300)""",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "job_id": {
+                        "type": "string",
+                        "description": "Job ID"
+                    },
+                    "kind": {
+                        "type": "string",
+                        "description": "Job kind filter for listing (synthesis, classify_batch)"
+                    },
+                    "wait_seconds": {
+                        "type": "integer",
+                        "description": "Seconds to wait for the job to finish (default 0)"
+                    }
+                },
+                "required": []
+            }
         )
     ]
 
@@ -936,6 +1025,20 @@ async def call_tool(name: str, arguments: dict):
 
         # PRD-039: Symbol-Level Confluence Tools
         # PRD-049: Added try/catch and validation
+        elif name == "get_all_symbols":
+            try:
+                symbols = client.get_all_symbols()
+                return [TextContent(
+                    type="text",
+                    text=json.dumps(symbols, indent=2)
+                )]
+            except Exception as e:
+                logger.error(f"get_all_symbols failed: {e}")
+                return [TextContent(
+                    type="text",
+                    text=f"Error fetching symbols: {str(e)}"
+                )]
+
         elif name == "get_symbol_analysis":
             symbol = arguments.get("symbol", "").upper()
             if not symbol:
@@ -977,6 +1080,38 @@ async def call_tool(name: str, arguments: dict):
                     text=f"Error fetching levels for {symbol}: {str(e)}"
                 )]
 
+        elif name == "get_nearby_levels":
+            symbol = arguments.get("symbol", "").upper()
+            if not symbol:
+                return [TextContent(
+                    type="text",
+                    text="Error: symbol is required"
+                )]
+            try:
+                if arguments.get("price") is not None:
+                    result = client.get_nearest_levels(
+                        symbol,
+                        float(arguments["price"]),
+                        int(arguments.get("k", 5)),
+                        arguments.get("within_pct")
+                    )
+                else:
+                    result = client.get_overlapping_levels(
+                        symbol,
+                        arguments.get("low"),
+                        arguments.get("high")
+                    )
+                return [TextContent(
+                    type="text",
+                    text=json.dumps(result, indent=2)
+                )]
+            except Exception as e:
+                logger.error(f"get_nearby_levels failed for {symbol}: {e}")
+                return [TextContent(
+                    type="text",
+                    text=f"Error fetching nearby levels for {symbol}: {str(e)}"
+                )]
+
         elif name == "get_confluence_opportunities":
             try:
                 opportunities = client.get_confluence_opportunities()
@@ -1215,6 +1350,33 @@ async def call_tool(name: str, arguments: dict):
                     text=f"Error fetching theme evolution {theme_id}: {str(e)}"
                 )]
 
+        elif name == "get_job_status":
+            job_id = arguments.get("job_id")
+            try:
+                if not job_id:
+                    result = client.list_jobs(kind=arguments.get("kind"))
+                else:
+                    wait_seconds = min(int(arguments.get("wait_seconds") or 0), 300)
+                    if wait_seconds > 0:
+                        result = client.wait_for_job(job_id, timeout=wait_seconds)
+                    else:
+                        result = client.get_job(job_id)
+                return [TextContent(
+                    type="text",
+                    text=json.dumps(result, indent=2)
+                )]
+            except ValueError:
+                return [TextContent(
+                    type="text",
+                    text=f"Error: wait_seconds must be an integer, got '{arguments.get('wait_seconds')}'"
+                )]
+            except Exception as e:
+                logger.error(f"get_job_status failed for job {job_id}: {e}")
+                return [TextContent(
+                    type="text",
+                    text=f"Error fetching job status: {str(e)}"
+                )]
+
         else:
             return [TextContent(
                 type="text",
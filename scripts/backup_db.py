@@ -2,29 +2,67 @@
 """
 Database Backup Script
 
-Creates timestamped backups of the SQLite database.
-Keeps last N backups (configurable).
+Creates timestamped, compressed backups of the database.
+Keeps last N backup chains (configurable).
 
 Usage:
-    python scripts/backup_db.py           # Create backup
-    python scripts/backup_db.py list      # List existing backups
+    python scripts/backup_db.py                      # Full backup
+    python scripts/backup_db.py --incremental        # Changed pages since last backup
+    python scripts/backup_db.py --compress gzip      # Force codec (zstd, gzip, none)
+    python scripts/backup_db.py list                 # List existing backups
     python scripts/backup_db.py restore <backup_name>  # Restore from backup
+    python scripts/backup_db.py benchmark [backup_name]  # Time a restore (live DB untouched)
 
 Can be scheduled via cron/Task Scheduler for regular backups.
 
 PRD-017: Database backup strategy implementation.
+
+SQLite backups use the online backup API in page-stepped mode, so writers
+are only blocked for one step at a time and the snapshot is consistent
+even with WAL enabled. The snapshot is streamed through zstd (if the
+zstandard package is installed) or gzip.
+
+Incremental backups store only the pages that changed since the previous
+backup in the chain; every backup writes a manifest with per-page hashes.
+A new full backup starts a chain after FULL_BACKUP_EVERY incrementals.
+
+When DATABASE_URL points at PostgreSQL, each table is streamed with
+COPY ... TO STDOUT into its own compressed CSV file, and restored with
+COPY ... FROM STDIN in foreign-key order.
 """
 
-import shutil
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
 import logging
+import os
+import shutil
+import sqlite3
+import struct
 import sys
+import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Configuration
 DB_PATH = Path(__file__).parent.parent / "database" / "confluence.db"
 BACKUP_DIR = Path(__file__).parent.parent / "backups"
-MAX_BACKUPS = 4  # Keep last 4 backups (1 month if weekly)
+MAX_BACKUPS = 4  # Keep last 4 backup chains (1 month if weekly)
+FULL_BACKUP_EVERY = 6  # Incrementals before a new full backup is forced
+
+# Online backup: copy this many pages per step, then yield to writers
+BACKUP_PAGES_PER_STEP = 1024
+BACKUP_STEP_SLEEP_SECONDS = 0.005
+
+STREAM_CHUNK_BYTES = 1024 * 1024
+PAGE_RECORD_HEADER = struct.Struct(">I")  # Page number in incremental files
 
 logging.basicConfig(
     level=logging.INFO,
@@ -33,127 +71,604 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def backup_database() -> bool:
+# ============================================================================
+# Compression
+# ============================================================================
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+CODEC_SUFFIXES = {"zstd": ".zst", "gzip": ".gz", "none": ""}
+
+
+def default_codec() -> str:
+    """Prefer zstd when installed, otherwise gzip."""
+    return "zstd" if ZSTD_AVAILABLE else "gzip"
+
+
+def _open_write(path: Path, codec: str):
+    """Open a compressed stream for writing."""
+    if codec == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("zstd requested but the zstandard package is not installed")
+        return zstandard.ZstdCompressor(level=3, threads=-1).stream_writer(open(path, "wb"))
+    if codec == "gzip":
+        return gzip.open(path, "wb", compresslevel=6)
+    return open(path, "wb")
+
+
+def _open_read(path: Path, codec: str):
+    """Open a compressed stream for reading."""
+    if codec == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("Backup is zstd-compressed but the zstandard package is not installed")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"))
+    if codec == "gzip":
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def _read_exact(stream, size: int) -> bytes:
+    """Read exactly size bytes from a (possibly compressed) stream."""
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = stream.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+# ============================================================================
+# Manifests
+# ============================================================================
+
+def _manifest_path(backup_dir: Path, name: str) -> Path:
+    return backup_dir / f"{name}.manifest.json"
+
+
+def _load_manifest(backup_dir: Path, name: str) -> Dict[str, Any]:
+    with open(_manifest_path(backup_dir, name)) as f:
+        return json.load(f)
+
+
+def _list_manifests(backup_dir: Path) -> List[Dict[str, Any]]:
+    """All manifests, oldest first."""
+    manifests = []
+    for path in sorted(backup_dir.glob("confluence_*.manifest.json")):
+        try:
+            with open(path) as f:
+                manifests.append(json.load(f))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Skipping unreadable manifest {path.name}: {e}")
+    return manifests
+
+
+def _chain_for(backup_dir: Path, name: str) -> List[Dict[str, Any]]:
+    """Manifests from the full backup up to and including name."""
+    chain = []
+    manifest = _load_manifest(backup_dir, name)
+    while True:
+        chain.append(manifest)
+        if manifest["kind"] == "full":
+            break
+        manifest = _load_manifest(backup_dir, manifest["parent"])
+    return list(reversed(chain))
+
+
+# ============================================================================
+# SQLite
+# ============================================================================
+
+def _online_snapshot(db_path: Path, snapshot_path: Path):
+    """Copy a consistent snapshot using SQLite's online backup API."""
+    src = sqlite3.connect(str(db_path))
+    dst = sqlite3.connect(str(snapshot_path))
+    try:
+        with dst:
+            # Each step holds a read lock for BACKUP_PAGES_PER_STEP pages only;
+            # if a writer changes the source mid-backup, SQLite restarts the copy
+            src.backup(dst, pages=BACKUP_PAGES_PER_STEP, sleep=BACKUP_STEP_SLEEP_SECONDS)
+    finally:
+        dst.close()
+        src.close()
+
+
+def _page_hashes(snapshot_path: Path, page_size: int) -> List[str]:
+    hashes = []
+    with open(snapshot_path, "rb") as f:
+        while True:
+            page = f.read(page_size)
+            if not page:
+                break
+            hashes.append(hashlib.blake2b(page, digest_size=16).hexdigest())
+    return hashes
+
+
+def _page_size(snapshot_path: Path) -> int:
+    conn = sqlite3.connect(str(snapshot_path))
+    try:
+        return conn.execute("PRAGMA page_size").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _write_full(snapshot_path: Path, output_path: Path, codec: str):
+    with open(snapshot_path, "rb") as src, _open_write(output_path, codec) as dst:
+        shutil.copyfileobj(src, dst, STREAM_CHUNK_BYTES)
+
+
+def _write_incremental(snapshot_path: Path, output_path: Path, codec: str,
+                       page_size: int, changed_pages: List[int]):
+    with open(snapshot_path, "rb") as src, _open_write(output_path, codec) as dst:
+        for page_no in changed_pages:
+            src.seek(page_no * page_size)
+            dst.write(PAGE_RECORD_HEADER.pack(page_no))
+            dst.write(src.read(page_size))
+
+
+def backup_database(
+    db_path: Optional[Path] = None,
+    backup_dir: Optional[Path] = None,
+    compression: Optional[str] = None,
+    incremental: bool = False
+) -> bool:
     """
     Create timestamped backup of database.
 
+    Args:
+        db_path: SQLite database to back up (default: DB_PATH)
+        backup_dir: Where backups are written (default: BACKUP_DIR)
+        compression: "zstd", "gzip" or "none" (default: zstd if installed)
+        incremental: Store only pages changed since the previous backup
+
     Returns:
         True if backup successful, False otherwise
     """
-    if not DB_PATH.exists():
-        logger.error(f"Database not found: {DB_PATH}")
+    db_path = Path(db_path or DB_PATH)
+    backup_dir = Path(backup_dir or BACKUP_DIR)
+    codec = compression or default_codec()
+
+    if not db_path.exists():
+        logger.error(f"Database not found: {db_path}")
         return False
 
     # Create backup directory
-    BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+    backup_dir.mkdir(parents=True, exist_ok=True)
 
-    # Generate timestamped filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_path = BACKUP_DIR / f"confluence_{timestamp}.db"
+    # Generate timestamped name (microseconds keep rapid backups distinct)
+    name = f"confluence_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+    started = time.perf_counter()
 
-    # Copy database
-    try:
-        shutil.copy2(DB_PATH, backup_path)
-        size_mb = backup_path.stat().st_size / (1024 * 1024)
-        logger.info(f"Backup created: {backup_path} ({size_mb:.2f} MB)")
-    except Exception as e:
-        logger.error(f"Backup failed: {e}")
-        return False
+    with tempfile.TemporaryDirectory(dir=backup_dir) as tmp:
+        snapshot_path = Path(tmp) / "snapshot.db"
+        try:
+            _online_snapshot(db_path, snapshot_path)
+        except Exception as e:
+            logger.error(f"Backup failed: {e}")
+            return False
+
+        page_size = _page_size(snapshot_path)
+        hashes = _page_hashes(snapshot_path, page_size)
+
+        # Decide whether this can be an incremental on top of the last backup
+        parent = None
+        chain_length = 0
+        if incremental:
+            manifests = _list_manifests(backup_dir)
+            if manifests:
+                last = manifests[-1]
+                chain_length = last.get("chain_length", 0)
+                if last["page_size"] == page_size and chain_length < FULL_BACKUP_EVERY:
+                    parent = last
+            if parent is None:
+                logger.info("No usable parent backup (or chain is full) - taking a full backup")
+
+        kind = "incremental" if parent else "full"
+        suffix = (".pages" if parent else ".db") + CODEC_SUFFIXES[codec]
+        output_path = backup_dir / f"{name}{suffix}"
+
+        try:
+            if parent:
+                parent_hashes = parent["page_hashes"]
+                changed = [
+                    i for i, h in enumerate(hashes)
+                    if i >= len(parent_hashes) or parent_hashes[i] != h
+                ]
+                _write_incremental(snapshot_path, output_path, codec, page_size, changed)
+            else:
+                changed = list(range(len(hashes)))
+                _write_full(snapshot_path, output_path, codec)
+        except Exception as e:
+            logger.error(f"Backup failed: {e}")
+            output_path.unlink(missing_ok=True)
+            return False
+
+        manifest = {
+            "name": name,
+            "kind": kind,
+            "parent": parent["name"] if parent else None,
+            "chain_length": chain_length + 1 if parent else 0,
+            "file": output_path.name,
+            "codec": codec,
+            "page_size": page_size,
+            "page_count": len(hashes),
+            "pages_written": len(changed),
+            "page_hashes": hashes,
+            "created_at": datetime.now().isoformat(),
+        }
+        with open(_manifest_path(backup_dir, name), "w") as f:
+            json.dump(manifest, f)
+
+    elapsed = time.perf_counter() - started
+    size_mb = output_path.stat().st_size / (1024 * 1024)
+    logger.info(
+        f"Backup created: {output_path} ({kind}, {len(changed)}/{len(hashes)} pages, "
+        f"{size_mb:.2f} MB, {elapsed:.2f}s)"
+    )
 
     # Rotate old backups
-    rotate_backups()
+    rotate_backups(backup_dir)
 
     return True
 
 
-def rotate_backups():
-    """Remove old backups, keeping only MAX_BACKUPS most recent."""
-    backups = sorted(BACKUP_DIR.glob("confluence_*.db"))
+def _materialize(backup_dir: Path, name: str, output_path: Path) -> Dict[str, Any]:
+    """Rebuild the database file for backup name (applying its chain) at output_path."""
+    chain = _chain_for(backup_dir, name)
+    target = chain[-1]
+    page_size = target["page_size"]
+
+    base = chain[0]
+    with _open_read(backup_dir / base["file"], base["codec"]) as src, open(output_path, "wb") as dst:
+        shutil.copyfileobj(src, dst, STREAM_CHUNK_BYTES)
 
-    if len(backups) > MAX_BACKUPS:
-        for old_backup in backups[:-MAX_BACKUPS]:
+    with open(output_path, "r+b") as dst:
+        for manifest in chain[1:]:
+            with _open_read(backup_dir / manifest["file"], manifest["codec"]) as src:
+                while True:
+                    header = _read_exact(src, PAGE_RECORD_HEADER.size)
+                    if not header:
+                        break
+                    (page_no,) = PAGE_RECORD_HEADER.unpack(header)
+                    dst.seek(page_no * page_size)
+                    dst.write(_read_exact(src, page_size))
+            dst.truncate(manifest["page_count"] * page_size)
+
+    return {"chain_length": len(chain), "page_count": target["page_count"]}
+
+
+def _restore_into(source_path: Path, db_path: Path):
+    """Copy a restored file into the live database through the backup API."""
+    src = sqlite3.connect(str(source_path))
+    dst = sqlite3.connect(str(db_path))
+    try:
+        with dst:
+            src.backup(dst, pages=BACKUP_PAGES_PER_STEP, sleep=BACKUP_STEP_SLEEP_SECONDS)
+    finally:
+        dst.close()
+        src.close()
+
+
+def rotate_backups(backup_dir: Optional[Path] = None):
+    """Remove old backups, keeping only the MAX_BACKUPS most recent chains."""
+    backup_dir = Path(backup_dir or BACKUP_DIR)
+
+    # Legacy uncompressed copies
+    legacy = sorted(backup_dir.glob("confluence_*.db"))
+    legacy = [p for p in legacy if not _manifest_path(backup_dir, p.stem).exists()]
+    if len(legacy) > MAX_BACKUPS:
+        for old_backup in legacy[:-MAX_BACKUPS]:
             logger.info(f"Removing old backup: {old_backup}")
             old_backup.unlink()
 
+    manifests = _list_manifests(backup_dir)
+    fulls = [m for m in manifests if m["kind"] == "full"]
+    if len(fulls) <= MAX_BACKUPS:
+        return
+
+    # Everything older than the oldest kept full backup belongs to dropped chains
+    oldest_kept = fulls[-MAX_BACKUPS]["name"]
+    for manifest in manifests:
+        if manifest["name"] >= oldest_kept:
+            break
+        logger.info(f"Removing old backup: {manifest['file']}")
+        (backup_dir / manifest["file"]).unlink(missing_ok=True)
+        _manifest_path(backup_dir, manifest["name"]).unlink(missing_ok=True)
 
-def list_backups():
+
+def list_backups(backup_dir: Optional[Path] = None):
     """List all existing backups."""
-    if not BACKUP_DIR.exists():
+    backup_dir = Path(backup_dir or BACKUP_DIR)
+    if not backup_dir.exists():
         logger.info("No backups directory found")
         return
 
-    backups = sorted(BACKUP_DIR.glob("confluence_*.db"))
+    manifests = _list_manifests(backup_dir)
+    legacy = [
+        p for p in sorted(backup_dir.glob("confluence_*.db"))
+        if not _manifest_path(backup_dir, p.stem).exists()
+    ]
+    postgres = sorted(p for p in backup_dir.glob("pg_*") if p.is_dir())
 
-    if not backups:
+    if not manifests and not legacy and not postgres:
         logger.info("No backups found")
         return
 
-    logger.info(f"Found {len(backups)} backup(s):")
-    for backup in backups:
-        size_mb = backup.stat().st_size / (1024 * 1024)
-        # Parse timestamp from filename
+    logger.info(f"Found {len(manifests) + len(legacy) + len(postgres)} backup(s):")
+    for manifest in manifests:
+        path = backup_dir / manifest["file"]
+        size_mb = path.stat().st_size / (1024 * 1024) if path.exists() else 0.0
         try:
-            ts_str = backup.stem.replace("confluence_", "")
-            ts = datetime.strptime(ts_str, "%Y%m%d_%H%M%S")
+            ts = datetime.fromisoformat(manifest["created_at"])
             age = datetime.now() - ts
             age_str = f"{age.days}d ago" if age.days > 0 else f"{age.seconds // 3600}h ago"
-        except ValueError:
+        except (KeyError, ValueError):
             age_str = "unknown age"
-
-        logger.info(f"  {backup.name} ({size_mb:.2f} MB) - {age_str}")
+        detail = manifest["kind"]
+        if manifest["kind"] == "incremental":
+            detail += f", {manifest['pages_written']}/{manifest['page_count']} pages"
+        logger.info(f"  {manifest['name']} ({detail}, {size_mb:.2f} MB) - {age_str}")
+    for backup in legacy:
+        size_mb = backup.stat().st_size / (1024 * 1024)
+        logger.info(f"  {backup.name} (legacy copy, {size_mb:.2f} MB)")
+    for backup in postgres:
+        logger.info(f"  {backup.name} (postgres COPY export)")
 
 
-def restore_backup(backup_name: str) -> bool:
+def restore_backup(backup_name: str, db_path: Optional[Path] = None,
+                   backup_dir: Optional[Path] = None) -> bool:
     """
     Restore database from backup.
 
     Args:
-        backup_name: Name of backup file (e.g., 'confluence_20251201_120000.db')
+        backup_name: Backup name (e.g., 'confluence_20251201_120000_000000'),
+            a legacy file name ('confluence_20251201_120000.db'), or a
+            PostgreSQL export directory ('pg_20251201_120000')
 
     Returns:
         True if restore successful, False otherwise
     """
-    backup_path = BACKUP_DIR / backup_name
-
-    if not backup_path.exists():
-        logger.error(f"Backup not found: {backup_path}")
+    db_path = Path(db_path or DB_PATH)
+    backup_dir = Path(backup_dir or BACKUP_DIR)
+
+    if backup_name.startswith("pg_"):
+        return asyncio.run(restore_postgres(backup_dir / backup_name))
+
+    # Accept the data file name as well as the manifest name
+    name = backup_name
+    for suffix in (".pages.zst", ".pages.gz", ".pages", ".db.zst", ".db.gz", ".db"):
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+            break
+
+    legacy_path = backup_dir / backup_name
+    has_manifest = _manifest_path(backup_dir, name).exists()
+    if not has_manifest and not legacy_path.exists():
+        logger.error(f"Backup not found: {backup_dir / backup_name}")
         return False
 
     # Create backup of current DB before restore
-    if DB_PATH.exists():
-        pre_restore = DB_PATH.with_suffix(".db.pre_restore")
-        shutil.copy2(DB_PATH, pre_restore)
+    if db_path.exists():
+        pre_restore = db_path.with_suffix(".db.pre_restore")
+        _online_snapshot(db_path, pre_restore)
         logger.info(f"Current DB backed up to: {pre_restore}")
 
     # Restore
     try:
-        shutil.copy2(backup_path, DB_PATH)
-        logger.info(f"Database restored from: {backup_path}")
+        with tempfile.TemporaryDirectory(dir=backup_dir) as tmp:
+            if has_manifest:
+                restored = Path(tmp) / "restored.db"
+                _materialize(backup_dir, name, restored)
+            else:
+                restored = legacy_path
+            _restore_into(restored, db_path)
+        logger.info(f"Database restored from: {backup_name}")
         return True
     except Exception as e:
         logger.error(f"Restore failed: {e}")
         return False
 
 
+def benchmark_restore(backup_name: Optional[str] = None,
+                      backup_dir: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """
+    Time a restore into a scratch file without touching the live database.
+
+    Measures decompression + chain application and the integrity check,
+    and reports throughput against the restored database size.
+
+    Args:
+        backup_name: Backup to restore (default: most recent)
+
+    Returns:
+        Dict of timings and sizes, or None if no backup is available
+    """
+    backup_dir = Path(backup_dir or BACKUP_DIR)
+    manifests = _list_manifests(backup_dir) if backup_dir.exists() else []
+    if not manifests:
+        logger.error("No backups found to benchmark")
+        return None
+
+    name = backup_name or manifests[-1]["name"]
+    chain = _chain_for(backup_dir, name)
+    stored_bytes = sum((backup_dir / m["file"]).stat().st_size for m in chain)
+
+    with tempfile.TemporaryDirectory(dir=backup_dir) as tmp:
+        restored = Path(tmp) / "restored.db"
+
+        started = time.perf_counter()
+        info = _materialize(backup_dir, name, restored)
+        materialize_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        conn = sqlite3.connect(str(restored))
+        try:
+            integrity = conn.execute("PRAGMA integrity_check").fetchone()[0]
+        finally:
+            conn.close()
+        check_seconds = time.perf_counter() - started
+
+        restored_bytes = restored.stat().st_size
+
+    mb = restored_bytes / (1024 * 1024)
+    result = {
+        "backup": name,
+        "chain_length": info["chain_length"],
+        "stored_mb": round(stored_bytes / (1024 * 1024), 3),
+        "restored_mb": round(mb, 3),
+        "compression_ratio": round(restored_bytes / stored_bytes, 2) if stored_bytes else None,
+        "restore_seconds": round(materialize_seconds, 3),
+        "restore_mb_per_second": round(mb / materialize_seconds, 1) if materialize_seconds else None,
+        "integrity_check_seconds": round(check_seconds, 3),
+        "integrity": integrity,
+    }
+    logger.info("Restore benchmark: " + ", ".join(f"{k}={v}" for k, v in result.items()))
+    return result
+
+
+# ============================================================================
+# PostgreSQL
+# ============================================================================
+
+def _postgres_url() -> Optional[str]:
+    url = os.getenv("DATABASE_URL", "")
+    if url.startswith("postgres://"):
+        url = url.replace("postgres://", "postgresql://", 1)
+    return url if url.startswith("postgresql") else None
+
+
+def _tables_in_fk_order() -> List[str]:
+    from backend.models import Base
+    return [table.name for table in Base.metadata.sorted_tables]
+
+
+def _serial_id_tables() -> set:
+    """Tables keyed by an autoincrement integer ``id`` (and so owning a sequence)."""
+    from sqlalchemy import Integer
+    from backend.models import Base
+
+    serial = set()
+    for table in Base.metadata.sorted_tables:
+        primary_key = list(table.primary_key.columns)
+        if [c.name for c in primary_key] == ["id"] and isinstance(primary_key[0].type, Integer):
+            serial.add(table.name)
+    return serial
+
+
+async def backup_postgres(backup_dir: Optional[Path] = None, compression: Optional[str] = None) -> bool:
+    """Stream every table with COPY TO STDOUT into per-table compressed CSV files."""
+    import asyncpg
+
+    backup_dir = Path(backup_dir or BACKUP_DIR)
+    codec = compression or default_codec()
+    target = backup_dir / f"pg_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    target.mkdir(parents=True, exist_ok=True)
+
+    conn = await asyncpg.connect(_postgres_url())
+    started = time.perf_counter()
+    try:
+        # One repeatable-read snapshot keeps all tables mutually consistent
+        async with conn.transaction(isolation="repeatable_read", readonly=True):
+            for table in _tables_in_fk_order():
+                exists = await conn.fetchval("SELECT to_regclass($1)", table)
+                if not exists:
+                    continue
+                path = target / f"{table}.csv{CODEC_SUFFIXES[codec]}"
+                with _open_write(path, codec) as out:
+                    async def write_chunk(chunk, out=out):
+                        out.write(chunk)
+                    await conn.copy_from_table(table, output=write_chunk, format="csv", header=True)
+                logger.info(f"Exported {table} -> {path.name}")
+    except Exception as e:
+        logger.error(f"PostgreSQL backup failed: {e}")
+        shutil.rmtree(target, ignore_errors=True)
+        return False
+    finally:
+        await conn.close()
+
+    with open(target / "manifest.json", "w") as f:
+        json.dump({"codec": codec, "created_at": datetime.now().isoformat()}, f)
+    logger.info(f"PostgreSQL backup created: {target} ({time.perf_counter() - started:.2f}s)")
+    return True
+
+
+async def restore_postgres(target: Path) -> bool:
+    """Reload a COPY export in foreign-key order inside one transaction."""
+    import asyncpg
+
+    if not (target / "manifest.json").exists():
+        logger.error(f"Backup not found: {target}")
+        return False
+    with open(target / "manifest.json") as f:
+        codec = json.load(f)["codec"]
+
+    tables = [
+        t for t in _tables_in_fk_order()
+        if (target / f"{t}.csv{CODEC_SUFFIXES[codec]}").exists()
+    ]
+
+    serial = _serial_id_tables()
+
+    conn = await asyncpg.connect(_postgres_url())
+    try:
+        async with conn.transaction():
+            await conn.execute(
+                "TRUNCATE " + ", ".join(f'"{t}"' for t in tables) + " RESTART IDENTITY CASCADE"
+            )
+            for table in tables:
+                path = target / f"{table}.csv{CODEC_SUFFIXES[codec]}"
+                with _open_read(path, codec) as src:
+                    await conn.copy_to_table(table, source=src, format="csv", header=True)
+                if table in serial:
+                    # Move the id sequence past the restored rows
+                    await conn.execute(
+                        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                        f"COALESCE((SELECT MAX(id) FROM \"{table}\"), 1))"
+                    )
+                logger.info(f"Restored {table}")
+        logger.info(f"Database restored from: {target}")
+        return True
+    except Exception as e:
+        logger.error(f"PostgreSQL restore failed: {e}")
+        return False
+    finally:
+        await conn.close()
+
+
 def main():
     """Main entry point."""
-    if len(sys.argv) > 1:
-        command = sys.argv[1].lower()
-
-        if command == "list":
-            list_backups()
-        elif command == "restore" and len(sys.argv) > 2:
-            backup_name = sys.argv[2]
-            success = restore_backup(backup_name)
-            sys.exit(0 if success else 1)
-        else:
-            print("Usage:")
-            print("  python scripts/backup_db.py           # Create backup")
-            print("  python scripts/backup_db.py list      # List backups")
-            print("  python scripts/backup_db.py restore <backup_name>  # Restore")
-            sys.exit(1)
+    parser = argparse.ArgumentParser(description="Database backup and restore")
+    parser.add_argument("command", nargs="?", default="backup",
+                        choices=["backup", "list", "restore", "benchmark"])
+    parser.add_argument("backup_name", nargs="?", help="Backup to restore or benchmark")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only store pages changed since the previous backup (SQLite)")
+    parser.add_argument("--compress", choices=list(CODEC_SUFFIXES), default=None,
+                        help="Compression codec (default: zstd if installed, else gzip)")
+    args = parser.parse_args()
+
+    if args.command == "list":
+        list_backups()
+    elif args.command == "restore":
+        if not args.backup_name:
+            parser.error("restore requires a backup name")
+        success = restore_backup(args.backup_name)
+        sys.exit(0 if success else 1)
+    elif args.command == "benchmark":
+        result = benchmark_restore(args.backup_name)
+        sys.exit(0 if result and result["integrity"] == "ok" else 1)
     else:
-        success = backup_database()
+        if _postgres_url():
+            success = asyncio.run(backup_postgres(compression=args.compress))
+        else:
+            success = backup_database(compression=args.compress, incremental=args.incremental)
         sys.exit(0 if success else 1)
 
 
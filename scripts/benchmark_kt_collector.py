@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+KT Technical Collector Benchmark
+
+Replays the recorded blog in tests/fixtures/kt_blog from a local HTTP
+server with simulated network latency and times KTTechnicalCollector:
+
+- sequential: one post and one image at a time (the old request pattern)
+- concurrent: default post / image concurrency over the pooled session
+- unchanged rerun: second conditional run, every post answers 304
+
+Each run also reports the worst event-loop stall seen by a ticker task,
+showing that collection no longer blocks the loop.
+
+Usage:
+    python scripts/benchmark_kt_collector.py
+    python scripts/benchmark_kt_collector.py --latency 0.1 --image-kb 400
+    python scripts/benchmark_kt_collector.py --rounds 3 --json
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+logger = logging.getLogger(__name__)
+
+FIXTURE_DIR = project_root / "tests" / "fixtures" / "kt_blog"
+SESSION_COOKIE = "wordpress_logged_in_kt"
+LAST_MODIFIED = formatdate(1763251200, usegmt=True)  # 2025-11-16
+PNG_HEADER = b"\x89PNG\r\n\x1a\n"
+
+
+# ============================================================================
+# Fixture server
+# ============================================================================
+
+class RecordedBlogHandler(BaseHTTPRequestHandler):
+    """Serves the recorded blog; every request is delayed by server.latency."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _count(self, kind: str):
+        with self.server.lock:
+            self.server.counts[kind] = self.server.counts.get(kind, 0) + 1
+
+    def _send(self, status: int, body: bytes = b"", content_type: str = "text/html; charset=UTF-8",
+              headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _logged_in(self) -> bool:
+        return f"{SESSION_COOKIE}=" in self.headers.get("Cookie", "")
+
+    def do_GET(self):
+        time.sleep(self.server.latency)
+        path = self.path.split("?")[0]
+
+        if path == "/login":
+            self._count("login_page")
+            return self._send(200, (FIXTURE_DIR / "login.html").read_bytes())
+
+        if not self._logged_in():
+            return self._send(302, headers={"Location": "/login"})
+
+        if path == "/account/":
+            return self._send(200, (FIXTURE_DIR / "account.html").read_bytes())
+
+        if path == "/blog-feed/":
+            self._count("feed")
+            return self._send(200, (FIXTURE_DIR / "blog-feed.html").read_bytes())
+
+        if path.startswith("/wp-content/uploads/"):
+            self._count("image")
+            with self.server.lock:
+                self.server.images_in_flight += 1
+                self.server.max_images_in_flight = max(self.server.max_images_in_flight,
+                                                       self.server.images_in_flight)
+            try:
+                return self._send_image()
+            finally:
+                with self.server.lock:
+                    self.server.images_in_flight -= 1
+
+        page = FIXTURE_DIR / "posts" / f"{path.strip('/')}.html"
+        if path.count("/") == 2 and page.exists():
+            body = page.read_bytes()
+            etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+            if self.headers.get("If-None-Match") == etag:
+                self._count("post_not_modified")
+                return self._send(304, headers={"ETag": etag})
+            self._count("post")
+            return self._send(200, body, headers={"ETag": etag, "Last-Modified": LAST_MODIFIED})
+
+        return self._send(404, b"Not found")
+
+    def do_POST(self):
+        time.sleep(self.server.latency)
+        length = int(self.headers.get("Content-Length", 0))
+        form = parse_qs(self.rfile.read(length).decode())
+        if self.path != "/login" or not form.get("log") or not form.get("pwd") or not form.get("_wpnonce"):
+            return self._send(200, (FIXTURE_DIR / "login.html").read_bytes())
+        self._count("login")
+        return self._send(302, headers={
+            "Location": "/account/",
+            "Set-Cookie": f"{SESSION_COOKIE}=replay-session; Path=/; HttpOnly",
+        })
+
+    def _send_image(self):
+        """Generated PNG body of server.image_bytes, written in chunks."""
+        size = self.server.image_bytes
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(size))
+        self.end_headers()
+        self.wfile.write(PNG_HEADER)
+        remaining = size - len(PNG_HEADER)
+        chunk = b"\0" * 65536
+        while remaining > 0:
+            self.wfile.write(chunk[:remaining])
+            remaining -= len(chunk)
+
+
+def start_fixture_server(latency: float = 0.05, image_bytes: int = 200 * 1024) -> Tuple[ThreadingHTTPServer, str]:
+    """Start the replay server on a free localhost port; returns (server, base_url)."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RecordedBlogHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.image_bytes = image_bytes
+    server.counts = {}
+    server.images_in_flight = 0
+    server.max_images_in_flight = 0
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://localhost:{server.server_address[1]}"
+
+
+# ============================================================================
+# Benchmark
+# ============================================================================
+
+async def _timed_collect(collector) -> Dict[str, Any]:
+    """Run collect() while a ticker measures the worst event-loop stall."""
+    stall = 0.0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal stall
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.005)
+            stall = max(stall, time.perf_counter() - start - 0.005)
+
+    tick = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    try:
+        items = await collector.collect()
+    finally:
+        done.set()
+        await tick
+    return {
+        "seconds": round(time.perf_counter() - start, 3),
+        "max_loop_stall_ms": round(stall * 1000, 1),
+        "items": len(items),
+        **collector.stats,
+    }
+
+
+def run_benchmark(latency: float = 0.05, image_kb: int = 200, rounds: int = 1) -> Dict[str, Any]:
+    """
+    Time the collector against the fixture server.
+
+    Runs in a temporary working directory (downloads, cookies and the
+    HTTP validator cache are written relative to it).
+
+    Returns:
+        {"latency", "image_kb", "scenarios": {name: best-of-rounds result}}
+    """
+    from collectors.kt_technical import KTTechnicalCollector
+
+    server, base_url = start_fixture_server(latency=latency, image_bytes=image_kb * 1024)
+    cwd = os.getcwd()
+    scenarios = {
+        "sequential": {"post_concurrency": 1, "image_concurrency": 1, "conditional": False},
+        "concurrent": {"conditional": False},
+        "unchanged rerun": {"conditional": True},
+    }
+    results: Dict[str, Any] = {}
+
+    try:
+        for name, options in scenarios.items():
+            best = None
+            for _ in range(rounds):
+                with tempfile.TemporaryDirectory() as workdir:
+                    os.chdir(workdir)
+
+                    def make():
+                        return KTTechnicalCollector("bench@example.com", "bench", base_url=base_url, **options)
+
+                    if name == "unchanged rerun":
+                        first = make()
+                        asyncio.run(first.collect())
+                        first.commit_validators()  # as if the posts were saved
+                    result = asyncio.run(_timed_collect(make()))
+                    os.chdir(cwd)
+                if best is None or result["seconds"] < best["seconds"]:
+                    best = result
+            results[name] = best
+    finally:
+        os.chdir(cwd)
+        server.shutdown()
+        server.server_close()
+
+    return {"latency": latency, "image_kb": image_kb, "scenarios": results}
+
+
+def _print_report(report: Dict[str, Any]):
+    print(f"\nKT Technical collector: {report['latency'] * 1000:.0f} ms latency, {report['image_kb']} KB images")
+    print(f"{'scenario':<18}{'seconds':>9}{'posts':>7}{'unchanged':>11}{'images':>8}{'loop stall ms':>15}")
+    sequential = report["scenarios"]["sequential"]["seconds"]
+    for name, result in report["scenarios"].items():
+        speedup = f"  ({sequential / result['seconds']:.1f}x)" if result["seconds"] else ""
+        print(f"{name:<18}{result['seconds']:>9.2f}{result['posts_collected']:>7}{result['posts_unchanged']:>11}"
+              f"{result['images_downloaded']:>8}{result['max_loop_stall_ms']:>15.1f}{speedup}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark KTTechnicalCollector against a recorded blog")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds added to every request (default 0.05)")
+    parser.add_argument("--image-kb", type=int, default=200, help="Size of each chart image (default 200)")
+    parser.add_argument("--rounds", type=int, default=1, help="Runs per scenario, best kept")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    report = run_benchmark(latency=args.latency, image_kb=args.image_kb, rounds=args.rounds)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
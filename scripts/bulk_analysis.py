@@ -0,0 +1,72 @@
+"""
+Bulk Analysis Backfills
+
+Runs classification, confluence scoring or symbol level extraction over
+many items as asynchronous message batches, polls until the batches end,
+and writes the results back to analyzed_content / confluence_scores /
+symbol_levels. Use for backfills; the live pipeline still calls Claude
+per item.
+
+Usage:
+    python scripts/bulk_analysis.py classify --source discord
+    python scripts/bulk_analysis.py score --days 30 --rescore
+    python scripts/bulk_analysis.py symbols --source kt_technical --days 90
+    python scripts/bulk_analysis.py score --limit 50 --local   # synchronous calls, no batch API
+"""
+
+import argparse
+import json
+import logging
+
+from backend.models import SessionLocal
+from backend.services.bulk_analysis import bulk_classify, bulk_extract_symbols, bulk_score
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _agent(job: str):
+    if job == "classify":
+        from agents.content_classifier import ContentClassifierAgent
+        return ContentClassifierAgent()
+    if job == "score":
+        from agents.confluence_scorer import ConfluenceScorerAgent
+        return ConfluenceScorerAgent()
+    from agents.symbol_level_extractor import SymbolLevelExtractor
+    return SymbolLevelExtractor()
+
+
+def run(args):
+    """Run one bulk job in its own session."""
+    from agents.bulk_runner import LocalBatchTransport
+
+    agent = _agent(args.job)
+    transport = LocalBatchTransport(lambda params: agent.client.messages.create(**params)) if args.local else None
+    runner_options = {"poll_interval": args.poll_interval} if args.poll_interval else {}
+    db = SessionLocal()
+
+    try:
+        if args.job == "classify":
+            summary = bulk_classify(db, agent, transport, source=args.source, limit=args.limit, **runner_options)
+        elif args.job == "score":
+            summary = bulk_score(db, agent, transport, days=args.days or 30, source=args.source,
+                                 rescore=args.rescore, limit=args.limit, **runner_options)
+        else:
+            summary = bulk_extract_symbols(db, agent, transport, days=args.days, source=args.source,
+                                           limit=args.limit, **runner_options)
+        logger.info(f"Bulk {args.job} complete: {json.dumps(summary)}")
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run analysis backfills as message batches")
+    parser.add_argument("job", choices=["classify", "score", "symbols"])
+    parser.add_argument("--source", default=None, help="Only this source name")
+    parser.add_argument("--days", type=int, default=None, help="Window in days (score: default 30)")
+    parser.add_argument("--limit", type=int, default=None, help="At most N items")
+    parser.add_argument("--rescore", action="store_true", help="score: replace existing scores")
+    parser.add_argument("--poll-interval", type=float, default=None, help="Seconds between batch status checks")
+    parser.add_argument("--local", action="store_true", help="Answer requests with synchronous calls")
+    run(parser.parse_args())
@@ -1,32 +1,57 @@
 """
 SQLite to PostgreSQL Migration Script (PRD-035)
 
-Exports data from SQLite and imports to PostgreSQL for production deployment.
+Streams data from SQLite into PostgreSQL for production deployment.
 
 Usage:
-    # Export SQLite data to JSON files
+    # Stream SQLite directly into PostgreSQL (resumable)
+    python scripts/migrate_to_postgres.py --migrate
+
+    # Export SQLite data to JSON Lines files
     python scripts/migrate_to_postgres.py --export
 
-    # Import JSON data to PostgreSQL
+    # Import JSON Lines data to PostgreSQL
     python scripts/migrate_to_postgres.py --import
 
-    # Verify migration (compare row counts)
+    # Verify migration (row counts + checksums)
     python scripts/migrate_to_postgres.py --verify
 
-    # Full migration (export + import + verify)
+    # Full migration (migrate + verify)
     python scripts/migrate_to_postgres.py --full
 
+    # Discard checkpoint and start over (truncates target tables)
+    python scripts/migrate_to_postgres.py --migrate --restart
+
+How it works:
+    - Rows are read in keyset-paginated batches (WHERE id > ? ORDER BY id
+      LIMIT ?) so memory stays flat regardless of table size.
+    - Batches are written with COPY FROM STDIN (asyncpg binary COPY).
+    - Tables whose foreign-key parents are already migrated run in
+      parallel (up to --parallel at a time).
+    - Each committed batch advances a checkpoint file; an interrupted run
+      resumes from max(checkpoint, highest id already in PostgreSQL).
+    - A per-table checksum of the source rows is accumulated while
+      streaming; --verify compares it with the same checksum computed
+      inside PostgreSQL, so no rows are read back.
+
 Requirements:
     - SQLite database at database/confluence.db (local)
     - PostgreSQL DATABASE_URL environment variable set (for import)
 """
 
 import argparse
+import asyncio
+import hashlib
 import json
+import math
 import os
+import sqlite3
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -41,22 +66,513 @@ TABLES_IN_ORDER = [
     "raw_content",
     "analyzed_content",
     "confluence_scores",
+    "ticker_mentions",
+    "theme_mentions",
     "themes",
     "theme_evidence",
     "bayesian_updates",
     "syntheses",
     "service_heartbeats",
-    "collection_runs"
+    "collection_runs",
+    "synthesis_feedback",
+    "theme_feedback",
+    "synthesis_quality_scores",
+    "quality_daily_rollups",
+    "symbol_levels",
+    "symbol_states",
+    "transcription_status",
+    "source_health",
+    "alerts",
+    "api_usage",
+    "api_token_usage",
+    "content_daily_rollups",
+    "theme_daily_rollups",
+    "jobs",
 ]
 
 EXPORT_DIR = Path("migration_export")
+CHECKPOINT_PATH = Path(os.getenv("MIGRATION_CHECKPOINT", "migration_checkpoint.json"))
+
+BATCH_SIZE = int(os.getenv("MIGRATION_BATCH_SIZE", "2000"))
+PARALLEL_TABLES = int(os.getenv("MIGRATION_PARALLEL_TABLES", "4"))
+
+NULL_TOKEN = "\\N"
+
+
+# ============================================================================
+# Schema helpers
+# ============================================================================
 
+def _sqlite_path() -> str:
+    return os.getenv("SQLITE_PATH", "database/confluence.db")
 
-def export_sqlite_data():
-    """Export all SQLite data to JSON files."""
-    import sqlite3
 
-    sqlite_path = os.getenv("SQLITE_PATH", "database/confluence.db")
+def _postgres_url() -> Optional[str]:
+    postgres_url = os.getenv("DATABASE_URL")
+    if not postgres_url:
+        return None
+    # Fix Railway URL format
+    if postgres_url.startswith("postgres://"):
+        postgres_url = postgres_url.replace("postgres://", "postgresql://", 1)
+    return postgres_url
+
+
+def _asyncpg_dsn(url: str) -> str:
+    """asyncpg doesn't understand SQLAlchemy driver suffixes."""
+    return "postgresql://" + url.split("://", 1)[1]
+
+
+def _orm_tables() -> Dict[str, Any]:
+    from backend.models import Base
+    return {name: table for name, table in Base.metadata.tables.items() if name in TABLES_IN_ORDER}
+
+
+def _column_kinds(table) -> Dict[str, str]:
+    """Map column name -> kind used for value conversion and checksums."""
+    from sqlalchemy import Boolean, DateTime, Float, Integer
+
+    kinds = {}
+    for column in table.columns:
+        if isinstance(column.type, Boolean):
+            kinds[column.name] = "bool"
+        elif isinstance(column.type, DateTime):
+            kinds[column.name] = "datetime"
+        elif isinstance(column.type, Float):
+            kinds[column.name] = "float"
+        elif isinstance(column.type, Integer):
+            kinds[column.name] = "int"
+        else:
+            kinds[column.name] = "text"
+    return kinds
+
+
+def _has_serial_id(table) -> bool:
+    """True if the table is keyed by an autoincrement integer ``id``."""
+    from sqlalchemy import Integer
+
+    primary_key = list(table.primary_key.columns)
+    return [c.name for c in primary_key] == ["id"] and isinstance(primary_key[0].type, Integer)
+
+
+def migration_waves(tables: Sequence[str]) -> List[List[str]]:
+    """
+    Group tables into waves: every table's FK parents are in an earlier wave.
+
+    Tables within a wave are independent and can be copied in parallel.
+    """
+    orm_tables = _orm_tables()
+    remaining = [t for t in tables if t in orm_tables]
+    done: set = set()
+    waves = []
+    while remaining:
+        wave = []
+        for name in remaining:
+            parents = {
+                fk.column.table.name for fk in orm_tables[name].foreign_keys
+            } - {name}
+            if parents <= done or not (parents & set(remaining)):
+                wave.append(name)
+        if not wave:
+            # Cycle - fall back to declared order for what's left
+            wave = [remaining[0]]
+        waves.append(wave)
+        done.update(wave)
+        remaining = [t for t in remaining if t not in wave]
+    return waves
+
+
+# ============================================================================
+# Value conversion and checksums
+# ============================================================================
+
+def _convert(value: Any, kind: str) -> Any:
+    """Convert a SQLite/JSON value to the Python type asyncpg expects."""
+    if value is None:
+        return None
+    if kind == "text":
+        return value if isinstance(value, str) else str(value)
+    if value == "":
+        return None
+    if kind == "int":
+        return int(value)
+    if kind == "float":
+        return float(value)
+    if kind == "bool":
+        if isinstance(value, str):
+            return value.strip().lower() in ("1", "true", "t", "yes")
+        return bool(value)
+    if kind == "datetime":
+        if isinstance(value, datetime):
+            dt = value
+        else:
+            dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+        return dt
+    return value
+
+
+def _float_text(value: float) -> str:
+    """
+    PostgreSQL 12+ float8 output text (shortest round-trip digits).
+
+    Both checksums hash this exact representation instead of rounding in
+    two engines with different rules; zero is written "0" on both sides so
+    -0.0 matches.
+    """
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "Infinity" if value > 0 else "-Infinity"
+    if value == 0:
+        return "0"
+    decimal = Decimal(repr(value)).normalize()
+    sign, digits, _ = decimal.as_tuple()
+    exponent = decimal.adjusted()
+    if -4 <= exponent < 15:
+        return format(decimal, "f")
+    mantissa = "".join(map(str, digits))
+    if len(mantissa) > 1:
+        mantissa = f"{mantissa[0]}.{mantissa[1:]}"
+    return f"{'-' if sign else ''}{mantissa}e{'+' if exponent >= 0 else '-'}{abs(exponent):02d}"
+
+
+def _canonical(value: Any, kind: str) -> str:
+    """Text form of a converted value; mirrors _canonical_sql()."""
+    if value is None:
+        return NULL_TOKEN
+    if kind == "bool":
+        return "true" if value else "false"
+    if kind == "float":
+        return _float_text(value)
+    if kind == "datetime":
+        return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+    return str(value)
+
+
+def _canonical_sql(column: str, kind: str) -> str:
+    """PostgreSQL expression producing the same text as _canonical()."""
+    col = f'"{column}"'
+    if kind == "bool":
+        expr = f"CASE WHEN {col} THEN 'true' ELSE 'false' END"
+    elif kind == "float":
+        # Shortest round-trip text (extra_float_digits >= 1, the PG 12+ default)
+        expr = f"CASE WHEN {col} = 0 THEN '0' ELSE {col}::float8::text END"
+    elif kind == "datetime":
+        expr = f"to_char({col}, 'YYYY-MM-DD HH24:MI:SS.US')"
+    else:
+        expr = f"{col}::text"
+    return f"CASE WHEN {col} IS NULL THEN '{NULL_TOKEN}' ELSE {expr} END"
+
+
+def row_checksum(row: Sequence[Any], kinds: Sequence[str]) -> int:
+    """60-bit hash of a converted row; table checksum is the sum of these."""
+    text = "|".join(_canonical(v, k) for v, k in zip(row, kinds))
+    return int(hashlib.md5(text.encode("utf-8")).hexdigest()[:15], 16)
+
+
+async def postgres_checksum(conn, table: str, columns: Sequence[str], kinds: Sequence[str]) -> Tuple[int, int]:
+    """Row count and checksum computed entirely inside PostgreSQL."""
+    parts = " || '|' || ".join(_canonical_sql(c, k) for c, k in zip(columns, kinds))
+    row = await conn.fetchrow(
+        f"SELECT COUNT(*) AS n, "
+        f"COALESCE(SUM(('x' || substr(md5({parts}), 1, 15))::bit(60)::bigint), 0) AS checksum "
+        f'FROM "{table}"'
+    )
+    return row["n"], int(row["checksum"])
+
+
+# ============================================================================
+# Sources (keyset-paginated)
+# ============================================================================
+
+def _sqlite_columns(conn: sqlite3.Connection, table: str) -> List[str]:
+    return [r[1] for r in conn.execute(f'PRAGMA table_info("{table}")').fetchall()]
+
+
+def iter_sqlite_batches(conn: sqlite3.Connection, table: str, columns: Sequence[str],
+                        after_id: int = 0, batch_size: int = BATCH_SIZE,
+                        until_id: Optional[int] = None) -> Iterator[List[tuple]]:
+    """Yield batches of rows ordered by id, using keyset pagination."""
+    column_sql = ", ".join(f'"{c}"' for c in columns)
+    id_index = list(columns).index("id")
+    upper = "" if until_id is None else " AND id <= ?"
+    last_id = after_id
+    while True:
+        params = (last_id,) + (() if until_id is None else (until_id,)) + (batch_size,)
+        rows = conn.execute(
+            f'SELECT {column_sql} FROM "{table}" WHERE id > ?{upper} ORDER BY id LIMIT ?',
+            params
+        ).fetchall()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][id_index]
+
+
+def iter_jsonl_batches(path: Path, columns: Sequence[str], after_id: int = 0,
+                       batch_size: int = BATCH_SIZE) -> Iterator[List[tuple]]:
+    """Yield batches of rows from an exported JSON Lines file."""
+    batch = []
+    with open(path) as f:
+        for line in f:
+            record = json.loads(line)
+            if after_id and record.get("id") is not None and record["id"] <= after_id:
+                continue
+            batch.append(tuple(record.get(c) for c in columns))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+# ============================================================================
+# Checkpointing
+# ============================================================================
+
+class Checkpoint:
+    """Per-table progress persisted after every committed batch."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path = path or CHECKPOINT_PATH
+        self.tables: Dict[str, Dict[str, Any]] = {}
+        if path.exists():
+            with open(path) as f:
+                self.tables = json.load(f).get("tables", {})
+
+    @property
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def get(self, table: str) -> Dict[str, Any]:
+        return self.tables.setdefault(
+            table, {"last_id": 0, "rows": 0, "checksum": 0, "done": False}
+        )
+
+    def save(self):
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump({"tables": self.tables, "updated_at": datetime.utcnow().isoformat()}, f)
+        os.replace(tmp, self.path)
+
+    def reset(self):
+        self.tables = {}
+        if self.path.exists():
+            self.path.unlink()
+
+
+# ============================================================================
+# Migration
+# ============================================================================
+
+async def _prepare_target(postgres_url: str):
+    """Create tables using ORM models."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from backend.models import Base
+
+    engine = create_async_engine(postgres_url.replace("postgresql://", "postgresql+asyncpg://", 1))
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    finally:
+        await engine.dispose()
+    print("Created database tables")
+
+
+async def _migrate_table(pool, table: str, open_source, checkpoint: Checkpoint,
+                         batch_size: int) -> int:
+    """Copy one table in keyset batches, advancing the checkpoint per batch."""
+    orm_table = _orm_tables()[table]
+    kinds_by_column = _column_kinds(orm_table)
+    state = checkpoint.get(table)
+    if state["done"]:
+        print(f"Skipped {table}: already migrated ({state['rows']} rows)")
+        return 0
+
+    source = open_source()
+    try:
+        source_columns = source.columns(table)
+        if source_columns is None:
+            print(f"Skipped {table}: not in source")
+            state["done"] = True
+            checkpoint.save()
+            return 0
+        columns = [c for c in orm_table.columns.keys() if c in source_columns]
+        kinds = [kinds_by_column[c] for c in columns]
+        id_index = columns.index("id")
+        started = time.perf_counter()
+
+        if not _has_serial_id(orm_table):
+            copied = await _copy_table_once(pool, table, source, columns, kinds, state, batch_size)
+            checkpoint.save()
+            elapsed = time.perf_counter() - started
+            print(f"Imported {table}: {copied} rows ({elapsed:.1f}s, single pass)")
+            return copied
+
+        async with pool.acquire() as conn:
+            # Batches commit atomically, so the target's max id is the true high-water mark
+            target_max = await conn.fetchval(f'SELECT COALESCE(MAX(id), 0) FROM "{table}"')
+            if target_max > state["last_id"]:
+                # Crashed after a commit but before the checkpoint write -
+                # fold the already-copied rows into the running checksum
+                for rows in source.batches(table, columns, state["last_id"], batch_size, until_id=target_max):
+                    converted = [tuple(_convert(v, k) for v, k in zip(r, kinds)) for r in rows]
+                    state["rows"] += len(converted)
+                    state["checksum"] += sum(row_checksum(r, kinds) for r in converted)
+                state["last_id"] = target_max
+
+            copied = 0
+            batches = source.batches(table, columns, state["last_id"], batch_size)
+            while True:
+                rows = await asyncio.to_thread(next, batches, None)
+                if rows is None:
+                    break
+                converted = [tuple(_convert(v, k) for v, k in zip(r, kinds)) for r in rows]
+                async with conn.transaction():
+                    await conn.copy_records_to_table(table, records=converted, columns=columns)
+                state["last_id"] = converted[-1][id_index]
+                state["rows"] += len(converted)
+                state["checksum"] += sum(row_checksum(r, kinds) for r in converted)
+                checkpoint.save()
+                copied += len(converted)
+
+            # Reset sequence for auto-increment
+            await conn.execute(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f'COALESCE((SELECT MAX(id) FROM "{table}"), 1))'
+            )
+    finally:
+        source.close()
+
+    state["done"] = True
+    checkpoint.save()
+    elapsed = time.perf_counter() - started
+    print(f"Imported {table}: {copied} rows ({elapsed:.1f}s, {state['rows']} total)")
+    return copied
+
+
+async def _copy_table_once(pool, table: str, source, columns: Sequence[str], kinds: Sequence[str],
+                           state: Dict[str, Any], batch_size: int) -> int:
+    """
+    Copy a table without an integer id in one transaction.
+
+    There is no numeric high-water mark to resume from (jobs are keyed by
+    uuid hex), so an interrupted copy rolls back entirely and the next run
+    starts the table over. Such tables are small.
+    """
+    rows_copied, checksum = 0, 0
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.execute(f'DELETE FROM "{table}"')
+            # after_id=0 sorts before any text id in SQLite, so this reads every row
+            for rows in source.batches(table, columns, 0, batch_size):
+                converted = [tuple(_convert(v, k) for v, k in zip(r, kinds)) for r in rows]
+                await conn.copy_records_to_table(table, records=converted, columns=columns)
+                rows_copied += len(converted)
+                checksum += sum(row_checksum(r, kinds) for r in converted)
+    state.update(rows=rows_copied, checksum=checksum, done=True)
+    return rows_copied
+
+
+class _SqliteSource:
+    """Keyset-paginated reader over the local SQLite file (one per task)."""
+
+    def __init__(self, path: str):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+
+    def columns(self, table: str) -> Optional[List[str]]:
+        return _sqlite_columns(self.conn, table) or None
+
+    def batches(self, table, columns, after_id, batch_size, until_id=None):
+        return iter_sqlite_batches(self.conn, table, columns, after_id, batch_size, until_id)
+
+    def close(self):
+        self.conn.close()
+
+
+class _JsonlSource:
+    """Reader over files written by --export."""
+
+    def columns(self, table: str) -> Optional[List[str]]:
+        path = EXPORT_DIR / f"{table}.jsonl"
+        if not path.exists():
+            return None
+        with open(path) as f:
+            first = f.readline()
+        return list(json.loads(first).keys()) if first else []
+
+    def batches(self, table, columns, after_id, batch_size, until_id=None):
+        for batch in iter_jsonl_batches(EXPORT_DIR / f"{table}.jsonl", columns, after_id, batch_size):
+            if until_id is not None:
+                id_index = list(columns).index("id")
+                batch = [r for r in batch if r[id_index] <= until_id]
+                if not batch:
+                    return
+            yield batch
+
+    def close(self):
+        pass
+
+
+async def _run_migration(open_source, restart: bool = False, batch_size: int = BATCH_SIZE,
+                         parallel: int = PARALLEL_TABLES) -> bool:
+    import asyncpg
+
+    postgres_url = _postgres_url()
+    if not postgres_url:
+        print("DATABASE_URL environment variable not set")
+        return False
+
+    await _prepare_target(postgres_url)
+
+    checkpoint = Checkpoint()
+    fresh = restart or not checkpoint.exists
+    if restart:
+        checkpoint.reset()
+
+    pool = await asyncpg.create_pool(_asyncpg_dsn(postgres_url), min_size=1, max_size=parallel)
+    try:
+        if fresh:
+            # Clear existing data (for idempotent migration)
+            tables = ", ".join(f'"{t}"' for t in TABLES_IN_ORDER if t in _orm_tables())
+            async with pool.acquire() as conn:
+                await conn.execute(f"TRUNCATE {tables} RESTART IDENTITY CASCADE")
+            checkpoint.save()
+
+        semaphore = asyncio.Semaphore(parallel)
+
+        async def run(table):
+            async with semaphore:
+                return await _migrate_table(pool, table, open_source, checkpoint, batch_size)
+
+        started = time.perf_counter()
+        total_rows = 0
+        for wave in migration_waves(TABLES_IN_ORDER):
+            results = await asyncio.gather(*(run(t) for t in wave))
+            total_rows += sum(results)
+    finally:
+        await pool.close()
+
+    print(f"\nTotal imported: {total_rows} rows in {time.perf_counter() - started:.1f}s")
+    return True
+
+
+def migrate_streaming(restart: bool = False, batch_size: int = BATCH_SIZE,
+                      parallel: int = PARALLEL_TABLES) -> bool:
+    """Stream SQLite tables straight into PostgreSQL."""
+    sqlite_path = _sqlite_path()
+    if not Path(sqlite_path).exists():
+        print(f"SQLite database not found: {sqlite_path}")
+        return False
+    return asyncio.run(_run_migration(
+        lambda: _SqliteSource(sqlite_path), restart, batch_size, parallel
+    ))
+
+
+def export_sqlite_data(batch_size: int = BATCH_SIZE):
+    """Export all SQLite data to JSON Lines files, one batch at a time."""
+    sqlite_path = _sqlite_path()
     if not Path(sqlite_path).exists():
         print(f"SQLite database not found: {sqlite_path}")
         return False
@@ -64,41 +580,26 @@ def export_sqlite_data():
     EXPORT_DIR.mkdir(exist_ok=True)
 
     conn = sqlite3.connect(sqlite_path)
-    conn.row_factory = sqlite3.Row
 
     total_rows = 0
 
     for table in TABLES_IN_ORDER:
-        try:
-            cursor = conn.execute(f"SELECT * FROM {table}")
-            rows = [dict(row) for row in cursor.fetchall()]
-
-            # Convert datetime strings to ISO format
-            for row in rows:
-                for key, value in row.items():
-                    if isinstance(value, str) and "T" in value:
-                        # Already ISO format
-                        pass
-                    elif key.endswith("_at") and value:
-                        # Normalize datetime format
-                        try:
-                            dt = datetime.fromisoformat(value.replace(" ", "T"))
-                            row[key] = dt.isoformat()
-                        except ValueError:
-                            pass
-
-            export_path = EXPORT_DIR / f"{table}.json"
-            with open(export_path, "w") as f:
-                json.dump(rows, f, indent=2, default=str)
-
-            print(f"Exported {table}: {len(rows)} rows")
-            total_rows += len(rows)
-
-        except sqlite3.OperationalError as e:
-            if "no such table" in str(e):
-                print(f"Skipped {table}: table does not exist")
-            else:
-                print(f"Error exporting {table}: {e}")
+        columns = _sqlite_columns(conn, table)
+        if not columns:
+            print(f"Skipped {table}: table does not exist")
+            continue
+
+        export_path = EXPORT_DIR / f"{table}.jsonl"
+        count = 0
+        with open(export_path, "w") as f:
+            for rows in iter_sqlite_batches(conn, table, columns, batch_size=batch_size):
+                for row in rows:
+                    f.write(json.dumps(dict(zip(columns, row)), default=str))
+                    f.write("\n")
+                count += len(rows)
+
+        print(f"Exported {table}: {count} rows")
+        total_rows += count
 
     conn.close()
     print(f"\nTotal exported: {total_rows} rows")
@@ -106,94 +607,90 @@ def export_sqlite_data():
     return True
 
 
-def import_to_postgres():
-    """Import JSON data to PostgreSQL."""
-    from sqlalchemy import create_engine, text
-    from sqlalchemy.orm import sessionmaker
-
-    postgres_url = os.getenv("DATABASE_URL")
-    if not postgres_url:
-        print("DATABASE_URL environment variable not set")
-        return False
-
-    # Fix Railway URL format
-    if postgres_url.startswith("postgres://"):
-        postgres_url = postgres_url.replace("postgres://", "postgresql://", 1)
-
+def import_to_postgres(restart: bool = False, batch_size: int = BATCH_SIZE,
+                       parallel: int = PARALLEL_TABLES):
+    """Import exported JSON Lines data to PostgreSQL."""
     if not EXPORT_DIR.exists():
         print(f"Export directory not found: {EXPORT_DIR}")
         print("Run with --export first")
         return False
+    return asyncio.run(_run_migration(_JsonlSource, restart, batch_size, parallel))
 
-    engine = create_engine(postgres_url)
-    Session = sessionmaker(bind=engine)
-
-    # Create tables using ORM models
-    from backend.models import Base
-    Base.metadata.create_all(bind=engine)
-    print("Created database tables")
-
-    total_rows = 0
 
-    with Session() as session:
-        for table in TABLES_IN_ORDER:
-            export_path = EXPORT_DIR / f"{table}.json"
-            if not export_path.exists():
-                print(f"Skipped {table}: no export file")
-                continue
+# ============================================================================
+# Verification
+# ============================================================================
 
-            with open(export_path) as f:
-                rows = json.load(f)
+def _source_checksum(conn: sqlite3.Connection, table: str, columns: Sequence[str],
+                     kinds: Sequence[str]) -> Tuple[int, int]:
+    count, checksum = 0, 0
+    for rows in iter_sqlite_batches(conn, table, columns):
+        for row in rows:
+            converted = tuple(_convert(v, k) for v, k in zip(row, kinds))
+            checksum += row_checksum(converted, kinds)
+            count += 1
+    return count, checksum
 
-            if not rows:
-                print(f"Skipped {table}: no data")
-                continue
 
-            try:
-                # Clear existing data (for idempotent migration)
-                session.execute(text(f"DELETE FROM {table}"))
+async def _verify(postgres_url: str, sqlite_path: str) -> bool:
+    import asyncpg
 
-                # Insert rows
-                for row in rows:
-                    # Handle NULL values
-                    cleaned_row = {k: (v if v != "" else None) for k, v in row.items()}
-
-                    columns = ", ".join(cleaned_row.keys())
-                    placeholders = ", ".join([f":{k}" for k in cleaned_row.keys()])
-                    insert_sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
-
-                    session.execute(text(insert_sql), cleaned_row)
+    checkpoint = Checkpoint()
+    sqlite_conn = sqlite3.connect(sqlite_path)
+    pg_conn = await asyncpg.connect(_asyncpg_dsn(postgres_url))
+    # Shortest round-trip float text, matching _float_text()
+    await pg_conn.execute("SET extra_float_digits = 1")
 
-                session.commit()
+    print("\nVerifying migration (SQLite vs PostgreSQL):\n")
+    print(f"{'Table':<25} {'SQLite':<10} {'PostgreSQL':<10} {'Status'}")
+    print("-" * 60)
 
-                # Reset sequence for auto-increment
-                max_id_result = session.execute(text(f"SELECT MAX(id) FROM {table}"))
-                max_id = max_id_result.scalar() or 0
-                if max_id > 0:
-                    session.execute(text(
-                        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), {max_id})"
-                    ))
-                    session.commit()
+    all_match = True
+    try:
+        for table, orm_table in ((t, _orm_tables().get(t)) for t in TABLES_IN_ORDER):
+            if orm_table is None:
+                continue
+            source_columns = _sqlite_columns(sqlite_conn, table)
+            if not source_columns:
+                continue
+            kinds_by_column = _column_kinds(orm_table)
+            columns = [c for c in orm_table.columns.keys() if c in source_columns]
+            kinds = [kinds_by_column[c] for c in columns]
+
+            # Source side: checksum captured while streaming, if complete
+            state = checkpoint.tables.get(table)
+            if state and state.get("done"):
+                sqlite_count, sqlite_sum = state["rows"], state["checksum"]
+            else:
+                sqlite_count, sqlite_sum = _source_checksum(sqlite_conn, table, columns, kinds)
 
-                print(f"Imported {table}: {len(rows)} rows")
-                total_rows += len(rows)
+            try:
+                pg_count, pg_sum = await postgres_checksum(pg_conn, table, columns, kinds)
+            except Exception:
+                pg_count, pg_sum = 0, None
+
+            if sqlite_count != pg_count:
+                status = "MISMATCH"
+            elif sqlite_sum != pg_sum:
+                status = "CHECKSUM MISMATCH"
+            else:
+                status = "OK"
+            if status != "OK":
+                all_match = False
 
-            except Exception as e:
-                session.rollback()
-                print(f"Error importing {table}: {e}")
-                raise
+            print(f"{table:<25} {sqlite_count:<10} {pg_count:<10} {status}")
+    finally:
+        sqlite_conn.close()
+        await pg_conn.close()
 
-    print(f"\nTotal imported: {total_rows} rows")
-    return True
+    print("\n" + ("Migration verified successfully!" if all_match else "Migration verification FAILED - some tables have mismatched row counts or checksums"))
+    return all_match
 
 
 def verify_migration():
-    """Verify migration by comparing row counts."""
-    import sqlite3
-    from sqlalchemy import create_engine, text
-
-    sqlite_path = os.getenv("SQLITE_PATH", "database/confluence.db")
-    postgres_url = os.getenv("DATABASE_URL")
+    """Verify migration by comparing row counts and content checksums."""
+    sqlite_path = _sqlite_path()
+    postgres_url = _postgres_url()
 
     if not Path(sqlite_path).exists():
         print(f"SQLite database not found: {sqlite_path}")
@@ -203,78 +700,41 @@ def verify_migration():
         print("DATABASE_URL environment variable not set")
         return False
 
-    # Fix Railway URL format
-    if postgres_url.startswith("postgres://"):
-        postgres_url = postgres_url.replace("postgres://", "postgresql://", 1)
-
-    sqlite_conn = sqlite3.connect(sqlite_path)
-    pg_engine = create_engine(postgres_url)
-
-    print("\nVerifying migration (SQLite vs PostgreSQL):\n")
-    print(f"{'Table':<25} {'SQLite':<10} {'PostgreSQL':<10} {'Status'}")
-    print("-" * 60)
-
-    all_match = True
-
-    for table in TABLES_IN_ORDER:
-        # SQLite count
-        sqlite_count = 0
-        try:
-            cursor = sqlite_conn.execute(f"SELECT COUNT(*) FROM {table}")
-            sqlite_count = cursor.fetchone()[0]
-        except sqlite3.OperationalError:
-            pass
-
-        # PostgreSQL count
-        pg_count = 0
-        try:
-            with pg_engine.connect() as conn:
-                result = conn.execute(text(f"SELECT COUNT(*) FROM {table}"))
-                pg_count = result.scalar()
-        except Exception:
-            pass
-
-        status = "OK" if sqlite_count == pg_count else "MISMATCH"
-        if sqlite_count != pg_count:
-            all_match = False
-
-        print(f"{table:<25} {sqlite_count:<10} {pg_count:<10} {status}")
-
-    sqlite_conn.close()
-    pg_engine.dispose()
-
-    print("\n" + ("Migration verified successfully!" if all_match else "Migration verification FAILED - some tables have mismatched row counts"))
-    return all_match
+    return asyncio.run(_verify(postgres_url, sqlite_path))
 
 
 def main():
     parser = argparse.ArgumentParser(description="SQLite to PostgreSQL Migration")
-    parser.add_argument("--export", action="store_true", help="Export SQLite to JSON")
-    parser.add_argument("--import", dest="do_import", action="store_true", help="Import JSON to PostgreSQL")
+    parser.add_argument("--migrate", action="store_true", help="Stream SQLite directly into PostgreSQL")
+    parser.add_argument("--export", action="store_true", help="Export SQLite to JSON Lines")
+    parser.add_argument("--import", dest="do_import", action="store_true", help="Import JSON Lines to PostgreSQL")
     parser.add_argument("--verify", action="store_true", help="Verify migration")
-    parser.add_argument("--full", action="store_true", help="Full migration (export + import + verify)")
+    parser.add_argument("--full", action="store_true", help="Full migration (migrate + verify)")
+    parser.add_argument("--restart", action="store_true", help="Ignore checkpoint and start over")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Rows per batch")
+    parser.add_argument("--parallel", type=int, default=PARALLEL_TABLES, help="Tables copied concurrently")
 
     args = parser.parse_args()
 
     if args.full:
         print("=== Full Migration ===\n")
-        print("Step 1: Export SQLite data")
-        if not export_sqlite_data():
+        print("Step 1: Stream SQLite data into PostgreSQL")
+        if not migrate_streaming(args.restart, args.batch_size, args.parallel):
             return 1
-        print("\nStep 2: Import to PostgreSQL")
-        if not import_to_postgres():
-            return 1
-        print("\nStep 3: Verify migration")
+        print("\nStep 2: Verify migration")
         if not verify_migration():
             return 1
         print("\nMigration complete!")
         return 0
 
+    if args.migrate:
+        return 0 if migrate_streaming(args.restart, args.batch_size, args.parallel) else 1
+
     if args.export:
-        return 0 if export_sqlite_data() else 1
+        return 0 if export_sqlite_data(args.batch_size) else 1
 
     if args.do_import:
-        return 0 if import_to_postgres() else 1
+        return 0 if import_to_postgres(args.restart, args.batch_size, args.parallel) else 1
 
     if args.verify:
         return 0 if verify_migration() else 1
@@ -0,0 +1,53 @@
+"""
+Rebuild Content Activity Rollups
+
+Recomputes content_daily_rollups from raw_content, analyzed_content and
+confluence_scores. The application fills an empty table at startup; run
+this any time the rollups are suspected to have drifted (e.g. after
+manual bulk deletes).
+
+Usage:
+    # Rebuild every source
+    python scripts/rebuild_activity_rollups.py
+
+    # Rebuild specific sources
+    python scripts/rebuild_activity_rollups.py --source youtube --source discord
+"""
+
+import argparse
+import logging
+
+from backend.models import SessionLocal, Source
+from backend.services.activity_rollup import rebuild_activity_rollups
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def rebuild(source_names=None):
+    """Rebuild rollups for the named sources (all when None)."""
+    db = SessionLocal()
+
+    try:
+        source_ids = None
+        if source_names:
+            sources = db.query(Source).filter(Source.name.in_(source_names)).all()
+            unknown = set(source_names) - {s.name for s in sources}
+            if unknown:
+                logger.error(f"Unknown sources: {', '.join(sorted(unknown))}")
+                return
+            source_ids = [s.id for s in sources]
+
+        written = rebuild_activity_rollups(db, source_ids=source_ids)
+        db.commit()
+        logger.info(f"Rebuild complete: {written} rollup rows written")
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild content_daily_rollups")
+    parser.add_argument("--source", action="append", dest="sources", help="Source name (repeatable)")
+    args = parser.parse_args()
+    rebuild(args.sources)
@@ -0,0 +1,48 @@
+"""
+Rebuild Ticker / Theme Mention Index
+
+Recreates ticker_mentions and theme_mentions from the comma-separated
+tickers_mentioned / key_themes columns of every analyzed_content row, then
+theme_daily_rollups from theme_mentions. The application fills empty
+tables at startup and indexes new analyses as they are saved; run this to
+force a full rebuild.
+
+Usage:
+    python scripts/rebuild_mention_index.py
+    python scripts/rebuild_mention_index.py --batch-size 5000
+"""
+
+import argparse
+import logging
+
+from backend.models import SessionLocal
+from backend.services.mention_index import rebuild_mention_index
+from backend.services.theme_rollup import rebuild_theme_rollups
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def rebuild(batch_size: int):
+    """Rebuild both mention tables and the theme rollups in one transaction."""
+    db = SessionLocal()
+
+    try:
+        counts = rebuild_mention_index(db, batch_size=batch_size)
+        rollups = rebuild_theme_rollups(db)
+        db.commit()
+        logger.info(
+            f"Backfill complete: {counts['analyses']} analyses, "
+            f"{counts['ticker_mentions']} ticker mentions, {counts['theme_mentions']} theme mentions, "
+            f"{rollups} theme rollup rows"
+        )
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild ticker_mentions, theme_mentions and theme_daily_rollups")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Analyses per batch")
+    args = parser.parse_args()
+    rebuild(args.batch_size)
@@ -0,0 +1,40 @@
+"""
+Rebuild Theme Similarity Terms
+
+Recomputes themes.similarity_terms (the weighted name / alias / description
+terms used by the local theme-matching prefilter) for every theme.
+Run once after migration 013; themes are refreshed as they are saved.
+
+Usage:
+    python scripts/rebuild_theme_terms.py
+    python scripts/rebuild_theme_terms.py --batch-size 1000
+"""
+
+import argparse
+import logging
+
+from backend.models import SessionLocal
+from backend.services.theme_similarity import rebuild_theme_terms
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def rebuild(batch_size: int):
+    """Recompute similarity terms for all themes in one transaction."""
+    db = SessionLocal()
+
+    try:
+        updated = rebuild_theme_terms(db, batch_size=batch_size)
+        db.commit()
+        logger.info(f"Backfill complete: {updated} themes")
+
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild themes.similarity_terms")
+    parser.add_argument("--batch-size", type=int, default=500, help="Themes per batch")
+    args = parser.parse_args()
+    rebuild(args.batch_size)
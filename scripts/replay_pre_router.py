@@ -0,0 +1,57 @@
+"""
+Replay Content Pre-Router
+
+Runs the classifier's deterministic pre-router over historical raw_content
+and reports its hit rate and agreement with past Claude classifications,
+overall and per rule, with a sample of disagreements. Read-only.
+
+Usage:
+    python scripts/replay_pre_router.py
+    python scripts/replay_pre_router.py --limit 5000 --source youtube
+    python scripts/replay_pre_router.py --json
+"""
+
+import argparse
+import json
+import logging
+
+from backend.models import SessionLocal
+from backend.services.pre_route_replay import replay_pre_router
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def replay(limit: int, source: str, sample_size: int, as_json: bool):
+    """Replay the pre-router and print the agreement report."""
+    db = SessionLocal()
+
+    try:
+        report = replay_pre_router(db, limit=limit, source=source, sample_size=sample_size)
+
+    finally:
+        db.close()
+
+    if as_json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"Items compared: {report['items']} ({report['skipped']} fallback / pre-routed records skipped)")
+    print(f"Pre-routed:     {report['pre_routed']} ({report['hit_rate']:.1%})")
+    print(f"Agreement:      classification {report['classification_agreement']}, "
+          f"routing {report['routing_agreement']}")
+    for rule, stats in report["by_rule"].items():
+        print(f"  {rule:<24} hits={stats['hits']:<6} classification={stats['classification_agreement']} "
+              f"routing={stats['routing_agreement']}")
+    for d in report["disagreements"]:
+        print(f"  #{d['raw_content_id']} [{d['rule']}] predicted {d['predicted']} vs past {d['past']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay the classifier pre-router over historical content")
+    parser.add_argument("--limit", type=int, default=None, help="Most recent N classified items")
+    parser.add_argument("--source", default=None, help="Only this source name")
+    parser.add_argument("--sample", type=int, default=20, help="Disagreements to show")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+    replay(args.limit, args.source, args.sample, args.json)
@@ -0,0 +1,194 @@
+"""
+Tests for daily content activity rollups.
+
+Covers:
+- Flush listener: ingest, processed flips, analysis, scoring, deletes
+- Rebuild matching the listener-maintained rows
+- Startup backfill of an empty table
+- Stats reads (per source, totals, content types, recent window)
+- Query count independent of corpus size
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.models import AnalyzedContent, Base, ConfluenceScore, ContentDailyRollup, RawContent, Source
+from backend.services.activity_rollup import (
+    backfill_activity_rollups,
+    content_totals,
+    content_type_counts,
+    rebuild_activity_rollups,
+    recent_activity,
+    source_activity,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'activity.db'}")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def sources(db):
+    sources = {name: Source(name=name, type=name) for name in ("youtube", "discord")}
+    db.add_all(sources.values())
+    db.commit()
+    return sources
+
+
+def _score(analyzed):
+    return ConfluenceScore(
+        analyzed_content_id=analyzed.id, macro_score=1, fundamentals_score=1, valuation_score=1,
+        positioning_score=1, policy_score=1, price_action_score=1, options_vol_score=1,
+        core_total=5, total_score=7, meets_threshold=True, reasoning="test"
+    )
+
+
+def _ingest(db, source, content_type="video", collected_at=None, conviction=None, scored=False):
+    raw = RawContent(source_id=source.id, content_type=content_type, collected_at=collected_at)
+    db.add(raw)
+    db.flush()
+    if conviction is not None:
+        analyzed = AnalyzedContent(raw_content_id=raw.id, agent_type="transcript",
+                                   analysis_result="{}", conviction=conviction)
+        db.add(analyzed)
+        db.flush()
+        if scored:
+            db.add(_score(analyzed))
+    db.commit()
+    return raw
+
+
+def _rollup_rows(db):
+    db.expire_all()
+    return {
+        (r.source_id, r.day, r.content_type): (r.collected_count, r.processed_count, r.analyzed_count,
+                                               r.scored_count, r.conviction_sum, r.conviction_count)
+        for r in db.query(ContentDailyRollup).all()
+    }
+
+
+class TestFlushTracking:
+
+    def test_ingest_analysis_and_scoring(self, db, sources):
+        _ingest(db, sources["youtube"], conviction=8, scored=True)
+        _ingest(db, sources["youtube"], conviction=6)
+        _ingest(db, sources["youtube"], content_type="text")
+
+        activity = source_activity(db)[sources["youtube"].id]
+        assert activity["total_items"] == 3
+        assert activity["analyzed_items"] == 2
+        assert activity["scored_items"] == 1
+        assert activity["avg_conviction"] == 7.0
+        assert activity["last_collected_at"] is not None
+
+    def test_processed_flip_on_expired_instance(self, db, sources):
+        raw = _ingest(db, sources["discord"], content_type="text")
+
+        raw.processed = True  # instance expired by the previous commit
+        db.commit()
+        assert source_activity(db)[sources["discord"].id]["unprocessed_items"] == 0
+
+        raw.processed = False
+        db.commit()
+        assert source_activity(db)[sources["discord"].id]["unprocessed_items"] == 1
+
+    def test_delete_cascades_counts(self, db, sources):
+        raw = _ingest(db, sources["youtube"], conviction=5, scored=True)
+
+        db.delete(raw)
+        db.commit()
+
+        assert content_totals(db) == {"total_raw": 0, "analyzed": 0, "scored": 0}
+
+    def test_rebuild_matches_listener(self, db, sources):
+        now = datetime.utcnow()
+        for i in range(6):
+            source = sources["youtube" if i % 2 else "discord"]
+            raw = _ingest(db, source, content_type=["video", "text"][i % 2],
+                          collected_at=now - timedelta(days=i), conviction=i, scored=i % 3 == 0)
+            if i % 2:
+                raw.processed = True
+        db.commit()
+        maintained = _rollup_rows(db)
+
+        rebuild_activity_rollups(db)
+        db.commit()
+
+        assert _rollup_rows(db) == maintained
+
+    def test_rebuild_single_source_after_bulk_delete(self, db, sources):
+        _ingest(db, sources["youtube"], conviction=4)
+        _ingest(db, sources["discord"])
+        db.query(RawContent).filter(RawContent.source_id == sources["youtube"].id).delete()
+
+        rebuild_activity_rollups(db, source_ids=[sources["youtube"].id])
+        db.commit()
+
+        activity = source_activity(db)
+        assert sources["youtube"].id not in activity
+        assert activity[sources["discord"].id]["total_items"] == 1
+
+
+    def test_backfill_only_when_empty(self, db, sources):
+        assert backfill_activity_rollups(db) is None  # no content yet
+
+        _ingest(db, sources["youtube"], conviction=4, scored=True)
+        _ingest(db, sources["discord"], content_type="text")
+        maintained = _rollup_rows(db)
+        assert backfill_activity_rollups(db) is None  # already maintained
+
+        db.query(ContentDailyRollup).delete()
+        db.commit()
+
+        assert backfill_activity_rollups(db) == 2
+        db.commit()
+        assert _rollup_rows(db) == maintained
+
+
+class TestStatsReads:
+
+    def test_content_type_counts(self, db, sources):
+        for content_type in ("video", "video", "text", "pdf"):
+            _ingest(db, sources["youtube"], content_type=content_type)
+
+        assert content_type_counts(db, sources["youtube"].id) == {"video": 2, "text": 1, "pdf": 1}
+
+    def test_recent_activity_window_is_exact(self, db, sources):
+        now = datetime(2026, 3, 10, 9, 0)
+        _ingest(db, sources["youtube"], collected_at=now - timedelta(hours=30))
+        _ingest(db, sources["youtube"], collected_at=now - timedelta(hours=20))
+        _ingest(db, sources["youtube"], collected_at=now - timedelta(hours=2))
+
+        assert recent_activity(db, hours=24, now=now)["collected"] == 2
+
+    def test_query_count_independent_of_corpus(self, engine, db, sources):
+        def count_statements():
+            statements = []
+            listener = lambda *args: statements.append(args[2])
+            event.listen(engine, "before_cursor_execute", listener)
+            try:
+                source_activity(db)
+                content_totals(db)
+                recent_activity(db)
+            finally:
+                event.remove(engine, "before_cursor_execute", listener)
+            return len(statements)
+
+        _ingest(db, sources["youtube"])
+        small = count_statements()
+        for i in range(30):
+            _ingest(db, sources["discord"], collected_at=datetime.utcnow() - timedelta(days=i), conviction=5)
+
+        assert count_statements() == small == 5
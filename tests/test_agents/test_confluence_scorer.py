@@ -187,3 +187,73 @@ def test_primary_thesis_present(scorer):
 
     assert "primary_thesis" in result
     assert len(result["primary_thesis"]) > 0
+
+
+def _batch_response(indexes):
+    return {"items": [dict(MOCK_CLAUDE_RESPONSE, index=i) for i in indexes]}
+
+
+def test_score_many_packs_short_items(scorer):
+    """Short items share one prompt; results come back in input order."""
+    items = [{"summary": f"item {i}", "source": "discord", "sentiment": "bullish"} for i in range(3)]
+
+    with patch.object(scorer, 'call_claude', return_value=_batch_response([2, 0, 1])) as call:
+        results = scorer.score_many(items, batch_size=5)
+
+    call.assert_called_once()
+    assert call.call_args.kwargs["prompt"].count("<item index=") == 3
+    assert [r["content_source"] for r in results] == ["discord"] * 3
+    assert all(r["total_score"] == 8 for r in results)
+
+
+def test_score_many_long_items_scored_alone(scorer):
+    """Items over the packing limit get their own single-item call."""
+    items = [
+        {"source": "42macro", "transcript": "x" * 9000},
+        {"source": "discord", "sentiment": "bearish"},
+        {"source": "discord", "sentiment": "bullish"},
+    ]
+
+    assert scorer._pack_batches(items, batch_size=5) == [[0], [1, 2]]
+
+
+def test_score_many_falls_back_per_item(scorer):
+    """Items missing or invalid in the batch response are rescored individually."""
+    items = [{"source": "discord", "sentiment": s} for s in ("bullish", "bearish", "neutral")]
+    invalid = dict(MOCK_CLAUDE_RESPONSE, index=1, pillar_scores={"macro": 5})
+    responses = [
+        {"items": [dict(MOCK_CLAUDE_RESPONSE, index=0), invalid]},
+        MOCK_CLAUDE_RESPONSE,
+        Exception("API down"),
+    ]
+
+    with patch.object(scorer, 'call_claude', side_effect=responses) as call:
+        results = scorer.score_many(items, batch_size=5)
+
+    assert call.call_count == 3
+    assert results[0]["total_score"] == 8 and results[1]["total_score"] == 8
+    assert isinstance(results[2], Exception)
+
+
+def test_score_many_runs_batches_concurrently(scorer):
+    """Separate batches are scored in parallel threads."""
+    import threading
+    import time
+
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def slow_call(**kwargs):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return MOCK_CLAUDE_RESPONSE
+
+    with patch.object(scorer, 'call_claude', side_effect=slow_call):
+        results = scorer.score_many([{"source": "discord"}] * 4, batch_size=1, max_workers=4)
+
+    assert len(results) == 4
+    assert peak[0] > 1
@@ -0,0 +1,227 @@
+"""
+Tests for batched ContentClassifierAgent classification.
+
+Covers:
+- Packing items per prompt with indexed JSON output, results in input order
+- Per-item fallback on batch parse failure or missing / invalid entries
+- Calls and estimated prompt tokens saved per batch
+- classify_and_route saving classifier records for each item
+- Deterministic pre-routing of obvious content, hit-rate counters
+- Replay of the pre-router against historical classifier records
+"""
+import json
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from agents import content_classifier
+from agents.content_classifier import ContentClassifierAgent, get_pre_route_stats
+
+
+def _item(i, content_type="text", source="discord"):
+    return {"raw_content_id": i, "source": source, "content_type": content_type,
+            "content_text": f"message {i} about SPX", "metadata": {}}
+
+
+def _entry(index, classification="simple_text"):
+    return {"index": index, "classification": classification, "detected_topics": [f"topic {index}"],
+            "information_density": "medium", "actionability": "low", "confidence": 0.9}
+
+
+SINGLE = {"classification": "simple_text", "detected_topics": ["single"],
+          "information_density": "low", "actionability": "low", "confidence": 0.8}
+
+
+@pytest.fixture
+def classifier():
+    return ContentClassifierAgent(api_key="test-key-for-unit-tests")
+
+
+class TestClassifyMany:
+
+    def test_packs_items_and_keeps_order(self, classifier):
+        items = [_item(i) for i in range(4)]
+        response = {"items": [_entry(3), _entry(1), _entry(0), _entry(2, "archive_only")]}
+
+        with patch.object(classifier, "call_claude", return_value=response) as call:
+            batch = classifier.classify_many(items, batch_size=10)
+
+        call.assert_called_once()
+        assert call.call_args.kwargs["prompt"].count("</item>") == 4
+        assert [r["detected_topics"] for r in batch["results"]] == [[f"topic {i}"] for i in range(4)]
+        assert batch["results"][2]["classification"] == "archive_only"
+        assert batch["stats"]["calls"] == 1
+        assert batch["stats"]["calls_saved"] == 3
+        assert batch["stats"]["estimated_tokens_saved"] > 0
+
+    def test_batches_split_by_size(self, classifier):
+        items = [_item(i) for i in range(5)]
+
+        def respond(prompt, **kwargs):
+            return {"items": [_entry(i) for i in range(prompt.count("</item>"))]}
+
+        with patch.object(classifier, "call_claude", side_effect=respond) as call:
+            batch = classifier.classify_many(items, batch_size=2)
+
+        assert call.call_count == 3
+        assert [b["items"] for b in batch["stats"]["batches"]] == [2, 2, 1]
+        assert batch["stats"]["calls_saved"] == 2
+
+    def test_parse_failure_falls_back_per_item(self, classifier):
+        items = [_item(i) for i in range(3)]
+        responses = [ValueError("Invalid JSON"), SINGLE, SINGLE, SINGLE]
+
+        with patch.object(classifier, "call_claude", side_effect=responses) as call:
+            batch = classifier.classify_many(items)
+
+        assert call.call_count == 4
+        assert all(r["detected_topics"] == ["single"] for r in batch["results"])
+        assert batch["stats"]["fallback_items"] == 3
+        assert batch["stats"]["calls_saved"] == -1
+        assert batch["stats"]["estimated_tokens_saved"] == 0
+
+    def test_missing_or_invalid_entries_fall_back(self, classifier):
+        items = [_item(i) for i in range(3)]
+        invalid = {"index": 1, "classification": "simple_text"}  # no topics / confidence
+        responses = [{"items": [_entry(0), invalid]}, SINGLE, SINGLE]
+
+        with patch.object(classifier, "call_claude", side_effect=responses) as call:
+            batch = classifier.classify_many(items)
+
+        assert call.call_count == 3
+        assert [r["detected_topics"] for r in batch["results"]] == [["topic 0"], ["single"], ["single"]]
+        assert batch["stats"]["fallback_items"] == 2
+        assert batch["stats"]["calls_saved"] == 0
+
+    def test_video_transcript_check_in_batch_prompt(self, classifier):
+        video = dict(_item(1, "video", "youtube"), content_text="x" * 600)
+        prompt = classifier._build_batch_classification_prompt([_item(0), video])
+
+        assert "**Has Transcript**: False" in prompt
+        assert "**Has Transcript**: True" in prompt
+
+
+class TestClassifyAndRoute:
+
+    def test_saves_classifier_records(self, tmp_path):
+        from backend.models import AnalyzedContent, Base, RawContent, Source
+        from backend.routes import analyze
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'classify.db'}")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        source = Source(name="discord", type="discord")
+        db.add(source)
+        db.flush()
+        raws = [RawContent(source_id=source.id, content_type="text", content_text=f"msg {i}",
+                           json_metadata=json.dumps({"channel": "macro"})) for i in range(3)]
+        db.add_all(raws)
+        db.commit()
+
+        classifier = ContentClassifierAgent(api_key="test-key-for-unit-tests")
+        response = {"items": [_entry(i) for i in range(3)]}
+        with patch.object(analyze, "get_classifier", return_value=classifier), \
+                patch.object(classifier, "call_claude", return_value=response), \
+                patch.object(analyze, "run_symbol_extraction", return_value={}):
+            results, stats = analyze.classify_and_route(db, raws)
+        db.commit()
+
+        assert stats["calls"] == 1
+        assert [r["classification"] for r in results] == ["simple_text"] * 3
+        assert db.query(AnalyzedContent).filter_by(agent_type="classifier").count() == 3
+        assert all(raw.processed for raw in raws)
+        db.close()
+
+
+class TestPreRoute:
+
+    @pytest.mark.parametrize("item, classification, agents", [
+        (dict(_item(0, "video", "youtube"), content_text="x" * 600), "transcript_complete", ["confluence_scorer"]),
+        (_item(0, "video", "youtube"), "transcript_needed", ["transcript_harvester", "confluence_scorer"]),
+        (_item(0, "pdf", "42macro"), "pdf_analysis", ["pdf_analyzer", "confluence_scorer"]),
+        (_item(0, "blog_post", "kt_technical"), "image_intelligence", ["image_intelligence", "confluence_scorer"]),
+        (_item(0, "image", "discord"), "image_intelligence", ["image_intelligence", "confluence_scorer"]),
+        (dict(_item(0), content_text="good morning all"), "archive_only", []),
+    ])
+    def test_obvious_content_skips_claude(self, classifier, item, classification, agents):
+        with patch.object(classifier, "call_claude") as call:
+            result = classifier.classify(item)
+
+        call.assert_not_called()
+        assert result["classification"] == classification
+        assert result["route_to_agents"] == agents
+        assert result["raw_analysis"]["pre_routed"] is True
+
+    def test_ambiguous_text_goes_to_claude(self, classifier):
+        assert classifier.pre_route(_item(0)) is None
+        assert classifier.pre_route(dict(_item(0), content_text="thoughts on this week")) is not None
+        assert classifier.pre_route(dict(_item(0), content_text="NVDA looks heavy")) is None
+
+    def test_confidence_threshold_and_switch(self, classifier):
+        chatter = dict(_item(0), content_text="lol")
+        with patch.object(content_classifier, "PRE_ROUTE_MIN_CONFIDENCE", 0.9):
+            assert classifier.pre_route(chatter) is None
+            assert classifier.pre_route(_item(0, "pdf")) is not None
+        with patch.object(content_classifier, "PRE_ROUTER_ENABLED", False):
+            assert classifier.pre_route(_item(0, "pdf")) is None
+
+    def test_classify_many_sends_only_ambiguous_items(self, classifier):
+        items = [_item(0, "pdf", "42macro"), _item(1), _item(2, "image"), _item(3)]
+        before = get_pre_route_stats()
+
+        with patch.object(classifier, "call_claude", return_value={"items": [_entry(0), _entry(1)]}) as call:
+            batch = classifier.classify_many(items)
+
+        assert call.call_args.kwargs["prompt"].count("</item>") == 2
+        assert [r["classification"] for r in batch["results"]] == [
+            "pdf_analysis", "simple_text", "image_intelligence", "simple_text"]
+        assert [r["detected_topics"] for r in batch["results"]][1::2] == [["topic 0"], ["topic 1"]]
+        assert batch["stats"]["pre_routed"] == 2
+
+        after = get_pre_route_stats()
+        assert after["pre_routed"] - before["pre_routed"] == 2
+        assert after["llm"] - before["llm"] == 2
+        assert after["by_rule"]["pdf_document"] > before["by_rule"].get("pdf_document", 0)
+
+
+class TestReplayPreRouter:
+
+    def test_reports_hit_rate_and_agreement(self, tmp_path, classifier):
+        from backend.models import AnalyzedContent, Base, RawContent, Source
+        from backend.services.pre_route_replay import replay_pre_router
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'replay.db'}")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        source = Source(name="42macro", type="web")
+        db.add(source)
+        db.flush()
+
+        history = [
+            # (content_type, text, past classification, past routing, raw_analysis)
+            ("pdf", "", "pdf_analysis", ["pdf_analyzer", "confluence_scorer"], {}),
+            ("image", "", "simple_text", ["confluence_scorer"], {}),
+            ("text", "Leadoff: SPX bid", "simple_text", ["confluence_scorer"], {}),
+            ("pdf", "", "pdf_analysis", ["pdf_analyzer", "confluence_scorer"], {"fallback": True}),
+        ]
+        for content_type, text, classification, routing, raw_analysis in history:
+            raw = RawContent(source_id=source.id, content_type=content_type, content_text=text)
+            db.add(raw)
+            db.flush()
+            db.add(AnalyzedContent(raw_content_id=raw.id, agent_type="classifier", analysis_result=json.dumps({
+                "classification": classification, "route_to_agents": routing, "raw_analysis": raw_analysis})))
+        db.commit()
+
+        before = get_pre_route_stats()
+        report = replay_pre_router(db, classifier=classifier)
+        assert get_pre_route_stats() == before  # replays leave the live hit rate alone
+
+        assert (report["items"], report["skipped"], report["pre_routed"]) == (3, 1, 2)
+        assert report["hit_rate"] == pytest.approx(2 / 3, abs=1e-3)
+        assert report["classification_agreement"] == 0.5
+        assert report["by_rule"]["pdf_document"]["routing_agreement"] == 1.0
+        assert [d["rule"] for d in report["disagreements"]] == ["image_post"]
+        assert replay_pre_router(db, classifier=classifier, source="discord")["items"] == 0
+        db.close()
@@ -0,0 +1,181 @@
+"""
+Tests for prompt-prefix caching and per-agent token tracking in BaseAgent.
+
+Covers:
+- System prompt and cached_context sent as cache_control blocks
+- Caching disabled via PROMPT_CACHE_ENABLED
+- Cache read / write token counts per agent, reported to the usage limiter
+- Confluence scoring and transcript extraction send static instructions as cached context
+"""
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agents import base_agent
+from agents.base_agent import BaseAgent, get_agent_token_usage
+
+
+class StubMessages:
+    """Records create() kwargs and returns canned responses with usage."""
+
+    def __init__(self, usages, text='{"ok": true}'):
+        self.usages = list(usages)
+        self.text = text
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        usage = SimpleNamespace(**self.usages.pop(0))
+        return SimpleNamespace(content=[SimpleNamespace(text=self.text)], usage=usage)
+
+
+def _usage(input_tokens=100, output_tokens=20, cache_write=0, cache_read=0):
+    return {
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "cache_creation_input_tokens": cache_write,
+        "cache_read_input_tokens": cache_read,
+    }
+
+
+@pytest.fixture
+def limiter():
+    limiter = MagicMock()
+    with patch("agents.base_agent.get_usage_limiter", return_value=limiter):
+        yield limiter
+
+
+def _agent(cls, messages):
+    agent = cls(api_key="test-key-for-unit-tests")
+    agent.client = SimpleNamespace(messages=messages)
+    return agent
+
+
+class CachingTestAgent(BaseAgent):
+    pass
+
+
+class TestCacheMarkers:
+
+    def test_system_and_context_blocks_cacheable(self, limiter):
+        messages = StubMessages([_usage()])
+        agent = _agent(CachingTestAgent, messages)
+
+        result = agent.call_claude("item 1", system_prompt="static system", cached_context="static rubric")
+
+        assert result == {"ok": True}
+        kwargs = messages.calls[0]
+        assert kwargs["system"] == [
+            {"type": "text", "text": "static system", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert kwargs["messages"][0]["content"] == [
+            {"type": "text", "text": "static rubric", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "item 1"},
+        ]
+
+    def test_plain_prompt_without_context(self, limiter):
+        messages = StubMessages([_usage()])
+        agent = _agent(CachingTestAgent, messages)
+
+        agent.call_claude("hello", system_prompt="sys", cache_system=False)
+
+        assert messages.calls[0]["system"] == "sys"
+        assert messages.calls[0]["messages"][0]["content"] == "hello"
+
+    def test_disabled_by_config(self, limiter):
+        messages = StubMessages([_usage()])
+        agent = _agent(CachingTestAgent, messages)
+
+        with patch.object(base_agent, "PROMPT_CACHE_ENABLED", False):
+            agent.call_claude("item", system_prompt="sys", cached_context="rubric")
+
+        kwargs = messages.calls[0]
+        assert kwargs["system"] == "sys"
+        assert all("cache_control" not in block for block in kwargs["messages"][0]["content"])
+
+    def test_vision_system_prompt_cacheable(self, limiter, tmp_path):
+        image = tmp_path / "chart.png"
+        image.write_bytes(b"\x89PNG")
+        messages = StubMessages([_usage()])
+        agent = _agent(CachingTestAgent, messages)
+
+        agent.call_claude_vision("levels?", str(image), system_prompt="chart rules")
+
+        assert messages.calls[0]["system"][0]["cache_control"] == {"type": "ephemeral"}
+
+
+class TestTokenUsage:
+
+    def test_counts_cache_reads_and_writes(self, limiter):
+        class ScoringLoopAgent(BaseAgent):
+            pass
+
+        messages = StubMessages([
+            _usage(input_tokens=300, cache_write=2000),
+            _usage(input_tokens=280, cache_read=2000),
+            _usage(input_tokens=310, cache_read=2000),
+        ])
+        agent = _agent(ScoringLoopAgent, messages)
+
+        for i in range(3):
+            agent.call_claude(f"item {i}", system_prompt="rubric")
+
+        expected = {
+            "calls": 3,
+            "input_tokens": 890,
+            "output_tokens": 60,
+            "cache_creation_input_tokens": 2000,
+            "cache_read_input_tokens": 4000,
+        }
+        assert agent.token_usage == expected
+        assert get_agent_token_usage()["ScoringLoopAgent"] == expected
+        assert limiter.record_token_usage.call_count == 3
+        agent_name, counts = limiter.record_token_usage.call_args.args
+        assert agent_name == "ScoringLoopAgent"
+        assert counts["cache_read_input_tokens"] == 2000
+
+    def test_mock_responses_without_usage_ignored(self, limiter):
+        agent = CachingTestAgent(api_key="test-key-for-unit-tests")
+        agent.client = MagicMock()
+        agent.client.messages.create.return_value.content = [SimpleNamespace(text='{"a": 1}')]
+
+        agent.call_claude("x")
+
+        assert agent.token_usage["calls"] == 0
+        limiter.record_token_usage.assert_not_called()
+
+
+class TestAgentsUseCachedContext:
+
+    def test_confluence_scorer(self, limiter):
+        from agents.confluence_scorer import ConfluenceScorerAgent
+
+        scores = dict.fromkeys(ConfluenceScorerAgent.ALL_PILLARS, 1)
+        response = (
+            '{"pillar_scores": %s, "reasoning": {}, "falsification_criteria": ["CPI > 0.5%%"]}'
+            % str(scores).replace("'", '"')
+        )
+        messages = StubMessages([_usage(), _usage()], text=response)
+        agent = _agent(ConfluenceScorerAgent, messages)
+
+        for source in ("42macro", "discord"):
+            agent.score_content({"source": source, "content_type": "pdf"}, {})
+
+        contexts = [call["messages"][0]["content"][0] for call in messages.calls]
+        assert contexts[0] == contexts[1]
+        assert contexts[0]["cache_control"] == {"type": "ephemeral"}
+        assert "Output JSON Format" in contexts[0]["text"]
+        assert "42macro" in messages.calls[0]["messages"][0]["content"][1]["text"]
+
+    def test_transcript_extraction(self, limiter):
+        from agents.symbol_level_extractor import SymbolLevelExtractor
+
+        messages = StubMessages([_usage()], text='{"symbols": [], "extraction_confidence": 0.9}')
+        agent = _agent(SymbolLevelExtractor, messages)
+
+        agent.extract_from_transcript("SPX support at 5000", source="kt_technical")
+
+        content = messages.calls[0]["messages"][0]["content"]
+        assert content[0]["text"] == agent._get_transcript_extraction_instructions()
+        assert "SPX support at 5000" in content[1]["text"]
@@ -562,7 +562,7 @@ class TestAutoScoring:
 
         with patch('backend.routes.synthesis.ConfluenceScorerAgent') as MockScorer:
             mock_instance = MagicMock()
-            mock_instance.analyze.return_value = mock_scorer_result
+            mock_instance.score_many.return_value = [mock_scorer_result]
             MockScorer.return_value = mock_instance
 
             from backend.routes.synthesis import _score_unscored_content
@@ -570,7 +570,9 @@ class TestAutoScoring:
 
         assert result["scored"] == 1
         assert result["failed"] == 0
-        mock_db.add.assert_called_once()
+        mock_instance.score_many.assert_called_once()
+        assert mock_instance.score_many.call_args.args[0][0]["summary"] == "Fed is hawkish on rates"
+        mock_db.add_all.assert_called_once()
         mock_db.commit.assert_called_once()
 
     def test_score_unscored_content_handles_scorer_failure(self, mock_env):
@@ -590,8 +592,8 @@ class TestAutoScoring:
 
         with patch('backend.routes.synthesis.ConfluenceScorerAgent') as MockScorer:
             mock_instance = MagicMock()
-            # First call fails, second succeeds
-            mock_instance.analyze.side_effect = [
+            # First item fails, second succeeds
+            mock_instance.score_many.return_value = [
                 Exception("API timeout"),
                 {
                     "pillar_scores": {"macro": 1, "fundamentals": 0, "valuation": 0,
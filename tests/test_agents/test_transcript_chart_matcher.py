@@ -0,0 +1,118 @@
+"""
+Tests for transcript-to-chart matching.
+
+Covers:
+- One-pass transcript scan matching the per-segment extraction
+- Asset aliases folded to one tag for transcript and page text
+- PageTextIndex ranking and page-text image prioritization
+- Filename matching fallback without an index
+- Index built during PDF image extraction
+"""
+import pytest
+
+from agents.transcript_chart_matcher import PageTextIndex, TranscriptChartMatcher
+
+
+TRANSCRIPT = (
+    "Welcome back everyone. Looking at the chart of the S&P 500 here, breadth is improving! "
+    "Moving to the dollar, DXY keeps grinding lower? Nothing else on rates today. "
+    "Next up, this chart shows Bitcoin versus liquidity. Thanks for watching."
+)
+
+
+@pytest.fixture
+def matcher():
+    return TranscriptChartMatcher()
+
+
+def _image(page):
+    return {"image_path": f"/tmp/page_{page}_img_1.png", "page_number": page}
+
+
+@pytest.fixture
+def page_index():
+    index = PageTextIndex()
+    pages = {
+        1: "42 Macro Weekly Macro Themes",
+        2: "SPX breadth: percent of members above 50-day moving average",
+        3: "US Dollar Index (DXY) vs 2y rate differential",
+        4: "BTC vs global liquidity proxy",
+        5: "Disclaimer",
+    }
+    for page, text in pages.items():
+        index.add_page(page, text)
+        index.add_image(page, _image(page)["image_path"])
+    return index
+
+
+class TestTranscriptScan:
+
+    def test_matches_per_segment_extraction(self, matcher):
+        segments = matcher._segment_transcript(TRANSCRIPT)
+        expected = []
+        for i, segment in enumerate(segments):
+            if any(kw in segment.lower() for kw in matcher.CHART_KEYWORDS):
+                topics = matcher._extract_topics(segment)
+                if topics:
+                    expected.append((i, sorted(topics), matcher._calculate_confidence(segment)))
+
+        mentions = matcher.extract_chart_mentions(TRANSCRIPT)
+
+        assert [(m["segment_index"], sorted(m["topics"]), m["confidence"]) for m in mentions] == expected
+        assert [m["segment_index"] for m in mentions] == [1, 2, 4]
+
+    def test_asset_aliases_share_a_tag(self, matcher):
+        assert "asset:spx" in matcher.topic_terms("S&P 500")
+        assert "asset:spx" in matcher.topic_terms("SPY")
+        assert matcher.topic_terms("the chart of breadth") == ["breadth"]
+
+
+class TestPageTextIndex:
+
+    def test_scores_only_matching_pages(self, page_index, matcher):
+        scores = page_index.score_pages({term: 1.0 for term in matcher.topic_terms("dollar")})
+
+        assert list(scores) == [3]
+        assert scores[3][1] == ["asset:dxy", "dollar"]
+
+    def test_prioritizes_discussed_slides(self, matcher, page_index):
+        images = [_image(page) for page in range(1, 6)]
+
+        result = matcher.prioritize_for_analysis(TRANSCRIPT, images, max_analyze=3, page_index=page_index)
+
+        assert result["status"] == "success"
+        assert sorted(img["page_number"] for img in result["images_to_analyze"]) == [2, 3, 4]
+        assert all(m["image_metadata"]["page_number"] != 5 for m in result["matched_images"])
+
+    def test_filename_fallback_without_index(self, matcher):
+        images = [{"image_path": "/tmp/dxy_weekly.png", "page_number": 1},
+                  {"image_path": "/tmp/page_2_img_1.png", "page_number": 2}]
+
+        matches = matcher.match_to_images([{"topics": ["dxy"], "confidence": 0.8}], images)
+
+        assert [m["image_metadata"]["page_number"] for m in matches] == [1]
+
+
+class TestIndexDuringExtraction:
+
+    def test_extract_images_fills_index(self, tmp_path):
+        fitz = pytest.importorskip("fitz")
+        from agents.pdf_analyzer import PDFAnalyzerAgent
+
+        pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 4, 4), False)
+        doc = fitz.open()
+        for text in ("Title slide", "SPX breadth thrust"):
+            page = doc.new_page()
+            page.insert_text((72, 72), text)
+            page.insert_image(fitz.Rect(72, 100, 172, 200), pixmap=pixmap)
+        pdf_path = tmp_path / "deck.pdf"
+        doc.save(pdf_path)
+        doc.close()
+
+        index = PageTextIndex()
+        agent = PDFAnalyzerAgent(api_key="test-key-for-unit-tests")
+        images = agent.extract_images(str(pdf_path), output_dir=str(tmp_path / "images"), page_index=index)
+
+        assert index.page_count == 2
+        assert index.page_images[2] == [images[1]["image_path"]]
+        assert list(index.score_pages({"asset:spx": 1.0})) == [2]
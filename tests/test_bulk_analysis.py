@@ -0,0 +1,245 @@
+"""
+Tests for bulk analysis through message batches.
+
+Covers:
+- Runner: chunked submission, polling until batches end, parsed results,
+  per-request errors, timeouts and token usage
+- Anthropic and local transports
+- bulk_classify: pre-routed items skip the batch, classifier records replaced
+- bulk_score: ConfluenceScore rows for unscored content, rescore replaces
+- bulk_extract_symbols: SymbolLevel rows saved from batch results
+"""
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from agents.bulk_runner import (
+    AnthropicBatchTransport, BatchTransport, BulkAnalysisRunner, BulkRequest, LocalBatchTransport
+)
+from agents.confluence_scorer import ConfluenceScorerAgent
+from agents.content_classifier import ContentClassifierAgent
+from agents.symbol_level_extractor import SymbolLevelExtractor
+from backend.models import AnalyzedContent, Base, ConfluenceScore, RawContent, Source, SymbolLevel, ThemeDailyRollup
+from backend.services.activity_rollup import content_totals
+from backend.services import level_index as level_index_module
+from backend.services import symbol_snapshot as symbol_snapshot_module
+from backend.services.bulk_analysis import bulk_classify, bulk_extract_symbols, bulk_score
+from backend.services.level_index import LevelIndex
+from backend.services.symbol_snapshot import SymbolSnapshot
+
+
+def _message(payload, usage=None):
+    text = payload if isinstance(payload, str) else json.dumps(payload)
+    return SimpleNamespace(content=[SimpleNamespace(text=text)], usage=usage)
+
+
+class FakeTransport(BatchTransport):
+    """Answers by custom_id; each batch reports in progress for `polls` checks."""
+
+    def __init__(self, respond, polls=1):
+        self.respond = respond
+        self.polls = polls
+        self.submitted = []
+        self.checks = {}
+
+    def submit(self, requests):
+        self.submitted.append(requests)
+        batch_id = f"batch_{len(self.submitted)}"
+        self.checks[batch_id] = 0
+        return batch_id
+
+    def is_done(self, batch_id):
+        self.checks[batch_id] += 1
+        return self.checks[batch_id] > self.polls
+
+    def results(self, batch_id):
+        for request in self.submitted[int(batch_id.split("_")[1]) - 1]:
+            answer = self.respond(request["custom_id"], request["params"])
+            if isinstance(answer, Exception):
+                yield request["custom_id"], None, f"errored: {answer}"
+            else:
+                yield request["custom_id"], _message(answer), None
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(level_index_module, "_level_index", LevelIndex())
+    monkeypatch.setattr(symbol_snapshot_module, "_snapshot", SymbolSnapshot())
+    engine = create_engine(f"sqlite:///{tmp_path / 'bulk.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _raw(db, source_name, content_type, text, **kwargs):
+    source = db.query(Source).filter_by(name=source_name).first()
+    if source is None:
+        source = Source(name=source_name, type="web")
+        db.add(source)
+        db.flush()
+    raw = RawContent(source_id=source.id, content_type=content_type, content_text=text, **kwargs)
+    db.add(raw)
+    db.flush()
+    return raw
+
+
+class TestBulkAnalysisRunner:
+
+    @pytest.fixture
+    def agent(self):
+        return ConfluenceScorerAgent(api_key="test-key-for-unit-tests")
+
+    def test_chunks_polls_and_parses(self, agent):
+        transport = FakeTransport(lambda custom_id, params: {"id": custom_id}, polls=2)
+        sleeps = []
+        runner = BulkAnalysisRunner(agent, transport, max_requests=2, poll_interval=5, sleep=sleeps.append)
+
+        results = runner.run([BulkRequest(f"r-{i}", f"prompt {i}", "system") for i in range(5)])
+
+        assert [len(batch) for batch in transport.submitted] == [2, 2, 1]
+        assert sleeps == [5, 5]
+        assert results == {f"r-{i}": {"id": f"r-{i}"} for i in range(5)}
+        assert runner.stats["batches"] == 3 and runner.stats["succeeded"] == 5
+        params = transport.submitted[0][0]["params"]
+        assert params["model"] == agent.model
+        assert params["messages"][0]["content"] == "prompt 0"
+
+    def test_errors_and_unparseable_results(self, agent):
+        answers = {"ok": {"fine": True}, "bad": "not json at all", "err": RuntimeError("overloaded")}
+        transport = FakeTransport(lambda custom_id, params: answers[custom_id], polls=0)
+
+        results = BulkAnalysisRunner(agent, transport).run([BulkRequest(cid, "p") for cid in answers])
+
+        assert results["ok"] == {"fine": True}
+        assert isinstance(results["bad"], ValueError)
+        assert isinstance(results["err"], RuntimeError) and "overloaded" in str(results["err"])
+
+    def test_unfinished_batches_time_out(self, agent):
+        transport = FakeTransport(lambda custom_id, params: {}, polls=100)
+
+        results = BulkAnalysisRunner(agent, transport, max_wait=0).run([BulkRequest("a", "p")])
+
+        assert isinstance(results["a"], TimeoutError)
+
+    def test_duplicate_ids_rejected(self, agent):
+        with pytest.raises(ValueError):
+            BulkAnalysisRunner(agent, FakeTransport(None)).run([BulkRequest("a", "p"), BulkRequest("a", "q")])
+
+    def test_token_usage_recorded(self, agent):
+        usage = SimpleNamespace(input_tokens=100, output_tokens=20,
+                                cache_creation_input_tokens=0, cache_read_input_tokens=80)
+        transport = LocalBatchTransport(lambda params: _message({"x": 1}, usage))
+
+        with patch("agents.base_agent.get_usage_limiter"):
+            BulkAnalysisRunner(agent, transport).run([BulkRequest("a", "p"), BulkRequest("b", "p")])
+
+        assert agent.token_usage["calls"] == 2
+        assert agent.token_usage["cache_read_input_tokens"] == 160
+
+
+class TestTransports:
+
+    def test_anthropic_transport(self):
+        client = MagicMock()
+        client.messages.batches.create.return_value = SimpleNamespace(id="msgbatch_1")
+        client.messages.batches.retrieve.return_value = SimpleNamespace(processing_status="ended")
+        client.messages.batches.results.return_value = [
+            SimpleNamespace(custom_id="a", result=SimpleNamespace(type="succeeded", message="msg")),
+            SimpleNamespace(custom_id="b", result=SimpleNamespace(type="expired")),
+        ]
+        transport = AnthropicBatchTransport(client)
+
+        assert transport.submit([{"custom_id": "a", "params": {}}]) == "msgbatch_1"
+        assert transport.is_done("msgbatch_1")
+        assert list(transport.results("msgbatch_1")) == [("a", "msg", None), ("b", None, "expired")]
+
+    def test_local_transport_errors(self):
+        def respond(params):
+            raise ConnectionError("down")
+
+        transport = LocalBatchTransport(respond)
+        batch_id = transport.submit([{"custom_id": "a", "params": {}}])
+
+        assert transport.is_done(batch_id)
+        assert list(transport.results(batch_id)) == [("a", None, "ConnectionError: down")]
+
+
+class TestBulkJobs:
+
+    def test_bulk_classify(self, db):
+        pdf = _raw(db, "42macro", "pdf", "")
+        text = _raw(db, "discord", "text", "SPX breadth improving into CPI")
+        db.add(AnalyzedContent(raw_content_id=text.id, agent_type="classifier", analysis_result="{}"))
+        db.commit()
+        response = {"classification": "simple_text", "detected_topics": ["breadth"],
+                    "information_density": "high", "actionability": "medium", "confidence": 0.9}
+        transport = FakeTransport(lambda custom_id, params: response, polls=0)
+
+        summary = bulk_classify(db, ContentClassifierAgent(api_key="test-key-for-unit-tests"), transport)
+
+        assert [r["custom_id"] for r in transport.submitted[0]] == [f"raw-{text.id}"]
+        assert (summary["pre_routed"], summary["classified"], summary["failed"]) == (1, 2, 0)
+        classifier_rows = db.query(AnalyzedContent).filter_by(agent_type="classifier").all()
+        assert len(classifier_rows) == 2
+        records = {r.raw_content_id: json.loads(r.analysis_result) for r in classifier_rows}
+        assert records[pdf.id]["classification"] == "pdf_analysis"
+        assert records[text.id]["detected_topics"] == ["breadth"]
+
+        # Replaced classifier records leave the rollups, not add to them
+        bulk_classify(db, ContentClassifierAgent(api_key="test-key-for-unit-tests"),
+                      FakeTransport(lambda custom_id, params: response, polls=0))
+        assert content_totals(db)["analyzed"] == 2
+        assert sum(r.mention_count for r in db.query(ThemeDailyRollup).filter_by(keyword="breadth")) == 1
+
+    def test_bulk_score_and_rescore(self, db):
+        raw = _raw(db, "youtube", "video", "transcript")
+        recent = AnalyzedContent(raw_content_id=raw.id, agent_type="transcript",
+                                 analysis_result=json.dumps({"key_themes": ["Liquidity improving"]}))
+        old = AnalyzedContent(raw_content_id=raw.id, agent_type="transcript", analysis_result="{}",
+                              analyzed_at=datetime.utcnow() - timedelta(days=90))
+        db.add_all([recent, old])
+        db.commit()
+        pillars = {p: 2 for p in ConfluenceScorerAgent.ALL_PILLARS}
+        response = {"pillar_scores": pillars, "reasoning": {"macro": "liquidity"}, "falsification_criteria": []}
+        transport = FakeTransport(lambda custom_id, params: response, polls=0)
+        agent = ConfluenceScorerAgent(api_key="test-key-for-unit-tests")
+
+        summary = bulk_score(db, agent, transport, days=30)
+
+        assert [r["custom_id"] for r in transport.submitted[0]] == [f"ac-{recent.id}"]
+        assert "Liquidity improving" in transport.submitted[0][0]["params"]["messages"][0]["content"][1]["text"]
+        score = db.query(ConfluenceScore).one()
+        assert (score.analyzed_content_id, score.total_score, score.meets_threshold) == (recent.id, 14, True)
+        assert summary["scored"] == 1
+
+        assert bulk_score(db, agent, FakeTransport(None), days=30)["items"] == 0
+        summary = bulk_score(db, agent, FakeTransport(lambda custom_id, params: response, polls=0),
+                             days=30, rescore=True)
+        assert (summary["scored"], summary["replaced"]) == (1, 1)
+        assert db.query(ConfluenceScore).count() == 1
+        bulk_score(db, agent, FakeTransport(lambda custom_id, params: response, polls=0), days=30, rescore=True)
+        assert content_totals(db)["scored"] == 1
+
+    def test_bulk_extract_symbols(self, db):
+        kt = _raw(db, "kt_technical", "blog_post", "NVDA wave 4 support holding at 120, target 150. " * 3)
+        _raw(db, "kt_technical", "blog_post", "too short")
+        _raw(db, "42macro", "pdf", "x" * 500)
+        db.commit()
+        response = {"symbols": [{"symbol": "NVDA", "bias": "bullish", "levels": [
+            {"type": "support", "price": 120}, {"type": "target", "price": 150}]}],
+            "extraction_confidence": 0.9}
+        transport = FakeTransport(lambda custom_id, params: response, polls=0)
+
+        summary = bulk_extract_symbols(db, SymbolLevelExtractor(api_key="test-key-for-unit-tests"), transport)
+
+        assert [r["custom_id"] for r in transport.submitted[0]] == [f"raw-{kt.id}"]
+        assert (summary["items"], summary["extracted"], summary["levels_created"]) == (1, 1, 2)
+        levels = db.query(SymbolLevel).all()
+        assert {(level.symbol, level.price) for level in levels} == {("NVDA", 120), ("NVDA", 150)}
+        assert all(level.extracted_from_content_id == kt.id for level in levels)
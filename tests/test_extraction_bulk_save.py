@@ -0,0 +1,180 @@
+"""
+Tests for the bulk save path of SymbolLevelExtractor (PRD-039).
+
+Covers:
+- Statement count independent of symbol count
+- Upsert merge rules for existing states (primary support only moves up)
+- Confluence recomputed in the same transaction
+- Compass upsert
+- Levels without a price reported instead of failing the batch
+"""
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from agents.symbol_level_extractor import SymbolLevelExtractor
+from backend.models import Base, SymbolLevel, SymbolState
+from backend.services import level_index as level_index_module
+from backend.services import symbol_snapshot as symbol_snapshot_module
+from backend.services.level_index import LevelIndex
+from backend.services.symbol_snapshot import SymbolSnapshot
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'extraction.db'}")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def db(engine, monkeypatch):
+    monkeypatch.setattr(level_index_module, "_level_index", LevelIndex())
+    monkeypatch.setattr(symbol_snapshot_module, "_snapshot", SymbolSnapshot())
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def extractor():
+    return SymbolLevelExtractor(api_key="test-key-for-unit-tests")
+
+
+def _kt_symbols(count, levels_per_symbol=3, prefix="S"):
+    return [
+        {
+            "symbol": f"{prefix}{i}",
+            "bias": "bullish",
+            "levels": [{"type": "support", "price": 100.0 + i + j} for j in range(levels_per_symbol)]
+        }
+        for i in range(count)
+    ]
+
+
+def _count_statements(engine, fn):
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return statements
+
+
+class TestBulkExtractionSave:
+
+    def test_statement_count_independent_of_symbols(self, engine, db, extractor):
+        def save(count, prefix):
+            return _count_statements(engine, lambda: extractor.save_extraction_to_db(
+                db=db, extraction_result={"symbols": _kt_symbols(count, prefix=prefix)}, source="kt_technical"
+            ))
+
+        small = save(2, "A")
+        large = save(15, "B")
+
+        assert len(large) == len(small)
+        assert db.query(SymbolState).count() == 17
+        assert db.query(SymbolLevel).count() == 2 * 3 + 15 * 3
+
+    def test_summary_keys(self, db, extractor):
+        summary = extractor.save_extraction_to_db(
+            db=db, extraction_result={"symbols": _kt_symbols(4)}, source="kt_technical"
+        )
+
+        assert summary == {"symbols_processed": 4, "levels_created": 12, "states_updated": 4, "errors": []}
+
+    def test_upsert_merges_existing_state(self, db, extractor):
+        db.add(SymbolState(symbol="SPX", kt_primary_support=300.0, kt_primary_target=350.0,
+                           discord_quadrant="buy_call"))
+        db.commit()
+
+        extractor.save_extraction_to_db(
+            db=db,
+            extraction_result={"symbols": [{
+                "symbol": "SPX", "bias": "bullish", "notes": "wave 3",
+                "levels": [{"type": "support", "price": 290.0}, {"type": "invalidation", "price": 280.0}]
+            }]},
+            source="kt_technical"
+        )
+
+        state = db.query(SymbolState).filter_by(symbol="SPX").one()
+        assert db.query(SymbolState).count() == 1
+        assert state.kt_notes == "wave 3"
+        assert state.kt_primary_support == 300.0  # only moves up
+        assert state.kt_primary_target == 350.0  # kept when not extracted
+        assert state.kt_invalidation == 280.0
+        assert state.discord_quadrant == "buy_call"
+        assert state.confluence_score == 0.85
+        assert state.sources_directionally_aligned is True
+        assert "Support: 300.0" in state.trade_setup_suggestion
+
+    def test_level_ids_reach_level_index(self, db, extractor):
+        index = level_index_module.get_level_index()
+        db.add(SymbolLevel(symbol="SPX", source="discord", level_type="gamma", price=90.0))
+        db.commit()
+        index.nearest(db, "SPX", 100, k=1)
+
+        extractor.save_extraction_to_db(
+            db=db,
+            extraction_result={"symbols": [{"symbol": "SPX", "bias": "bullish",
+                                            "levels": [{"type": "target", "price": 110.0}]}]},
+            source="kt_technical"
+        )
+
+        nearest = index.nearest(db, "SPX", 109, k=1)[0]
+        stored = db.query(SymbolLevel).filter_by(price=110.0).one()
+        assert nearest["id"] == stored.id
+        assert index.loads == 1
+
+    def test_level_without_price_is_reported(self, db, extractor):
+        summary = extractor.save_extraction_to_db(
+            db=db,
+            extraction_result={"symbols": [{"symbol": "SPX", "bias": "bearish", "levels": [
+                {"type": "support", "price": None}, {"type": "target", "price": 250.0}
+            ]}]},
+            source="kt_technical"
+        )
+
+        assert summary["levels_created"] == 1
+        assert summary["errors"] == ["SPX: support level has no price"]
+        assert db.query(SymbolLevel).count() == 1
+
+    def test_discord_quadrant_only_when_present(self, db, extractor):
+        db.add(SymbolState(symbol="QQQ", discord_quadrant="sell_put"))
+        db.commit()
+
+        extractor.save_extraction_to_db(
+            db=db,
+            extraction_result={"symbols": [
+                {"symbol": "QQQ", "notes": "no quadrant"},
+                {"symbol": "SPX", "quadrant": "buy_put", "iv_regime": "cheap"},
+            ]},
+            source="discord"
+        )
+
+        states = {s.symbol: s for s in db.query(SymbolState).all()}
+        assert states["QQQ"].discord_quadrant == "sell_put"
+        assert states["QQQ"].discord_notes == "no quadrant"
+        assert states["SPX"].discord_quadrant == "buy_put"
+        assert states["SPX"].discord_iv_regime == "cheap"
+
+
+class TestBulkCompassSave:
+
+    def test_compass_upsert_and_confluence(self, db, extractor):
+        db.add(SymbolState(symbol="NVDA", kt_bias="bearish"))
+        db.commit()
+
+        summary = extractor.save_compass_to_db(db, {"compass_data": [
+            {"symbol": "NVDA", "quadrant": "buy_call", "iv_regime": "expensive"},
+            {"symbol": "TSLA", "quadrant": "sell_call", "iv_regime": "cheap"},
+        ]})
+
+        states = {s.symbol: s for s in db.query(SymbolState).all()}
+        assert summary == {"symbols_processed": 2, "states_updated": 2, "errors": []}
+        assert states["NVDA"].discord_quadrant == "buy_call"
+        assert states["NVDA"].confluence_score == 0.2
+        assert states["TSLA"].discord_iv_regime == "cheap"
+        assert states["TSLA"].confluence_score == 0.0
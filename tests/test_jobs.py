@@ -0,0 +1,389 @@
+"""
+Tests for persisted background jobs and their progress streams.
+
+Covers:
+- JobTracker: steps, state transitions and results persisted to the jobs table
+- job_progress events published from the event loop and from worker threads
+- run_job / start_job: success, failure recording and re-raise
+- Progress writes queued off the event loop, in order; job heartbeats
+- Reconciliation of jobs whose heartbeat stopped (restart, other workers)
+- follow_job: initial snapshot, live events, DB polling fallback, termination
+- Job routes: status, listing, SSE stream; synthesis progress read from jobs
+- Background batch classification job steps
+"""
+import asyncio
+import json
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.models import Base, Job, RawContent, Source
+from backend.services import jobs as jobs_module
+from backend.services import pubsub as pubsub_module
+from backend.services.jobs import (
+    JOB_CHANNEL, JobTracker, fail_interrupted_jobs, follow_job, get_job, run_job, start_job
+)
+from backend.services.pubsub import InMemoryPubSub
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    monkeypatch.setattr(pubsub_module, "_pubsub", InMemoryPubSub())
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def events():
+    received = []
+
+    async def handler(payload):
+        received.append(json.loads(payload))
+
+    pubsub_module.get_pubsub().subscribe(JOB_CHANNEL, handler)
+    return received
+
+
+async def _drain():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def _collect(stream):
+    return [s async for s in stream]
+
+
+class TestJobTracker:
+
+    def test_create_and_progress_persisted(self, db, session_factory):
+        tracker = JobTracker.create(db, "synthesis", {"time_window": "7d"}, user="testuser",
+                                    session_factory=session_factory)
+        assert get_job(db, tracker.job_id)["status"] == "queued"
+
+        tracker.start()
+        tracker.set_steps(["Loading content", "Merging analyses", "Extracting themes"], complete=1)
+        tracker.step("Merging analyses")
+        tracker.step("Merging analyses", "complete")
+        tracker.finish({"synthesis_id": 7})
+
+        job = get_job(session_factory(), tracker.job_id)
+        assert job["status"] == "succeeded"
+        assert job["params"] == {"time_window": "7d"} and job["created_by"] == "testuser"
+        assert [s["status"] for s in job["steps"]] == ["complete", "complete", "pending"]
+        assert job["current_step"] is None
+        assert job["result"] == {"synthesis_id": 7}
+        assert job["started_at"] and job["finished_at"]
+
+    def test_unknown_step_appended(self, db, session_factory):
+        tracker = JobTracker.create(db, "synthesis", session_factory=session_factory)
+        tracker.step("Cross-referencing")
+
+        job = get_job(session_factory(), tracker.job_id)
+        assert job["steps"] == [{"name": "Cross-referencing", "status": "in_progress"}]
+        assert job["current_step"] == "Cross-referencing"
+
+    @pytest.mark.asyncio
+    async def test_events_from_loop_and_worker_threads(self, db, session_factory, events):
+        tracker = JobTracker.create(db, "synthesis", session_factory=session_factory)
+        tracker.set_steps(["a", "b"])
+        await asyncio.to_thread(tracker.step, "a")
+        await tracker.flush()
+        await _drain()
+
+        assert [e["type"] for e in events] == ["job_progress", "job_progress"]
+        assert events[-1]["data"]["job_id"] == tracker.job_id
+        assert events[-1]["data"]["current_step"] == "a"
+        assert "result" not in events[-1]["data"]
+
+    @pytest.mark.asyncio
+    async def test_writes_from_loop_are_queued_in_order(self, db, session_factory, monkeypatch):
+        tracker = JobTracker.create(db, "synthesis", session_factory=session_factory)
+        writer_threads = []
+        write = tracker._write
+        monkeypatch.setattr(tracker, "_write",
+                            lambda fields: (writer_threads.append(threading.get_ident()), write(fields)))
+
+        tracker.start()
+        tracker.set_steps(["a", "b"])
+        tracker.step("a")
+        tracker.step("a", "complete")
+        tracker.finish({"ok": True})
+        assert get_job(session_factory(), tracker.job_id)["status"] == "queued"  # nothing written inline
+
+        await tracker.flush()
+        job = get_job(session_factory(), tracker.job_id)
+        assert (job["status"], job["result"], job["current_step"]) == ("succeeded", {"ok": True}, None)
+        assert job["steps"] == [{"name": "a", "status": "complete"}, {"name": "b", "status": "pending"}]
+        assert len(writer_threads) == 5 and threading.get_ident() not in writer_threads
+
+
+class TestRunJob:
+
+    @pytest.mark.asyncio
+    async def test_success_stores_summary(self, db, session_factory):
+        tracker = JobTracker.create(db, "synthesis", session_factory=session_factory)
+
+        async def work(t):
+            t.step("Merging analyses")
+            return {"status": "success", "synthesis_id": 3, "synthesis": "long text"}
+
+        result = await run_job(tracker, work, summarize=lambda r: {"synthesis_id": r["synthesis_id"]})
+
+        assert result["synthesis"] == "long text"
+        job = get_job(session_factory(), tracker.job_id)
+        assert (job["status"], job["result"]) == ("succeeded", {"synthesis_id": 3})
+
+    @pytest.mark.asyncio
+    async def test_failure_recorded_and_raised(self, db, session_factory):
+        tracker = JobTracker.create(db, "synthesis", session_factory=session_factory)
+
+        async def work(t):
+            raise RuntimeError("pipeline exploded")
+
+        with pytest.raises(RuntimeError):
+            await run_job(tracker, work)
+
+        job = get_job(session_factory(), tracker.job_id)
+        assert (job["status"], job["error"]) == ("failed", "pipeline exploded")
+
+    @pytest.mark.asyncio
+    async def test_start_job_runs_in_background(self, db, session_factory):
+        tracker = JobTracker.create(db, "classify_batch", session_factory=session_factory)
+        release = asyncio.Event()
+
+        async def work(t):
+            await release.wait()
+            return {"count": 1}
+
+        task = start_job(tracker, work)
+        await _drain()
+        await tracker.flush()
+        assert get_job(session_factory(), tracker.job_id)["status"] == "running"
+
+        release.set()
+        await task
+        assert get_job(session_factory(), tracker.job_id)["result"] == {"count": 1}
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_while_running(self, db, session_factory, monkeypatch):
+        monkeypatch.setattr(jobs_module, "JOB_HEARTBEAT_SECONDS", 0.01)
+        tracker = JobTracker.create(db, "synthesis", session_factory=session_factory)
+        beats = []
+        monkeypatch.setattr(tracker, "heartbeat", lambda: beats.append(1))
+
+        async def work(t):
+            await asyncio.sleep(0.1)
+            return {}
+
+        await run_job(tracker, work)
+        count = len(beats)
+        await asyncio.sleep(0.05)
+
+        assert count >= 2
+        assert len(beats) == count  # stopped with the job
+
+    @pytest.mark.asyncio
+    async def test_interrupted_jobs_failed_on_startup(self, db, session_factory):
+        queued = JobTracker.create(db, "synthesis", session_factory=session_factory)
+        orphaned = JobTracker.create(db, "synthesis", session_factory=session_factory)
+        orphaned.loop = None
+        orphaned.start()
+        orphaned.step("Merging analyses")
+        other_worker = JobTracker.create(db, "synthesis", session_factory=session_factory)
+        other_worker.loop = None
+        other_worker.start()
+        live = JobTracker.create(db, "classify_batch", session_factory=session_factory)
+        release = asyncio.Event()
+        task = start_job(live, lambda t: release.wait())
+        await _drain()
+        await live.flush()
+
+        # Heartbeats stopped long ago, except for the job another worker is still running
+        stale = datetime.utcnow() - timedelta(seconds=jobs_module.JOB_STALE_SECONDS + 60)
+        db.query(Job).filter(Job.id != other_worker.job_id).update({Job.updated_at: stale})
+        db.commit()
+
+        assert fail_interrupted_jobs(session_factory()) == 2
+
+        for tracker in (queued, orphaned):
+            job = get_job(session_factory(), tracker.job_id)
+            assert (job["status"], job["error"], job["current_step"]) == ("failed", "interrupted", None)
+            assert job["finished_at"]
+        assert get_job(session_factory(), live.job_id)["status"] == "running"
+        assert get_job(session_factory(), other_worker.job_id)["status"] == "running"
+        stream = [s async for s in follow_job(orphaned.job_id, session_factory, poll_interval=5)]
+        assert [s["status"] for s in stream] == ["failed"]
+
+        release.set()
+        await task
+
+
+class TestFollowJob:
+
+    @pytest.mark.asyncio
+    async def test_streams_until_terminal(self, db, session_factory):
+        tracker = JobTracker.create(db, "synthesis", session_factory=session_factory)
+        tracker.set_steps(["a", "b"])
+        release = asyncio.Event()
+
+        async def work(t):
+            await release.wait()
+            t.step("a")
+            t.step("a", "complete")
+            return {"ok": True}
+
+        seen = []
+
+        async def consume():
+            async for snapshot in follow_job(tracker.job_id, session_factory, poll_interval=5):
+                seen.append(snapshot)
+
+        consumer = asyncio.create_task(consume())
+        await _drain()
+        start_job(tracker, work)
+        release.set()
+        await asyncio.wait_for(consumer, timeout=5)
+
+        assert seen[0]["status"] == "queued"
+        assert any(s["current_step"] == "a" for s in seen)
+        assert seen[-1]["status"] == "succeeded"
+        assert seen[-1]["result"] == {"ok": True}
+
+    @pytest.mark.asyncio
+    async def test_polls_db_without_events(self, db, session_factory):
+        """Progress made in another worker (no local event) is picked up by polling."""
+        tracker = JobTracker.create(db, "synthesis", session_factory=session_factory)
+        tracker.loop = None  # events never published
+
+        async def consume():
+            return [s async for s in follow_job(tracker.job_id, session_factory, poll_interval=0.05)]
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0.1)
+        tracker.start()
+        tracker.finish({"done": 1})
+        seen = await asyncio.wait_for(consumer, timeout=5)
+
+        assert None in seen  # keepalive while idle
+        assert [s["status"] for s in seen if s][-1] == "succeeded"
+
+    @pytest.mark.asyncio
+    async def test_job_without_heartbeat_fails(self, db, session_factory, monkeypatch):
+        """A job whose process went away after startup ends the stream as interrupted."""
+        monkeypatch.setattr(jobs_module, "JOB_STALE_SECONDS", 0.1)
+        tracker = JobTracker.create(db, "synthesis", session_factory=session_factory)
+        tracker.loop = None
+        tracker.start()
+
+        seen = await asyncio.wait_for(
+            _collect(follow_job(tracker.job_id, session_factory, poll_interval=0.05)), timeout=5
+        )
+
+        assert seen[0]["status"] == "running"
+        assert (seen[-1]["status"], seen[-1]["error"]) == ("failed", "interrupted")
+
+    @pytest.mark.asyncio
+    async def test_unknown_job(self, session_factory):
+        assert [s async for s in follow_job("missing", session_factory)] == []
+
+
+class TestJobRoutes:
+
+    @pytest.fixture
+    def app_db(self, test_app, session_factory):
+        from backend.models import get_db
+
+        def override():
+            session = session_factory()
+            try:
+                yield session
+            finally:
+                session.close()
+
+        test_app.dependency_overrides[get_db] = override
+        yield session_factory
+        test_app.dependency_overrides.pop(get_db, None)
+
+    @pytest.mark.asyncio
+    async def test_status_list_and_stream(self, client, jwt_headers, app_db):
+        db = app_db()
+        tracker = JobTracker.create(db, "synthesis", {"time_window": "24h"}, session_factory=app_db)
+        tracker.set_steps(["Loading content"])
+        tracker.finish({"synthesis_id": 1})
+        await tracker.flush()
+
+        response = await client.get(f"/api/jobs/{tracker.job_id}", headers=jwt_headers)
+        assert response.status_code == 200
+        assert response.json()["status"] == "succeeded"
+
+        response = await client.get("/api/jobs?kind=synthesis", headers=jwt_headers)
+        assert [j["job_id"] for j in response.json()["jobs"]] == [tracker.job_id]
+
+        response = await client.get(f"/api/jobs/{tracker.job_id}/events", headers=jwt_headers)
+        assert response.headers["content-type"].startswith("text/event-stream")
+        data = [json.loads(line[5:]) for line in response.text.splitlines() if line.startswith("data:")]
+        assert data[-1]["result"] == {"synthesis_id": 1}
+
+        assert (await client.get("/api/jobs/missing", headers=jwt_headers)).status_code == 404
+        assert (await client.get("/api/jobs")).status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_synthesis_progress_reads_latest_job(self, client, jwt_headers, app_db):
+        response = await client.get("/api/synthesis/progress", headers=jwt_headers)
+        assert response.json()["active"] is False
+
+        tracker = JobTracker.create(app_db(), "synthesis", session_factory=app_db)
+        tracker.start()
+        tracker.set_steps(["Loading content", "Merging analyses"], complete=1)
+        tracker.step("Merging analyses")
+        await tracker.flush()
+
+        progress = (await client.get("/api/synthesis/progress", headers=jwt_headers)).json()
+        assert progress["active"] is True and progress["job_id"] == tracker.job_id
+        assert progress["current_step"] == "Merging analyses"
+        assert progress["steps"][0] == {"name": "Loading content", "status": "complete"}
+
+
+class TestClassifyJob:
+
+    @pytest.mark.asyncio
+    async def test_chunked_steps(self, db, session_factory, monkeypatch):
+        from backend.routes import analyze
+
+        source = Source(name="discord", type="discord")
+        db.add(source)
+        db.flush()
+        db.add_all([RawContent(source_id=source.id, content_type="text", content_text=f"msg {i}")
+                    for i in range(5)])
+        db.commit()
+
+        def fake_classify_and_route(session, items):
+            for item in items:
+                item.processed = True
+            return [{"raw_content_id": item.id} for item in items], {"items": len(items), "batches": [{}]}
+
+        monkeypatch.setattr(analyze, "classify_and_route", fake_classify_and_route)
+        monkeypatch.setattr(analyze, "CLASSIFY_JOB_CHUNK", 2)
+        tracker = JobTracker.create(db, "classify_batch", session_factory=session_factory)
+
+        await run_job(tracker, lambda t: analyze._run_classify_job(session_factory, 10, True, t))
+
+        job = get_job(session_factory(), tracker.job_id)
+        assert [s["name"] for s in job["steps"]] == [
+            "Classifying items 1-2", "Classifying items 3-4", "Classifying items 5-5"
+        ]
+        assert all(s["status"] == "complete" for s in job["steps"])
+        assert job["result"]["count"] == 5
+        assert job["result"]["classification_stats"] == {"items": 5, "batches": [{}, {}, {}]}
+        assert session_factory().query(RawContent).filter(RawContent.processed == False).count() == 0
@@ -0,0 +1,153 @@
+"""
+Tests for the async KT Technical collector, run against the recorded blog
+replayed by scripts/benchmark_kt_collector.py.
+
+Covers:
+- Login, feed parsing and posts returned in feed order
+- Chart images streamed to disk with unique names; icons filtered
+- Image concurrency limit
+- Conditional rerun: unchanged posts answer 304 and are skipped
+- Validators committed only after a save (dry runs leave them untouched)
+- JSON cookie persistence
+- Benchmark report
+"""
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from collectors.kt_technical import KTTechnicalCollector
+
+SCRIPT_PATH = Path(__file__).parent.parent / "scripts" / "benchmark_kt_collector.py"
+
+
+@pytest.fixture(scope="module")
+def benchmark():
+    spec = importlib.util.spec_from_file_location("benchmark_kt_collector", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def blog(benchmark, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    server, base_url = benchmark.start_fixture_server(latency=0.01, image_bytes=20 * 1024)
+    yield server, base_url
+    server.shutdown()
+    server.server_close()
+
+
+def _collector(base_url, **kwargs):
+    return KTTechnicalCollector("user@example.com", "secret", base_url=base_url, **kwargs)
+
+
+class TestCollect:
+
+    @pytest.mark.asyncio
+    async def test_collects_posts_and_images(self, blog, tmp_path):
+        server, base_url = blog
+        collector = _collector(base_url, image_concurrency=3)
+
+        posts = await collector.collect()
+
+        assert [p["url"].rsplit("/", 2)[-2] for p in posts] == [
+            f"weekly-market-update-{day}-2025" for day in
+            ("november-16", "november-9", "november-2", "october-26", "october-19", "october-12")
+        ]
+        first = posts[0]
+        assert first["content_type"] == "blog_post"
+        assert first["metadata"]["published_date"]
+        assert all("icon" not in url and "logo" not in url for p in posts for url in p["metadata"]["image_urls"])
+
+        paths = [path for p in posts for path in p["metadata"]["image_paths"]]
+        assert len(paths) == len(set(paths)) == server.counts["image"] == collector.stats["images_downloaded"]
+        assert all((tmp_path / path).stat().st_size == 20 * 1024 for path in paths)
+        assert collector.stats["image_bytes"] == 20 * 1024 * len(paths)
+        assert 0 < server.max_images_in_flight <= 3
+        assert collector.session is None
+
+    @pytest.mark.asyncio
+    async def test_unchanged_posts_skipped_on_rerun(self, blog, tmp_path):
+        server, base_url = blog
+        first = _collector(base_url)
+        assert len(await first.collect()) == 6
+        first.commit_validators()
+        images = server.counts["image"]
+
+        collector = _collector(base_url)
+        assert await collector.collect() == []
+
+        assert collector.stats["posts_unchanged"] == 6
+        assert server.counts["post_not_modified"] == 6
+        assert server.counts["image"] == images
+        assert len(json.loads((tmp_path / KTTechnicalCollector.HTTP_CACHE_FILE).read_text())) == 6
+
+    @pytest.mark.asyncio
+    async def test_dry_run_then_real_run_returns_posts(self, blog, tmp_path, monkeypatch):
+        from backend.models import Base, RawContent
+        from backend.routes.trigger import _collect_from_source
+
+        server, base_url = blog
+        monkeypatch.setattr(KTTechnicalCollector, "BASE_URL", base_url)
+        monkeypatch.setenv("KT_EMAIL", "user@example.com")
+        monkeypatch.setenv("KT_PASSWORD", "secret")
+        engine = create_engine(f"sqlite:///{tmp_path / 'kt.db'}")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+
+        try:
+            assert len(await _collect_from_source(None, "kt_technical", dry_run=True)) == 6
+            assert not (tmp_path / KTTechnicalCollector.HTTP_CACHE_FILE).exists()
+
+            assert len(await _collect_from_source(db, "kt_technical")) == 6
+            assert db.query(RawContent).count() == 6
+            assert "post_not_modified" not in server.counts
+
+            # Saved, so the validators are committed and the next run is conditional
+            assert await _collect_from_source(db, "kt_technical") == []
+            assert server.counts["post_not_modified"] == 6
+        finally:
+            db.close()
+
+    @pytest.mark.asyncio
+    async def test_unconditional_refetches(self, blog):
+        server, base_url = blog
+        first = _collector(base_url)
+        await first.collect()
+        first.commit_validators()
+
+        assert len(await _collector(base_url, conditional=False).collect()) == 6
+        assert "post_not_modified" not in server.counts
+
+    @pytest.mark.asyncio
+    async def test_cookies_saved_as_json(self, blog, tmp_path):
+        server, base_url = blog
+        await _collector(base_url).collect()
+        saved = json.loads((tmp_path / KTTechnicalCollector.COOKIE_FILE).read_text())
+        assert [c["name"] for c in saved] == ["wordpress_logged_in_kt"]
+
+        collector = _collector(base_url)
+        collector.session = collector._open_session()
+        try:
+            assert collector.load_cookies()
+            assert [m.value for m in collector.session.cookie_jar] == ["replay-session"]
+        finally:
+            await collector.close()
+
+
+class TestBenchmark:
+
+    def test_report(self, benchmark, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+
+        report = benchmark.run_benchmark(latency=0.01, image_kb=8)
+
+        scenarios = report["scenarios"]
+        assert list(scenarios) == ["sequential", "concurrent", "unchanged rerun"]
+        assert scenarios["sequential"]["posts_collected"] == scenarios["concurrent"]["posts_collected"] == 6
+        assert scenarios["unchanged rerun"]["posts_unchanged"] == 6
+        assert scenarios["concurrent"]["seconds"] < scenarios["sequential"]["seconds"]
@@ -0,0 +1,179 @@
+"""
+Tests for the price-proximity level index (backend/services/level_index.py).
+
+Covers:
+- k-nearest queries (points and ranges, percentage band, source filter)
+- Range-overlap queries
+- KT Technical / Discord overlap sweep
+- Maintenance on insert, dismissal and staleness; TTL expiry
+"""
+import random
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.models import Base, SymbolLevel
+from backend.services import level_index as level_index_module
+from backend.services.level_index import LevelIndex, SymbolIntervals
+
+
+def _entry(id, low, high=None, source="kt_technical"):
+    return {"id": id, "symbol": "SPX", "source": source, "type": "support",
+            "price": low, "price_upper": high, "low": low, "high": high if high is not None else low}
+
+
+def _brute_nearest(entries, price, k, max_distance=None):
+    def distance(e):
+        return max(e["low"] - price, price - e["high"], 0.0)
+    candidates = [e for e in entries if max_distance is None or distance(e) <= max_distance]
+    return [e["id"] for e in sorted(candidates, key=lambda e: (distance(e), e["id"]))[:k]]
+
+
+class TestSymbolIntervals:
+
+    def test_nearest_points(self):
+        intervals = SymbolIntervals([_entry(1, 100), _entry(2, 105), _entry(3, 110), _entry(4, 98)])
+
+        result = intervals.nearest(104, k=2)
+
+        assert [e["id"] for e in result] == [2, 1]
+        assert result[0]["distance"] == 1
+
+    def test_wide_range_containing_price_is_nearest(self):
+        # Starts far to the left but covers the price
+        intervals = SymbolIntervals([_entry(1, 50, 200), _entry(2, 101), _entry(3, 95)])
+
+        result = intervals.nearest(150, k=1)
+
+        assert result[0]["id"] == 1
+        assert result[0]["distance"] == 0
+
+    def test_max_distance_band(self):
+        intervals = SymbolIntervals([_entry(1, 100), _entry(2, 103), _entry(3, 99.5)])
+
+        result = intervals.nearest(100, k=5, max_distance=1.0)
+
+        assert sorted(e["id"] for e in result) == [1, 3]
+
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        entries = []
+        for i in range(300):
+            low = rng.uniform(0, 1000)
+            high = low + rng.choice([0, 0, rng.uniform(0, 40)])
+            entries.append(_entry(i, low, high))
+        intervals = SymbolIntervals(entries)
+
+        for _ in range(50):
+            price = rng.uniform(-50, 1050)
+            k = rng.randint(1, 10)
+            band = rng.choice([None, 5.0, 50.0])
+            assert [e["id"] for e in intervals.nearest(price, k, band)] == _brute_nearest(entries, price, k, band)
+
+    def test_overlapping_range(self):
+        intervals = SymbolIntervals([_entry(1, 90, 100), _entry(2, 105), _entry(3, 120, 130), _entry(4, 10, 200)])
+
+        assert sorted(e["id"] for e in intervals.overlapping(99, 110)) == [1, 2, 4]
+        assert sorted(e["id"] for e in intervals.overlapping(131, 140)) == [4]
+
+    def test_cross_source_overlaps(self):
+        intervals = SymbolIntervals([
+            _entry(1, 313, 319, "kt_technical"),
+            _entry(2, 315, None, "discord"),
+            _entry(3, 400, None, "kt_technical"),
+            _entry(4, 402, None, "discord"),
+            _entry(5, 330, None, "discord"),
+        ])
+
+        exact = intervals.cross_source_overlaps()
+        padded = intervals.cross_source_overlaps(tolerance_pct=0.5)
+
+        assert [(p["kt_technical"]["id"], p["discord"]["id"]) for p in exact] == [(1, 2)]
+        assert sorted((p["kt_technical"]["id"], p["discord"]["id"]) for p in padded) == [(1, 2), (3, 4)]
+
+
+class TestLevelIndexMaintenance:
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'levels.db'}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        session.add_all([
+            SymbolLevel(symbol="SPX", source="kt_technical", level_type="support", price=100.0, is_active=True),
+            SymbolLevel(symbol="SPX", source="discord", level_type="resistance", price=110.0, is_active=True),
+            SymbolLevel(symbol="SPX", source="kt_technical", level_type="support", price=101.0, is_active=False),
+            SymbolLevel(symbol="SPX", source="kt_technical", level_type="support", price=102.0, is_active=True,
+                        is_stale=True),
+        ])
+        session.commit()
+        yield session
+        session.close()
+
+    @pytest.fixture
+    def index(self, monkeypatch):
+        index = LevelIndex()
+        monkeypatch.setattr(level_index_module, "_level_index", index)
+        return index
+
+    def test_loads_active_non_stale_levels_once(self, db, index):
+        first = index.nearest(db, "SPX", 101, k=5)
+        index.nearest(db, "SPX", 108, k=5)
+
+        assert sorted(e["price"] for e in first) == [100.0, 110.0]
+        assert index.loads == 1
+
+    def test_expired_symbol_reloads(self, db, index, monkeypatch):
+        """Levels dismissed by another worker drop out once the symbol expires."""
+        index.nearest(db, "SPX", 100, k=5)
+        db.query(SymbolLevel).filter(SymbolLevel.price == 110.0).update({"is_active": False})
+        db.commit()
+
+        assert len(index.nearest(db, "SPX", 100, k=5)) == 2
+        monkeypatch.setattr(index, "ttl_seconds", 0)
+
+        assert [e["price"] for e in index.nearest(db, "SPX", 100, k=5)] == [100.0]
+        assert index.loads == 2
+
+    def test_source_filter(self, db, index):
+        result = index.nearest(db, "SPX", 101, k=5, source="discord")
+
+        assert [e["price"] for e in result] == [110.0]
+
+    def test_extraction_inserts_into_loaded_symbol(self, db, index):
+        from agents.symbol_level_extractor import SymbolLevelExtractor
+
+        index.nearest(db, "SPX", 100, k=1)
+        extractor = SymbolLevelExtractor(api_key="test-key-for-unit-tests")
+        extractor.save_extraction_to_db(
+            db=db,
+            extraction_result={"symbols": [
+                {"symbol": "SPX", "bias": "bullish", "levels": [{"type": "target", "price": 104.5}]}
+            ]},
+            source="kt_technical"
+        )
+
+        result = index.nearest(db, "SPX", 104, k=1)
+        assert result[0]["price"] == 104.5
+        assert index.loads == 1
+
+    def test_remove_level(self, db, index):
+        result = index.nearest(db, "SPX", 100, k=1)
+
+        index.remove_level("SPX", result[0]["id"])
+
+        assert [e["price"] for e in index.nearest(db, "SPX", 100, k=5)] == [110.0]
+
+    def test_staleness_refresh_reloads_symbol(self, db, index):
+        from backend.models import SymbolState
+        from backend.utils.staleness_manager import refresh_staleness_for_symbol
+
+        db.add(SymbolState(symbol="SPX"))
+        db.commit()
+        index.nearest(db, "SPX", 100, k=5)
+
+        refresh_staleness_for_symbol(db, "SPX", "kt_technical")
+
+        assert sorted(e["price"] for e in index.nearest(db, "SPX", 100, k=5)) == [100.0, 102.0, 110.0]
+        assert index.loads == 2
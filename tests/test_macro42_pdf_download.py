@@ -0,0 +1,259 @@
+"""
+Tests for 42 Macro direct PDF downloads.
+
+Covers:
+- PDF discovery from research cards and from research API responses
+- Stored reports (raw_content) and locked reports skipped before download
+- Concurrent streamed downloads; non-PDF responses rejected
+- Fallback to click mode when no URLs are found or all downloads fail
+- existing_report_keys dedup helper and the report-keys endpoint used in Railway mode
+"""
+import json
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.models import Base, RawContent, Source
+from backend.utils.deduplication import existing_report_keys
+from collectors.macro42_selenium import Macro42Collector, reports_from_api
+
+PDF_BYTES = b"%PDF-1.4\n" + b"x" * 200
+
+
+class FakeElement:
+
+    def __init__(self, text="", attrs=None, children=None):
+        self.text = text
+        self.attrs = attrs or {}
+        self.children = children or {}
+
+    def get_attribute(self, name):
+        return self.attrs.get(name)
+
+    def find_elements(self, by, selector):
+        return self.children.get(selector, [])
+
+    def find_element(self, by, selector):
+        found = self.find_elements(by, selector)
+        if not found:
+            from selenium.common.exceptions import NoSuchElementException
+            raise NoSuchElementException(selector)
+        return found[0]
+
+
+def _card(report_type, date, href=None, locked=False):
+    children = {".capitalize": [FakeElement(report_type)], ".text-select.font-bold": [FakeElement(date)]}
+    if href:
+        children["a[href]"] = [FakeElement(attrs={"href": href})]
+    if locked:
+        children["svg.text-white.absolute"] = [FakeElement()]
+    return FakeElement(children=children)
+
+
+class FakeDriver:
+
+    def __init__(self, cards, resources=()):
+        self.cards = cards
+        self.resources = list(resources)
+        self.waits = []
+
+    def get(self, url):
+        self.current_url = url
+
+    def implicitly_wait(self, seconds):
+        self.waits.append(seconds)
+
+    def find_element(self, by, selector):
+        return self.cards[0] if self.cards else None
+
+    def find_elements(self, by, selector):
+        return self.cards
+
+    def execute_script(self, script, *args):
+        if "navigator.userAgent" in script:
+            return "TestBrowser/1.0"
+        return self.resources
+
+    def get_cookies(self):
+        return [{"name": "session", "value": "abc", "domain": "app.42macro.com", "path": "/"}]
+
+
+class FakeResponse:
+
+    def __init__(self, body=b"", status_code=200, content_type="application/pdf"):
+        self.body = body
+        self.status_code = status_code
+        self.headers = {"Content-Type": content_type}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+    def json(self):
+        return json.loads(self.body)
+
+
+class FakeSession:
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requested = []
+
+    def get(self, url, **kwargs):
+        self.requested.append(url)
+        return self.responses.get(url, FakeResponse(status_code=404))
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def collector(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("collectors.macro42_selenium.extract_pdf_text", lambda path: "report text")
+    collector = Macro42Collector("user@example.com", "secret", pdf_mode="direct", known_reports=set())
+    collector.PDF_CHUNK_BYTES = 64
+    return collector
+
+
+def _use(collector, driver, session, monkeypatch, click_result=None):
+    collector.driver = driver
+    monkeypatch.setattr(collector, "_http_session", lambda: session)
+    clicked = []
+
+    def click():
+        clicked.append(True)
+        return click_result or []
+
+    monkeypatch.setattr(collector, "_collect_pdfs_click", click)
+    return clicked
+
+
+class TestDirectDownloads:
+
+    def test_downloads_card_links_skipping_known_and_locked(self, collector, monkeypatch):
+        base = "https://app.42macro.com/files"
+        driver = FakeDriver([
+            _card("Leadoff Morning Note", "Tuesday, November 18, 2025", f"{base}/lmn.pdf?sig=1"),
+            _card("Around The Horn", "Sunday, November 16, 2025", f"{base}/ath.pdf"),
+            _card("Macro Scouting Report", "Monday, November 17, 2025", f"{base}/msr.pdf", locked=True),
+        ])
+        session = FakeSession({f"{base}/lmn.pdf?sig=1": FakeResponse(PDF_BYTES),
+                               f"{base}/ath.pdf": FakeResponse(PDF_BYTES)})
+        clicked = _use(collector, driver, session, monkeypatch)
+        collector.known_reports = {("Around The Horn", "Sunday, November 16, 2025")}
+
+        pdfs = collector._collect_pdfs()
+
+        assert session.requested == [f"{base}/lmn.pdf?sig=1"]
+        assert not clicked
+        assert len(pdfs) == 1
+        item = pdfs[0]
+        assert item["url"] == f"{base}/lmn.pdf"
+        assert item["metadata"]["report_type"] == "Leadoff Morning Note"
+        assert item["metadata"]["download_mode"] == "direct"
+        assert item["content_text"].startswith("Leadoff Morning Note - Tuesday, November 18, 2025")
+        with open(item["file_path"], "rb") as f:
+            assert f.read() == PDF_BYTES
+        # Card lookups ran without the implicit wait, which was restored afterwards
+        assert driver.waits[-1] == collector.IMPLICIT_WAIT_SECONDS and 0 in driver.waits
+
+    def test_discovers_urls_from_page_api_requests(self, collector, monkeypatch):
+        api = "https://api.42macro.com/research?page=1"
+        pdf = "https://cdn.42macro.com/reports/ath.pdf"
+        listing = {"data": [{"report_type": "around_the_horn", "published_at": "2025-11-16T12:00:00Z",
+                             "file": {"url": pdf}}]}
+        driver = FakeDriver([_card("Around The Horn", "Sunday, November 16, 2025")], resources=[api])
+        session = FakeSession({api: FakeResponse(json.dumps(listing).encode(), content_type="application/json"),
+                               pdf: FakeResponse(PDF_BYTES)})
+        _use(collector, driver, session, monkeypatch)
+
+        pdfs = collector._collect_pdfs()
+
+        assert [p["metadata"]["date"] for p in pdfs] == ["Sunday, November 16, 2025"]
+        assert pdfs[0]["metadata"]["report_type"] == "Around The Horn"
+
+    def test_falls_back_to_click_without_urls(self, collector, monkeypatch):
+        clicked = _use(collector, FakeDriver([_card("Around The Horn", "Sunday")]), FakeSession({}),
+                       monkeypatch, click_result=[{"content_type": "pdf"}])
+
+        assert collector._collect_pdfs() == [{"content_type": "pdf"}]
+        assert clicked
+
+    def test_falls_back_when_every_download_fails(self, collector, monkeypatch):
+        url = "https://app.42macro.com/files/ath.pdf"
+        session = FakeSession({url: FakeResponse(b"<html>login</html>", content_type="text/html")})
+        clicked = _use(collector, FakeDriver([_card("Around The Horn", "Sunday", url)]), session, monkeypatch)
+
+        assert collector._collect_pdfs() == []
+        assert clicked
+        assert not list(collector.download_dir.glob("*.pdf*"))
+
+    def test_reports_from_api(self):
+        data = {"items": [
+            {"title": "Leadoff Morning Note", "date": "2025-11-18", "pdf": "https://x/a.pdf"},
+            {"title": "Video", "date": "2025-11-18", "url": "https://vimeo.com/1"},
+        ]}
+
+        assert reports_from_api(data) == [{"report_type": "Leadoff Morning Note", "date": "Tuesday, November 18, 2025",
+                                           "pdf_url": "https://x/a.pdf", "is_locked": False}]
+
+
+class TestExistingReportKeys:
+
+    def test_keys_from_stored_pdfs(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'dedup.db'}")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        source = Source(name="42macro", type="42macro")
+        db.add(source)
+        db.flush()
+        db.add_all([
+            RawContent(source_id=source.id, content_type="pdf",
+                       json_metadata=json.dumps({"report_type": "Around The Horn", "date": "Sunday"})),
+            RawContent(source_id=source.id, content_type="video",
+                       json_metadata=json.dumps({"report_type": "Around The Horn", "date": "Monday"})),
+        ])
+        db.commit()
+
+        assert existing_report_keys(db, source.id) == {("Around The Horn", "Sunday")}
+        db.close()
+
+    @pytest.mark.asyncio
+    async def test_report_keys_endpoint(self, client, jwt_headers, test_app, tmp_path):
+        from backend.models import get_db
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'keys.db'}")
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine)
+        db = session_factory()
+        source = Source(name="42macro", type="42macro")
+        db.add(source)
+        db.flush()
+        db.add(RawContent(source_id=source.id, content_type="pdf",
+                          json_metadata=json.dumps({"report_type": "Leadoff Morning Note", "date": "Monday"})))
+        db.commit()
+        db.close()
+
+        def override():
+            session = session_factory()
+            try:
+                yield session
+            finally:
+                session.close()
+
+        test_app.dependency_overrides[get_db] = override
+        try:
+            response = await client.get("/api/collect/42macro/report-keys", headers=jwt_headers)
+        finally:
+            test_app.dependency_overrides.pop(get_db, None)
+
+        assert response.status_code == 200
+        assert response.json() == {"reports": [["Leadoff Morning Note", "Monday"]]}
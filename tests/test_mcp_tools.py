@@ -108,6 +108,20 @@ class TestClientMethods:
             client.get_theme_evolution(theme_id=7)
             mock.assert_called_once_with("GET", "/api/dashboard/historical/7")
 
+    @patch.dict(os.environ, {"CONFLUENCE_USERNAME": "test", "CONFLUENCE_PASSWORD": "test"})
+    def test_get_job(self):
+        client = self._make_client()
+        with patch.object(client, '_request', return_value={}) as mock:
+            client.get_job("abc123")
+            mock.assert_called_once_with("GET", "/api/jobs/abc123")
+
+    @patch.dict(os.environ, {"CONFLUENCE_USERNAME": "test", "CONFLUENCE_PASSWORD": "test"})
+    def test_list_jobs(self):
+        client = self._make_client()
+        with patch.object(client, '_request', return_value={}) as mock:
+            client.list_jobs(kind="synthesis", limit=5)
+            mock.assert_called_once_with("GET", "/api/jobs", params={"limit": 5, "kind": "synthesis"})
+
     @patch.dict(os.environ, {"CONFLUENCE_USERNAME": "test", "CONFLUENCE_PASSWORD": "test"})
     def test_get_synthesis_quality_latest(self):
         client = self._make_client()
@@ -136,6 +150,20 @@ class TestClientMethods:
             client.get_symbol_detail("SPX")
             mock.assert_called_once_with("GET", "/api/symbols/SPX")
 
+    @patch.dict(os.environ, {"CONFLUENCE_USERNAME": "test", "CONFLUENCE_PASSWORD": "test"})
+    def test_get_nearest_levels(self):
+        client = self._make_client()
+        with patch.object(client, '_request', return_value={}) as mock:
+            client.get_nearest_levels("SPX", 5000.0, k=3, within_pct=1.0)
+            mock.assert_called_once_with("GET", "/api/symbols/SPX/levels/nearest?price=5000.0&k=3&within_pct=1.0")
+
+    @patch.dict(os.environ, {"CONFLUENCE_USERNAME": "test", "CONFLUENCE_PASSWORD": "test"})
+    def test_get_overlapping_levels_range(self):
+        client = self._make_client()
+        with patch.object(client, '_request', return_value={}) as mock:
+            client.get_overlapping_levels("SPX", low=4950.0, high=5050.0)
+            mock.assert_called_once_with("GET", "/api/symbols/SPX/levels/overlaps?low=4950.0&high=5050.0")
+
 
 # ============================================================================
 # B. Error handling tests
@@ -234,6 +262,9 @@ class TestServerToolDefinitions:
     def test_get_theme_evolution_tool_defined(self):
         assert 'name="get_theme_evolution"' in self.server_source
 
+    def test_get_job_status_tool_defined(self):
+        assert 'name="get_job_status"' in self.server_source
+
     def test_synthesis_id_required_error_handling(self):
         """Verify synthesis_id required check exists in handler."""
         assert 'synthesis_id is required' in self.server_source
@@ -0,0 +1,198 @@
+"""
+Tests for the ticker / theme mention index.
+
+Covers:
+- Ticker normalization through SymbolLevelExtractor.SYMBOL_ALIASES
+- Index maintained on analysis insert, edit and delete
+- Backfill from existing analyzed_content rows (forced and at startup when empty)
+- Focus-topic filtering (LIKE wildcards matched literally) and cross-reference contradictions via the index
+- Per-ticker timeline
+"""
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.models import AnalyzedContent, Base, RawContent, Source, ThemeMention, TickerMention
+from backend.services.mention_index import (
+    backfill_mention_index,
+    content_themes,
+    content_tickers,
+    normalize_ticker,
+    rebuild_mention_index,
+    ticker_timeline,
+    tickers_by_content,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'mentions.db'}")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def source(db):
+    source = Source(name="youtube", type="youtube")
+    db.add(source)
+    db.commit()
+    return source
+
+
+def _analysis(db, source, tickers=None, themes=None, analyzed_at=None, sentiment="bullish", title="Video"):
+    raw = RawContent(source_id=source.id, content_type="video", json_metadata=json.dumps({"title": title}))
+    db.add(raw)
+    db.flush()
+    analyzed = AnalyzedContent(raw_content_id=raw.id, agent_type="transcript", analysis_result="{}",
+                               tickers_mentioned=tickers, key_themes=themes, sentiment=sentiment,
+                               conviction=7, analyzed_at=analyzed_at)
+    db.add(analyzed)
+    db.commit()
+    return analyzed
+
+
+def _tickers(db, analyzed_id):
+    return sorted(m.ticker for m in db.query(TickerMention).filter_by(analyzed_content_id=analyzed_id))
+
+
+class TestNormalization:
+
+    def test_aliases_and_futures(self):
+        assert normalize_ticker("Google") == "GOOGL"
+        assert normalize_ticker(" /ES ") == "SPX"
+        assert normalize_ticker("SPY") == "SPX"
+        assert normalize_ticker("$AMD") == "AMD"
+        assert normalize_ticker("") is None
+
+    def test_csv_and_json_lists(self):
+        assert content_tickers("SPY, spx,Nvidia") == ["SPX", "NVDA"]
+        assert content_themes('["AI  Capex", "ai capex", "Rates"]') == ["ai capex", "rates"]
+
+
+class TestIndexMaintenance:
+
+    def test_populated_on_insert(self, db, source):
+        analyzed = _analysis(db, source, tickers="SPY,Tesla", themes="Liquidity,Rates")
+
+        assert _tickers(db, analyzed.id) == ["SPX", "TSLA"]
+        mentions = db.query(ThemeMention).filter_by(analyzed_content_id=analyzed.id).all()
+        assert sorted(m.keyword for m in mentions) == ["liquidity", "rates"]
+        assert all(m.mentioned_at == analyzed.analyzed_at for m in mentions)
+
+    def test_resynced_on_edit(self, db, source):
+        analyzed = _analysis(db, source, tickers="SPX,QQQ")
+
+        analyzed.tickers_mentioned = "QQQ,BTC"
+        db.commit()
+
+        assert _tickers(db, analyzed.id) == ["BTC", "QQQ"]
+
+    def test_removed_with_analysis(self, db, source):
+        analyzed = _analysis(db, source, tickers="SPX", themes="rates")
+
+        db.delete(analyzed)
+        db.commit()
+
+        assert db.query(TickerMention).count() == 0
+        assert db.query(ThemeMention).count() == 0
+
+    def test_rebuild_from_existing_rows(self, db, source):
+        first = _analysis(db, source, tickers="SPY", themes="rates")
+        second = _analysis(db, source, tickers="Apple,MSFT")
+        db.query(TickerMention).delete()
+        db.query(ThemeMention).delete()
+        db.commit()
+
+        counts = rebuild_mention_index(db, batch_size=1)
+        db.commit()
+
+        assert counts == {"analyses": 2, "ticker_mentions": 3, "theme_mentions": 1}
+        assert tickers_by_content(db, [first.id, second.id]) == {first.id: ["SPX"], second.id: ["AAPL", "MSFT"]}
+
+    def test_backfill_only_when_empty(self, db, source):
+        assert backfill_mention_index(db) is None  # no analyses yet
+
+        _analysis(db, source, tickers="SPY", themes="rates")
+        assert backfill_mention_index(db) is None  # already indexed by the listener
+
+        db.query(TickerMention).delete()
+        db.query(ThemeMention).delete()
+        db.commit()
+
+        assert backfill_mention_index(db) == {"analyses": 1, "ticker_mentions": 1, "theme_mentions": 1}
+        db.commit()
+        assert db.query(ThemeMention).count() == 1
+
+
+class TestIndexReads:
+
+    def test_focus_topic_uses_index(self, db, source):
+        from backend.routes.trigger import _get_content_for_synthesis
+
+        _analysis(db, source, tickers="GOOG", themes="search ads")
+        _analysis(db, source, tickers="SPX", themes="AI capex boom")
+        _analysis(db, source, tickers="TLT", themes="duration")
+        cutoff = datetime.utcnow() - timedelta(days=1)
+
+        by_alias = _get_content_for_synthesis(db, cutoff, focus_topic="google")
+        by_theme = _get_content_for_synthesis(db, cutoff, focus_topic="capex")
+
+        assert [item["tickers"] for item in by_alias] == [["GOOG"]]
+        assert [item["tickers"] for item in by_theme] == [["SPX"]]
+
+    def test_focus_topic_wildcards_match_literally(self, db, source):
+        from backend.routes.trigger import _get_content_for_synthesis
+
+        _analysis(db, source, tickers="SPY", themes="50% retracement")
+        _analysis(db, source, tickers="TLT", themes="500 day average")
+        cutoff = datetime.utcnow() - timedelta(days=1)
+
+        assert [i["tickers"] for i in _get_content_for_synthesis(db, cutoff, focus_topic="50%")] == [["SPY"]]
+        assert _get_content_for_synthesis(db, cutoff, focus_topic="5_0") == []
+
+    def test_contradictions_group_canonical_tickers(self):
+        from agents.cross_reference import CrossReferenceAgent
+
+        agent = CrossReferenceAgent(api_key="test-key-for-unit-tests")
+        contradictions = agent._detect_contradictions([
+            {"content_source": "youtube", "variant_view": "bullish upside into year end", "tickers": ["SPX"]},
+            {"content_source": "discord", "variant_view": "bearish, expect downside", "tickers": ["SPX"]},
+        ])
+
+        assert [c["ticker"] for c in contradictions] == ["SPX"]
+
+    def test_ticker_timeline(self, db, source):
+        now = datetime.utcnow()
+        _analysis(db, source, tickers="NVDA", analyzed_at=now - timedelta(days=40), title="old")
+        _analysis(db, source, tickers="Nvidia", analyzed_at=now - timedelta(days=2), title="older")
+        _analysis(db, source, tickers="NVDA,SPX", analyzed_at=now - timedelta(hours=1),
+                  sentiment="bearish", title="newest")
+
+        timeline = ticker_timeline(db, "nvidia", days=30)
+
+        assert timeline["ticker"] == "NVDA"
+        assert timeline["total_mentions"] == 2
+        assert timeline["by_sentiment"] == {"bullish": 1, "bearish": 1}
+        assert [m["title"] for m in timeline["mentions"]] == ["newest", "older"]
+
+    def test_timeline_statement_count_fixed(self, engine, db, source):
+        for i in range(20):
+            _analysis(db, source, tickers="BTC")
+
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        timeline = ticker_timeline(db, "BTC", limit=5)
+
+        assert len(timeline["mentions"]) == 5
+        assert timeline["total_mentions"] == 20
+        assert len(statements) == 2
@@ -0,0 +1,291 @@
+"""
+Tests for the streaming SQLite -> PostgreSQL migrator (scripts/migrate_to_postgres.py).
+
+Covers:
+- Keyset-paginated batch reads
+- Dependency waves for parallel table copies
+- Value conversion and checksum canonical form
+- Checkpointed, resumable table copies (fake asyncpg pool)
+- Single-pass copy of tables keyed by uuid hex (jobs)
+"""
+import asyncio
+import importlib.util
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).parent.parent / "scripts" / "migrate_to_postgres.py"
+
+
+@pytest.fixture
+def migrator(tmp_path, monkeypatch):
+    spec = importlib.util.spec_from_file_location("migrate_to_postgres", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "CHECKPOINT_PATH", tmp_path / "checkpoint.json")
+    return module
+
+
+@pytest.fixture
+def source_db(tmp_path):
+    db_path = tmp_path / "confluence.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE sources (id INTEGER PRIMARY KEY, name TEXT, type TEXT, "
+        "active BOOLEAN, last_collected_at DATETIME, created_at DATETIME)"
+    )
+    conn.executemany(
+        "INSERT INTO sources (id, name, type, active, last_collected_at, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+        [(i, f"source-{i}", "youtube", i % 2, "2025-01-01 12:00:00", "2025-01-01T08:30:00.250000")
+         for i in range(1, 26)]
+    )
+    conn.commit()
+    conn.close()
+    return db_path
+
+
+class FakeConnection:
+    """Records COPY batches; can fail after a number of batches."""
+
+    def __init__(self, store, fail_after=None):
+        self.store = store
+        self.fail_after = fail_after
+        self.queries = []
+
+    def transaction(self):
+        conn = self
+
+        class _Tx:
+            async def __aenter__(self):
+                return conn
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Tx()
+
+    async def fetchval(self, query):
+        return max((r[0] for r in self.store), default=0)
+
+    async def copy_records_to_table(self, table, records, columns):
+        if self.fail_after is not None and self.fail_after <= 0:
+            raise ConnectionError("connection lost")
+        self.store.extend(records)
+        if self.fail_after is not None:
+            self.fail_after -= 1
+
+    async def execute(self, query):
+        if query.startswith("DELETE"):
+            self.store.clear()
+        self.queries.append(query)
+
+
+class FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def acquire(self):
+        conn = self.conn
+
+        class _Acquire:
+            async def __aenter__(self):
+                return conn
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Acquire()
+
+
+class TestKeysetBatches:
+
+    def test_batches_cover_all_rows_in_order(self, migrator, source_db):
+        conn = sqlite3.connect(source_db)
+        batches = list(migrator.iter_sqlite_batches(conn, "sources", ["id", "name"], batch_size=10))
+        conn.close()
+
+        assert [len(b) for b in batches] == [10, 10, 5]
+        assert [r[0] for b in batches for r in b] == list(range(1, 26))
+
+    def test_batches_resume_after_id(self, migrator, source_db):
+        conn = sqlite3.connect(source_db)
+        batches = list(migrator.iter_sqlite_batches(conn, "sources", ["id"], after_id=20, batch_size=10))
+        conn.close()
+
+        assert [r[0] for b in batches for r in b] == [21, 22, 23, 24, 25]
+
+    def test_batches_respect_upper_bound(self, migrator, source_db):
+        conn = sqlite3.connect(source_db)
+        batches = list(migrator.iter_sqlite_batches(conn, "sources", ["id"], after_id=5, until_id=8))
+        conn.close()
+
+        assert [r[0] for b in batches for r in b] == [6, 7, 8]
+
+
+class TestMigrationWaves:
+
+    def test_parents_precede_children(self, migrator):
+        waves = migrator.migration_waves(migrator.TABLES_IN_ORDER)
+        position = {t: i for i, wave in enumerate(waves) for t in wave}
+
+        assert position["sources"] < position["raw_content"] < position["analyzed_content"]
+        assert position["themes"] < position["theme_evidence"]
+        assert position["syntheses"] < position["synthesis_feedback"]
+
+    def test_independent_tables_share_a_wave(self, migrator):
+        waves = migrator.migration_waves(migrator.TABLES_IN_ORDER)
+
+        assert "sources" in waves[0]
+        assert "service_heartbeats" in waves[0]
+        assert sorted(t for wave in waves for t in wave) == sorted(migrator.TABLES_IN_ORDER)
+
+
+class TestConversionAndChecksums:
+
+    def test_sqlite_values_converted_to_column_types(self, migrator):
+        assert migrator._convert(1, "bool") is True
+        assert migrator._convert("2025-01-01T08:30:00Z", "datetime") == datetime(2025, 1, 1, 8, 30)
+        assert migrator._convert("", "float") is None
+        assert migrator._convert("", "text") == ""
+        assert migrator._convert(5, "text") == "5"
+
+    def test_canonical_form_is_stable(self, migrator):
+        kinds = ["int", "float", "datetime", "bool", "text"]
+        row = (1, 313.0, datetime(2025, 1, 1, 12, 0), False, None)
+
+        assert "|".join(migrator._canonical(v, k) for v, k in zip(row, kinds)) == \
+            "1|313|2025-01-01 12:00:00.000000|false|\\N"
+        assert migrator.row_checksum(row, kinds) == migrator.row_checksum(tuple(row), kinds)
+        assert migrator.row_checksum(row, kinds) < 2 ** 60
+
+    def test_floats_use_postgres_float8_text(self, migrator):
+        cases = [
+            (0.0, "0"), (-0.0, "0"), (-1e-12, "-1e-12"), (0.1 + 0.2, "0.30000000000000004"),
+            (2.675, "2.675"), (0.0001, "0.0001"), (0.00001, "1e-05"), (-1.5e-7, "-1.5e-07"),
+            (123456789012345.0, "123456789012345"), (1e15, "1e+15"), (1.25e300, "1.25e+300"),
+            (float("nan"), "NaN"), (float("-inf"), "-Infinity"),
+        ]
+        assert [(value, migrator._canonical(value, "float")) for value, _ in cases] == cases
+        assert "::float8::text" in migrator._canonical_sql("score", "float")
+
+    def test_sql_expressions_cover_every_kind(self, migrator):
+        for kind in ("int", "float", "datetime", "bool", "text"):
+            assert "IS NULL" in migrator._canonical_sql("col", kind)
+
+
+class TestCheckpointedCopy:
+
+    def _run(self, migrator, pool, source_db, checkpoint, batch_size=10):
+        return asyncio.run(migrator._migrate_table(
+            pool, "sources", lambda: migrator._SqliteSource(str(source_db)), checkpoint, batch_size
+        ))
+
+    def test_copies_table_and_records_checksum(self, migrator, source_db):
+        store = []
+        checkpoint = migrator.Checkpoint()
+
+        copied = self._run(migrator, FakePool(FakeConnection(store)), source_db, checkpoint)
+
+        state = migrator.Checkpoint().get("sources")
+        assert copied == 25
+        assert len(store) == 25
+        assert state["done"] is True
+        assert state["last_id"] == 25
+        assert state["rows"] == 25
+        assert state["checksum"] > 0
+
+    def test_interrupted_copy_resumes_without_duplicates(self, migrator, source_db):
+        store = []
+        with pytest.raises(ConnectionError):
+            self._run(migrator, FakePool(FakeConnection(store, fail_after=1)), source_db, migrator.Checkpoint())
+
+        assert migrator.Checkpoint().get("sources")["last_id"] == 10
+
+        self._run(migrator, FakePool(FakeConnection(store)), source_db, migrator.Checkpoint())
+
+        assert [r[0] for r in store] == list(range(1, 26))
+        resumed_checksum = migrator.Checkpoint().get("sources")["checksum"]
+
+        # Same checksum as an uninterrupted run
+        fresh_store = []
+        migrator.Checkpoint().reset()
+        self._run(migrator, FakePool(FakeConnection(fresh_store)), source_db, migrator.Checkpoint())
+        assert fresh_store == store
+        assert migrator.Checkpoint().get("sources")["checksum"] == resumed_checksum
+
+    def test_resume_uses_target_high_water_mark(self, migrator, source_db):
+        # Rows 1-15 committed but the checkpoint only recorded 10
+        conn = sqlite3.connect(source_db)
+        kinds = ["int", "text", "text", "bool", "datetime", "datetime"]
+        store = [
+            tuple(migrator._convert(v, k) for v, k in zip(row, kinds))
+            for row in conn.execute("SELECT * FROM sources WHERE id <= 15 ORDER BY id")
+        ]
+        conn.close()
+        checkpoint = migrator.Checkpoint()
+        checkpoint.get("sources")["last_id"] = 10
+        checkpoint.save()
+
+        self._run(migrator, FakePool(FakeConnection(store)), source_db, migrator.Checkpoint())
+
+        state = migrator.Checkpoint().get("sources")
+        assert [r[0] for r in store] == list(range(1, 26))
+        assert state["rows"] == 15
+        assert state["last_id"] == 25
+
+    def test_completed_table_is_skipped(self, migrator, source_db):
+        checkpoint = migrator.Checkpoint()
+        checkpoint.get("sources").update(done=True, rows=25)
+        checkpoint.save()
+        store = []
+
+        copied = self._run(migrator, FakePool(FakeConnection(store)), source_db, migrator.Checkpoint())
+
+        assert copied == 0
+        assert store == []
+
+
+class TestStringKeyedCopy:
+
+    JOB_IDS = ["9b1e4d2c7a5f4e3b8c6d0a1f2e3b4c5d", "0f3c9a52e4b84d7c9e1a6b2d5c8f7e10"]
+
+    @pytest.fixture
+    def jobs_db(self, tmp_path):
+        db_path = tmp_path / "jobs.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE jobs (id VARCHAR PRIMARY KEY, kind VARCHAR, status VARCHAR, "
+                     "created_at DATETIME)")
+        conn.executemany("INSERT INTO jobs VALUES (?, 'synthesis', 'succeeded', '2025-01-01 12:00:00')",
+                         [(job_id,) for job_id in self.JOB_IDS])
+        conn.commit()
+        conn.close()
+        return db_path
+
+    def _run(self, migrator, conn, jobs_db):
+        return asyncio.run(migrator._migrate_table(
+            FakePool(conn), "jobs", lambda: migrator._SqliteSource(str(jobs_db)), migrator.Checkpoint(), 1
+        ))
+
+    def test_jobs_copied_in_one_pass(self, migrator, jobs_db):
+        store = []
+        conn = FakeConnection(store)
+
+        assert self._run(migrator, conn, jobs_db) == 2
+
+        state = migrator.Checkpoint().get("jobs")
+        assert sorted(r[0] for r in store) == sorted(self.JOB_IDS)
+        assert state["done"] is True and state["rows"] == 2 and state["checksum"] > 0
+        assert not any("setval" in q for q in conn.queries)
+
+    def test_interrupted_copy_restarts_table(self, migrator, jobs_db):
+        store = []
+        with pytest.raises(ConnectionError):
+            self._run(migrator, FakeConnection(store, fail_after=1), jobs_db)
+        assert migrator.Checkpoint().get("jobs")["done"] is False
+
+        self._run(migrator, FakeConnection(store), jobs_db)
+
+        assert sorted(r[0] for r in store) == sorted(self.JOB_IDS)
+        assert migrator.Checkpoint().get("jobs")["rows"] == 2
@@ -199,7 +199,7 @@ class TestBackwardsCompatibility:
 
     def test_sources_included_format_unchanged(self):
         """Verify sources_included field format is not changed."""
-        synthesis_path = Path(__file__).parent.parent / "backend" / "routes" / "synthesis.py"
+        synthesis_path = Path(__file__).parent.parent / "backend" / "services" / "synthesis_pipeline.py"
         content = synthesis_path.read_text(encoding='utf-8')
 
         # sources_included should still work the same way
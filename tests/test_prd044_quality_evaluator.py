@@ -337,14 +337,16 @@ class TestSynthesisPipelineIntegration:
         """Synthesis routes import quality components."""
         from backend.routes import synthesis
 
-        # Check imports are present
+        # Check imports are present (evaluation runs as a stage of the shared synthesis pipeline)
         source_code = open('backend/routes/synthesis.py', encoding='utf-8').read()
-        assert 'SynthesisQualityScore' in source_code
-        assert 'SynthesisEvaluatorAgent' in source_code
+        assert 'synthesis_stages' in source_code
+        pipeline_code = open('backend/services/synthesis_pipeline.py', encoding='utf-8').read()
+        assert 'SynthesisEvaluatorAgent' in pipeline_code
+        assert 'record_quality_score' in pipeline_code
 
     def test_quality_evaluation_is_optional(self):
         """Quality evaluation can be disabled via env var."""
-        source_code = open('backend/routes/synthesis.py', encoding='utf-8').read()
+        source_code = open('backend/services/synthesis_pipeline.py', encoding='utf-8').read()
         assert 'ENABLE_QUALITY_EVALUATION' in source_code
 
 
@@ -0,0 +1,227 @@
+"""
+Tests for incrementally maintained SourceHealth (PRD-045).
+
+Covers:
+- Ingestion, transcription and collection-run event upserts
+- Reconciliation from content tables (grouped, fixed query count)
+- errors_24h expiry
+- Health endpoint built from the SourceHealth row alone
+- Background reconciler
+"""
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.models import Base, RawContent, Source, SourceHealth, TranscriptionStatus
+from backend.services.alerting import (
+    collection_result_event,
+    items_collected_event,
+    reconcile_source_health,
+    record_collection_result,
+    transcription_event,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "health.db"
+    Base.metadata.create_all(create_engine(f"sqlite:///{path}"))
+    return path
+
+
+@pytest.fixture
+def db(db_path):
+    session = sessionmaker(bind=create_engine(f"sqlite:///{db_path}"))()
+    yield session
+    session.close()
+
+
+@pytest_asyncio.fixture
+async def async_engine(db_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def async_db(async_engine):
+    async with async_sessionmaker(async_engine, expire_on_commit=False)() as session:
+        yield session
+
+
+def _health(db, source_name):
+    db.expire_all()
+    return db.query(SourceHealth).filter_by(source_name=source_name).one()
+
+
+class TestHealthEvents:
+
+    def test_ingestion_increments_and_creates_row(self, db):
+        db.execute(items_collected_event(db, "youtube", 3))
+        db.execute(items_collected_event(db, "youtube", 2))
+        db.commit()
+
+        health = _health(db, "youtube")
+        assert health.items_collected_24h == 5
+        assert health.last_collection_at is not None
+        assert health.is_stale is False
+
+    def test_transcription_lifecycle(self, db):
+        db.execute(transcription_event(db, "youtube", None, "pending"))
+        db.execute(transcription_event(db, "youtube", None, "pending"))
+        db.execute(transcription_event(db, "youtube", "pending", "processing"))
+        db.execute(transcription_event(db, "youtube", "processing", "completed"))
+        db.execute(transcription_event(db, "youtube", "processing", "failed"))
+        db.commit()
+
+        health = _health(db, "youtube")
+        assert health.transcription_pending == 0
+        assert health.transcription_completed == 1
+        assert health.transcription_failed == 1
+        assert health.items_transcribed_24h == 1
+        assert health.last_transcription_at is not None
+
+    def test_collection_failures_and_reset(self, db):
+        db.execute(collection_result_event(db, "discord", False))
+        db.execute(collection_result_event(db, "discord", False))
+        db.commit()
+
+        health = _health(db, "discord")
+        assert health.consecutive_failures == 2
+        assert health.errors_24h == 2
+        assert health.last_collection_status == "failed"
+
+        db.execute(collection_result_event(db, "discord", True))
+        db.commit()
+
+        health = _health(db, "discord")
+        assert health.consecutive_failures == 0
+        assert health.errors_24h == 2
+        assert health.last_collection_status == "success"
+
+    @pytest.mark.asyncio
+    async def test_record_collection_result_returns_counts(self, async_db):
+        await record_collection_result("substack", False, error_message="timeout", db=async_db)
+        result = await record_collection_result("substack", False, db=async_db)
+        await async_db.commit()
+
+        assert result["status"] == "failed"
+        assert result["consecutive_failures"] == 2
+
+
+class TestReconciliation:
+
+    @pytest.fixture
+    def seeded(self, db):
+        now = datetime.utcnow()
+        sources = {name: Source(name=name, type=name, last_collected_at=now) for name in ("youtube", "discord")}
+        sources["substack"] = Source(name="substack", type="substack", last_collected_at=now - timedelta(days=5))
+        db.add_all(sources.values())
+        db.flush()
+        for i in range(4):
+            content = RawContent(source_id=sources["youtube"].id, content_type="video",
+                                 collected_at=now - timedelta(hours=i * 10))
+            db.add(content)
+            db.flush()
+            status = ["pending", "completed", "failed", "pending"][i]
+            db.add(TranscriptionStatus(
+                content_id=content.id, status=status,
+                created_at=now - timedelta(hours=30 if i == 3 else 1),
+                completed_at=now - timedelta(hours=2) if status == "completed" else None
+            ))
+        db.add(RawContent(source_id=sources["discord"].id, content_type="text", collected_at=now))
+        # Drifted counters from missed events
+        db.add(SourceHealth(source_name="youtube", items_collected_24h=99, transcription_pending=7,
+                            errors_24h=4, last_failure_at=now - timedelta(hours=30)))
+        db.commit()
+
+    @pytest.mark.asyncio
+    async def test_recomputes_counters(self, db, seeded, async_db):
+        result = await reconcile_source_health(async_db)
+        await async_db.commit()
+
+        assert result["sources_reconciled"] == 3
+        youtube = _health(db, "youtube")
+        assert youtube.items_collected_24h == 3
+        assert youtube.transcription_pending == 2
+        assert youtube.transcription_completed == 1
+        assert youtube.transcription_failed == 1
+        assert youtube.transcription_backlog == 1
+        assert youtube.items_transcribed_24h == 1
+        assert youtube.errors_24h == 0  # last failure is older than 24h
+        assert youtube.reconciled_at is not None
+        assert _health(db, "discord").items_collected_24h == 1
+        assert _health(db, "substack").is_stale is True
+
+    @pytest.mark.asyncio
+    async def test_keeps_recent_errors(self, db, seeded, async_db):
+        db.execute(collection_result_event(db, "discord", False))
+        db.commit()
+
+        await reconcile_source_health(async_db)
+        await async_db.commit()
+
+        assert _health(db, "discord").errors_24h == 1
+
+    @pytest.mark.asyncio
+    async def test_query_count_independent_of_sources(self, seeded, async_engine, async_db):
+        statements = []
+        event.listen(async_engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        await reconcile_source_health(async_db)
+
+        # sources + items + transcription aggregates + one upsert
+        assert len(statements) == 4
+
+
+class TestHealthEndpointRead:
+
+    def test_status_from_row(self):
+        from backend.routes.health import _source_health_info
+
+        now = datetime.utcnow()
+        cutoff = now - timedelta(hours=48)
+        health = SourceHealth(source_name="youtube", last_collection_at=now, items_collected_24h=4,
+                              errors_24h=0, consecutive_failures=0, transcription_pending=3,
+                              transcription_completed=10, transcription_failed=1, transcription_backlog=2)
+
+        info = _source_health_info(health, "youtube", cutoff)
+
+        assert info["status"] == "degraded"
+        assert info["items_24h"] == 4
+        assert info["transcription"] == {"pending": 3, "completed": 10, "failed": 1, "backlog": 2}
+        assert "2 transcriptions pending" in info["message"]
+
+    def test_critical_and_unknown(self):
+        from backend.routes.health import _source_health_info
+
+        cutoff = datetime.utcnow() - timedelta(hours=48)
+        failing = SourceHealth(source_name="substack", last_collection_at=datetime.utcnow(),
+                               consecutive_failures=3, errors_24h=3)
+
+        assert _source_health_info(failing, "substack", cutoff)["status"] == "critical"
+        assert _source_health_info(None, "substack", cutoff)["status"] == "unknown"
+
+
+class TestSourceHealthReconciler:
+
+    @pytest.mark.asyncio
+    async def test_reconcile_records_result(self, monkeypatch):
+        from backend.services import alerting
+        from backend.workers.source_health_reconciler import SourceHealthReconciler
+
+        async def fake_reconcile():
+            return {"sources_reconciled": 5, "duration_ms": 1.0}
+
+        monkeypatch.setattr(alerting, "reconcile_source_health", fake_reconcile)
+        reconciler = SourceHealthReconciler(interval_seconds=60)
+
+        result = await reconciler.reconcile()
+
+        assert result["sources_reconciled"] == 5
+        assert reconciler.runs == 1
+        assert reconciler.last_result == result
@@ -0,0 +1,176 @@
+"""
+Tests for the set-based staleness sweep (PRD-048).
+
+Covers:
+- One UPDATE per table regardless of symbol count
+- 14-day source staleness and level marking
+- Stored stale_since stamped and cleared
+- Rows touched / timing reporting and idempotency
+- Reads from stored columns
+- Background sweeper
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.models import Base, SymbolLevel, SymbolState
+from backend.utils.staleness_manager import check_and_mark_stale_data
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'staleness.db'}")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _add_symbol(db, symbol, kt_age=None, discord_age=None, updated_age=timedelta(0), levels=2):
+    now = datetime.utcnow()
+    db.add(SymbolState(
+        symbol=symbol,
+        kt_last_updated=now - kt_age if kt_age is not None else None,
+        discord_last_updated=now - discord_age if discord_age is not None else None,
+        updated_at=now - updated_age
+    ))
+    for i in range(levels):
+        db.add(SymbolLevel(symbol=symbol, source="kt_technical", level_type="support", price=100.0 + i))
+        db.add(SymbolLevel(symbol=symbol, source="discord", level_type="gamma", price=200.0 + i))
+
+
+class TestSetBasedSweep:
+
+    def test_statement_count_independent_of_symbols(self, engine, db):
+        for i in range(25):
+            _add_symbol(db, f"S{i}", kt_age=timedelta(days=20), updated_age=timedelta(days=20))
+        db.commit()
+
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        result = check_and_mark_stale_data(db)
+
+        assert len(result["kt_stale_symbols"]) == 25
+        # preselect + one UPDATE per table
+        assert len([s for s in statements if s.lstrip().upper().startswith("UPDATE")]) == 2
+        assert len(statements) == 3
+
+    def test_marks_stale_sources_and_their_levels(self, db):
+        _add_symbol(db, "SPX", kt_age=timedelta(days=20), discord_age=timedelta(days=1))
+        _add_symbol(db, "QQQ", kt_age=timedelta(days=1), discord_age=timedelta(days=30))
+        db.commit()
+
+        result = check_and_mark_stale_data(db)
+
+        assert result["kt_stale_symbols"] == ["SPX"]
+        assert result["discord_stale_symbols"] == ["QQQ"]
+        assert result["stale_levels_marked"] == 4
+        spx = db.query(SymbolState).filter_by(symbol="SPX").one()
+        assert spx.kt_is_stale is True
+        assert spx.discord_is_stale is False
+        assert "14+ days" in spx.kt_stale_warning
+        stale_levels = db.query(SymbolLevel).filter_by(is_stale=True).all()
+        assert {(l.symbol, l.source) for l in stale_levels} == {("SPX", "kt_technical"), ("QQQ", "discord")}
+        assert all(l.stale_since is not None for l in stale_levels)
+
+    def test_stamps_read_staleness(self, db):
+        _add_symbol(db, "SPX", kt_age=timedelta(hours=60), discord_age=timedelta(hours=2),
+                    updated_age=timedelta(hours=60))
+        db.commit()
+
+        check_and_mark_stale_data(db)
+
+        spx = db.query(SymbolState).filter_by(symbol="SPX").one()
+        assert spx.stale_since is not None
+        assert spx.kt_stale_since is not None
+        assert spx.discord_stale_since is None
+        # 60h is past the read threshold but not the 14-day one
+        assert spx.kt_is_stale is False
+
+    def test_clears_stale_since_when_fresh_again(self, db):
+        _add_symbol(db, "SPX", kt_age=timedelta(hours=60), updated_age=timedelta(hours=60))
+        db.commit()
+        check_and_mark_stale_data(db)
+
+        spx = db.query(SymbolState).filter_by(symbol="SPX").one()
+        spx.kt_last_updated = datetime.utcnow()
+        spx.updated_at = datetime.utcnow()
+        db.commit()
+        result = check_and_mark_stale_data(db)
+
+        spx = db.query(SymbolState).filter_by(symbol="SPX").one()
+        assert result["states_updated"] == 1
+        assert spx.stale_since is None
+        assert spx.kt_stale_since is None
+
+    def test_second_sweep_touches_nothing(self, db):
+        _add_symbol(db, "SPX", kt_age=timedelta(days=20), updated_age=timedelta(days=3))
+        _add_symbol(db, "QQQ", kt_age=timedelta(hours=1))
+        db.commit()
+
+        first = check_and_mark_stale_data(db)
+        second = check_and_mark_stale_data(db)
+
+        assert first["states_updated"] == 1
+        assert second["states_updated"] == 0
+        assert second["stale_levels_marked"] == 0
+        assert second["kt_stale_symbols"] == []
+        assert second["duration_ms"] >= 0
+
+    def test_refresh_clears_stored_staleness(self, db):
+        from backend.utils.staleness_manager import refresh_staleness_for_symbol
+
+        _add_symbol(db, "SPX", kt_age=timedelta(days=20), updated_age=timedelta(days=20))
+        db.commit()
+        check_and_mark_stale_data(db)
+
+        refresh_staleness_for_symbol(db, "SPX", "kt_technical")
+
+        spx = db.query(SymbolState).filter_by(symbol="SPX").one()
+        assert spx.kt_is_stale is False
+        assert spx.kt_stale_since is None
+        assert spx.stale_since is None
+        assert db.query(SymbolLevel).filter_by(symbol="SPX", source="kt_technical", is_stale=True).count() == 0
+
+
+class TestReadStaleness:
+
+    def test_stored_flag_decides(self):
+        from backend.routes.symbols import read_staleness
+
+        last_updated = datetime.utcnow() - timedelta(hours=100)
+
+        assert read_staleness(last_updated, None)["is_stale"] is False
+        stale = read_staleness(last_updated, datetime.utcnow())
+        assert stale["is_stale"] is True
+        assert "h old" in stale["staleness_message"]
+
+    def test_never_updated(self):
+        from backend.routes.symbols import read_staleness
+
+        assert read_staleness(None, None)["staleness_message"] == "Never updated"
+
+
+class TestStalenessSweeper:
+
+    @pytest.mark.asyncio
+    async def test_sweep_records_result(self, monkeypatch):
+        from backend.workers import staleness_sweeper
+
+        fake_result = {"states_updated": 3, "stale_levels_marked": 5, "duration_ms": 1.2,
+                       "kt_stale_symbols": [], "discord_stale_symbols": []}
+        monkeypatch.setattr(staleness_sweeper, "_run_sweep", lambda: fake_result)
+        sweeper = staleness_sweeper.StalenessSweeper(interval_seconds=60)
+
+        result = await sweeper.sweep()
+
+        assert result == fake_result
+        assert sweeper.sweeps == 1
+        assert sweeper.last_result == fake_result
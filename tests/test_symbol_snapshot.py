@@ -0,0 +1,161 @@
+"""
+Tests for the materialized symbol snapshot (backend/services/symbol_snapshot.py).
+
+Covers:
+- Grouped active-level counts
+- Cold load in a constant number of queries
+- Incremental refresh from save_extraction_to_db and update_symbol_confluence
+- Invalidation after staleness sweeps
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.models import Base, SymbolLevel, SymbolState
+from backend.services import symbol_snapshot
+from backend.services.symbol_snapshot import SymbolSnapshot, active_level_counts
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'symbols.db'}")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def snapshot(monkeypatch):
+    snapshot = SymbolSnapshot(ttl_seconds=3600)
+    monkeypatch.setattr(symbol_snapshot, "_snapshot", snapshot)
+    return snapshot
+
+
+def _count_statements(engine):
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def _seed(db, symbols=("SPX", "QQQ", "NVDA"), levels_per_symbol=3):
+    for symbol in symbols:
+        db.add(SymbolState(symbol=symbol, kt_bias="bullish", discord_quadrant="buy_call",
+                           updated_at=datetime.utcnow()))
+        for i in range(levels_per_symbol):
+            db.add(SymbolLevel(symbol=symbol, source="kt_technical", level_type="support",
+                               price=100.0 + i, is_active=True))
+        db.add(SymbolLevel(symbol=symbol, source="kt_technical", level_type="target",
+                           price=200.0, is_active=False))
+    db.commit()
+
+
+class TestActiveLevelCounts:
+
+    def test_counts_only_active_levels(self, db):
+        _seed(db)
+
+        assert active_level_counts(db) == {"SPX": 3, "QQQ": 3, "NVDA": 3}
+
+    def test_counts_subset(self, db):
+        _seed(db)
+
+        assert active_level_counts(db, ["SPX"]) == {"SPX": 3}
+
+
+class TestSymbolSnapshot:
+
+    def test_cold_load_uses_constant_queries(self, engine, db, snapshot):
+        _seed(db, symbols=[f"S{i}" for i in range(20)])
+        db.expire_all()
+        statements = _count_statements(engine)
+
+        entries = snapshot.entries(db)
+
+        assert len(entries) == 20
+        assert len(statements) == 2
+        assert all(e["active_levels_count"] == 3 for e in entries)
+
+    def test_warm_reads_skip_database(self, engine, db, snapshot):
+        _seed(db)
+        snapshot.entries(db)
+        statements = _count_statements(engine)
+
+        snapshot.entries(db)
+        snapshot.get(db, "SPX")
+
+        assert statements == []
+
+    def test_expired_snapshot_reloads(self, db):
+        _seed(db)
+        snapshot = SymbolSnapshot(ttl_seconds=0)
+
+        snapshot.entries(db)
+        snapshot.entries(db)
+
+        assert snapshot.loads == 2
+
+    def test_confluence_update_applies_without_reload(self, db, snapshot):
+        from backend.utils.staleness_manager import update_symbol_confluence
+
+        _seed(db)
+        snapshot.entries(db)
+
+        update_symbol_confluence(db, "SPX")
+
+        entry = snapshot.get(db, "SPX")
+        assert entry["sources_directionally_aligned"] is True
+        assert entry["confluence_score"] == 0.85
+        assert entry["active_levels_count"] == 3
+        assert snapshot.loads == 1
+
+    def test_extraction_refreshes_touched_symbols(self, db, snapshot):
+        from agents.symbol_level_extractor import SymbolLevelExtractor
+
+        _seed(db)
+        snapshot.entries(db)
+
+        extractor = SymbolLevelExtractor(api_key="test-key-for-unit-tests")
+        extractor.save_extraction_to_db(
+            db=db,
+            extraction_result={"symbols": [
+                {"symbol": "SPX", "bias": "bearish", "levels": [{"type": "resistance", "price": 500.0}]},
+                {"symbol": "TSLA", "bias": "bullish", "levels": [{"type": "support", "price": 250.0}]},
+            ]},
+            source="kt_technical"
+        )
+
+        assert snapshot.get(db, "SPX")["active_levels_count"] == 4
+        assert snapshot.get(db, "SPX")["kt_bias"] == "bearish"
+        assert snapshot.get(db, "TSLA")["active_levels_count"] == 1
+        assert snapshot.loads == 1
+
+    def test_staleness_sweep_invalidates(self, db, snapshot):
+        from backend.utils.staleness_manager import check_and_mark_stale_data
+
+        _seed(db)
+        state = db.query(SymbolState).filter_by(symbol="SPX").first()
+        state.kt_last_updated = datetime.utcnow() - timedelta(days=30)
+        db.commit()
+        snapshot.entries(db)
+
+        check_and_mark_stale_data(db)
+
+        assert not snapshot.is_loaded
+        assert snapshot.get(db, "SPX")["kt_is_stale"] is True
+
+    def test_refresh_before_load_is_noop(self, engine, db, snapshot):
+        _seed(db)
+        statements = _count_statements(engine)
+
+        snapshot.refresh(db, ["SPX"])
+
+        assert statements == []
+        assert not snapshot.is_loaded
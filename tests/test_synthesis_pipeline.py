@@ -0,0 +1,155 @@
+"""
+Tests for the synthesis stage DAG.
+
+Covers:
+- Independent stages run concurrently; dependents wait for their inputs
+- Per-stage timings, critical path vs serial time
+- Non-fatal stage failures, required stage failures and timeouts
+- Graph validation (unknown dependencies, cycles)
+- synthesis_stages: cross-reference enrichment, save, quality and themes
+"""
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.models import Base, Synthesis
+from backend.services.synthesis_pipeline import Stage, StageFailed, run_pipeline, synthesis_stages
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pipeline.db'}")
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+def _sleep(seconds, value=None):
+    def func(db, results):
+        time.sleep(seconds)
+        return value
+    return func
+
+
+class TestRunPipeline:
+
+    @pytest.mark.asyncio
+    async def test_independent_stages_overlap(self, session_factory):
+        stages = [
+            Stage("a", _sleep(0.2, 1)),
+            Stage("b", _sleep(0.2, 2)),
+            Stage("c", lambda db, results: results["a"] + results["b"], after=["a", "b"]),
+        ]
+
+        run = await run_pipeline(stages, session_factory)
+
+        assert run["results"]["c"] == 3
+        assert run["wall_seconds"] < 0.35
+        assert run["serial_seconds"] >= 0.4
+        assert run["critical_path_seconds"] == pytest.approx(run["wall_seconds"], abs=0.1)
+        timings = {t["stage"]: t for t in run["timings"]}
+        assert timings["c"]["started_at"] >= timings["a"]["started_at"] + timings["a"]["seconds"]
+
+    @pytest.mark.asyncio
+    async def test_each_stage_gets_its_own_session(self, session_factory):
+        sessions = []
+        lock = threading.Lock()
+
+        def record(db, results):
+            with lock:
+                sessions.append(db)
+
+        await run_pipeline([Stage("a", record), Stage("b", record)], session_factory)
+
+        assert len(sessions) == 2 and sessions[0] is not sessions[1]
+
+    @pytest.mark.asyncio
+    async def test_non_fatal_failure_keeps_dependents(self, session_factory):
+        def boom(db, results):
+            raise RuntimeError("scorer down")
+
+        progress = []
+        stages = [
+            Stage("scoring", boom, label="Scoring"),
+            Stage("synthesis", lambda db, results: results["scoring"] is None, after=["scoring"], required=True),
+        ]
+
+        run = await run_pipeline(stages, session_factory, on_progress=lambda *args: progress.append(args))
+
+        assert run["failed"] == ["scoring"]
+        assert run["results"]["synthesis"] is True
+        assert progress == [("Scoring", "in_progress"), ("Scoring", "complete")]
+
+    @pytest.mark.asyncio
+    async def test_required_timeout_raises(self, session_factory):
+        stages = [Stage("synthesis", _sleep(0.5), required=True, timeout=0.05),
+                  Stage("save", _sleep(0), after=["synthesis"])]
+
+        with pytest.raises(StageFailed) as exc:
+            await run_pipeline(stages, session_factory)
+
+        assert exc.value.stage == "synthesis"
+        assert isinstance(exc.value.error, asyncio.TimeoutError)
+
+    @pytest.mark.parametrize("stages", [
+        [Stage("a", _sleep(0), after=["missing"])],
+        [Stage("a", _sleep(0), after=["b"]), Stage("b", _sleep(0), after=["a"])],
+    ])
+    def test_invalid_graphs_rejected(self, session_factory, stages):
+        with pytest.raises(ValueError):
+            asyncio.run(run_pipeline(stages, session_factory))
+
+
+class TestSynthesisStages:
+
+    RESULT = {
+        "executive_summary": {"synthesis_narrative": "Risk on", "overall_tone": "bullish"},
+        "confluence_zones": [{"theme": "AI capex"}],
+        "content_count": 2,
+    }
+
+    @pytest.mark.asyncio
+    async def test_post_collection_graph(self, session_factory, monkeypatch):
+        monkeypatch.setenv("ENABLE_QUALITY_EVALUATION", "true")
+        synthesis_agent = MagicMock()
+        synthesis_agent.return_value.analyze.side_effect = lambda **kwargs: (time.sleep(0.2), dict(self.RESULT))[1]
+        evaluator = MagicMock()
+        evaluator.return_value.evaluate.return_value = {"grade": "A", "quality_score": 90}
+
+        def cross_reference(db):
+            time.sleep(0.2)
+            return {"high_conviction_ideas": [{"theme": "AI capex"}], "contradictions": []}
+
+        stages = synthesis_stages(
+            [{"id": 1}, {"id": 2}], time_window="24h",
+            load_older=lambda db: [{"id": 0}], load_kt=lambda db: [],
+            score_content=lambda db, items: {"scored": len(items)},
+            load_pillar_scores=lambda db: {"youtube": {}},
+            cross_reference=cross_reference
+        )
+        with patch("agents.synthesis_agent.SynthesisAgent", synthesis_agent), \
+                patch("agents.synthesis_evaluator.SynthesisEvaluatorAgent", evaluator), \
+                patch("backend.services.quality_rollup.record_quality_score") as record, \
+                patch("agents.theme_extractor.extract_and_track_themes", return_value={"created": 1}):
+            run = await run_pipeline(stages, session_factory)
+
+        kwargs = synthesis_agent.return_value.analyze.call_args.kwargs
+        assert kwargs["older_content"] == [{"id": 0}]
+        assert kwargs["pillar_scores"] == {"youtube": {}}
+        # cross-reference ran alongside the synthesis, not after it
+        assert run["wall_seconds"] < 0.35
+
+        saved = run["results"]["save"]
+        assert record.call_args.args[1] == saved["id"]
+        assert run["results"]["themes"] == {"created": 1}
+
+        db = session_factory()
+        row = db.get(Synthesis, saved["id"])
+        assert row.market_regime == "bullish"
+        assert json.loads(row.synthesis_json)["bayesian_convictions"] == [{"theme": "AI capex"}]
+        db.close()
@@ -0,0 +1,300 @@
+"""
+Tests for daily theme mention rollups.
+
+Covers:
+- Flush listeners: new analyses, edited themes / sentiment / conviction, deletes
+- Rebuild matching the listener-maintained rows (all and single source)
+- Startup backfill of an empty table (after the mention index)
+- Aggregated themes: counts, sources, sentiment mix, conviction trend, windows
+- Aggregated themes endpoint served from the rollups
+- Reclassify-source endpoint keeping the rollups and theme_mentions in step
+- Query count independent of lookback and corpus size
+"""
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.models import AnalyzedContent, Base, RawContent, Source, ThemeDailyRollup, ThemeMention
+from backend.services.theme_rollup import aggregated_themes, backfill_theme_rollups, rebuild_theme_rollups
+
+NOW = datetime(2026, 3, 10, 12, 0)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "themes.db"
+    Base.metadata.create_all(create_engine(f"sqlite:///{path}"))
+    return path
+
+
+@pytest.fixture
+def db(db_path):
+    session = sessionmaker(bind=create_engine(f"sqlite:///{db_path}"))()
+    yield session
+    session.close()
+
+
+@pytest_asyncio.fixture
+async def async_engine(db_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def async_db(async_engine):
+    async with async_sessionmaker(async_engine, expire_on_commit=False)() as session:
+        yield session
+
+
+@pytest.fixture
+def sources(db):
+    sources = {name: Source(name=name, type=name) for name in ("youtube", "discord")}
+    db.add_all(sources.values())
+    db.commit()
+    return sources
+
+
+def _analyze(db, source, themes, sentiment=None, conviction=None, days_ago=0, now=NOW):
+    raw = RawContent(source_id=source.id, content_type="text")
+    db.add(raw)
+    db.flush()
+    analyzed = AnalyzedContent(raw_content_id=raw.id, agent_type="classifier", analysis_result="{}",
+                               key_themes=themes, sentiment=sentiment, conviction=conviction,
+                               analyzed_at=now - timedelta(days=days_ago))
+    db.add(analyzed)
+    db.commit()
+    return analyzed
+
+
+def _rollup_rows(db):
+    db.expire_all()
+    return {
+        (r.keyword, r.source_id, r.day): (r.mention_count, r.bullish_count, r.bearish_count,
+                                          r.neutral_count, r.conviction_sum, r.conviction_count)
+        for r in db.query(ThemeDailyRollup).all()
+        if r.mention_count
+    }
+
+
+class TestFlushTracking:
+
+    def test_new_analysis_counted_per_keyword(self, db, sources):
+        _analyze(db, sources["youtube"], "Fed Policy, inflation", "bullish", 8)
+        _analyze(db, sources["youtube"], "fed  policy", "Bearish", 4)
+
+        rows = _rollup_rows(db)
+        day = NOW.date()
+        assert rows[("fed policy", sources["youtube"].id, day)] == (2, 1, 1, 0, 12, 2)
+        assert rows[("inflation", sources["youtube"].id, day)] == (1, 1, 0, 0, 8, 1)
+
+    def test_edits_move_counts(self, db, sources):
+        analyzed = _analyze(db, sources["discord"], "inflation, china", "bullish", 6)
+
+        analyzed.key_themes = "inflation, tariffs"  # instance expired by the previous commit
+        analyzed.sentiment = "neutral"
+        db.commit()
+        analyzed.conviction = 9
+        db.commit()
+
+        day = NOW.date()
+        assert _rollup_rows(db) == {
+            ("inflation", sources["discord"].id, day): (1, 0, 0, 1, 9, 1),
+            ("tariffs", sources["discord"].id, day): (1, 0, 0, 1, 9, 1),
+        }
+
+    def test_moved_to_another_day(self, db, sources):
+        analyzed = _analyze(db, sources["discord"], "gold")
+
+        analyzed.analyzed_at = NOW - timedelta(days=3)
+        db.commit()
+
+        assert list(_rollup_rows(db)) == [("gold", sources["discord"].id, (NOW - timedelta(days=3)).date())]
+
+    def test_delete_removes_counts(self, db, sources):
+        analyzed = _analyze(db, sources["youtube"], "gold, silver", "bullish", 5)
+
+        db.delete(analyzed.raw_content)
+        db.commit()
+
+        assert _rollup_rows(db) == {}
+
+    def test_rebuild_matches_listener(self, db, sources):
+        for i in range(8):
+            source = sources["youtube" if i % 2 else "discord"]
+            _analyze(db, source, ["gold, rates", "rates", "AI capex, rates"][i % 3],
+                     ["bullish", "bearish", "neutral", None][i % 4], i if i % 3 else None, days_ago=i % 4)
+        edited = _analyze(db, sources["youtube"], "gold", "bullish", 3)
+        edited.key_themes = "gold, oil"
+        db.commit()
+        maintained = _rollup_rows(db)
+
+        rebuild_theme_rollups(db)
+        db.commit()
+
+        assert _rollup_rows(db) == maintained
+
+    def test_rebuild_single_source_after_bulk_delete(self, db, sources):
+        _analyze(db, sources["youtube"], "gold")
+        _analyze(db, sources["discord"], "gold")
+        db.query(RawContent).filter(RawContent.source_id == sources["youtube"].id).delete()
+
+        rebuild_theme_rollups(db, source_ids=[sources["youtube"].id])
+        db.commit()
+
+        assert list(_rollup_rows(db)) == [("gold", sources["discord"].id, NOW.date())]
+
+
+    def test_startup_backfill_of_existing_data(self, db, sources, monkeypatch):
+        from backend.app import _backfill_derived_tables
+        from backend.models import TickerMention
+
+        _analyze(db, sources["youtube"], "gold, rates", "bullish", 6)
+        _analyze(db, sources["discord"], "gold", days_ago=2)
+        maintained = _rollup_rows(db)
+        assert backfill_theme_rollups(db) is None  # already maintained
+
+        # Pre-migration data: analyses only, index and rollups empty
+        for model in (ThemeDailyRollup, ThemeMention, TickerMention):
+            db.query(model).delete()
+        db.commit()
+        monkeypatch.setattr("backend.models.SessionLocal", sessionmaker(bind=db.get_bind()))
+        _backfill_derived_tables()
+
+        assert _rollup_rows(db) == maintained
+
+
+class TestAggregatedThemes:
+
+    @pytest.mark.asyncio
+    async def test_counts_sources_and_sentiment(self, db, sources, async_db):
+        _analyze(db, sources["youtube"], "Gold, rates", "bullish", 8, days_ago=1)
+        _analyze(db, sources["discord"], "gold", "bearish", 4, days_ago=2)
+        _analyze(db, sources["discord"], "gold", "bullish", days_ago=3)
+        _analyze(db, sources["discord"], "rates", days_ago=20)
+
+        themes = await aggregated_themes(async_db, days=7, today=NOW.date())
+
+        assert [t["name"] for t in themes] == ["gold", "rates"]
+        gold = themes[0]
+        assert gold["sources"] == ["discord", "youtube"] and gold["source_count"] == 2
+        assert gold["mention_count"] == 3
+        assert (gold["first_seen"], gold["last_seen"]) == ("2026-03-07", "2026-03-09")
+        assert gold["sentiment_mix"] == {"bullish": 2, "bearish": 1, "neutral": 0}
+        assert gold["avg_sentiment"] == 0.33
+        assert gold["avg_conviction"] == 6.0
+        assert themes[1]["mention_count"] == 1 and themes[1]["avg_sentiment"] == 1.0
+
+        assert [t["name"] for t in await aggregated_themes(async_db, days=7, min_sources=2, today=NOW.date())] \
+            == ["gold"]
+        all_time = await aggregated_themes(async_db, days=None, today=NOW.date())
+        assert {t["name"]: t["mention_count"] for t in all_time} == {"gold": 3, "rates": 2}
+
+    @pytest.mark.asyncio
+    async def test_conviction_trend(self, db, sources, async_db):
+        for days_ago, conviction in ((6, 3), (5, 4), (1, 7), (0, 8)):
+            _analyze(db, sources["youtube"], "ai capex, recession", conviction=conviction, days_ago=days_ago)
+        _analyze(db, sources["youtube"], "recession", conviction=9, days_ago=6)
+        _analyze(db, sources["youtube"], "recession", conviction=1, days_ago=0)
+        _analyze(db, sources["youtube"], "gold", conviction=5, days_ago=1)
+
+        themes = {t["name"]: t for t in await aggregated_themes(async_db, days=7, today=NOW.date())}
+
+        assert themes["ai capex"]["conviction_trend"] == "rising"
+        assert themes["recession"]["conviction_trend"] == "stable"
+        assert themes["gold"]["conviction_trend"] == "stable"
+        assert themes["gold"]["avg_sentiment"] is None
+
+        for days_ago in (0, 1):
+            _analyze(db, sources["youtube"], "recession", conviction=0, days_ago=days_ago)
+        themes = {t["name"]: t for t in await aggregated_themes(async_db, days=7, today=NOW.date())}
+        assert themes["recession"]["conviction_trend"] == "falling"
+
+    @pytest.mark.asyncio
+    async def test_statement_count_independent_of_window(self, db, sources, async_engine, async_db):
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(async_engine.sync_engine, "before_cursor_execute", listener)
+
+        for i in range(40):
+            _analyze(db, sources["discord" if i % 2 else "youtube"], f"theme {i % 5}, rates", days_ago=i * 2)
+        try:
+            week = await aggregated_themes(async_db, days=7, today=NOW.date())
+            quarter = await aggregated_themes(async_db, days=90, today=NOW.date())
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", listener)
+
+        assert len(statements) == 2
+        assert week[0]["mention_count"] < quarter[0]["mention_count"] == 40
+
+
+class TestAggregatedThemesRoute:
+
+    @pytest.mark.asyncio
+    async def test_served_from_rollups(self, client, jwt_headers, test_app, db, sources, async_engine):
+        from backend.models import get_async_db
+
+        _analyze(db, sources["youtube"], "gold", "bullish", 7, now=datetime.utcnow())
+        _analyze(db, sources["youtube"], "gold", now=datetime.utcnow() - timedelta(days=20))
+        _analyze(db, sources["youtube"], "gold", now=datetime.utcnow() - timedelta(days=40))
+        db.execute(AnalyzedContent.__table__.delete())  # rollups alone answer the endpoint
+        db.commit()
+
+        async def override():
+            async with async_sessionmaker(async_engine, expire_on_commit=False)() as session:
+                yield session
+
+        test_app.dependency_overrides[get_async_db] = override
+        try:
+            response = await client.get("/api/search/themes/aggregated?days=30", headers=jwt_headers)
+        finally:
+            test_app.dependency_overrides.pop(get_async_db, None)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total_themes"] == 1 and body["days"] == 30
+        assert body["themes"][0]["name"] == "gold"
+        assert body["themes"][0]["mention_count"] == 2
+
+
+class TestReclassifySourceRoute:
+
+    @pytest.mark.asyncio
+    async def test_old_classifications_removed_from_rollups(self, client, jwt_headers, test_app, db, db_path,
+                                                            sources, monkeypatch):
+        from backend.models import get_db
+        from backend.routes import analyze
+
+        for _ in range(2):
+            _analyze(db, sources["youtube"], "gold")
+
+        class FakeClassifier:
+            def classify_many(self, items):
+                return {"results": [{"classification": "macro", "priority": "low", "detected_topics": ["gold"]}
+                                    for _ in items], "stats": {}}
+
+        monkeypatch.setattr(analyze, "get_classifier", lambda: FakeClassifier())
+        session_factory = sessionmaker(bind=create_engine(f"sqlite:///{db_path}"))
+
+        def override():
+            session = session_factory()
+            try:
+                yield session
+            finally:
+                session.close()
+
+        test_app.dependency_overrides[get_db] = override
+        try:
+            response = await client.post("/api/analyze/reclassify-source/youtube", headers=jwt_headers)
+        finally:
+            test_app.dependency_overrides.pop(get_db, None)
+
+        assert response.status_code == 200
+        assert response.json()["old_records_deleted"] == 2
+        db.expire_all()
+        assert db.query(ThemeMention).count() == 2
+        assert sum(counts[0] for counts in _rollup_rows(db).values()) == 2
@@ -0,0 +1,185 @@
+"""
+Tests for the local theme similarity prefilter.
+
+Covers:
+- Tokenizing and TF-IDF nearest / pair lookups
+- Theme.similarity_terms maintained on insert and update, and backfill
+- match_themes: local updates / creates, top-k shortlist for Claude
+- cluster_themes: local merges, adjudication of ambiguous pairs only
+"""
+import json
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from agents.cross_reference import CrossReferenceAgent
+from agents.theme_extractor import ThemeExtractorAgent
+from backend.models import Base, Theme
+from backend.services.theme_similarity import rebuild_theme_terms
+from backend.utils.text_similarity import TermIndex, theme_terms, tokenize
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'themes.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+EXISTING = [
+    {"id": 1, "name": "FOMC hawkish cut expectations", "aliases": ["Fed hawkish cut"],
+     "description": "Fed expected to cut 25bp while signalling a higher terminal rate"},
+    {"id": 2, "name": "AI capex boom", "aliases": [],
+     "description": "Hyperscaler capital expenditure on AI infrastructure accelerating"},
+    {"id": 3, "name": "Dollar weakness", "aliases": [],
+     "description": "DXY trending lower as rate differentials narrow"},
+]
+
+
+class TestTermIndex:
+
+    def test_tokenize(self):
+        assert tokenize("The Fed's rate cuts, 25bp!") == ["fed", "rate", "cut", "25bp"]
+
+    def test_nearest_ranks_and_filters(self):
+        index = TermIndex({t["id"]: theme_terms(t["name"], t["description"], t["aliases"]) for t in EXISTING})
+
+        nearest = index.nearest(theme_terms("AI capex acceleration"), k=5, min_score=0.1)
+
+        assert [key for key, _ in nearest] == [2]
+        assert index.nearest(theme_terms("Gold breakout"), k=5) == []
+
+    def test_pairs_most_similar_first(self):
+        index = TermIndex({i: theme_terms(text) for i, text in enumerate(
+            ["Fed will pivot dovish", "Dovish shift confirmed", "Fed will pivot dovish soon"]
+        )})
+
+        pairs = index.pairs(min_score=0.05)
+
+        assert pairs[0][:2] == (0, 2)
+        assert all(a < b for a, b, _ in pairs)
+
+
+class TestStoredTerms:
+
+    def test_maintained_on_insert_and_update(self, db):
+        theme = Theme(name="Dollar weakness", aliases=json.dumps(["Weak USD"]))
+        db.add(theme)
+        db.commit()
+        assert "usd" in json.loads(theme.similarity_terms)
+
+        theme.description = "Rate differentials narrowing"
+        db.commit()
+        assert "differential" in json.loads(theme.similarity_terms)
+
+    def test_rebuild_backfills(self, db):
+        db.add(Theme(name="AI capex boom"))
+        db.commit()
+        db.execute(Theme.__table__.update().values(similarity_terms=None))
+
+        assert rebuild_theme_terms(db, batch_size=1) == 1
+        db.commit()
+
+        stored = db.query(Theme.similarity_terms).scalar()
+        assert json.loads(stored) == theme_terms("AI capex boom")
+
+
+class TestMatchThemes:
+
+    @pytest.fixture
+    def agent(self):
+        return ThemeExtractorAgent(api_key="test-key-for-unit-tests")
+
+    def test_obvious_cases_skip_claude(self, agent):
+        new = [
+            {"name": "Fed hawkish cut", "sources": {"42macro": "25bp with hawkish dots", "discord": "agreed"}},
+            {"name": "Gold breakout", "sources": {"kt_technical": "new highs"}},
+        ]
+
+        with patch.object(agent, "call_claude") as call:
+            matches = agent.match_themes(new, EXISTING)
+
+        call.assert_not_called()
+        assert [(m["action"], m["match_id"]) for m in matches] == [("update", 1), ("create", None)]
+        assert [e["source"] for e in matches[0]["evidence_to_add"]] == ["42macro", "discord"]
+        assert matches[1]["new_theme"]["name"] == "Gold breakout"
+
+    def test_ambiguous_theme_sent_with_shortlist(self, agent):
+        new = [
+            {"name": "AI capex acceleration", "description": "Hyperscalers raising guidance"},
+            {"name": "Gold breakout"},
+        ]
+        response = {"matches": [{"new_theme_name": "AI capex acceleration", "action": "update", "match_id": 2}]}
+
+        with patch.object(agent, "call_claude", return_value=response) as call:
+            matches = agent.match_themes(new, EXISTING)
+
+        prompt = call.call_args.kwargs["prompt"]
+        assert "AI capex boom" in prompt
+        assert "Dollar weakness" not in prompt and "Gold breakout" not in prompt
+        assert [(m["action"], m["match_id"]) for m in matches] == [("update", 2), ("create", None)]
+        assert matches[0]["new_theme"]["name"] == "AI capex acceleration"
+
+    def test_shortlist_bounded_by_top_k(self, agent):
+        existing = [{"id": i, "name": f"AI capex theme {i}", "aliases": []} for i in range(50)]
+
+        with patch("agents.theme_extractor.THEME_MATCH_TOP_K", 3), \
+                patch.object(agent, "call_claude", return_value={"matches": []}) as call:
+            matches = agent.match_themes([{"name": "AI capex"}], existing)
+
+        prompt = call.call_args.kwargs["prompt"]
+        assert prompt.count('"id":') == 3
+        assert matches[0]["action"] == "create"
+
+
+class TestClusterThemes:
+
+    @pytest.fixture
+    def agent(self):
+        return CrossReferenceAgent(api_key="test-key-for-unit-tests")
+
+    @staticmethod
+    def _theme(text, source, score=5):
+        return {"theme": text, "source": source, "core_score": score}
+
+    def test_near_duplicates_merge_locally(self, agent):
+        themes = [
+            self._theme("Long duration as inflation rolls over", "42macro", 7),
+            self._theme("Long duration as inflation rolls over", "discord", 8),
+            self._theme("Energy sector strength", "youtube"),
+        ]
+
+        with patch.object(agent, "call_claude") as call:
+            clusters = agent.cluster_themes(themes)
+
+        call.assert_not_called()
+        assert [c["source_count"] for c in clusters] == [2, 1]
+        assert clusters[0]["themes"][0]["core_score"] == 7
+        assert clusters[0]["representative_theme"] == themes[1]["theme"]
+
+    def test_only_ambiguous_pairs_adjudicated(self, agent):
+        themes = [
+            self._theme("Fed will pivot dovish", "42macro"),
+            self._theme("Fed will pivot dovish soon", "discord"),
+            self._theme("Energy sector strength", "youtube"),
+        ]
+
+        with patch.object(agent, "call_claude",
+                          return_value={"pairs": [{"pair": 1, "same": True, "confidence": 0.9}]}) as call:
+            clusters = agent.cluster_themes(themes)
+
+        prompt = call.call_args.kwargs["prompt"]
+        assert "Energy sector strength" not in prompt
+        assert [(c["source_count"], c["confidence"]) for c in clusters] == [(2, 0.9), (1, 1.0)]
+
+    def test_adjudication_failure_keeps_local_clusters(self, agent):
+        themes = [self._theme("Fed will pivot dovish", "42macro"), self._theme("Fed will pivot dovish soon", "discord")]
+
+        with patch.object(agent, "call_claude", side_effect=Exception("API down")):
+            clusters = agent.cluster_themes(themes)
+
+        assert len(clusters) == 2
@@ -0,0 +1,92 @@
+"""
+Tests for event-driven wakeup of the background transcription processor.
+
+Covers:
+- notify() / pub/sub notifications wake the processor immediately
+- Polling only happens on the slow fallback interval
+- Stuck-item recovery runs on fallback polls, not on every wakeup
+"""
+import asyncio
+import pytest
+
+from backend.workers import transcription_processor as tp
+from backend.workers.transcription_processor import TranscriptionProcessor
+
+
+class TestProcessorWakeup:
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out_without_notification(self):
+        processor = TranscriptionProcessor()
+        assert await processor._wait_for_wakeup(0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_notify_wakes_waiter(self):
+        processor = TranscriptionProcessor()
+        waiter = asyncio.create_task(processor._wait_for_wakeup(30))
+        await asyncio.sleep(0)
+        processor.notify()
+        assert await asyncio.wait_for(waiter, timeout=1) is True
+
+    @pytest.mark.asyncio
+    async def test_queued_notification_reaches_processor(self, monkeypatch):
+        monkeypatch.setattr(tp, "STARTUP_DELAY_SECONDS", 3600)
+        monkeypatch.setattr(tp, "_processor", None)
+        processor = tp.get_processor()
+        await processor.start()
+        try:
+            await tp.notify_transcription_queued()
+            assert processor._wakeup.is_set()
+        finally:
+            await processor.stop()
+
+    @pytest.mark.asyncio
+    async def test_run_loop_processes_on_wakeup_without_polling(self, monkeypatch):
+        monkeypatch.setattr(tp, "STARTUP_DELAY_SECONDS", 0)
+        monkeypatch.setattr(tp, "PROCESSOR_INTERVAL_SECONDS", 3600)
+
+        processor = TranscriptionProcessor()
+        calls = []
+
+        async def fake_process_pending(recover_stuck=True):
+            calls.append(recover_stuck)
+
+        processor._process_pending = fake_process_pending
+        processor.running = True
+        task = asyncio.create_task(processor._run_loop())
+        try:
+            await asyncio.sleep(0.01)
+            assert calls == [True]  # initial pass recovers stuck items
+
+            processor.notify()
+            await asyncio.sleep(0.01)
+            assert calls == [True, False]  # wakeup pass skips recovery
+        finally:
+            processor.running = False
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    @pytest.mark.asyncio
+    async def test_fallback_poll_recovers_stuck_items(self, monkeypatch):
+        monkeypatch.setattr(tp, "STARTUP_DELAY_SECONDS", 0)
+        monkeypatch.setattr(tp, "PROCESSOR_INTERVAL_SECONDS", 0.01)
+
+        processor = TranscriptionProcessor()
+        calls = []
+
+        async def fake_process_pending(recover_stuck=True):
+            calls.append(recover_stuck)
+
+        processor._process_pending = fake_process_pending
+        processor.running = True
+        task = asyncio.create_task(processor._run_loop())
+        try:
+            await asyncio.sleep(0.05)
+            assert len(calls) >= 2
+            assert all(calls)
+        finally:
+            processor.running = False
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
@@ -121,3 +121,103 @@ class TestUsageLimiterCostCalculations:
 
         # Should be approximately $243/month (includes synthesis + evaluation costs)
         assert 220 < monthly_max < 270
+
+
+class TestUsageLimiterPersistence:
+    """Test in-memory counting with batched, multi-worker-safe persistence."""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        from sqlalchemy import create_engine
+        return create_engine(f"sqlite:///{tmp_path / 'usage.db'}")
+
+    @staticmethod
+    def _count_statements(engine):
+        from sqlalchemy import event
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        return statements
+
+    def test_checks_and_records_do_not_hit_database(self, engine):
+        limiter = UsageLimiter(engine=engine, flush_interval=3600)
+        statements = self._count_statements(engine)
+
+        for _ in range(50):
+            limiter.can_use_text()
+            limiter.record_text_use()
+
+        assert statements == []
+        assert limiter.get_today_usage()["text_analyses"] == 50
+
+    def test_flush_persists_pending_counts(self, engine):
+        limiter = UsageLimiter(engine=engine, flush_interval=3600)
+        limiter.record_vision_use(count=3, notes="PDF charts")
+        limiter.record_text_use(count=2)
+        assert limiter.flush()
+
+        fresh = UsageLimiter(engine=engine, flush_interval=3600)
+        usage = fresh.get_today_usage()
+        assert usage["vision_analyses"] == 3
+        assert usage["text_analyses"] == 2
+        assert usage["estimated_cost_usd"] == pytest.approx(
+            3 * UsageLimiter.COST_PER_VISION + 2 * UsageLimiter.COST_PER_TEXT
+        )
+
+    def test_workers_accumulate_without_lost_updates(self, engine):
+        worker_a = UsageLimiter(engine=engine, flush_interval=3600)
+        worker_b = UsageLimiter(engine=engine, flush_interval=3600)
+
+        worker_a.record_text_use(count=4)
+        worker_b.record_text_use(count=6)
+        worker_a.flush()
+        worker_b.sync()
+        worker_a.sync()
+
+        assert worker_a.get_today_usage()["text_analyses"] == 10
+        assert worker_b.get_today_usage()["text_analyses"] == 10
+
+    def test_limit_enforced_across_workers_near_threshold(self, engine):
+        worker_a = UsageLimiter(engine=engine, flush_interval=3600)
+        worker_b = UsageLimiter(engine=engine, flush_interval=3600)
+
+        worker_a.record_vision_use(count=UsageLimiter.MAX_VISION_DAILY)
+        worker_a.flush()
+
+        # worker_b's local view is stale, but it syncs once near the limit
+        can_use, reason = worker_b.can_use_vision(count=UsageLimiter.MAX_VISION_DAILY)
+        assert can_use is False
+        assert "Vision limit reached" in reason
+
+    def test_notes_appended(self, engine):
+        from sqlalchemy import text
+        limiter = UsageLimiter(engine=engine, flush_interval=3600)
+        limiter.record_vision_use(notes="first")
+        limiter.flush()
+        limiter.record_vision_use(notes="second")
+        limiter.flush()
+
+        with engine.connect() as conn:
+            notes = conn.execute(text("SELECT notes FROM api_usage")).scalar()
+        assert "first" in notes and "second" in notes
+
+    def test_token_usage_per_agent_persisted(self, engine):
+        worker_a = UsageLimiter(engine=engine, flush_interval=3600)
+        worker_b = UsageLimiter(engine=engine, flush_interval=3600)
+
+        worker_a.record_token_usage("ConfluenceScorerAgent", {
+            "calls": 1, "input_tokens": 300, "output_tokens": 50, "cache_creation_input_tokens": 2000
+        })
+        worker_b.record_token_usage("ConfluenceScorerAgent", {
+            "calls": 3, "input_tokens": 900, "output_tokens": 150, "cache_read_input_tokens": 6000
+        })
+        worker_b.record_token_usage("ContentClassifierAgent", {"calls": 1, "input_tokens": 400})
+        assert worker_a.flush() and worker_b.flush()
+
+        fresh = UsageLimiter(engine=engine, flush_interval=3600)
+        tokens = fresh.get_budget_status()["tokens"]
+        scorer = tokens["ConfluenceScorerAgent"]
+        assert scorer["calls"] == 4
+        assert scorer["cache_creation_input_tokens"] == 2000
+        assert scorer["cache_read_input_tokens"] == 6000
+        assert scorer["cache_read_ratio"] == round(6000 / (1200 + 2000 + 6000), 3)
+        assert tokens["ContentClassifierAgent"]["cache_read_ratio"] == 0.0
@@ -0,0 +1,177 @@
+"""
+Tests for WebSocket fan-out and the pub/sub backbone.
+
+Covers:
+- Per-client bounded queues (one slow client doesn't block others)
+- Slow-consumer eviction
+- Single serialization per broadcast
+- Backend selection for the pub/sub backbone
+"""
+import asyncio
+import json
+import pytest
+import pytest_asyncio
+
+from backend.routes.websocket import ConnectionManager, BROADCAST_CHANNEL
+from backend.services.pubsub import InMemoryPubSub, PostgresPubSub, create_pubsub
+
+
+class FakeWebSocket:
+    """Minimal WebSocket stand-in recording sent payloads."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.sent = []
+        self.closed_with = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, payload: str):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(payload)
+
+    async def close(self, code: int = 1000):
+        self.closed_with = code
+
+
+async def _drain():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest_asyncio.fixture
+async def managers():
+    """Track managers created in a test and stop their sender tasks afterwards."""
+    created = []
+
+    def factory(**kwargs):
+        manager = ConnectionManager(pubsub=InMemoryPubSub(), **kwargs)
+        created.append(manager)
+        return manager
+
+    yield factory
+
+    tasks = []
+    for manager in created:
+        for client in list(manager.connections.values()):
+            tasks.append(client.sender_task)
+            manager.disconnect(client.websocket)
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class TestConnectionManagerFanOut:
+
+    @pytest.mark.asyncio
+    async def test_broadcast_reaches_all_clients(self, managers):
+        manager = managers()
+        clients = [FakeWebSocket() for _ in range(3)]
+        for ws in clients:
+            await manager.connect(ws)
+
+        await manager.broadcast({"type": "new_analysis", "data": {"source": "youtube"}})
+        await _drain()
+
+        for ws in clients:
+            assert json.loads(ws.sent[0])["type"] == "new_analysis"
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_fast_clients(self, managers):
+        manager = managers(send_timeout=30)
+        slow = FakeWebSocket(delay=10)
+        fast = FakeWebSocket()
+        await manager.connect(slow)
+        await manager.connect(fast)
+
+        await asyncio.wait_for(manager.broadcast({"type": "theme_update"}), timeout=1)
+        await _drain()
+
+        assert len(fast.sent) == 1
+        assert slow.sent == []
+
+    @pytest.mark.asyncio
+    async def test_full_queue_evicts_slow_consumer(self, managers):
+        manager = managers(queue_size=2, send_timeout=30)
+        slow = FakeWebSocket(delay=10)
+        await manager.connect(slow)
+
+        for i in range(5):
+            await manager.broadcast({"type": "theme_update", "n": i})
+        await _drain()
+
+        assert slow not in manager.active_connections
+        assert manager.evicted_count == 1
+        assert slow.closed_with == 1013
+
+    @pytest.mark.asyncio
+    async def test_stalled_send_evicts_client(self, managers):
+        manager = managers(send_timeout=0.05)
+        stalled = FakeWebSocket(delay=5)
+        await manager.connect(stalled)
+
+        await manager.broadcast({"type": "theme_update"})
+        await asyncio.sleep(0.2)
+
+        assert stalled not in manager.active_connections
+
+    @pytest.mark.asyncio
+    async def test_message_serialized_once(self, managers):
+        manager = managers()
+        clients = [FakeWebSocket() for _ in range(10)]
+        for ws in clients:
+            await manager.connect(ws)
+
+        await manager.broadcast({"type": "collection_complete"})
+        await _drain()
+
+        # Every client receives the very same encoded string object
+        payload = clients[0].sent[0]
+        assert all(ws.sent[0] is payload for ws in clients)
+
+
+class TestPubSubBackbone:
+
+    @pytest.mark.asyncio
+    async def test_events_from_other_publishers_reach_local_clients(self, managers):
+        manager = managers()
+        pubsub = manager.pubsub
+        ws = FakeWebSocket()
+        await manager.connect(ws)
+
+        # e.g. a worker publishing directly onto the backbone
+        await pubsub.publish(BROADCAST_CHANNEL, '{"type":"collection_complete"}')
+        await _drain()
+
+        assert ws.sent == ['{"type":"collection_complete"}']
+
+    @pytest.mark.asyncio
+    async def test_handler_errors_are_isolated(self):
+        pubsub = InMemoryPubSub()
+        received = []
+
+        async def broken(payload):
+            raise RuntimeError("boom")
+
+        async def working(payload):
+            received.append(payload)
+
+        pubsub.subscribe("events", broken)
+        pubsub.subscribe("events", working)
+        await pubsub.publish("events", "x")
+
+        assert received == ["x"]
+
+    def test_memory_backend_for_sqlite(self, monkeypatch):
+        monkeypatch.setenv("DATABASE_URL", "sqlite:///test.db")
+        assert isinstance(create_pubsub("auto"), InMemoryPubSub)
+
+    def test_postgres_backend_for_postgres_url(self, monkeypatch):
+        monkeypatch.setenv("DATABASE_URL", "postgres://user:pw@host:5432/db")
+        backend = create_pubsub("auto")
+        assert isinstance(backend, PostgresPubSub)
+        assert backend.dsn == "postgresql://user:pw@host:5432/db"
+
+    def test_explicit_memory_backend(self, monkeypatch):
+        monkeypatch.setenv("DATABASE_URL", "postgresql://user:pw@host:5432/db")
+        assert isinstance(create_pubsub("memory"), InMemoryPubSub)